@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for MMR re-ranking (modules/rag/mmr.py).
+
+Compares the matrix-based ``mmr_select`` against the previous pairwise
+Python-loop implementation on random 4096-dim vectors, and verifies that
+both select the same indices for every configuration.
+
+Usage:
+    python scripts/benchmark_mmr.py                 # k=5..50, n=15..500
+    python scripts/benchmark_mmr.py --dim 1024      # Smaller vectors
+    python scripts/benchmark_mmr.py --repeat 20     # More timing samples
+"""
+
+import argparse
+import functools
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from modules.rag.mmr import mmr_select  # noqa: E402
+
+K_VALUES = [5, 10, 20, 50]
+N_VALUES = [15, 50, 150, 500]
+
+
+def _cosine(a: np.ndarray, b: np.ndarray) -> float:
+    da = np.linalg.norm(a) + 1e-9
+    db = np.linalg.norm(b) + 1e-9
+    return float(np.dot(a, b) / (da * db))
+
+
+def reference_mmr(
+    query_vec: np.ndarray, doc_vecs: list[np.ndarray], k: int, lam: float
+) -> list[int]:
+    """Pairwise implementation previously used by RAGManager._mmr."""
+    if not doc_vecs:
+        return []
+    sims = [_cosine(query_vec, v) for v in doc_vecs]
+    selected: list[int] = []
+    candidates = set(range(len(doc_vecs)))
+    while candidates and len(selected) < k:
+        if not selected:
+            i = int(np.argmax(sims))
+            selected.append(i)
+            candidates.remove(i)
+            continue
+        best_i = None
+        best_score = float("-inf")
+        for i in sorted(candidates):
+            redundancy = max(_cosine(doc_vecs[i], doc_vecs[j]) for j in selected)
+            score = (1.0 - lam) * sims[i] + lam * (1.0 - redundancy)
+            if score > best_score:
+                best_score = score
+                best_i = i
+        if best_i is None:
+            break
+        selected.append(best_i)
+        candidates.remove(best_i)
+    return selected
+
+
+def _time_ms(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--dim", type=int, default=4096, help="Vector dimension")
+    parser.add_argument("--lam", type=float, default=0.7, help="MMR lambda")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing samples per case")
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    mismatches = 0
+
+    print(f"{'k':>4} {'n':>5} {'loop ms':>10} {'matrix ms':>10} {'speedup':>8}  match")
+    for n in N_VALUES:
+        for k in K_VALUES:
+            if k > n:
+                continue
+            query = rng.standard_normal(args.dim).astype(np.float32)
+            docs = [rng.standard_normal(args.dim).astype(np.float32) for _ in range(n)]
+
+            expected = reference_mmr(query, docs, k, args.lam)
+            actual = mmr_select(query, docs, k, args.lam)
+            match = expected == actual
+            mismatches += 0 if match else 1
+
+            # The loop version is O(k*n^2); keep large cases to a single sample
+            loop_repeat = 1 if n * k > 5000 else args.repeat
+            loop_ms = _time_ms(
+                functools.partial(reference_mmr, query, docs, k, args.lam), loop_repeat
+            )
+            matrix_ms = _time_ms(
+                functools.partial(mmr_select, query, docs, k, args.lam), args.repeat
+            )
+            speedup = loop_ms / matrix_ms if matrix_ms > 0 else float("inf")
+            print(
+                f"{k:>4} {n:>5} {loop_ms:>10.2f} {matrix_ms:>10.2f} {speedup:>7.1f}x  "
+                f"{'yes' if match else 'NO'}"
+            )
+
+    if mismatches:
+        print(f"\n{mismatches} configuration(s) selected different indices")
+        return 1
+    print("\nAll configurations selected identical indices")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Retrieval benchmark for RAGManager.retrieve, MemoryStore.search and RetrievalTool.run.
+
+Loads a fixture corpus plus labeled queries (tests/retrieval/corpus.yaml) into
+an in-process Qdrant (qdrant_client local mode), embeds with a deterministic
+hashing stub, and reports per target:
+
+    p50/p95 latency, recall@k, MRR, and bytes transferred per query
+    (serialized Qdrant responses plus the result handed back to the caller)
+
+Quality numbers come from a lexical stub embedder, so they are only meaningful
+relative to other runs of this script: use them to catch regressions when
+tuning top_k, mmr_lambda, chunk sizes, hybrid search or quantization.
+
+Usage:
+    python scripts/benchmark_retrieval.py                        # Defaults
+    python scripts/benchmark_retrieval.py --hybrid               # Dense + sparse fusion
+    python scripts/benchmark_retrieval.py --quantization int8 --dimensions 128
+    python scripts/benchmark_retrieval.py --output run.json      # Save JSON results
+    python scripts/benchmark_retrieval.py --compare run.json     # Diff against a saved run
+    python scripts/benchmark_retrieval.py --json                 # JSON on stdout only
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import statistics
+import sys
+import time
+import uuid
+import zlib
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import yaml
+
+AGENT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(AGENT_ROOT / "src"))
+
+from qdrant_client import AsyncQdrantClient  # noqa: E402
+
+from core.providers import set_embedder, set_rag_manager  # noqa: E402
+from core.runtime.config import Settings  # noqa: E402
+from core.runtime.memory import MemoryRecord, MemoryStore  # noqa: E402
+from core.tools.retrieval import RetrievalTool  # noqa: E402
+from core.utils.sparse import tokenize  # noqa: E402
+from core.utils.vector_storage import VectorStorageProfile, create_collection  # noqa: E402
+from modules.indexer import SemanticChunker  # noqa: E402
+from modules.rag import RAGManager  # noqa: E402
+
+DEFAULT_CORPUS = AGENT_ROOT / "tests" / "retrieval" / "corpus.yaml"
+RAG_COLLECTION = "bench-documents"
+MEMORY_COLLECTION = "bench-memories"
+CONTEXT_ID = uuid.UUID(int=1)
+HEADLINE_METRICS = ["p50_ms", "p95_ms", "recall_at_k", "mrr", "qdrant_bytes_per_query"]
+
+# (retrieved ids, Qdrant response bytes, result bytes)
+RunResult = tuple[list[str], int, int]
+
+
+class HashingEmbedder:
+    """Deterministic embedder: signed feature hashing of lexical tokens, L2-normalised."""
+
+    def __init__(self, dimension: int) -> None:
+        self._dimension = dimension
+
+    @property
+    def dimension(self) -> int:
+        return self._dimension
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        vectors = []
+        for text in texts:
+            vec = np.zeros(self._dimension, dtype=np.float32)
+            for token in tokenize(text):
+                h = zlib.crc32(token.encode("utf-8"))
+                vec[h % self._dimension] += -1.0 if h & 0x80000000 else 1.0
+            norm = float(np.linalg.norm(vec))
+            if norm == 0.0:
+                vec[0] = 1.0
+            else:
+                vec /= norm
+            vectors.append(vec.tolist())
+        return vectors
+
+
+class MeteredClient:
+    """AsyncQdrantClient proxy that counts the serialized size of query responses."""
+
+    def __init__(self, inner: AsyncQdrantClient) -> None:
+        self._inner = inner
+        self.bytes = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+    async def query_points(self, *args: Any, **kwargs: Any) -> Any:
+        response = await self._inner.query_points(*args, **kwargs)
+        self.bytes += len(response.model_dump_json())
+        return response
+
+
+def load_corpus(path: Path) -> dict[str, Any]:
+    with open(path) as f:
+        corpus: dict[str, Any] = yaml.safe_load(f)
+    uris = {doc["uri"] for doc in corpus["documents"]}
+    for query in corpus["queries"]:
+        unknown = set(query["relevant"]) - uris
+        if unknown:
+            raise ValueError(f"Query {query['id']} labels unknown documents: {sorted(unknown)}")
+    return corpus
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def _reciprocal_rank(ids: list[str], relevant: set[str]) -> float:
+    for rank, uri in enumerate(ids, start=1):
+        if uri in relevant:
+            return 1.0 / rank
+    return 0.0
+
+
+async def measure(
+    queries: list[dict[str, Any]],
+    run: Callable[[str], Awaitable[RunResult]],
+    *,
+    k: int,
+    repeat: int,
+) -> dict[str, Any]:
+    """Run every query ``repeat`` times; quality is scored on the first pass."""
+    latencies: list[float] = []
+    qdrant_bytes: list[int] = []
+    output_bytes: list[int] = []
+    per_query: dict[str, dict[str, float]] = {}
+
+    for iteration in range(repeat):
+        for query in queries:
+            start = time.perf_counter()
+            ids, q_bytes, o_bytes = await run(query["query"])
+            latencies.append((time.perf_counter() - start) * 1000)
+            qdrant_bytes.append(q_bytes)
+            output_bytes.append(o_bytes)
+            if iteration == 0:
+                relevant = set(query["relevant"])
+                top = ids[:k]
+                per_query[query["id"]] = {
+                    "recall": len(relevant & set(top)) / len(relevant),
+                    "rr": _reciprocal_rank(top, relevant),
+                }
+
+    return {
+        "p50_ms": round(_percentile(latencies, 50), 3),
+        "p95_ms": round(_percentile(latencies, 95), 3),
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "recall_at_k": round(statistics.fmean(q["recall"] for q in per_query.values()), 4),
+        "mrr": round(statistics.fmean(q["rr"] for q in per_query.values()), 4),
+        "qdrant_bytes_per_query": round(statistics.fmean(qdrant_bytes)),
+        "output_bytes_per_query": round(statistics.fmean(output_bytes)),
+        "per_query": per_query,
+    }
+
+
+async def run_benchmark(args: argparse.Namespace, corpus: dict[str, Any]) -> dict[str, Any]:
+    embedder = HashingEmbedder(args.dim)
+    set_embedder(embedder)
+    profile = VectorStorageProfile(quantization=args.quantization, dimensions=args.dimensions)
+    client = MeteredClient(AsyncQdrantClient(location=":memory:"))
+    for name in (RAG_COLLECTION, MEMORY_COLLECTION):
+        await create_collection(client, name, dimension=embedder.dimension, profile=profile)
+
+    rag = RAGManager(
+        embedder=embedder,
+        collection_name=RAG_COLLECTION,
+        top_k=args.top_k,
+        mmr_lambda=args.mmr_lambda,
+        chunker=SemanticChunker(chunk_size=args.chunk_size),
+        hybrid=args.hybrid,
+        storage_profile=profile,
+    )
+    rag._client = client
+    set_rag_manager(rag)
+
+    chunks = 0
+    for doc in corpus["documents"]:
+        metadata = {"uri": doc["uri"], "source": doc["source"], "context_id": str(CONTEXT_ID)}
+        chunks += await rag.ingest_document(doc["text"], metadata=metadata)
+    if chunks == 0:
+        raise RuntimeError("Ingestion produced no chunks")
+
+    settings = Settings(
+        qdrant_collection=MEMORY_COLLECTION,
+        rag_hybrid_search=args.hybrid,
+        qdrant_quantization=args.quantization,
+        qdrant_vector_dimensions=args.dimensions,
+    )
+    memory = MemoryStore(settings, context_id=CONTEXT_ID, client=client)
+    await memory.ainit()
+    await memory.add_records(
+        MemoryRecord(conversation_id=doc["uri"], text=doc["text"]) for doc in corpus["documents"]
+    )
+
+    tool = RetrievalTool()
+    k = args.top_k
+
+    async def rag_retrieve(query: str) -> RunResult:
+        before = client.bytes
+        docs = await rag.retrieve(query, top_k=k)
+        return [d["uri"] for d in docs], client.bytes - before, len(json.dumps(docs))
+
+    async def memory_search(query: str) -> RunResult:
+        before = client.bytes
+        records = await memory.search(query, limit=k)
+        ids = [r.conversation_id for r in records]
+        return ids, client.bytes - before, sum(len(r.text.encode()) for r in records)
+
+    async def retrieval_tool(query: str) -> RunResult:
+        RetrievalTool._attempt_counts.clear()  # repeats must not hit the attempt cap
+        before = client.bytes
+        output = await tool.run(query, top_k=k, context_id=str(CONTEXT_ID))
+        ids = [r["uri"] for r in json.loads(output)["results"]]
+        return ids, client.bytes - before, len(output.encode())
+
+    queries = corpus["queries"]
+    results = {
+        "rag_retrieve": await measure(queries, rag_retrieve, k=k, repeat=args.repeat),
+        "memory_search": await measure(queries, memory_search, k=k, repeat=args.repeat),
+        "retrieval_tool": await measure(queries, retrieval_tool, k=k, repeat=args.repeat),
+    }
+    await client.close()
+
+    return {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "config": {
+            "corpus": str(args.corpus),
+            "top_k": args.top_k,
+            "mmr_lambda": args.mmr_lambda,
+            "chunk_size": args.chunk_size,
+            "hybrid": args.hybrid,
+            "quantization": args.quantization,
+            "dimensions": args.dimensions,
+            "embedding_dim": args.dim,
+            "repeat": args.repeat,
+        },
+        "corpus": {
+            "documents": len(corpus["documents"]),
+            "chunks": chunks,
+            "queries": len(queries),
+        },
+        "results": results,
+    }
+
+
+def print_report(report: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    config = report["config"]
+    print(
+        f"k={config['top_k']} lambda={config['mmr_lambda']} chunk={config['chunk_size']} "
+        f"hybrid={config['hybrid']} quantization={config['quantization']} "
+        f"dims={config['dimensions'] or config['embedding_dim']}"
+    )
+    print(
+        f"{'target':<16} {'p50 ms':>8} {'p95 ms':>8} {'recall':>7} {'mrr':>7} "
+        f"{'qdrant B':>9} {'output B':>9}"
+    )
+    for name, res in report["results"].items():
+        print(
+            f"{name:<16} {res['p50_ms']:>8.2f} {res['p95_ms']:>8.2f} "
+            f"{res['recall_at_k']:>7.3f} {res['mrr']:>7.3f} "
+            f"{res['qdrant_bytes_per_query']:>9} {res['output_bytes_per_query']:>9}"
+        )
+        if baseline and name in baseline.get("results", {}):
+            base = baseline["results"][name]
+            deltas = "  ".join(
+                f"{metric}={res[metric] - base[metric]:+.3f}"
+                for metric in HEADLINE_METRICS
+                if metric in base
+            )
+            print(f"{'':<16} vs baseline: {deltas}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS, help="Fixture YAML")
+    parser.add_argument("--top-k", type=int, default=5, help="Results per query (k)")
+    parser.add_argument("--mmr-lambda", type=float, default=0.7, help="RAGManager MMR lambda")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="SemanticChunker size")
+    parser.add_argument("--hybrid", action="store_true", help="Dense + sparse fusion")
+    parser.add_argument(
+        "--quantization", choices=["none", "int8", "binary"], default="none", help="Profile"
+    )
+    parser.add_argument("--dimensions", type=int, default=None, help="Matryoshka truncation")
+    parser.add_argument("--dim", type=int, default=256, help="Stub embedding dimension")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing passes over all queries")
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to diff against")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    parser.add_argument(
+        "--fail-under-recall", type=float, default=None, help="Exit 1 if any recall@k is lower"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    corpus = load_corpus(args.corpus)
+    report = asyncio.run(run_benchmark(args, corpus))
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        baseline = json.loads(args.compare.read_text()) if args.compare else None
+        print_report(report, baseline)
+
+    if args.fail_under_recall is not None:
+        worst = min(res["recall_at_k"] for res in report["results"].values())
+        if worst < args.fail_under_recall:
+            print(f"recall@k {worst:.3f} below {args.fail_under_recall:.3f}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
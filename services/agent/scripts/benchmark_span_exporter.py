@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the span exporter (core.observability.tracing._FileSpanExporter).
+
+Two measurements, each for the current buffered exporter and for the
+previous write path (records written synchronously in ``export`` with one
+``json.dumps`` per record and the span log reopened per batch):
+
+- throughput: spans/s from ``export`` until the spans are in the span store
+  (and the JSONL mirror, with --mirror), best of --repeat runs;
+- request latency: a simulated request emitting --spans-per-request nested
+  spans through an OpenTelemetry TracerProvider with a BatchSpanProcessor.
+  p50/p99 are reported with no exporter, the previous path and the current
+  exporter, so the latency each exporter adds to the request path is the
+  difference to the first row.
+
+Usage:
+    python scripts/benchmark_span_exporter.py                 # defaults
+    python scripts/benchmark_span_exporter.py --mirror        # also write spans.jsonl
+    python scripts/benchmark_span_exporter.py --requests 2000 --spans-per-request 50
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
+
+AGENT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(AGENT_ROOT / "src"))
+
+from core.observability.span_store import SpanStore  # noqa: E402
+from core.observability.tracing import _FileSpanExporter  # noqa: E402
+
+
+class LegacyExporter(SpanExporter):
+    """Previous write path: synchronous in ``export``, json.dumps per record."""
+
+    def __init__(self, path: Path, store: SpanStore, mirror: bool) -> None:
+        self._path = path
+        self._store = store
+        self._mirror = mirror
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        records = [_FileSpanExporter._span_record(span) for span in spans]
+        self._store.add(records)
+        if self._mirror:
+            with self._path.open("a", encoding="utf-8") as fp:
+                for record in records:
+                    fp.write(json.dumps(record) + "\n")
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        pass
+
+
+def _make_exporter(kind: str, workdir: Path, mirror: bool, **options: Any) -> tuple[Any, SpanStore]:
+    store = SpanStore(workdir / f"{kind}.db", max_size_mb=1024)
+    path = workdir / f"{kind}.jsonl"
+    if kind == "legacy":
+        return LegacyExporter(path, store, mirror), store
+    return _FileSpanExporter(str(path), store=store, mirror_jsonl=mirror, **options), store
+
+
+def _emit_request(tracer: Any, spans: int) -> None:
+    """One request: a root span with nested children and a few attributes."""
+    with tracer.start_as_current_span("http.request", attributes={"http.route": "/v1/chat"}):
+        for i in range(spans - 1):
+            with tracer.start_as_current_span(
+                f"step.{i % 8}", attributes={"context_id": "ctx-bench", "step": i}
+            ) as span:
+                span.add_event("debug.step", {"debug.event_type": "skill_step"})
+
+
+def _sample_spans(count: int) -> list[ReadableSpan]:
+    finished: list[ReadableSpan] = []
+
+    class Collector(SpanExporter):
+        def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+            finished.extend(spans)
+            return SpanExportResult.SUCCESS
+
+    provider = TracerProvider()
+    provider.add_span_processor(BatchSpanProcessor(Collector(), max_export_batch_size=512))
+    tracer = provider.get_tracer("bench")
+    for _ in range(count // 50 + 1):
+        _emit_request(tracer, 50)
+    provider.shutdown()
+    return finished[:count]
+
+
+def throughput(kind: str, spans: list[ReadableSpan], mirror: bool, batch: int) -> float:
+    """Spans/s from export() until the spans are stored."""
+    with tempfile.TemporaryDirectory() as tmp:
+        # export() outpaces the writer here; size the buffer so nothing is dropped
+        options = {"max_queue_size": len(spans)} if kind == "current" else {}
+        exporter, store = _make_exporter(kind, Path(tmp), mirror, **options)
+        start = time.perf_counter()
+        for offset in range(0, len(spans), batch):
+            exporter.export(spans[offset : offset + batch])
+        exporter.shutdown()
+        elapsed = time.perf_counter() - start
+        stored = store.count()
+        store.close()
+    if stored != len(spans):
+        raise RuntimeError(f"{kind}: stored {stored} of {len(spans)} spans")
+    return len(spans) / elapsed
+
+
+def request_latency(kind: str | None, args: argparse.Namespace) -> tuple[float, float]:
+    """p50 and p99 request time in ms with the given exporter (None: no exporter)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        provider = TracerProvider()
+        store = None
+        if kind is not None:
+            exporter, store = _make_exporter(kind, Path(tmp), args.mirror)
+            provider.add_span_processor(
+                BatchSpanProcessor(exporter, schedule_delay_millis=200, max_export_batch_size=512)
+            )
+        tracer = provider.get_tracer("bench")
+        for _ in range(args.warmup):
+            _emit_request(tracer, args.spans_per_request)
+        samples: list[float] = []
+        for _ in range(args.requests):
+            start = time.perf_counter()
+            _emit_request(tracer, args.spans_per_request)
+            samples.append((time.perf_counter() - start) * 1000)
+            # Leave the processor thread time to run, as between real requests
+            time.sleep(args.gap_ms / 1000)
+        provider.shutdown()
+        if store is not None:
+            store.close()
+        dropped = getattr(exporter, "dropped_spans", 0) if kind is not None else 0
+        if dropped:
+            print(f"  ({kind}: {dropped} spans dropped by the exporter buffer)")
+    quantiles = statistics.quantiles(samples, n=100)
+    return quantiles[49], quantiles[98]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--spans", type=int, default=50_000, help="Spans for the throughput run")
+    parser.add_argument("--batch", type=int, default=512, help="Spans per export() call")
+    parser.add_argument("--repeat", type=int, default=3, help="Throughput runs (best is shown)")
+    parser.add_argument("--requests", type=int, default=1000, help="Simulated requests")
+    parser.add_argument("--warmup", type=int, default=100, help="Requests before timing")
+    parser.add_argument("--spans-per-request", type=int, default=50, help="Spans per request")
+    parser.add_argument("--gap-ms", type=float, default=1.0, help="Pause between requests")
+    parser.add_argument("--mirror", action="store_true", help="Also write the JSONL mirror")
+    args = parser.parse_args()
+
+    spans = _sample_spans(args.spans)
+    print(f"Throughput ({len(spans)} spans, {args.batch} per export, mirror={args.mirror})")
+    rates: dict[str, list[float]] = {"legacy": [], "current": []}
+    for _ in range(args.repeat):
+        # Alternate the runs so page cache and CPU frequency effects hit both
+        for kind, samples in rates.items():
+            samples.append(throughput(kind, spans, args.mirror, args.batch))
+    for kind, samples in rates.items():
+        print(f"  {kind:<8} {max(samples):>10,.0f} spans/s")
+
+    print(f"\nRequest latency ({args.requests} requests x {args.spans_per_request} spans)")
+    print(f"  {'exporter':<8} {'p50 ms':>8} {'p99 ms':>8} {'+p99 ms':>8}")
+    base_p50, base_p99 = request_latency(None, args)
+    print(f"  {'none':<8} {base_p50:>8.2f} {base_p99:>8.2f} {0:>8.2f}")
+    for kind in ("legacy", "current"):
+        p50, p99 = request_latency(kind, args)
+        print(f"  {kind:<8} {p50:>8.2f} {p99:>8.2f} {p99 - base_p99:>8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import logging
 from collections.abc import AsyncGenerator, Callable
-from datetime import datetime
 from typing import Any
 
 import orjson
@@ -15,6 +14,7 @@ from core.models.pydantic_schemas import PlanEvent, TraceContext
 from core.observability.logging import log_event
 from core.observability.tracing import current_trace_ids, start_span
 from core.runtime.litellm_client import LiteLLMClient
+from core.runtime.prompt_layout import current_time_context
 
 LOGGER = logging.getLogger(__name__)
 
@@ -169,24 +169,13 @@ class PlannerAgent:
         except (TypeError, ValueError):
             metadata_text = str(request.metadata)
 
-        now = datetime.now().strftime("%Y-%m-%d %H:%M")
-        today = datetime.now().strftime("%Y-%m-%d")
-        year = datetime.now().year
-
-        system_context = (
-            "SYSTEM CONTEXT:\n"
-            f"- Current Date & Time: {now}\n"
-            f"- Your knowledge cutoff is static, but YOU ARE LIVE in {year}.\n"
-            f"- Treat all retrieved documents dated up to {today} "
-            "as HISTORICAL FACTS, not predictions.\n"
-        )
-
         # Optimized prompt for Llama 3.3 70B - concise, structured, clear rules
         # Uses skills-native format: executor="skill", action="skill"
+        # Static for a given skill index so it forms a cacheable prompt prefix;
+        # the current time goes into the user message below
         system_message = AgentMessage(
             role="system",
             content=(
-                f"{system_context}\n"
                 "# PLANNER AGENT\n\n"
                 "You generate JSON execution plans. You are an ORCHESTRATOR - "
                 "delegate ALL work to skills.\n\n"
@@ -216,7 +205,10 @@ class PlannerAgent:
                 "4. COMPLETION RULES (CRITICAL):\n"
                 "   - NEVER add completion step if plan has ANY skills\n"
                 "   - Skills communicate via history, skill output IS the answer\n"
-                "   - User sees skill output directly, no synthesis needed\n\n"
+                "   - User sees skill output directly, no synthesis needed\n"
+                "5. PARALLEL STEPS: steps run in order by default. When steps are independent,\n"
+                '   give EVERY step a "depends_on" list of the step ids it needs ([] for none)\n'
+                "   so independent steps run at the same time\n\n"
                 "## MULTI-TURN SKILL ROUTING (CRITICAL)\n"
                 "If history contains `[AWAITING_USER_INPUT:*]` from a skill:\n"
                 "- The user's current message is answering that skill's question\n"
@@ -239,6 +231,12 @@ class PlannerAgent:
                 '"tool":"deep_research","args":{"goal":"Research X"}},'
                 '{"id":"2","label":"Draft","executor":"skill","action":"skill",'
                 '"tool":"requirements_drafter","args":{"goal":"Draft based on research"}}]}\n\n'
+                '"Compare Rust and Go" → independent skills in parallel (NO completion):\n'
+                '{"description":"Two topics","steps":['
+                '{"id":"1","label":"Research Rust","executor":"skill","action":"skill",'
+                '"tool":"researcher","args":{"goal":"Rust strengths"},"depends_on":[]},'
+                '{"id":"2","label":"Research Go","executor":"skill","action":"skill",'
+                '"tool":"researcher","args":{"goal":"Go strengths"},"depends_on":[]}]}\n\n'
                 "Multi-turn (history has [AWAITING_USER_INPUT:team_selection], user says "
                 '"security"):\n'
                 '{"description":"Continue drafting","steps":[{"id":"1","label":"Continue draft",'
@@ -254,6 +252,7 @@ class PlannerAgent:
             role="user",
             content=(
                 f"### AVAILABLE TOOLS\n{available_tools_text}\n\n"
+                f"{current_time_context()}\n"
                 f"### USER REQUEST\n{sanitized_prompt}\n\n"
                 f"### CONTEXT (History)\n{history_text}\n\n"
                 f"### METADATA\n{metadata_text}\n\n"
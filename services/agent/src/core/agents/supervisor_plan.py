@@ -10,7 +10,8 @@ from shared.models import AgentMessage, Plan
 
 from core.models.pydantic_schemas import SupervisorDecision, TraceContext
 from core.observability.logging import log_event
-from core.observability.tracing import current_trace_ids, start_span
+from core.observability.profiler import phase
+from core.observability.tracing import current_trace_ids
 
 if TYPE_CHECKING:
     from core.runtime.litellm_client import LiteLLMClient
@@ -62,7 +63,7 @@ class PlanSupervisorAgent:
         Returns:
             The validated plan.
         """
-        with start_span(
+        with phase(
             "supervisor.plan_review",
             attributes={"plan.steps": len(plan.steps) if plan.steps else 0},
         ) as span:
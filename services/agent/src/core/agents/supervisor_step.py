@@ -10,6 +10,7 @@ from shared.models import AgentMessage, PlanStep, StepOutcome, StepResult
 
 from core.models.pydantic_schemas import SupervisorDecision, TraceContext
 from core.observability.logging import log_event
+from core.observability.profiler import phase
 from core.observability.tracing import current_trace_ids, start_span
 from core.runtime.litellm_client import LiteLLMClient
 
@@ -255,7 +256,7 @@ class StepSupervisorAgent:
             ),
         )
 
-        with start_span(
+        with phase(
             "supervisor.step_review",
             attributes={
                 "step_id": step.id,
@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from core.auth.header_auth import UserIdentity
 from core.auth.user_service import get_or_create_user, get_user_default_context
 from core.db.models import Context, Conversation, UserContext
+from core.observability.profiler import profiled_phase
 
 LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +25,7 @@ class ContextService:
     """Resolves or creates Context records for different adapter scenarios."""
 
     @staticmethod
+    @profiled_phase("context.resolve")
     async def resolve_for_authenticated_user(identity: UserIdentity, session: AsyncSession) -> UUID:
         """Resolve context for an authenticated user.
 
@@ -78,6 +80,7 @@ class ContextService:
         return context.id
 
     @staticmethod
+    @profiled_phase("context.resolve")
     async def resolve_for_platform(platform: str, platform_id: str, session: AsyncSession) -> UUID:
         """Resolve context for a platform conversation (Telegram, API).
 
@@ -111,6 +114,7 @@ class ContextService:
         return context.id
 
     @staticmethod
+    @profiled_phase("context.resolve")
     async def resolve_for_conversation_id(
         conversation_id_str: str, platform: str, session: AsyncSession
     ) -> UUID:
@@ -167,6 +171,7 @@ class ContextService:
         return context.id
 
     @staticmethod
+    @profiled_phase("context.resolve")
     async def resolve_anonymous(platform: str, session: AsyncSession) -> UUID:
         """Create an ephemeral context when there is no identity or conversation.
 
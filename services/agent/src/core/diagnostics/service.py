@@ -4,7 +4,7 @@ import asyncio
 import json
 import logging
 import time
-from collections import Counter, deque
+from collections import Counter
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -18,6 +18,7 @@ from pydantic import BaseModel
 from sqlalchemy import text
 
 from core.db.engine import engine
+from core.observability.span_store import SpanStore, get_span_store
 from core.providers import get_embedder
 from core.runtime.config import Settings
 
@@ -75,10 +76,22 @@ class DiagnosticsService:
         self._settings = settings
         self._trace_log_path = Path(str(settings.trace_span_log_path or "data/spans.jsonl"))
 
-    def _read_trace_lines(self) -> deque[str]:
-        """Read trace log lines synchronously (called via asyncio.to_thread)."""
-        with self._trace_log_path.open("r", encoding="utf-8") as f:
-            return deque(f, maxlen=3000)
+    def _span_store(self) -> SpanStore | None:
+        """Return the indexed span store for the trace log, or None if nothing was traced."""
+        return get_span_store(self._trace_log_path)
+
+    def _read_recent_span_records(self, limit: int = 3000) -> list[dict[str, Any]]:
+        """Read the most recent span records (called via asyncio.to_thread)."""
+        store = self._span_store()
+        return store.recent_spans(limit) if store else []
+
+    def get_spans_since(self, start_time: datetime) -> list[dict[str, Any]]:
+        """Read span records started at or after ``start_time`` (naive UTC).
+
+        Blocking; async callers use ``asyncio.to_thread``.
+        """
+        store = self._span_store()
+        return store.spans_since(start_time.isoformat()) if store else []
 
     def _calculate_percentiles(self, durations: list[float]) -> dict[str, float]:
         """Calculate p50, p95, p99 latency percentiles from duration list.
@@ -127,18 +140,18 @@ class DiagnosticsService:
             "latency_percentiles": {"p50": 0.0, "p95": 0.0, "p99": 0.0},
         }
 
-        if not self._trace_log_path.exists():
+        if self._span_store() is None:
             return {
                 "status": "UNKNOWN",
                 "metrics": metrics,
                 "reason": "No trace log found",
             }
 
-        # Read last N lines efficiently
-        # We read more lines than window size to ensure we capture full traces
-        # Assuming average 10 spans per trace, 3000 lines covers ~300 traces
+        # Read the last N spans from the store
+        # We read more spans than window size to ensure we capture full traces
+        # Assuming average 10 spans per trace, 3000 spans covers ~300 traces
         try:
-            lines = await asyncio.to_thread(self._read_trace_lines)
+            records = await asyncio.to_thread(self._read_recent_span_records)
         except Exception as e:
             LOGGER.error(f"Failed to read trace log: {e}")
             return {
@@ -155,21 +168,17 @@ class DiagnosticsService:
         error_traces = set()
 
         # Reverse iterate to get newest first
-        for line in reversed(lines):
-            try:
-                span = json.loads(line)
-                trace_id = span.get("context", {}).get("trace_id")
-                if not trace_id:
-                    continue
+        for span in reversed(records):
+            trace_id = span.get("context", {}).get("trace_id")
+            if not trace_id:
+                continue
 
-                if trace_id not in recent_traces:
-                    if len(recent_traces) >= window:
-                        continue
-                    recent_traces[trace_id] = []
+            if trace_id not in recent_traces:
+                if len(recent_traces) >= window:
+                    continue
+                recent_traces[trace_id] = []
 
-                recent_traces[trace_id].append(span)
-            except json.JSONDecodeError:
-                continue
+            recent_traces[trace_id].append(span)
 
         # Analyze traces
         total_requests = len(recent_traces)
@@ -1245,36 +1254,21 @@ class DiagnosticsService:
             return None
 
     def _read_trace_spans_by_id(self, trace_id: str) -> list[TraceSpan]:
-        """Search entire file for spans matching trace_id (called via asyncio.to_thread)."""
-        raw_spans: list[TraceSpan] = []
-        with self._trace_log_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                if trace_id not in line:
-                    continue
-                try:
-                    data = json.loads(line)
-                    span = self._parse_span(data)
-                    if span:
-                        raw_spans.append(span)
-                except (json.JSONDecodeError, ValueError):
-                    continue
-        return raw_spans
+        """Look up spans matching trace_id in the span store (called via asyncio.to_thread)."""
+        store = self._span_store()
+        if store is None:
+            return []
+        return [
+            span for data in store.spans_for_trace(trace_id) if (span := self._parse_span(data))
+        ]
 
     def _read_recent_trace_spans(self, limit: int) -> list[TraceSpan]:
-        """Read recent trace spans from tail of file (called via asyncio.to_thread)."""
-        raw_spans: list[TraceSpan] = []
-        with self._trace_log_path.open("r", encoding="utf-8") as f:
-            last_lines = deque(f, maxlen=limit)
-
-        for line in last_lines:
-            try:
-                data = json.loads(line)
-                span = self._parse_span(data)
-                if span:
-                    raw_spans.append(span)
-            except (json.JSONDecodeError, ValueError):
-                continue
-        return raw_spans
+        """Read the most recent spans from the span store (called via asyncio.to_thread)."""
+        return [
+            span
+            for data in self._read_recent_span_records(limit)
+            if (span := self._parse_span(data))
+        ]
 
     async def get_recent_traces(
         self, limit: int = 1000, show_all: bool = False, trace_id: str | None = None
@@ -1287,13 +1281,13 @@ class DiagnosticsService:
             show_all: If True, include diagnostic/health-check traces. Default False.
             trace_id: If provided, filter to traces containing this ID (partial match).
         """
-        if not self._trace_log_path.exists():
+        if self._span_store() is None:
             LOGGER.warning(f"Trace log not found at {self._trace_log_path}")
             return []
 
         # 1. Read Raw Spans
-        # When trace_id is specified, search the entire file for matching spans
-        # Otherwise, read only the last N lines for performance
+        # When trace_id is specified, look up its spans by index
+        # Otherwise, read only the last N spans
         raw_spans: list[TraceSpan] = []
         try:
             if trace_id:
@@ -4,19 +4,24 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections.abc import Callable
 from contextlib import AsyncExitStack, suppress
 from datetime import datetime, timedelta
 from enum import Enum, auto
 from typing import Any
 from uuid import UUID
 
+from mcp import types as mcp_types
 from mcp.client.session import ClientSession
 from mcp.client.sse import sse_client
 from mcp.client.streamable_http import streamablehttp_client
 from mcp.shared.exceptions import McpError
 from pydantic import AnyUrl
 
+from core.mcp.schema_cache import McpSchemaCache, server_fingerprint
 from core.models.mcp import McpPrompt, McpResource, McpTool
+from core.observability.metrics import record_mcp_schema_cache
 from core.observability.tracing import start_span
 
 LOGGER = logging.getLogger(__name__)
@@ -47,6 +52,8 @@ class McpClient:
     - Automatic reconnection with exponential backoff
     - Connection state tracking
     - Cache TTL for tools/resources/prompts
+    - Optional persistent schema cache so reconnects skip the list calls
+    - Refresh on ``notifications/*/list_changed`` from the server
     - Support for full MCP protocol (Tools, Resources, Prompts)
     """
 
@@ -61,6 +68,8 @@ class McpClient:
         context_id: UUID | None = None,
         oauth_provider: str | None = None,
         transport: McpTransport = McpTransport.AUTO,
+        schema_cache: McpSchemaCache | None = None,
+        on_schemas_changed: Callable[[], None] | None = None,
     ) -> None:
         self._url = url
         self._name = name
@@ -80,6 +89,10 @@ class McpClient:
         self._prompts_cache: list[McpPrompt] = []
         self._cache_timestamp: datetime | None = None
         self._cache_ttl = timedelta(seconds=cache_ttl_seconds)
+        self._schema_cache = schema_cache
+        self._server_fingerprint: str | None = None
+        self._on_schemas_changed = on_schemas_changed
+        self._refresh_task: asyncio.Task[None] | None = None
 
         # Connection management
         self._state = McpConnectionState.DISCONNECTED
@@ -87,6 +100,11 @@ class McpClient:
         self._max_retries = max_retries
         self._connect_lock = asyncio.Lock()
 
+        # Liveness tracking, read by the pool's health supervisor
+        self._last_seen: float | None = None
+        self._reconnect_count = 0
+        self._has_connected = False
+
     @property
     def name(self) -> str:
         """Server name identifier."""
@@ -117,6 +135,19 @@ class McpClient:
         """Cached prompts."""
         return self._prompts_cache
 
+    @property
+    def last_seen(self) -> float | None:
+        """Monotonic time of the last successful exchange with the server."""
+        return self._last_seen
+
+    @property
+    def reconnect_count(self) -> int:
+        """Number of successful connections after the first one."""
+        return self._reconnect_count
+
+    def _mark_seen(self) -> None:
+        self._last_seen = time.monotonic()
+
     def is_cache_stale(self) -> bool:
         """Check if cache needs refresh."""
         if not self._cache_timestamp:
@@ -165,6 +196,10 @@ class McpClient:
                 try:
                     await self._establish_connection()
                     self._state = McpConnectionState.CONNECTED
+                    if self._has_connected:
+                        self._reconnect_count += 1
+                    self._has_connected = True
+                    self._mark_seen()
                     return
                 except TimeoutError:
                     LOGGER.warning(
@@ -242,7 +277,7 @@ class McpClient:
                     getattr(self._mcp_session, "server_info", "N/A"),
                 )
 
-            await self.refresh_cache()
+            await self._load_schemas()
 
         except Exception as e:
             LOGGER.error("Failed to connect to MCP %s: %s", self._name, e, exc_info=True)
@@ -257,9 +292,10 @@ class McpClient:
         )
         read_stream, write_stream = streams
 
-        session = ClientSession(read_stream, write_stream)
+        session = ClientSession(read_stream, write_stream, message_handler=self._handle_message)
         self._mcp_session = await self._exit_stack.enter_async_context(session)
-        await asyncio.wait_for(self._mcp_session.initialize(), timeout=8.0)
+        init_result = await asyncio.wait_for(self._mcp_session.initialize(), timeout=8.0)
+        self._server_fingerprint = server_fingerprint(init_result)
 
     async def _connect_streamable_http(self, headers: dict[str, str]) -> None:
         """Connect using the Streamable HTTP transport (spec 2025-03-26+)."""
@@ -272,13 +308,18 @@ class McpClient:
         # streamablehttp_client returns (read, write, get_session_id)
         read_stream, write_stream = streams[0], streams[1]
 
-        session = ClientSession(read_stream, write_stream)
+        session = ClientSession(read_stream, write_stream, message_handler=self._handle_message)
         self._mcp_session = await self._exit_stack.enter_async_context(session)
-        await asyncio.wait_for(self._mcp_session.initialize(), timeout=8.0)
+        init_result = await asyncio.wait_for(self._mcp_session.initialize(), timeout=8.0)
+        self._server_fingerprint = server_fingerprint(init_result)
 
     async def _cleanup_connection(self) -> None:
         """Clean up connection resources."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
         self._mcp_session = None
+        self._server_fingerprint = None
         with suppress(Exception):
             await self._exit_stack.aclose()
         self._exit_stack = AsyncExitStack()
@@ -289,17 +330,59 @@ class McpClient:
         self._state = McpConnectionState.DISCONNECTED
         LOGGER.info("Disconnected from MCP server %s.", self._name)
 
-    async def refresh_cache(self) -> None:
-        """Refresh tools, resources, and prompts from server."""
+    async def reconnect(self) -> None:
+        """Drop the current session (if any) and connect again."""
+        async with self._connect_lock:
+            await self._cleanup_connection()
+            self._state = McpConnectionState.DISCONNECTED
+        await self.connect()
+
+    def _schema_cache_key(self) -> str | None:
+        if self._schema_cache is None or self._server_fingerprint is None:
+            return None
+        return McpSchemaCache.make_key(self._url, self._server_fingerprint, self._context_id)
+
+    async def _load_schemas(self) -> None:
+        """Populate the caches from the persistent schema cache, or list them."""
+        key = self._schema_cache_key()
+        if self._schema_cache is not None and key is not None:
+            try:
+                entry = await asyncio.to_thread(self._schema_cache.get, key)
+            except Exception:
+                LOGGER.warning("MCP schema cache lookup failed for %s", self._name, exc_info=True)
+                entry = None
+            record_mcp_schema_cache(hit=entry is not None)
+            if entry is not None:
+                self._tools_cache = entry.tools
+                self._resources_cache = entry.resources
+                self._prompts_cache = entry.prompts
+                self._cache_timestamp = datetime.fromtimestamp(entry.fetched_at)
+                LOGGER.info(
+                    "Loaded %d cached tools for %s (no list calls)",
+                    len(self._tools_cache),
+                    self._name,
+                )
+                return
+        await self.refresh_cache()
+
+    async def refresh_cache(self) -> bool:
+        """Refresh tools, resources, and prompts from server.
+
+        Returns:
+            True if the listing differs from what was cached before.
+        """
         if not self._mcp_session:
             LOGGER.warning("Cannot refresh cache: not connected")
-            return
+            return False
 
+        previous = (self._tools_cache, self._resources_cache, self._prompts_cache)
+        tools_loaded = False
         with start_span(f"mcp.refresh.{self._name}"):
             # Refresh tools
             try:
                 tools_result = await self._mcp_session.list_tools()
                 self._tools_cache = [McpTool(**t.model_dump()) for t in tools_result.tools]
+                tools_loaded = True
                 LOGGER.info("Loaded %d tools from %s", len(self._tools_cache), self._name)
             except Exception as e:
                 LOGGER.error("Failed to load tools from %s: %s", self._name, e)
@@ -334,6 +417,49 @@ class McpClient:
 
             self._cache_timestamp = datetime.now()
 
+        key = self._schema_cache_key()
+        if tools_loaded and self._schema_cache is not None and key is not None:
+            try:
+                await asyncio.to_thread(
+                    self._schema_cache.put,
+                    key,
+                    self._url,
+                    self._tools_cache,
+                    self._resources_cache,
+                    self._prompts_cache,
+                )
+            except Exception:
+                LOGGER.warning("Failed to persist MCP schemas for %s", self._name, exc_info=True)
+
+        return previous != (self._tools_cache, self._resources_cache, self._prompts_cache)
+
+    async def _handle_message(self, message: Any) -> None:
+        """Session message handler: schedule a refresh on ``list_changed`` notifications."""
+        if not isinstance(message, mcp_types.ServerNotification):
+            return
+        if not isinstance(
+            message.root,
+            mcp_types.ToolListChangedNotification
+            | mcp_types.ResourceListChangedNotification
+            | mcp_types.PromptListChangedNotification,
+        ):
+            return
+        # The handler runs inside the session's receive loop, so the list calls
+        # (which wait on that loop for their responses) must run in a task.
+        # Notifications arriving while a refresh runs coalesce into it.
+        if self._refresh_task is None or self._refresh_task.done():
+            LOGGER.info("MCP server %s reported a list change; refreshing", self._name)
+            self._refresh_task = asyncio.create_task(self._refresh_after_change())
+
+    async def _refresh_after_change(self) -> None:
+        try:
+            changed = await self.refresh_cache()
+        except Exception:
+            LOGGER.warning("MCP refresh after list change failed for %s", self._name, exc_info=True)
+            return
+        if changed and self._on_schemas_changed is not None:
+            self._on_schemas_changed()
+
     async def get_tools(self) -> list[McpTool]:
         """Fetch tool definitions from the MCP server.
 
@@ -369,6 +495,7 @@ class McpClient:
         ):
             try:
                 result = await self._mcp_session.call_tool(tool_name, arguments=args)
+                self._mark_seen()
                 LOGGER.info("Successfully executed MCP tool '%s' on %s.", tool_name, self._name)
                 # MCP protocol returns a CallToolResult object, convert to dict
                 return result.model_dump() if hasattr(result, "model_dump") else dict(result)
@@ -403,6 +530,7 @@ class McpClient:
             attributes={"mcp.server": self._name, "mcp.resource_uri": uri},
         ):
             result = await self._mcp_session.read_resource(AnyUrl(uri))
+            self._mark_seen()
             # MCP protocol returns ReadResourceResult with .contents list
             # Contents are TextResourceContents or BlobResourceContents (Pydantic models)
             # Always convert to dicts for consistent return type
@@ -420,6 +548,7 @@ class McpClient:
             attributes={"mcp.server": self._name, "mcp.prompt": name},
         ):
             result = await self._mcp_session.get_prompt(name, arguments or {})
+            self._mark_seen()
             # MCP protocol returns GetPromptResult, convert to dict
             return result.model_dump() if hasattr(result, "model_dump") else dict(result)
 
@@ -434,6 +563,7 @@ class McpClient:
         try:
             # Use MCP protocol's native ping for lightweight health check
             await asyncio.wait_for(self._mcp_session.send_ping(), timeout=5.0)
+            self._mark_seen()
             return True
         except Exception:
             LOGGER.debug(
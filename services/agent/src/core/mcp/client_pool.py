@@ -4,7 +4,7 @@ This module manages MCP clients on a per-context basis, enabling:
 - OAuth token-based authentication (per-context isolation)
 - Client caching and reuse
 - Automatic reconnection on connection loss
-- Health monitoring
+- Background health supervision (idle pings, jittered reconnect backoff)
 - Graceful shutdown
 """
 
@@ -12,8 +12,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 import time
 from collections import defaultdict
+from contextlib import suppress
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
@@ -23,25 +26,44 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.db.oauth_models import OAuthToken
 from core.mcp.client import McpClient
+from core.mcp.schema_cache import McpSchemaCache
 from core.runtime.config import Settings
 
 LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class _Supervision:
+    """Reconnect bookkeeping for one pooled client."""
+
+    failures: int = 0
+    next_attempt: float = 0.0
+
+
 class McpClientPool:
     """Manages MCP clients per context with OAuth token support.
 
     Each context can have multiple MCP clients (one per provider).
     Clients are created on-demand and cached for reuse.
+
+    Health is tracked off the request path: a background supervisor treats
+    recent successful calls as proof of liveness, pings only idle clients,
+    and reconnects failed ones with jittered exponential backoff. Requests
+    read the resulting health table without any network round-trip.
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, schema_cache: McpSchemaCache | None = None):
         """Initialize the MCP client pool.
 
         Args:
             settings: Application settings
+            schema_cache: Optional persistent cache of server listings, shared by
+                all clients so reconnects and restarts skip the list calls
         """
         self._settings = settings
+        self._schema_cache = schema_cache
+        # Listings are re-fetched when they outlive the persistent cache's TTL
+        self._schema_ttl_seconds = int(schema_cache.ttl_seconds) if schema_cache else 300
         self._pools: dict[UUID, list[McpClient]] = defaultdict(list)
         self._locks: dict[UUID, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._timestamps: dict[UUID, float] = {}
@@ -50,6 +72,17 @@ class McpClientPool:
         self._negative_cache_ttl = 300  # Don't retry failed connections for 5 minutes
         self._eviction_task: asyncio.Task[None] | None = None
 
+        # Health supervision
+        self._healthy: dict[UUID, list[McpClient]] = {}  # context_id → connected clients
+        self._supervision: dict[McpClient, _Supervision] = {}
+        self._supervise_interval = 15.0
+        self._idle_ping_after = 60.0  # Ping only clients without traffic for this long
+        self._ping_timeout = 2.0
+        self._reconnect_timeout = 10.0
+        self._backoff_base = 1.0
+        self._backoff_max = 300.0
+        self._supervisor_task: asyncio.Task[None] | None = None
+
     async def get_clients(
         self,
         context_id: UUID,
@@ -59,18 +92,17 @@ class McpClientPool:
 
         This method:
         1. Checks negative cache (skip if recently failed)
-        2. Checks cache for existing clients
-        3. Validates cached clients are still connected
-        4. Loads OAuth tokens for this context
-        5. Creates clients for each authorized provider
-        6. Caches clients for reuse
+        2. Returns the healthy clients of an already pooled context (no I/O)
+        3. Loads OAuth tokens for this context
+        4. Creates clients for each authorized provider
+        5. Caches clients for reuse
 
         Args:
             context_id: Context UUID
             session: Database session for loading OAuth tokens
 
         Returns:
-            List of MCP clients for this context (may be empty)
+            List of connected MCP clients for this context (may be empty)
         """
         # Check negative cache - don't retry recently failed connections
         if context_id in self._negative_cache:
@@ -86,71 +118,17 @@ class McpClientPool:
             # TTL expired - clear negative cache and retry
             del self._negative_cache[context_id]
 
-        # Check cache first and validate existing clients
-        if context_id in self._pools and self._pools[context_id]:
-            # Parallelize health checks for all cached clients
-            async def check_client_health(client: McpClient) -> McpClient | None:
-                """Check if a client is healthy. Returns client if healthy, None otherwise."""
-                if not client.is_connected:
-                    LOGGER.warning("Client %s disconnected, removing from pool", client.name)
-                    try:
-                        await client.disconnect()
-                    except Exception as e:
-                        LOGGER.error("Error disconnecting stale client: %s", e)
-                    return None
-
-                try:
-                    # Quick ping to verify connection
-                    is_healthy = await asyncio.wait_for(client.ping(), timeout=2.0)
-                    if is_healthy:
-                        return client
-                    else:
-                        LOGGER.warning(
-                            "Client %s failed health check, removing from pool", client.name
-                        )
-                        try:
-                            await client.disconnect()
-                        except Exception as e:
-                            LOGGER.error("Error disconnecting unhealthy client: %s", e)
-                        return None
-                except TimeoutError:
-                    LOGGER.warning("Client %s ping timeout, removing from pool", client.name)
-                    try:
-                        await client.disconnect()
-                    except Exception as e:
-                        LOGGER.error("Error disconnecting timed-out client: %s", e)
-                    return None
-
-            # Check all clients in parallel
-            health_results = await asyncio.gather(
-                *[check_client_health(client) for client in self._pools[context_id]],
-                return_exceptions=True,
-            )
-
-            # Filter out None results and exceptions
-            valid_clients: list[McpClient] = []
-            for health_check_result in health_results:
-                if isinstance(health_check_result, McpClient):
-                    valid_clients.append(health_check_result)
-                elif isinstance(health_check_result, Exception):
-                    LOGGER.error("Error during health check: %s", health_check_result)
-                # else: health_check_result is None, skip
-
-            if valid_clients:
-                self._pools[context_id] = valid_clients
-                LOGGER.debug(
-                    "Using %d cached MCP clients for context %s",
-                    len(valid_clients),
-                    context_id,
-                )
-                return valid_clients
+        # Pooled context: the supervisor keeps the health table current and
+        # reconnects failed clients in the background
+        if self._pools.get(context_id):
+            return self._healthy.get(context_id, [])
 
         # Need to create new clients - acquire lock to prevent duplicates
         async with self._locks[context_id]:
             # Double-check after acquiring lock
-            if context_id in self._pools and self._pools[context_id]:
+            if self._pools.get(context_id):
                 LOGGER.debug("Found clients after acquiring lock for context %s", context_id)
-                return self._pools[context_id]
+                return self._healthy.get(context_id, [])
 
             # Load OAuth tokens for this context
             stmt = select(OAuthToken).where(OAuthToken.context_id == context_id)
@@ -177,7 +155,9 @@ class McpClientPool:
                             name="Context7",
                             auto_reconnect=True,
                             max_retries=1,
-                            cache_ttl_seconds=300,
+                            cache_ttl_seconds=self._schema_ttl_seconds,
+                            schema_cache=self._schema_cache,
+                            on_schemas_changed=lambda: self._clients_changed(context_id),
                         )
                         await asyncio.wait_for(client.connect(), timeout=5.0)
                         clients.append(client)
@@ -198,10 +178,12 @@ class McpClientPool:
 
             # Store in cache with timestamp for eviction
             self._pools[context_id] = clients
+            self._healthy[context_id] = list(clients)
             self._timestamps[context_id] = time.monotonic()
 
             if clients:
                 LOGGER.info("Created %d MCP clients for context %s", len(clients), context_id)
+                self._clients_changed(context_id)
                 # Clear negative cache on success
                 self._negative_cache.pop(context_id, None)
             elif connection_attempted:
@@ -314,8 +296,10 @@ class McpClientPool:
                     name=server.name,
                     auto_reconnect=True,
                     max_retries=1,
-                    cache_ttl_seconds=300,
+                    cache_ttl_seconds=self._schema_ttl_seconds,
                     transport=transport,
+                    schema_cache=self._schema_cache,
+                    on_schemas_changed=lambda: self._clients_changed(context_id),
                 )
                 await asyncio.wait_for(client.connect(), timeout=10.0)
                 clients.append(client)
@@ -370,10 +354,14 @@ class McpClientPool:
                 disconnect_errors.append((client.name, e))
                 LOGGER.warning("Error disconnecting %s: %s", client.name, e)
 
-        # Remove from pool, timestamps, and locks
+        # Remove from pool, health table, timestamps, and locks
         del self._pools[context_id]
+        self._healthy.pop(context_id, None)
+        for client in clients:
+            self._supervision.pop(client, None)
         self._timestamps.pop(context_id, None)
         self._locks.pop(context_id, None)
+        self._clients_changed(context_id)
 
         if disconnect_errors:
             LOGGER.warning(
@@ -387,6 +375,103 @@ class McpClientPool:
                 "Successfully disconnected %d clients for context %s", len(clients), context_id
             )
 
+    @staticmethod
+    def _clients_changed(context_id: UUID) -> None:
+        """Invalidate the context's cached AgentService, whose MCP tools are now stale."""
+        from core.runtime.service_factory import invalidate_context_services
+
+        invalidate_context_services(context_id)
+
+    async def _supervisor_loop(self) -> None:
+        """Periodically check client health and reconnect failed clients."""
+        while True:
+            await asyncio.sleep(self._supervise_interval)
+            try:
+                await self._supervise()
+            except Exception:
+                LOGGER.exception("MCP health supervision pass failed")
+
+    async def _supervise(self) -> None:
+        """Run one supervision pass over every pooled client."""
+        pooled = [
+            (context_id, client)
+            for context_id, clients in list(self._pools.items())
+            for client in clients
+        ]
+        await asyncio.gather(*(self._check_client(ctx, client) for ctx, client in pooled))
+
+        for context_id in {ctx for ctx, _ in pooled}:
+            clients = self._pools.get(context_id)
+            if not clients:
+                continue
+            healthy = [client for client in clients if client.is_connected]
+            if healthy != self._healthy.get(context_id):
+                self._healthy[context_id] = healthy
+                self._clients_changed(context_id)
+
+    async def _check_client(self, context_id: UUID, client: McpClient) -> None:
+        """Ping an idle client, or reconnect a failed one once its backoff expires.
+
+        Healthy clients whose listings outlived their TTL are refreshed here too.
+        """
+        state = self._supervision.setdefault(client, _Supervision())
+        now = time.monotonic()
+
+        if client.is_connected:
+            # Recent successful traffic proves liveness
+            alive = client.last_seen is not None and now - client.last_seen < self._idle_ping_after
+            if not alive:
+                with suppress(TimeoutError):
+                    alive = await asyncio.wait_for(client.ping(), timeout=self._ping_timeout)
+            if alive:
+                state.failures = 0
+                if client.is_cache_stale():
+                    await self._refresh_schemas(context_id, client)
+                return
+            LOGGER.warning("MCP client %s failed idle health check", client.name)
+            try:
+                await client.disconnect()
+            except Exception as e:
+                LOGGER.error("Error disconnecting unhealthy client: %s", e)
+
+        if now < state.next_attempt or client not in self._pools.get(context_id, ()):
+            return
+        try:
+            await asyncio.wait_for(client.reconnect(), timeout=self._reconnect_timeout)
+        except Exception as e:
+            state.failures += 1
+            delay = min(self._backoff_max, self._backoff_base * 2 ** (state.failures - 1))
+            jitter = 0.5 + random.random() / 2  # noqa: S311
+            state.next_attempt = time.monotonic() + delay * jitter
+            LOGGER.warning(
+                "Reconnect %d failed for MCP client %s (retry in ~%.0fs): %s",
+                state.failures,
+                client.name,
+                delay,
+                e,
+            )
+            return
+
+        state.failures = 0
+        if client not in self._pools.get(context_id, ()):
+            # Context was disconnected while reconnecting
+            await client.disconnect()
+            return
+        LOGGER.info("Reconnected MCP client %s for context %s", client.name, context_id)
+
+    async def _refresh_schemas(self, context_id: UUID, client: McpClient) -> None:
+        """Re-list a client's tools after TTL expiry; invalidate services on change."""
+        try:
+            changed = await asyncio.wait_for(
+                client.refresh_cache(), timeout=self._reconnect_timeout
+            )
+        except Exception as e:
+            LOGGER.warning("Schema refresh failed for MCP client %s: %s", client.name, e)
+            return
+        if changed:
+            LOGGER.info("MCP client %s listings changed after TTL refresh", client.name)
+            self._clients_changed(context_id)
+
     async def _eviction_loop(self) -> None:
         """Periodically remove stale MCP clients."""
         while True:
@@ -407,19 +492,23 @@ class McpClientPool:
             await self.disconnect_context(context_id)
 
     def start_eviction(self) -> None:
-        """Start background eviction loop."""
+        """Start the background eviction and health supervision loops."""
         if self._eviction_task is None:
             self._eviction_task = asyncio.create_task(self._eviction_loop())
+        if self._supervisor_task is None:
+            self._supervisor_task = asyncio.create_task(self._supervisor_loop())
 
     async def stop(self) -> None:
-        """Stop eviction and disconnect all clients."""
-        if self._eviction_task is not None:
-            self._eviction_task.cancel()
-            try:
-                await self._eviction_task
-            except asyncio.CancelledError:
-                pass
-            self._eviction_task = None
+        """Stop background loops and disconnect all clients."""
+        for task in (self._eviction_task, self._supervisor_task):
+            if task is not None:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._eviction_task = None
+        self._supervisor_task = None
         await self.shutdown()
 
     async def shutdown(self) -> None:
@@ -455,12 +544,14 @@ class McpClientPool:
             Dict mapping context_id (str) → health info
         """
         health: dict[str, dict[str, Any]] = {}
+        now = time.monotonic()
 
         for context_id, clients in self._pools.items():
             if not clients:
                 continue
             context_health = []
             for client in clients:
+                state = self._supervision.get(client, _Supervision())
                 context_health.append(
                     {
                         "name": client.name,
@@ -470,12 +561,23 @@ class McpClientPool:
                         "resources_count": len(client.resources),
                         "prompts_count": len(client.prompts),
                         "cache_stale": client.is_cache_stale(),
+                        "last_seen_seconds_ago": (
+                            round(now - client.last_seen, 1)
+                            if client.last_seen is not None
+                            else None
+                        ),
+                        "reconnect_count": client.reconnect_count,
+                        "consecutive_failures": state.failures,
+                        "next_reconnect_in_seconds": (
+                            round(max(0.0, state.next_attempt - now), 1) if state.failures else None
+                        ),
                     }
                 )
 
             health[str(context_id)] = {
                 "clients": context_health,
                 "total_clients": len(clients),
+                "healthy_clients": len(self._healthy.get(context_id, [])),
             }
 
         return health
@@ -491,12 +593,16 @@ class McpClientPool:
         connected_clients = sum(
             1 for clients in self._pools.values() for client in clients if client.is_connected
         )
+        total_reconnects = sum(
+            client.reconnect_count for clients in self._pools.values() for client in clients
+        )
 
         return {
             "total_contexts": total_contexts,
             "total_clients": total_clients,
             "connected_clients": connected_clients,
             "disconnected_clients": total_clients - connected_clients,
+            "total_reconnects": total_reconnects,
         }
 
 
@@ -0,0 +1,146 @@
+"""Persistent cache of MCP server listings (tools, resources, prompts).
+
+Entries are keyed by server URL, a fingerprint of the server's initialize
+handshake (name, version, protocol version, capabilities) and the owning
+context, since tool lists can depend on the caller's credentials. A new
+server release changes the fingerprint, so stale schemas are never served
+after an upgrade; within one release, ``notifications/*/list_changed`` or
+the TTL trigger a refresh.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from core.models.mcp import McpPrompt, McpResource, McpTool
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class McpSchemaEntry:
+    """One cached server listing."""
+
+    tools: list[McpTool]
+    resources: list[McpResource]
+    prompts: list[McpPrompt]
+    fetched_at: float  # Unix time of the list calls that produced this entry
+
+
+def server_fingerprint(init_result: Any) -> str:
+    """Hash the identifying parts of an MCP ``InitializeResult``."""
+    payload = {
+        "protocol": getattr(init_result, "protocolVersion", None),
+        "server": _dump(getattr(init_result, "serverInfo", None)),
+        "capabilities": _dump(getattr(init_result, "capabilities", None)),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:32]
+
+
+def _dump(value: Any) -> Any:
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json", exclude_none=True)
+    return value
+
+
+class McpSchemaCache:
+    """SQLite-backed store of MCP server listings.
+
+    All methods are synchronous and thread-safe; ``McpClient`` calls them via
+    ``asyncio.to_thread`` so the event loop never blocks on disk I/O.
+    """
+
+    def __init__(self, path: Path, ttl_seconds: float = 86400.0) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS mcp_schemas ("
+            "  key TEXT PRIMARY KEY,"
+            "  url TEXT NOT NULL,"
+            "  payload TEXT NOT NULL,"
+            "  fetched_at REAL NOT NULL"
+            ")"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(url: str, fingerprint: str, context_id: UUID | None) -> str:
+        """Build the cache key for one server as seen by one context."""
+        return f"{url}|{fingerprint}|{context_id or '-'}"
+
+    def get(self, key: str) -> McpSchemaEntry | None:
+        """Return the entry for ``key`` unless it is missing, expired or unreadable."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, fetched_at FROM mcp_schemas WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        payload, fetched_at = row
+        if time.time() - fetched_at > self.ttl_seconds:
+            return None
+        try:
+            data = json.loads(payload)
+            return McpSchemaEntry(
+                tools=[McpTool(**t) for t in data.get("tools", [])],
+                resources=[McpResource(**r) for r in data.get("resources", [])],
+                prompts=[McpPrompt(**p) for p in data.get("prompts", [])],
+                fetched_at=fetched_at,
+            )
+        except Exception:
+            LOGGER.warning("Discarding unreadable MCP schema cache entry", exc_info=True)
+            self.delete(key)
+            return None
+
+    def put(
+        self,
+        key: str,
+        url: str,
+        tools: list[McpTool],
+        resources: list[McpResource],
+        prompts: list[McpPrompt],
+    ) -> None:
+        """Store a freshly fetched listing."""
+        payload = json.dumps(
+            {
+                "tools": [t.model_dump(mode="json") for t in tools],
+                "resources": [r.model_dump(mode="json") for r in resources],
+                "prompts": [p.model_dump(mode="json") for p in prompts],
+            }
+        )
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO mcp_schemas (key, url, payload, fetched_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, url, payload, time.time()),
+            )
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        """Drop one entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM mcp_schemas WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["McpSchemaCache", "McpSchemaEntry", "server_fingerprint"]
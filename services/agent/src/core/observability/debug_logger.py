@@ -2,9 +2,9 @@
 
 Debug events are emitted as OTel span events via span.add_event().
 The _FileSpanExporter in tracing.py captures these events alongside span
-attributes and writes them to spans.jsonl.
+attributes and writes them to the indexed span store (spans.db).
 
-The Diagnostic API reads debug events from spans.jsonl instead of the
+The Diagnostic API reads debug events from the span store instead of the
 old debug_logs.jsonl file.
 """
 
@@ -22,6 +22,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.db.models import SystemConfig
+from core.observability.span_store import get_span_store
 
 # Toggle cache with TTL
 _debug_enabled_cache: tuple[bool, float] | None = None
@@ -126,7 +127,7 @@ def _sanitize_args(args: dict[str, Any] | Any) -> dict[str, Any]:
 
 
 def _get_spans_path() -> Path:
-    """Get the path to the spans JSONL file."""
+    """Get the configured span log path (the span store is derived from it)."""
     try:
         from core.runtime.config import get_settings
 
@@ -142,13 +143,13 @@ def _extract_debug_events_from_spans_file(
     event_type: str | None,
     limit: int,
 ) -> list[dict[str, Any]]:
-    """Extract debug events from span events in spans.jsonl (blocking I/O).
+    """Look up debug events in the span store for spans_path (blocking I/O).
 
-    Each span record in spans.jsonl has an "events" list. Debug events
-    have names starting with "debug." and contain structured attributes.
+    The exporter indexes span events whose names start with "debug." by
+    trace_id and event_type, so this is an index lookup rather than a scan.
 
     Args:
-        spans_path: Path to spans.jsonl file.
+        spans_path: Path to the span log (the store is spans.db next to it).
         trace_id: Optional trace_id filter.
         event_type: Optional event_type filter (e.g., "tool_call").
         limit: Maximum results to return.
@@ -156,66 +157,30 @@ def _extract_debug_events_from_spans_file(
     Returns:
         List of debug event dicts, newest first.
     """
-    if not spans_path.exists():
+    store = get_span_store(spans_path)
+    if store is None:
         return []
 
     results: list[dict[str, Any]] = []
+    for evt in store.debug_events(trace_id=trace_id, event_type=event_type, limit=limit):
+        evt_attrs = evt["attributes"]
 
-    try:
-        with spans_path.open("r", encoding="utf-8") as f:
-            lines = f.readlines()
-    except Exception:
-        return []
-
-    # Process in reverse (newest spans first)
-    for line in reversed(lines):
-        if not line.strip():
-            continue
-        if len(results) >= limit:
-            break
-
+        # Reconstruct the legacy debug log format for API compatibility
+        event_data_str = evt_attrs.get("debug.event_data", "{}")
         try:
-            span_record = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-
-        span_trace_id = span_record.get("context", {}).get("trace_id", "")
-
-        # If filtering by trace_id and this span doesn't match, skip
-        if trace_id and span_trace_id != trace_id:
-            continue
-
-        events = span_record.get("events", [])
-        for evt in reversed(events):  # newest events first within span
-            evt_name = evt.get("name", "")
-            if not evt_name.startswith("debug."):
-                continue
-
-            evt_attrs = evt.get("attributes", {})
-            evt_event_type = evt_attrs.get("debug.event_type", "")
-
-            # Apply event_type filter
-            if event_type and evt_event_type != event_type:
-                continue
-
-            # Reconstruct the legacy debug log format for API compatibility
-            event_data_str = evt_attrs.get("debug.event_data", "{}")
-            try:
-                event_data = json.loads(event_data_str)
-            except (json.JSONDecodeError, TypeError):
-                event_data = {}
-
-            result_entry = {
-                "trace_id": evt_attrs.get("debug.trace_id", span_trace_id),
-                "event_type": evt_event_type,
+            event_data = json.loads(event_data_str)
+        except (json.JSONDecodeError, TypeError):
+            event_data = {}
+
+        results.append(
+            {
+                "trace_id": evt_attrs.get("debug.trace_id", evt["trace_id"]),
+                "event_type": evt_attrs.get("debug.event_type", ""),
                 "conversation_id": evt_attrs.get("debug.conversation_id"),
                 "event_data": event_data,
-                "timestamp": evt.get("timestamp", span_record.get("start_time")),
+                "timestamp": evt["timestamp"],
             }
-            results.append(result_entry)
-
-            if len(results) >= limit:
-                break
+        )
 
     return results
 
@@ -225,7 +190,7 @@ async def _read_debug_events_from_spans(
     event_type: str | None = None,
     limit: int = 50,
 ) -> list[dict[str, Any]]:
-    """Async wrapper for reading debug events from spans.jsonl.
+    """Async wrapper for reading debug events from the span store.
 
     Args:
         trace_id: Filter by trace ID.
@@ -250,7 +215,7 @@ async def read_debug_logs(
     event_type: str | None = None,
     limit: int = 50,
 ) -> list[dict[str, Any]]:
-    """Read debug events from span events in spans.jsonl.
+    """Read debug events from span events in the span store.
 
     Args:
         trace_id: Filter by trace ID.
@@ -273,15 +238,11 @@ def _extract_supervisor_events_for_context(
 ) -> list[dict[str, Any]]:
     """Extract supervisor REPLAN/ABORT events for a specific context.
 
-    Reads spans.jsonl and filters by:
-    1. Span attributes.context_id == context_id
-    2. Events with name starting with "debug."
-    3. Event attribute debug.event_type == "supervisor"
-    4. Event timestamp >= since_iso
-    5. Event data outcome in (REPLAN, ABORT)
+    Reads the span store's supervisor decision aggregate, which the exporter
+    maintains from "debug.supervisor" events whose span has a context_id.
 
     Args:
-        spans_path: Path to spans.jsonl file.
+        spans_path: Path to the span log (the store is spans.db next to it).
         context_id: Context UUID string to filter by.
         since_iso: ISO timestamp cutoff (only events after this).
         limit: Maximum results to return.
@@ -290,79 +251,10 @@ def _extract_supervisor_events_for_context(
         List of dicts with keys: trace_id, outcome, reason, step_label, timestamp,
         conversation_id, skill_name
     """
-    if not spans_path.exists():
-        return []
-
-    results: list[dict[str, Any]] = []
-
-    try:
-        with spans_path.open("r", encoding="utf-8") as f:
-            lines = f.readlines()
-    except Exception:
+    store = get_span_store(spans_path)
+    if store is None:
         return []
-
-    for line in reversed(lines):
-        if not line.strip():
-            continue
-        if len(results) >= limit:
-            break
-
-        try:
-            span_record = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-
-        # Filter by context_id (set as root span attribute)
-        span_attrs = span_record.get("attributes", {})
-        if span_attrs.get("context_id") != context_id:
-            continue
-
-        span_trace_id = span_record.get("context", {}).get("trace_id", "")
-
-        events = span_record.get("events", [])
-        for evt in reversed(events):
-            evt_name = evt.get("name", "")
-            if not evt_name.startswith("debug."):
-                continue
-
-            evt_attrs = evt.get("attributes", {})
-            if evt_attrs.get("debug.event_type") != "supervisor":
-                continue
-
-            # Parse event data
-            event_data_str = evt_attrs.get("debug.event_data", "{}")
-            try:
-                event_data = json.loads(event_data_str)
-            except (json.JSONDecodeError, TypeError):
-                event_data = {}
-
-            outcome = event_data.get("outcome", "")
-            if outcome not in ("REPLAN", "ABORT"):
-                continue
-
-            # Check timestamp
-            evt_ts = evt.get("timestamp", "")
-            if evt_ts and evt_ts < since_iso:
-                continue
-
-            skill_name_evt = event_data.get("skill_name")
-
-            results.append(
-                {
-                    "trace_id": span_trace_id,
-                    "outcome": outcome,
-                    "reason": event_data.get("reason", ""),
-                    "step_label": event_data.get("step_label", ""),
-                    "timestamp": evt_ts,
-                    "conversation_id": evt_attrs.get("debug.conversation_id"),
-                    "skill_name": skill_name_evt,
-                }
-            )
-
-            if len(results) >= limit:
-                break
-
-    return results
+    return store.supervisor_decisions(context_id, since_iso, limit)
 
 
 async def read_supervisor_events_for_context(
@@ -397,64 +289,16 @@ def _count_skill_executions_for_context(
 ) -> dict[str, dict[str, int]]:
     """Count skill executions by outcome for a context.
 
+    Sums the span store's hourly skill outcome counters, so the hour
+    containing since_iso is counted in full.
+
     Returns:
         Dict mapping skill_name -> {"total": N, "SUCCESS": N, "REPLAN": N, "ABORT": N, "RETRY": N}
     """
-    if not spans_path.exists():
+    store = get_span_store(spans_path)
+    if store is None:
         return {}
-
-    counts: dict[str, dict[str, int]] = {}
-
-    try:
-        with spans_path.open("r", encoding="utf-8") as f:
-            lines = f.readlines()
-    except Exception:
-        return {}
-
-    for line in lines:
-        if not line.strip():
-            continue
-
-        try:
-            span_record = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-
-        span_attrs = span_record.get("attributes", {})
-        if span_attrs.get("context_id") != context_id:
-            continue
-
-        events = span_record.get("events", [])
-        for evt in events:
-            evt_name = evt.get("name", "")
-            if not evt_name.startswith("debug."):
-                continue
-
-            evt_attrs = evt.get("attributes", {})
-            if evt_attrs.get("debug.event_type") != "skill_step":
-                continue
-
-            evt_ts = evt.get("timestamp", "")
-            if evt_ts and evt_ts < since_iso:
-                continue
-
-            event_data_str = evt_attrs.get("debug.event_data", "{}")
-            try:
-                event_data = json.loads(event_data_str)
-            except (json.JSONDecodeError, TypeError):
-                continue
-
-            skill_name = event_data.get("skill_name", "unknown")
-            outcome = event_data.get("outcome", "unknown")
-
-            if skill_name not in counts:
-                counts[skill_name] = {"total": 0, "SUCCESS": 0, "REPLAN": 0, "ABORT": 0, "RETRY": 0}
-
-            counts[skill_name]["total"] += 1
-            if outcome in counts[skill_name]:
-                counts[skill_name][outcome] += 1
-
-    return counts
+    return store.skill_outcome_counts(context_id, since_iso)
 
 
 async def count_skill_executions_for_context(
@@ -476,7 +320,7 @@ class DebugLogger:
 
     Events are added to the current active OTel span via span.add_event().
     The _FileSpanExporter captures events alongside span attributes and
-    writes them to spans.jsonl (the single source of truth).
+    writes them to the span store (the single source of truth).
     """
 
     def __init__(self, session: AsyncSession) -> None:
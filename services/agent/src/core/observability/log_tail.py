@@ -0,0 +1,132 @@
+"""Reverse reader for append-only JSONL logs.
+
+Diagnostics endpoints show the newest matching entries of logs that grow to
+hundreds of megabytes. ``tail_jsonl`` seeks from the end of the file in
+fixed-size blocks and decodes and filters lines until it has enough, so its
+cost depends on how far back the matches are, not on the file size.
+
+Results are paged by byte offset: a page carries the offset of the oldest
+line it scanned, and passing that back as ``before`` continues from there.
+Offsets stay valid until the file is rotated; an offset past the end of the
+current file starts again from the end.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+
+def iter_lines_reversed(
+    path: Path, *, before: int | None = None, block_size: int = DEFAULT_BLOCK_SIZE
+) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(offset, line)`` pairs from the end of ``path`` backwards.
+
+    ``offset`` is the byte offset the line starts at. Reading starts at
+    ``before`` when it lies inside the file. Lines are yielded without their
+    newline and blank lines are skipped.
+    """
+    with path.open("rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        if before is not None and 0 <= before < end:
+            end = before
+        position = end
+        remainder = b""
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + remainder).split(b"\n")
+            # The first piece may continue in the previous block
+            remainder = lines[0]
+            offsets: list[int] = []
+            cursor = position + len(remainder) + 1
+            for line in lines[1:]:
+                offsets.append(cursor)
+                cursor += len(line) + 1
+            for offset, line in zip(reversed(offsets), reversed(lines[1:]), strict=True):
+                if line.strip():
+                    yield offset, line
+        if remainder.strip():
+            yield 0, remainder
+
+
+def literal_needle(value: str) -> bytes | None:
+    """Return ``value`` as raw bytes if it appears verbatim in JSON-encoded lines.
+
+    Values that JSON escapes (quotes, backslashes, non-ASCII) return None and
+    cannot be used as a pre-filter.
+    """
+    if json.dumps(value)[1:-1] != value:
+        return None
+    return value.encode()
+
+
+@dataclass(frozen=True, slots=True)
+class TailPage:
+    """Newest-first entries read by ``tail_jsonl``."""
+
+    entries: list[dict[str, Any]] = field(default_factory=list)
+    next_before: int | None = None  # None once the start of the file was reached
+    scanned_lines: int = 0
+
+
+def tail_jsonl(
+    path: Path,
+    limit: int,
+    *,
+    match: Callable[[dict[str, Any]], bool] | None = None,
+    contains: Sequence[bytes] = (),
+    before: int | None = None,
+    max_lines: int | None = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> TailPage:
+    """Return up to ``limit`` of the newest JSON objects in ``path``, newest first.
+
+    Args:
+        path: JSONL file to read.
+        limit: Maximum number of entries to return.
+        match: Filter applied to each decoded entry during the scan.
+        contains: Byte strings a raw line must all contain; lines without
+            them are skipped without being decoded.
+        before: Byte offset to continue from (a previous page's ``next_before``).
+        max_lines: Stop after scanning this many lines, even if fewer than
+            ``limit`` entries matched.
+        block_size: Size of each block read from the end of the file.
+    """
+    if not path.exists():
+        return TailPage()
+
+    entries: list[dict[str, Any]] = []
+    scanned = 0
+    last_offset: int | None = None
+    exhausted = True
+    for offset, line in iter_lines_reversed(path, before=before, block_size=block_size):
+        if len(entries) >= limit or (max_lines is not None and scanned >= max_lines):
+            exhausted = False
+            break
+        scanned += 1
+        last_offset = offset
+        if any(needle not in line for needle in contains):
+            continue
+        try:
+            entry = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue
+        if not isinstance(entry, dict) or (match is not None and not match(entry)):
+            continue
+        entries.append(entry)
+
+    next_before = None if exhausted or not last_offset else last_offset
+    return TailPage(entries=entries, next_before=next_before, scanned_lines=scanned)
+
+
+__all__ = ["DEFAULT_BLOCK_SIZE", "TailPage", "iter_lines_reversed", "literal_needle", "tail_jsonl"]
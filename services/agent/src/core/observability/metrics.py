@@ -5,6 +5,10 @@ Provides counters, histograms, and gauges for monitoring:
 - LLM token usage and call duration
 - Tool execution counts and duration
 - Skill execution metrics
+- Embedding cache hit rates and upstream embedding cost
+- Embedding scheduler batch sizes, retries and throughput
+- Per-context service assembly cache hit rate and assembly time
+- Chat request phase durations and event-loop stalls
 - Error rates by category
 
 Gracefully degrades to no-op when OpenTelemetry is unavailable.
@@ -99,11 +103,25 @@ llm_token_counter: Any = _NoOpCounter()
 tool_call_counter: Any = _NoOpCounter()
 tool_error_counter: Any = _NoOpCounter()
 skill_step_counter: Any = _NoOpCounter()
+embedding_cache_counter: Any = _NoOpCounter()
+embedding_cache_bytes_counter: Any = _NoOpCounter()
+embedding_batch_counter: Any = _NoOpCounter()
+service_assembly_counter: Any = _NoOpCounter()
+mcp_schema_cache_counter: Any = _NoOpCounter()
+routing_cache_counter: Any = _NoOpCounter()
+dns_lookup_counter: Any = _NoOpCounter()
+span_export_counter: Any = _NoOpCounter()
+loop_stall_counter: Any = _NoOpCounter()
 
 # Histograms
 request_duration_histogram: Any = _NoOpHistogram()
 llm_call_duration_histogram: Any = _NoOpHistogram()
 tool_call_duration_histogram: Any = _NoOpHistogram()
+embedding_upstream_duration_histogram: Any = _NoOpHistogram()
+embedding_batch_size_histogram: Any = _NoOpHistogram()
+service_assembly_duration_histogram: Any = _NoOpHistogram()
+dns_resolve_duration_histogram: Any = _NoOpHistogram()
+phase_duration_histogram: Any = _NoOpHistogram()
 
 # Up-down counters (gauges)
 active_requests_gauge: Any = _NoOpUpDownCounter()
@@ -126,6 +144,14 @@ def configure_metrics(
     global request_duration_histogram, llm_call_duration_histogram
     global tool_call_duration_histogram
     global active_requests_gauge
+    global embedding_cache_counter, embedding_cache_bytes_counter
+    global embedding_upstream_duration_histogram
+    global embedding_batch_counter, embedding_batch_size_histogram
+    global service_assembly_counter, service_assembly_duration_histogram
+    global mcp_schema_cache_counter, routing_cache_counter
+    global dns_lookup_counter, dns_resolve_duration_histogram
+    global span_export_counter
+    global phase_duration_histogram, loop_stall_counter
 
     if not _OTEL_METRICS_AVAILABLE:
         logger.info("OpenTelemetry metrics not available; using no-op instruments")
@@ -175,6 +201,18 @@ def configure_metrics(
             instrument_name="agent.tools.calls.duration",
             aggregation=ExplicitBucketHistogramAggregation(boundaries=latency_buckets),
         ),
+        View(
+            instrument_name="agent.embeddings.upstream.duration",
+            aggregation=ExplicitBucketHistogramAggregation(boundaries=latency_buckets),
+        ),
+        View(
+            instrument_name="agent.services.assembly.duration",
+            aggregation=ExplicitBucketHistogramAggregation(boundaries=latency_buckets),
+        ),
+        View(
+            instrument_name="agent.phases.duration",
+            aggregation=ExplicitBucketHistogramAggregation(boundaries=latency_buckets),
+        ),
     ]
 
     provider = MeterProvider(resource=resource, metric_readers=readers, views=views)
@@ -247,6 +285,90 @@ def configure_metrics(
         unit="1",
     )
 
+    # Embedding cache metrics
+    embedding_cache_counter = meter.create_counter(
+        name="agent.embeddings.cache.lookups",
+        description="Embedding cache lookups by tier and result",
+        unit="1",
+    )
+    embedding_cache_bytes_counter = meter.create_counter(
+        name="agent.embeddings.cache.bytes",
+        description="Embedding vector bytes served from cache or fetched upstream",
+        unit="By",
+    )
+    embedding_upstream_duration_histogram = meter.create_histogram(
+        name="agent.embeddings.upstream.duration",
+        description="Duration of upstream embedding calls made on cache misses",
+        unit="ms",
+    )
+    embedding_batch_counter = meter.create_counter(
+        name="agent.embeddings.batches",
+        description="Upstream embedding batches sent by the scheduler, by outcome",
+        unit="1",
+    )
+    embedding_batch_size_histogram = meter.create_histogram(
+        name="agent.embeddings.batch.size",
+        description="Number of texts per upstream embedding batch",
+        unit="1",
+    )
+
+    # Service assembly cache metrics
+    service_assembly_counter = meter.create_counter(
+        name="agent.services.assembly.lookups",
+        description="Per-context AgentService cache lookups by result",
+        unit="1",
+    )
+    service_assembly_duration_histogram = meter.create_histogram(
+        name="agent.services.assembly.duration",
+        description="Time to assemble an AgentService on a cache miss",
+        unit="ms",
+    )
+
+    # MCP schema cache metrics
+    mcp_schema_cache_counter = meter.create_counter(
+        name="agent.mcp.schema_cache.lookups",
+        description="Persistent MCP schema cache lookups on connect by result",
+        unit="1",
+    )
+
+    # Semantic routing cache metrics
+    routing_cache_counter = meter.create_counter(
+        name="agent.routing_cache.lookups",
+        description="Semantic routing cache lookups by outcome (hit, miss, shadow agreement)",
+        unit="1",
+    )
+
+    # Fetcher DNS resolution metrics
+    dns_lookup_counter = meter.create_counter(
+        name="agent.fetcher.dns.lookups",
+        description="WebFetcher hostname lookups by result (hit, negative_hit, miss, error)",
+        unit="1",
+    )
+    dns_resolve_duration_histogram = meter.create_histogram(
+        name="agent.fetcher.dns.duration",
+        description="WebFetcher DNS resolution latency on a cache miss",
+        unit="ms",
+    )
+
+    # Span export metrics
+    span_export_counter = meter.create_counter(
+        name="agent.tracing.spans",
+        description="Spans handled by the span store exporter by result (exported, dropped)",
+        unit="1",
+    )
+
+    # Request phase profiler metrics
+    phase_duration_histogram = meter.create_histogram(
+        name="agent.phases.duration",
+        description="Duration of chat request phases (planner, skill turns, ...) by phase",
+        unit="ms",
+    )
+    loop_stall_counter = meter.create_counter(
+        name="agent.event_loop.stalls",
+        description="Event loop stalls over the stall monitor threshold",
+        unit="1",
+    )
+
     logger.info("OpenTelemetry metrics configured with %d reader(s)", len(readers))
 
 
@@ -292,8 +414,13 @@ def record_llm_call(
     duration_ms: float,
     prompt_tokens: int = 0,
     completion_tokens: int = 0,
+    cached_tokens: int = 0,
 ) -> None:
-    """Record an LLM API call."""
+    """Record an LLM API call.
+
+    ``cached_tokens`` is the part of ``prompt_tokens`` served from the
+    provider's prompt cache (``gen_ai.usage.cached_tokens``).
+    """
     attrs = {"model": model}
 
     llm_call_counter.add(1, attributes=attrs)
@@ -303,9 +430,13 @@ def record_llm_call(
     if total_tokens > 0:
         llm_token_counter.add(prompt_tokens, attributes={"model": model, "type": "prompt"})
         llm_token_counter.add(completion_tokens, attributes={"model": model, "type": "completion"})
+    if cached_tokens > 0:
+        llm_token_counter.add(cached_tokens, attributes={"model": model, "type": "cached"})
 
     _increment_snapshot("llm.calls.total")
     _increment_snapshot("llm.tokens.total", float(total_tokens))
+    _increment_snapshot("llm.tokens.prompt", float(prompt_tokens))
+    _increment_snapshot("llm.tokens.cached", float(cached_tokens))
     _increment_snapshot("llm.duration_ms_sum", duration_ms)
 
 
@@ -340,6 +471,166 @@ def record_skill_step(
     _increment_snapshot("skills.steps.total")
 
 
+def record_embedding_cache(
+    *,
+    model: str,
+    memory_hits: int = 0,
+    disk_hits: int = 0,
+    misses: int = 0,
+    bytes_served: int = 0,
+    bytes_fetched: int = 0,
+    upstream_duration_ms: float | None = None,
+) -> None:
+    """Record the outcome of one cached embedding batch.
+
+    Args:
+        model: Embedding model name the batch was keyed under.
+        memory_hits: Texts answered from the in-process LRU tier.
+        disk_hits: Texts answered from the on-disk tier.
+        misses: Unique texts that had to be embedded upstream.
+        bytes_served: Vector bytes (float32) returned from cache.
+        bytes_fetched: Vector bytes (float32) returned by the upstream embedder.
+        upstream_duration_ms: Duration of the upstream call, if one was made.
+    """
+    for tier, count in (("memory", memory_hits), ("disk", disk_hits)):
+        if count:
+            embedding_cache_counter.add(
+                count, attributes={"model": model, "tier": tier, "result": "hit"}
+            )
+    if misses:
+        embedding_cache_counter.add(misses, attributes={"model": model, "result": "miss"})
+    if bytes_served:
+        embedding_cache_bytes_counter.add(
+            bytes_served, attributes={"model": model, "source": "cache"}
+        )
+    if bytes_fetched:
+        embedding_cache_bytes_counter.add(
+            bytes_fetched, attributes={"model": model, "source": "upstream"}
+        )
+    if upstream_duration_ms is not None:
+        embedding_upstream_duration_histogram.record(
+            upstream_duration_ms, attributes={"model": model}
+        )
+        _increment_snapshot("embeddings.upstream.calls")
+        _increment_snapshot("embeddings.upstream.duration_ms_sum", upstream_duration_ms)
+
+    _increment_snapshot("embeddings.cache.hits", float(memory_hits + disk_hits))
+    _increment_snapshot("embeddings.cache.disk_hits", float(disk_hits))
+    _increment_snapshot("embeddings.cache.misses", float(misses))
+    _increment_snapshot("embeddings.cache.bytes_served", float(bytes_served))
+    _increment_snapshot("embeddings.cache.bytes_fetched", float(bytes_fetched))
+
+
+def record_embedding_batch(
+    *,
+    model: str,
+    size: int,
+    duration_ms: float,
+    outcome: str,
+) -> None:
+    """Record one upstream batch attempt made by the embedding scheduler.
+
+    Args:
+        model: Embedding model name.
+        size: Number of texts in the batch.
+        duration_ms: Duration of the upstream call.
+        outcome: ``ok``, ``retry``, ``split`` or ``error``.
+    """
+    attrs = {"model": model, "outcome": outcome}
+    embedding_batch_counter.add(1, attributes=attrs)
+    embedding_batch_size_histogram.record(size, attributes=attrs)
+
+    _increment_snapshot(f"embeddings.batches.{outcome}")
+    if outcome == "ok":
+        _increment_snapshot("embeddings.batches.texts", float(size))
+        _increment_snapshot("embeddings.batches.duration_ms_sum", duration_ms)
+
+
+def record_service_assembly(*, hit: bool, duration_ms: float | None = None) -> None:
+    """Record one per-context AgentService cache lookup.
+
+    Args:
+        hit: Whether a cached service was reused.
+        duration_ms: Assembly time on a miss.
+    """
+    service_assembly_counter.add(1, attributes={"result": "hit" if hit else "miss"})
+    _increment_snapshot("services.assembly.hits" if hit else "services.assembly.misses")
+    if duration_ms is not None:
+        service_assembly_duration_histogram.record(duration_ms)
+        _increment_snapshot("services.assembly.duration_ms_sum", duration_ms)
+
+
+def record_mcp_schema_cache(*, hit: bool) -> None:
+    """Record one persistent MCP schema cache lookup made while connecting."""
+    mcp_schema_cache_counter.add(1, attributes={"result": "hit" if hit else "miss"})
+    _increment_snapshot("mcp.schema_cache.hits" if hit else "mcp.schema_cache.misses")
+
+
+def record_routing_cache(outcome: str) -> None:
+    """Record one semantic routing cache lookup.
+
+    Args:
+        outcome: ``"hit"`` (LLM skipped), ``"miss"``, or in shadow mode
+            ``"shadow_agree"`` / ``"shadow_disagree"`` when a cached decision
+            was compared against the planner's.
+    """
+    routing_cache_counter.add(1, attributes={"outcome": outcome})
+    _increment_snapshot(f"routing_cache.{outcome}")
+
+
+def record_dns_lookup(result: str, duration_ms: float | None = None) -> None:
+    """Record one WebFetcher hostname lookup.
+
+    Args:
+        result: ``"hit"``, ``"negative_hit"`` (cached failure), ``"miss"``
+            (resolved) or ``"error"`` (resolution failed).
+        duration_ms: Resolver latency when a lookup went to DNS.
+    """
+    dns_lookup_counter.add(1, attributes={"result": result})
+    _increment_snapshot(f"fetcher.dns.{result}")
+    if duration_ms is not None:
+        dns_resolve_duration_histogram.record(duration_ms)
+        _increment_snapshot("fetcher.dns.resolutions")
+        _increment_snapshot("fetcher.dns.duration_ms_sum", duration_ms)
+
+
+def record_span_export(exported: int, dropped: int = 0) -> None:
+    """Record spans written by the span exporter and spans it dropped.
+
+    Args:
+        exported: Spans written to the span store in one flush.
+        dropped: Spans discarded because the exporter's queue was full.
+    """
+    if exported:
+        span_export_counter.add(exported, attributes={"result": "exported"})
+        _increment_snapshot("tracing.spans.exported", float(exported))
+    if dropped:
+        span_export_counter.add(dropped, attributes={"result": "dropped"})
+        _increment_snapshot("tracing.spans.dropped", float(dropped))
+
+
+def record_phase_duration(phase: str, duration_ms: float, *, skill: str | None = None) -> None:
+    """Record the duration of one chat request phase.
+
+    Percentiles for the admin dashboard come from the latency profiler's own
+    windowed histograms, so this only feeds the exported metric.
+
+    Args:
+        phase: Phase name (e.g. ``planner.generate``).
+        duration_ms: Wall-clock duration.
+        skill: Skill the phase ran for, if any.
+    """
+    attrs = {"phase": phase} if skill is None else {"phase": phase, "skill": skill}
+    phase_duration_histogram.record(duration_ms, attributes=attrs)
+
+
+def record_loop_stall(duration_ms: float) -> None:
+    """Record one event-loop stall detected by the stall monitor."""
+    loop_stall_counter.add(1)
+    _increment_snapshot("event_loop.stalls")
+    _increment_snapshot("event_loop.stall_ms_sum", duration_ms)
+
+
 @contextmanager
 def measure_duration() -> Iterator[dict[str, float]]:
     """Context manager that measures elapsed time in milliseconds.
@@ -361,9 +652,18 @@ __all__ = [
     "configure_metrics",
     "get_metric_snapshot",
     "measure_duration",
+    "record_dns_lookup",
+    "record_embedding_batch",
+    "record_embedding_cache",
     "record_llm_call",
+    "record_loop_stall",
+    "record_mcp_schema_cache",
+    "record_phase_duration",
     "record_request_end",
     "record_request_start",
+    "record_routing_cache",
+    "record_service_assembly",
     "record_skill_step",
+    "record_span_export",
     "record_tool_call",
 ]
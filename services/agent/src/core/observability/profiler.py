@@ -0,0 +1,424 @@
+"""In-process latency profiler for the phases of a chat request.
+
+``phase`` wraps a block in a span (via ``tracing.start_span``) and records
+its wall-clock duration in a fixed-bucket histogram per phase and, for
+skill phases, per skill. Histograms are kept in 10-second slots for the last
+hour, so percentiles can be read over sliding windows (1, 5, 15, 60 minutes)
+without keeping individual samples.
+
+A phase nested in a phase of the same name (e.g. ``ContextService`` resolvers
+calling each other) is only recorded once, by the outermost block. Streams
+consumed with ``async for`` are timed with ``profiled_iter``, which counts only
+the time spent producing items, so no phase stays open across a ``yield``.
+
+``LoopStallMonitor`` is an opt-in sampling mode for event-loop stalls: a
+heartbeat task measures how late the loop wakes up, and a watchdog thread
+captures the loop thread's stack while it is overdue, so each stall over the
+threshold is reported with the code that was blocking the loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import sys
+import threading
+import time
+import traceback
+from bisect import bisect_left
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Coroutine, Iterator
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any, ParamSpec, TypeVar
+
+from core.observability.metrics import record_loop_stall, record_phase_duration
+from core.observability.tracing import start_span
+
+LOGGER = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Upper bounds of the histogram buckets in ms; slower samples go to an overflow bucket
+PHASE_BUCKETS_MS: tuple[float, ...] = (
+    1,
+    2,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+    30000,
+    60000,
+    120000,
+)
+SLOT_SECONDS = 10
+MAX_WINDOW_SECONDS = 3600
+WINDOWS_SECONDS: tuple[int, ...] = (60, 300, 900, 3600)
+PERCENTILES: tuple[float, ...] = (0.5, 0.95, 0.99)
+
+
+class _Slot:
+    __slots__ = ("counts", "max_ms", "sum_ms")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(PHASE_BUCKETS_MS) + 1)
+        self.max_ms = 0.0
+        self.sum_ms = 0.0
+
+
+class PhaseHistogram:
+    """Fixed-bucket latency histogram over a sliding window of time slots."""
+
+    def __init__(self) -> None:
+        self._slots: dict[int, _Slot] = {}
+
+    def record(self, duration_ms: float, now: float) -> None:
+        index = int(now // SLOT_SECONDS)
+        slot = self._slots.get(index)
+        if slot is None:
+            slot = self._slots[index] = _Slot()
+            oldest = index - MAX_WINDOW_SECONDS // SLOT_SECONDS
+            for stale in [i for i in self._slots if i <= oldest]:
+                del self._slots[stale]
+        slot.counts[bisect_left(PHASE_BUCKETS_MS, duration_ms)] += 1
+        slot.sum_ms += duration_ms
+        slot.max_ms = max(slot.max_ms, duration_ms)
+
+    def summary(self, window_seconds: int, now: float) -> dict[str, Any] | None:
+        """Count, mean, max and percentiles over the last ``window_seconds``.
+
+        The window is rounded up to whole slots. Returns None without samples.
+        """
+        first = int((now - window_seconds) // SLOT_SECONDS) + 1
+        counts = [0] * (len(PHASE_BUCKETS_MS) + 1)
+        total_ms = 0.0
+        max_ms = 0.0
+        for index, slot in self._slots.items():
+            if index < first:
+                continue
+            counts = [a + b for a, b in zip(counts, slot.counts, strict=True)]
+            total_ms += slot.sum_ms
+            max_ms = max(max_ms, slot.max_ms)
+        count = sum(counts)
+        if not count:
+            return None
+        result: dict[str, Any] = {
+            "count": count,
+            "mean_ms": round(total_ms / count, 1),
+            "max_ms": round(max_ms, 1),
+        }
+        for q in PERCENTILES:
+            result[f"p{round(q * 100)}_ms"] = round(_percentile(counts, count, max_ms, q), 1)
+        return result
+
+
+def _percentile(counts: list[int], count: int, max_ms: float, q: float) -> float:
+    """Estimate a percentile by interpolating inside the bucket that holds it."""
+    rank = q * count
+    seen = 0
+    for i, bucket_count in enumerate(counts):
+        if not bucket_count or seen + bucket_count < rank:
+            seen += bucket_count
+            continue
+        lower = PHASE_BUCKETS_MS[i - 1] if i > 0 else 0.0
+        upper = PHASE_BUCKETS_MS[i] if i < len(PHASE_BUCKETS_MS) else max_ms
+        estimate = lower + (upper - lower) * (rank - seen) / bucket_count
+        return min(estimate, max_ms)
+    return max_ms
+
+
+class LatencyProfiler:
+    """Sliding-window phase histograms, keyed by phase and optional skill."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, str | None], PhaseHistogram] = {}
+
+    def record(self, phase_name: str, duration_ms: float, *, skill: str | None = None) -> None:
+        """Record one phase duration; skill phases also count toward the phase total."""
+        now = self._clock()
+        keys = [(phase_name, None)] if skill is None else [(phase_name, None), (phase_name, skill)]
+        with self._lock:
+            for key in keys:
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = PhaseHistogram()
+                histogram.record(duration_ms, now)
+
+    def summary(self, window_seconds: int = 300) -> list[dict[str, Any]]:
+        """Per-phase (and per-skill) statistics for the window, slowest p95 first."""
+        now = self._clock()
+        rows: list[dict[str, Any]] = []
+        with self._lock:
+            for (phase_name, skill), histogram in self._histograms.items():
+                stats = histogram.summary(window_seconds, now)
+                if stats is not None:
+                    rows.append({"phase": phase_name, "skill": skill, **stats})
+        rows.sort(key=lambda row: (row["skill"] is not None, -row["p95_ms"], row["phase"]))
+        return rows
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+_profiler = LatencyProfiler()
+_active_phases: ContextVar[frozenset[str]] = ContextVar("active_phases", default=frozenset())
+
+
+def get_latency_profiler() -> LatencyProfiler:
+    """Return the process-wide latency profiler."""
+    return _profiler
+
+
+@contextmanager
+def phase(
+    name: str,
+    *,
+    skill: str | None = None,
+    span_name: str | None = None,
+    attributes: dict[str, Any] | None = None,
+) -> Iterator[Any]:
+    """Run a block as a profiled phase and yield its span.
+
+    Args:
+        name: Phase name the duration is recorded under.
+        skill: Skill the phase belongs to, for the per-skill breakdown.
+        span_name: Span name if it differs from ``name`` (default: ``name``).
+        attributes: Span attributes.
+    """
+    active = _active_phases.get()
+    token = None if name in active else _active_phases.set(active | {name})
+    start = time.perf_counter()
+    try:
+        with start_span(span_name or name, attributes=attributes) as span:
+            yield span
+    finally:
+        if token is not None:
+            duration_ms = (time.perf_counter() - start) * 1000
+            # An async generator closed from another context cannot reset its token
+            try:
+                _active_phases.reset(token)
+            except ValueError:
+                _active_phases.set(active)
+            _profiler.record(name, duration_ms, skill=skill)
+            record_phase_duration(name, duration_ms, skill=skill)
+
+
+def profiled_phase(
+    name: str,
+) -> Callable[[Callable[P, Coroutine[Any, Any, T]]], Callable[P, Coroutine[Any, Any, T]]]:
+    """Decorate a coroutine function so each call is recorded as phase ``name``."""
+
+    def decorator(
+        func: Callable[P, Coroutine[Any, Any, T]],
+    ) -> Callable[P, Coroutine[Any, Any, T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            with phase(name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+async def profiled_iter(
+    name: str, stream: AsyncIterator[T], *, skill: str | None = None
+) -> AsyncGenerator[T, None]:
+    """Forward ``stream`` and record the time spent producing its items as phase ``name``.
+
+    Time the consumer spends between items is not counted. If the consumer
+    stops early or is cancelled, ``stream`` is closed here rather than at
+    garbage collection.
+    """
+    elapsed = 0.0
+    try:
+        while True:
+            start = time.perf_counter()
+            try:
+                item = await anext(stream)
+            except StopAsyncIteration:
+                return
+            finally:
+                elapsed += time.perf_counter() - start
+            yield item
+    finally:
+        _profiler.record(name, elapsed * 1000, skill=skill)
+        record_phase_duration(name, elapsed * 1000, skill=skill)
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+@dataclass(frozen=True, slots=True)
+class LoopStall:
+    """An event-loop stall and the loop thread's stack sampled during it."""
+
+    started_at: str
+    duration_ms: float
+    stack: list[str] = field(default_factory=list)
+
+
+class LoopStallMonitor:
+    """Detect event-loop stalls over a threshold and sample the blocking stack.
+
+    A heartbeat task sleeps for a fraction of the threshold and measures how
+    late it wakes up. A watchdog thread polls at the same interval and, once
+    the heartbeat is overdue by the threshold, captures the loop thread's
+    current stack (``sys._current_frames``). When the heartbeat runs again the
+    stall is recorded with its measured duration and the sampled stack.
+
+    Stalls spent in C code that holds the GIL are measured but cannot be
+    sampled until the GIL is released; their stack is then the first Python
+    frame that ran afterwards, or empty.
+    """
+
+    def __init__(self, threshold_ms: float = 250.0, *, max_stalls: int = 50) -> None:
+        self.threshold_ms = threshold_ms
+        self._interval = max(threshold_ms / 4, 10.0) / 1000
+        self._stalls: deque[LoopStall] = deque(maxlen=max_stalls)
+        self._lock = threading.Lock()
+        self._pending_stack: list[str] | None = None
+        self._last_beat = time.monotonic()
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start monitoring the running event loop (call from the loop thread)."""
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-stall-monitor", daemon=True
+        )
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+
+    def stalls(self) -> list[dict[str, Any]]:
+        """Recorded stalls, newest first."""
+        with self._lock:
+            return [asdict(stall) for stall in reversed(self._stalls)]
+
+    async def _heartbeat(self) -> None:
+        while True:
+            self._last_beat = time.monotonic()
+            await asyncio.sleep(self._interval)
+            lag_ms = (time.monotonic() - self._last_beat - self._interval) * 1000
+            with self._lock:
+                stack, self._pending_stack = self._pending_stack, None
+                if lag_ms >= self.threshold_ms:
+                    started = datetime.now(UTC) - timedelta(milliseconds=lag_ms)
+                    self._stalls.append(
+                        LoopStall(
+                            started_at=started.isoformat(),
+                            duration_ms=round(lag_ms, 1),
+                            stack=stack or [],
+                        )
+                    )
+            if lag_ms >= self.threshold_ms:
+                record_loop_stall(lag_ms)
+                LOGGER.warning(
+                    "Event loop stalled for %.0f ms%s",
+                    lag_ms,
+                    f" in {stack[-1].strip().splitlines()[0]}" if stack else "",
+                )
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self._interval):
+            overdue_ms = (time.monotonic() - self._last_beat - self._interval) * 1000
+            if overdue_ms < self.threshold_ms or self._loop_thread_id is None:
+                continue
+            with self._lock:
+                if self._pending_stack is not None:
+                    continue
+                frame = sys._current_frames().get(self._loop_thread_id)
+                # Innermost frames identify the blocking call
+                self._pending_stack = traceback.format_stack(frame)[-25:] if frame else []
+
+
+_stall_monitor: LoopStallMonitor | None = None
+
+
+def get_stall_monitor() -> LoopStallMonitor | None:
+    """Return the event-loop stall monitor if one was started."""
+    return _stall_monitor
+
+
+def start_stall_monitor(threshold_ms: float) -> LoopStallMonitor:
+    """Start the process-wide stall monitor on the running loop."""
+    global _stall_monitor
+    if _stall_monitor is None:
+        _stall_monitor = LoopStallMonitor(threshold_ms)
+    _stall_monitor.start()
+    LOGGER.info("Event loop stall monitor started (threshold %.0f ms)", threshold_ms)
+    return _stall_monitor
+
+
+def stop_stall_monitor() -> None:
+    if _stall_monitor is not None:
+        with suppress(Exception):
+            _stall_monitor.stop()
+
+
+def latency_report(window_seconds: int = 300) -> dict[str, Any]:
+    """Phase percentiles for a window plus stall monitor state, for the admin API."""
+    monitor = _stall_monitor
+    return {
+        "window_seconds": window_seconds,
+        "windows": list(WINDOWS_SECONDS),
+        "buckets_ms": list(PHASE_BUCKETS_MS),
+        "phases": _profiler.summary(window_seconds),
+        "stall_monitor": {
+            "enabled": monitor is not None and monitor.running,
+            "threshold_ms": monitor.threshold_ms if monitor is not None else None,
+            "stalls": monitor.stalls() if monitor is not None else [],
+        },
+    }
+
+
+__all__ = [
+    "PHASE_BUCKETS_MS",
+    "WINDOWS_SECONDS",
+    "LatencyProfiler",
+    "LoopStall",
+    "LoopStallMonitor",
+    "PhaseHistogram",
+    "get_latency_profiler",
+    "get_stall_monitor",
+    "latency_report",
+    "phase",
+    "profiled_iter",
+    "profiled_phase",
+    "start_stall_monitor",
+    "stop_stall_monitor",
+]
@@ -0,0 +1,518 @@
+"""Indexed SQLite store for exported spans.
+
+``_FileSpanExporter`` writes every span here; the diagnostics API, debug log
+readers and skill-quality analysis query it instead of re-parsing
+``spans.jsonl``. Spans are indexed by trace ID, start time, context ID, name
+and status, and ``debug.*`` span events (the platform's debug log) get their
+own table indexed by event type, trace and context. Each span is kept as its
+original JSON record, so readers receive exactly what the JSONL file held.
+
+The store lives next to the configured span log (``spans.jsonl`` ->
+``spans.db``). When it is first created, an existing span log and its rotated
+files are imported so history survives the switch. Retention is size based:
+once stored records exceed the limit, the oldest spans are deleted.
+
+Skill-quality analysis reads two aggregates maintained as spans are added,
+so its cost does not grow with trace history: ``skill_step`` outcome counters
+per (context, skill, outcome, hour) and the supervisor's REPLAN/ABORT
+decisions per context. ``debug.event_data`` is decoded once, on insert.
+Aggregates outlive span retention and are kept for ``AGGREGATE_RETENTION_DAYS``.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE_MB = 100
+
+# Retention trims down to this share of the limit so it does not run per batch
+_TRIM_TARGET = 0.9
+_IMPORT_BATCH = 500
+
+AGGREGATE_RETENTION_DAYS = 90
+
+# Skill outcomes tracked per skill; other outcomes only count towards the total
+SKILL_OUTCOMES = ("SUCCESS", "REPLAN", "ABORT", "RETRY")
+_SUPERVISOR_FAILURES = ("REPLAN", "ABORT")
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS spans ("
+    "  seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+    "  trace_id TEXT NOT NULL,"
+    "  span_id TEXT NOT NULL,"
+    "  name TEXT NOT NULL,"
+    "  start_time TEXT,"
+    "  status TEXT,"
+    "  context_id TEXT,"
+    "  size INTEGER NOT NULL,"
+    "  record BLOB NOT NULL,"
+    "  UNIQUE (trace_id, span_id)"
+    ")",
+    "CREATE INDEX IF NOT EXISTS spans_start ON spans (start_time)",
+    "CREATE INDEX IF NOT EXISTS spans_context ON spans (context_id) WHERE context_id IS NOT NULL",
+    "CREATE INDEX IF NOT EXISTS spans_name ON spans (name)",
+    "CREATE INDEX IF NOT EXISTS spans_status ON spans (status)",
+    "CREATE TABLE IF NOT EXISTS span_events ("
+    "  seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+    "  span_seq INTEGER NOT NULL,"
+    "  trace_id TEXT NOT NULL,"
+    "  context_id TEXT,"
+    "  event_type TEXT NOT NULL,"
+    "  timestamp TEXT,"
+    "  attributes BLOB NOT NULL"
+    ")",
+    "CREATE INDEX IF NOT EXISTS span_events_type ON span_events (event_type)",
+    "CREATE INDEX IF NOT EXISTS span_events_trace ON span_events (trace_id)",
+    "CREATE INDEX IF NOT EXISTS span_events_context "
+    "ON span_events (context_id, event_type, timestamp)",
+    "CREATE INDEX IF NOT EXISTS span_events_span ON span_events (span_seq)",
+)
+
+# Hour buckets ("2026-01-01T10") keep short windows (the post-conversation
+# check looks back one hour) accurate to within an hour
+_AGGREGATE_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS skill_outcomes ("
+    "  context_id TEXT NOT NULL,"
+    "  hour TEXT NOT NULL,"
+    "  skill_name TEXT NOT NULL,"
+    "  outcome TEXT NOT NULL,"
+    "  count INTEGER NOT NULL,"
+    "  PRIMARY KEY (context_id, hour, skill_name, outcome)"
+    ") WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS supervisor_decisions ("
+    "  seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+    "  context_id TEXT NOT NULL,"
+    "  timestamp TEXT NOT NULL,"
+    "  trace_id TEXT NOT NULL,"
+    "  outcome TEXT NOT NULL,"
+    "  skill_name TEXT,"
+    "  reason TEXT NOT NULL,"
+    "  step_label TEXT NOT NULL,"
+    "  conversation_id TEXT"
+    ")",
+    "CREATE INDEX IF NOT EXISTS supervisor_decisions_context "
+    "ON supervisor_decisions (context_id, timestamp)",
+    "CREATE INDEX IF NOT EXISTS supervisor_decisions_time ON supervisor_decisions (timestamp)",
+)
+
+
+def span_store_path(span_log_path: Path) -> Path:
+    """Return the store file used for a configured span log path."""
+    return span_log_path.with_suffix(".db")
+
+
+class SpanStore:
+    """SQLite (WAL) span store with size-based retention.
+
+    All methods are synchronous and thread-safe; async callers use
+    ``asyncio.to_thread``.
+    """
+
+    def __init__(self, path: Path, max_size_mb: int = DEFAULT_MAX_SIZE_MB) -> None:
+        self.path = path
+        self.max_bytes = max_size_mb * 1024 * 1024
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        has_aggregates = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'skill_outcomes'"
+        ).fetchone()
+        for statement in _SCHEMA + _AGGREGATE_SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM spans").fetchone()
+        self._bytes = int(row[0])
+        self._pruned_hour = ""
+        if not has_aggregates:
+            self._backfill_aggregates()
+
+    # -- Writes -------------------------------------------------------------
+
+    def add(
+        self,
+        records: Iterable[dict[str, Any]],
+        encoded: Iterable[bytes] | None = None,
+    ) -> None:
+        """Store exported span records (the JSONL record format).
+
+        ``encoded`` optionally holds each record already serialised with
+        orjson, so the exporter does not encode a span twice.
+        """
+        with self._lock:
+            if encoded is None:
+                for record in records:
+                    self._insert(record)
+            else:
+                for record, blob in zip(records, encoded, strict=True):
+                    self._insert(record, blob)
+            self._conn.commit()
+            if self._bytes > self.max_bytes:
+                self._trim()
+
+    def _insert(self, record: dict[str, Any], blob: bytes | None = None) -> None:
+        context = record.get("context") or {}
+        trace_id = context.get("trace_id")
+        span_id = context.get("span_id")
+        if not trace_id or not span_id:
+            return
+        attributes = record.get("attributes") or {}
+        context_id = attributes.get("context_id")
+        context_id = str(context_id) if context_id else None
+        if blob is None:
+            blob = orjson.dumps(record, default=str)
+        size = len(blob)
+        debug_events: list[tuple[dict[str, Any], Any, bytes]] = []
+        for event in record.get("events") or ():
+            if str(event.get("name", "")).startswith("debug."):
+                event_attrs = event.get("attributes") or {}
+                event_blob = orjson.dumps(event_attrs, default=str)
+                size += len(event_blob)
+                debug_events.append((event_attrs, event.get("timestamp"), event_blob))
+
+        cursor = self._conn.execute(
+            "INSERT OR IGNORE INTO spans "
+            "(trace_id, span_id, name, start_time, status, context_id, size, record) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                trace_id,
+                span_id,
+                str(record.get("name", "unknown")),
+                record.get("start_time"),
+                record.get("status"),
+                context_id,
+                size,
+                blob,
+            ),
+        )
+        if not cursor.rowcount:
+            return  # Already stored (re-import or duplicate export)
+        self._bytes += size
+        if not debug_events:
+            return
+        span_seq = cursor.lastrowid
+        self._conn.executemany(
+            "INSERT INTO span_events "
+            "(span_seq, trace_id, context_id, event_type, timestamp, attributes) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    span_seq,
+                    trace_id,
+                    context_id,
+                    str(event_attrs.get("debug.event_type", "")),
+                    timestamp,
+                    event_blob,
+                )
+                for event_attrs, timestamp, event_blob in debug_events
+            ],
+        )
+        if context_id:
+            for event_attrs, timestamp, _ in debug_events:
+                self._aggregate_event(
+                    trace_id, context_id, timestamp or record.get("start_time"), event_attrs
+                )
+
+    def _trim(self) -> None:
+        """Delete the oldest spans until stored bytes are under the trim target."""
+        target = self.max_bytes * _TRIM_TARGET
+        freed = 0
+        boundary: int | None = None
+        for seq, size in self._conn.execute("SELECT seq, size FROM spans ORDER BY seq"):
+            boundary = seq
+            freed += size
+            if self._bytes - freed <= target:
+                break
+        if boundary is None:
+            return
+        self._conn.execute("DELETE FROM span_events WHERE span_seq <= ?", (boundary,))
+        self._conn.execute("DELETE FROM spans WHERE seq <= ?", (boundary,))
+        self._conn.commit()
+        self._bytes -= freed
+
+    def import_jsonl(self, span_log_path: Path, max_files: int = 10) -> int:
+        """Import a span log and its rotated files (oldest first); return spans read."""
+        files = [Path(f"{span_log_path}.{i}") for i in range(max_files, 0, -1)]
+        files.append(span_log_path)
+        imported = 0
+        for file in files:
+            if not file.exists():
+                continue
+            batch: list[dict[str, Any]] = []
+            with file.open("rb") as fp:
+                for line in fp:
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue
+                    if isinstance(record, dict):
+                        batch.append(record)
+                    if len(batch) >= _IMPORT_BATCH:
+                        self.add(batch)
+                        imported += len(batch)
+                        batch = []
+            self.add(batch)
+            imported += len(batch)
+        return imported
+
+    # -- Span queries ---------------------------------------------------------
+
+    def _records(self, sql: str, params: tuple[Any, ...]) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [orjson.loads(row[0]) for row in rows]
+
+    def spans_for_trace(self, trace_id: str) -> list[dict[str, Any]]:
+        """Return spans whose trace ID equals, or for a partial ID contains, ``trace_id``."""
+        if len(trace_id) == 32:
+            return self._records(
+                "SELECT record FROM spans WHERE trace_id = ? ORDER BY seq", (trace_id,)
+            )
+        return self._records(
+            "SELECT record FROM spans WHERE instr(trace_id, ?) > 0 ORDER BY seq", (trace_id,)
+        )
+
+    def recent_spans(self, limit: int) -> list[dict[str, Any]]:
+        """Return the ``limit`` most recently stored spans, oldest first."""
+        records = self._records("SELECT record FROM spans ORDER BY seq DESC LIMIT ?", (limit,))
+        records.reverse()
+        return records
+
+    def spans_since(self, start_time: str) -> list[dict[str, Any]]:
+        """Return spans that started at or after ``start_time`` (naive UTC ISO)."""
+        return self._records(
+            "SELECT record FROM spans WHERE start_time >= ? ORDER BY start_time", (start_time,)
+        )
+
+    # -- Debug event queries --------------------------------------------------
+
+    def debug_events(
+        self,
+        *,
+        trace_id: str | None = None,
+        event_type: str | None = None,
+        context_id: str | None = None,
+        since: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return ``debug.*`` span events, newest first.
+
+        Each item has ``trace_id``, ``timestamp`` and the event ``attributes``.
+        ``since`` keeps events at or after that ISO timestamp plus events
+        without one.
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, value in (
+            ("trace_id", trace_id),
+            ("event_type", event_type),
+            ("context_id", context_id),
+        ):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since:
+            clauses.append("(timestamp IS NULL OR timestamp = '' OR timestamp >= ?)")
+            params.append(since)
+        sql = "SELECT trace_id, timestamp, attributes FROM span_events"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY seq DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {"trace_id": row[0], "timestamp": row[1], "attributes": orjson.loads(row[2])}
+            for row in rows
+        ]
+
+    # -- Skill aggregates -----------------------------------------------------
+
+    def _aggregate_event(
+        self,
+        trace_id: str,
+        context_id: str,
+        timestamp: str | None,
+        attributes: dict[str, Any],
+    ) -> None:
+        """Fold one debug event into the skill outcome and supervisor aggregates."""
+        event_type = attributes.get("debug.event_type")
+        if event_type not in ("skill_step", "supervisor") or not timestamp:
+            return
+        try:
+            data = orjson.loads(attributes.get("debug.event_data", "{}"))
+        except (orjson.JSONDecodeError, TypeError):
+            return
+        if not isinstance(data, dict):
+            return
+
+        hour = timestamp[:13]
+        if hour > self._pruned_hour:
+            self._prune_aggregates(hour)
+
+        if event_type == "skill_step":
+            self._conn.execute(
+                "INSERT INTO skill_outcomes (context_id, hour, skill_name, outcome, count) "
+                "VALUES (?, ?, ?, ?, 1) "
+                "ON CONFLICT (context_id, hour, skill_name, outcome) "
+                "DO UPDATE SET count = count + 1",
+                (
+                    context_id,
+                    hour,
+                    str(data.get("skill_name", "unknown")),
+                    str(data.get("outcome", "unknown")),
+                ),
+            )
+        elif data.get("outcome") in _SUPERVISOR_FAILURES:
+            self._conn.execute(
+                "INSERT INTO supervisor_decisions (context_id, timestamp, trace_id, outcome, "
+                "skill_name, reason, step_label, conversation_id) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    context_id,
+                    timestamp,
+                    trace_id,
+                    data["outcome"],
+                    data.get("skill_name"),
+                    str(data.get("reason", "")),
+                    str(data.get("step_label", "")),
+                    attributes.get("debug.conversation_id"),
+                ),
+            )
+
+    def _prune_aggregates(self, hour: str) -> None:
+        """Drop aggregates older than the retention window (at most once per hour)."""
+        self._pruned_hour = hour
+        try:
+            cutoff = datetime.fromisoformat(hour + ":00") - timedelta(days=AGGREGATE_RETENTION_DAYS)
+        except ValueError:
+            return
+        cutoff_iso = cutoff.isoformat()
+        self._conn.execute("DELETE FROM skill_outcomes WHERE hour < ?", (cutoff_iso[:13],))
+        self._conn.execute("DELETE FROM supervisor_decisions WHERE timestamp < ?", (cutoff_iso,))
+
+    def _backfill_aggregates(self) -> None:
+        """Build the aggregates from stored debug events (stores created before them)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT trace_id, context_id, timestamp, attributes FROM span_events "
+                "WHERE context_id IS NOT NULL AND event_type IN ('skill_step', 'supervisor') "
+                "ORDER BY seq"
+            ).fetchall()
+            for trace_id, context_id, timestamp, attributes in rows:
+                self._aggregate_event(trace_id, context_id, timestamp, orjson.loads(attributes))
+            self._conn.commit()
+
+    def skill_outcome_counts(self, context_id: str, since: str) -> dict[str, dict[str, int]]:
+        """Return ``skill_step`` counts per skill for a context since an ISO timestamp.
+
+        Counts are kept per hour, so the hour containing ``since`` is counted
+        in full. Each value has ``total`` plus a count per ``SKILL_OUTCOMES``.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT skill_name, outcome, SUM(count) FROM skill_outcomes "
+                "WHERE context_id = ? AND hour >= ? GROUP BY skill_name, outcome",
+                (context_id, since[:13]),
+            ).fetchall()
+        counts: dict[str, dict[str, int]] = {}
+        for skill_name, outcome, count in rows:
+            skill_counts = counts.setdefault(
+                skill_name, {"total": 0, **dict.fromkeys(SKILL_OUTCOMES, 0)}
+            )
+            skill_counts["total"] += count
+            if outcome in skill_counts:
+                skill_counts[outcome] += count
+        return counts
+
+    def supervisor_decisions(
+        self, context_id: str, since: str, limit: int = 500
+    ) -> list[dict[str, Any]]:
+        """Return REPLAN/ABORT supervisor decisions for a context since ``since``, newest first.
+
+        Each item has ``trace_id``, ``outcome``, ``reason``, ``step_label``,
+        ``timestamp``, ``conversation_id`` and ``skill_name``.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT trace_id, outcome, reason, step_label, timestamp, conversation_id, "
+                "skill_name FROM supervisor_decisions "
+                "WHERE context_id = ? AND timestamp >= ? "
+                "ORDER BY timestamp DESC, seq DESC LIMIT ?",
+                (context_id, since, limit),
+            ).fetchall()
+        keys = (
+            "trace_id",
+            "outcome",
+            "reason",
+            "step_label",
+            "timestamp",
+            "conversation_id",
+            "skill_name",
+        )
+        return [dict(zip(keys, row, strict=True)) for row in rows]
+
+    def count(self) -> int:
+        """Return the number of stored spans."""
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM spans").fetchone()
+        return int(row[0]) if row else 0
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_stores: dict[Path, SpanStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_span_store(
+    span_log_path: Path, *, create: bool = False, max_size_mb: int | None = None
+) -> SpanStore | None:
+    """Return the shared store for a configured span log path.
+
+    Readers pass ``create=False`` and get None when there is neither a store
+    nor a span log to import. The exporter passes ``create=True`` and its
+    retention limit.
+    """
+    db_path = span_store_path(span_log_path)
+    key = db_path.resolve()
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            is_new = not db_path.exists()
+            if is_new and not create and not span_log_path.exists():
+                return None
+            store = SpanStore(db_path, max_size_mb=max_size_mb or DEFAULT_MAX_SIZE_MB)
+            if is_new and span_log_path.exists():
+                imported = store.import_jsonl(span_log_path)
+                LOGGER.info("Imported %d spans from %s into %s", imported, span_log_path, db_path)
+            _stores[key] = store
+        elif max_size_mb is not None:
+            store.max_bytes = max_size_mb * 1024 * 1024
+        return store
+
+
+__all__ = [
+    "AGGREGATE_RETENTION_DAYS",
+    "DEFAULT_MAX_SIZE_MB",
+    "SKILL_OUTCOMES",
+    "SpanStore",
+    "get_span_store",
+    "span_store_path",
+]
@@ -0,0 +1,77 @@
+"""Tests for the reverse JSONL log reader."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from core.observability.log_tail import iter_lines_reversed, literal_needle, tail_jsonl
+
+
+def _write_log(path: Path, count: int) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        for i in range(count):
+            level = "ERROR" if i % 3 == 0 else "WARNING"
+            f.write(json.dumps({"i": i, "level": level, "message": f"entry {i}"}) + "\n")
+        f.write("not json\n\n")
+
+
+def test_lines_are_read_backwards_across_block_boundaries(tmp_path: Path) -> None:
+    path = tmp_path / "app_logs.jsonl"
+    path.write_bytes(b"first\nsecond line\n\nthird\nlast")
+    data = path.read_bytes()
+
+    lines = list(iter_lines_reversed(path, block_size=4))
+
+    assert [line for _, line in lines] == [b"last", b"third", b"second line", b"first"]
+    assert all(data[offset:].startswith(line) for offset, line in lines)
+
+
+def test_tail_returns_newest_entries_and_filters_during_scan(tmp_path: Path) -> None:
+    path = tmp_path / "app_logs.jsonl"
+    _write_log(path, 100)
+
+    page = tail_jsonl(path, 3, block_size=64)
+    assert [e["i"] for e in page.entries] == [99, 98, 97]
+
+    errors = tail_jsonl(
+        path,
+        3,
+        match=lambda e: e["level"] == "ERROR",
+        contains=[b"ERROR"],
+        block_size=64,
+    )
+    assert [e["i"] for e in errors.entries] == [99, 96, 93]
+
+
+def test_pages_continue_from_next_before(tmp_path: Path) -> None:
+    path = tmp_path / "app_logs.jsonl"
+    _write_log(path, 10)
+
+    seen: list[int] = []
+    before = None
+    for _ in range(10):
+        page = tail_jsonl(path, 4, before=before, block_size=32)
+        seen.extend(e["i"] for e in page.entries)
+        before = page.next_before
+        if before is None:
+            break
+
+    assert seen == list(range(9, -1, -1))
+
+
+def test_scan_budget_limits_lines_read(tmp_path: Path) -> None:
+    path = tmp_path / "app_logs.jsonl"
+    _write_log(path, 100)
+
+    page = tail_jsonl(path, 10, match=lambda e: e["i"] < 5, max_lines=20)
+
+    assert page.entries == []
+    assert page.scanned_lines == 20
+    assert page.next_before is not None
+
+
+def test_literal_needle_rejects_escaped_values() -> None:
+    assert literal_needle("core.runtime") == b"core.runtime"
+    assert literal_needle('say "hi"') is None
+    assert literal_needle("café") is None
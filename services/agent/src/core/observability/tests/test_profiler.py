@@ -0,0 +1,166 @@
+"""Tests for the request phase latency profiler."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+
+from core.observability import profiler
+from core.observability.profiler import (
+    LatencyProfiler,
+    LoopStallMonitor,
+    PhaseHistogram,
+    get_latency_profiler,
+    phase,
+    profiled_iter,
+    profiled_phase,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 10_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_percentiles_are_interpolated_within_fixed_buckets() -> None:
+    histogram = PhaseHistogram()
+    for value in range(1, 101):  # 1..100 ms
+        histogram.record(float(value), now=0.0)
+
+    stats = histogram.summary(60, now=0.0)
+
+    assert stats is not None
+    assert stats["count"] == 100 and stats["max_ms"] == 100.0
+    assert 25 <= stats["p50_ms"] <= 50
+    assert 50 <= stats["p95_ms"] <= 100
+    assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+
+
+def test_sliding_windows_drop_old_samples() -> None:
+    clock = _Clock()
+    latency = LatencyProfiler(clock=clock)
+    latency.record("planner", 900.0)
+    clock.now += 600
+    latency.record("planner", 20.0)
+
+    assert [row["count"] for row in latency.summary(60)] == [1]
+    assert latency.summary(60)[0]["max_ms"] == 20.0
+    assert latency.summary(900)[0]["count"] == 2
+
+    clock.now += 3600
+    assert latency.summary(3600) == []
+
+
+def test_skill_phases_are_recorded_per_skill_and_in_total() -> None:
+    latency = LatencyProfiler(clock=_Clock())
+    latency.record("skill.turn", 100.0, skill="research")
+    latency.record("skill.turn", 300.0, skill="backlog")
+
+    rows = {(row["phase"], row["skill"]): row["count"] for row in latency.summary()}
+
+    assert rows == {
+        ("skill.turn", None): 2,
+        ("skill.turn", "research"): 1,
+        ("skill.turn", "backlog"): 1,
+    }
+
+
+def test_nested_phases_with_the_same_name_are_recorded_once() -> None:
+    get_latency_profiler().reset()
+
+    @profiled_phase("context.resolve")
+    async def resolve_anonymous() -> str:
+        return "ctx"
+
+    @profiled_phase("context.resolve")
+    async def resolve_for_conversation_id() -> str:
+        with phase("history.load"):
+            return await resolve_anonymous()
+
+    assert asyncio.run(resolve_for_conversation_id()) == "ctx"
+
+    counts = {row["phase"]: row["count"] for row in get_latency_profiler().summary()}
+    assert counts == {"context.resolve": 1, "history.load": 1}
+    get_latency_profiler().reset()
+
+
+def test_profiled_iter_excludes_consumer_time() -> None:
+    get_latency_profiler().reset()
+
+    async def produce() -> AsyncIterator[int]:
+        for i in range(2):
+            await asyncio.sleep(0.01)
+            yield i
+
+    async def consume() -> list[int]:
+        items = []
+        async for item in profiled_iter("orchestrator", produce()):
+            items.append(item)
+            await asyncio.sleep(0.2)  # Slow consumer must not count
+        return items
+
+    assert asyncio.run(consume()) == [0, 1]
+
+    [row] = get_latency_profiler().summary()
+    assert row["phase"] == "orchestrator" and row["count"] == 1
+    assert 20 <= row["max_ms"] < 200
+    get_latency_profiler().reset()
+
+
+def test_profiled_iter_closes_stream_when_consumer_stops_early() -> None:
+    get_latency_profiler().reset()
+    closed = []
+
+    async def produce() -> AsyncIterator[int]:
+        try:
+            for i in range(3):
+                yield i
+        finally:
+            closed.append(True)
+
+    async def consume() -> None:
+        wrapped = profiled_iter("orchestrator", produce())
+        async for _ in wrapped:
+            break
+        await wrapped.aclose()
+
+    asyncio.run(consume())
+
+    assert closed == [True]
+    get_latency_profiler().reset()
+
+
+def test_stall_monitor_captures_blocking_stack() -> None:
+    def blocking_call() -> None:
+        time.sleep(0.3)
+
+    async def run() -> LoopStallMonitor:
+        monitor = LoopStallMonitor(threshold_ms=100)
+        monitor.start()
+        await asyncio.sleep(0.05)
+        blocking_call()
+        await asyncio.sleep(0.1)
+        monitor.stop()
+        return monitor
+
+    monitor = asyncio.run(run())
+    stalls = monitor.stalls()
+
+    assert len(stalls) == 1
+    assert stalls[0]["duration_ms"] >= 100
+    assert any("blocking_call" in frame for frame in stalls[0]["stack"])
+
+
+def test_latency_report_includes_stall_monitor_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(profiler, "_stall_monitor", None)
+
+    report = profiler.latency_report(900)
+
+    assert report["window_seconds"] == 900
+    assert report["stall_monitor"] == {"enabled": False, "threshold_ms": None, "stalls": []}
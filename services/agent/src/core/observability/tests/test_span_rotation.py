@@ -102,17 +102,21 @@ def test_rotated_files_contain_valid_json() -> None:
                     assert isinstance(data, dict), "Each line should be valid JSON"
 
 
-def test_rotation_is_thread_safe() -> None:
-    """Test that rotation uses locking for thread safety."""
-    import threading
-
+def test_rotation_reopens_the_span_log() -> None:
+    """Test that writes after a rotation go to a freshly opened span log."""
     with tempfile.TemporaryDirectory() as tmpdir:
         log_path = Path(tmpdir) / "spans.jsonl"
         exporter = _FileSpanExporter(str(log_path), max_size_mb=1, max_files=3)
+        exporter._max_size_bytes = 1000  # Override to 1KB for testing
+
+        exporter._write_batch_sync([{"batch": 1, "data": "x" * 1000}])
+        exporter._write_batch_sync([{"batch": 2}])
 
-        # Verify rotation lock exists
-        assert hasattr(exporter, "_rotation_lock")
-        assert isinstance(exporter._rotation_lock, threading.Lock)
+        rotated = [json.loads(line) for line in Path(f"{log_path}.1").read_text().splitlines()]
+        current = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert [r["batch"] for r in rotated] == [1]
+        assert current == [{"batch": 2}]
+        exporter.shutdown()
 
 
 def test_rotation_handles_missing_file() -> None:
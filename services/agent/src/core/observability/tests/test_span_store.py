@@ -0,0 +1,259 @@
+"""Tests for the indexed span store."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from core.observability.span_store import SpanStore, get_span_store
+from core.observability.tracing import _FileSpanExporter
+
+TRACE_A = "a" * 32
+TRACE_B = "b" * 32
+
+
+def _span(
+    trace_id: str,
+    span_id: str,
+    *,
+    start: str = "2026-01-01T10:00:00",
+    context_id: str | None = None,
+    events: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    attributes = {"context_id": context_id} if context_id else {}
+    return {
+        "name": "request",
+        "context": {"trace_id": trace_id, "span_id": span_id, "parent_id": None},
+        "attributes": attributes,
+        "start_time": start,
+        "duration_ms": 12.5,
+        "status": "OK",
+        "events": events or [],
+    }
+
+
+def _debug_event(event_type: str, timestamp: str, data: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "name": f"debug.{event_type}",
+        "timestamp": timestamp,
+        "attributes": {"debug.event_type": event_type, "debug.event_data": json.dumps(data)},
+    }
+
+
+def test_spans_are_looked_up_by_trace_and_start_time(tmp_path: Path) -> None:
+    store = SpanStore(tmp_path / "spans.db")
+    store.add(
+        [
+            _span(TRACE_A, "1", start="2026-01-01T10:00:00"),
+            _span(TRACE_B, "2", start="2026-01-01T11:00:00"),
+            _span(TRACE_A, "3", start="2026-01-01T12:00:00"),
+        ]
+    )
+    store.add([_span(TRACE_A, "1")])  # Duplicate exports are ignored
+
+    assert [s["context"]["span_id"] for s in store.spans_for_trace(TRACE_A)] == ["1", "3"]
+    assert len(store.spans_for_trace("bbbb")) == 1
+    assert [s["context"]["span_id"] for s in store.recent_spans(2)] == ["2", "3"]
+    assert [s["context"]["span_id"] for s in store.spans_since("2026-01-01T10:30:00")] == [
+        "2",
+        "3",
+    ]
+    assert store.count() == 3
+    store.close()
+
+
+def test_debug_events_filter_by_context_type_and_time(tmp_path: Path) -> None:
+    store = SpanStore(tmp_path / "spans.db")
+    store.add(
+        [
+            _span(
+                TRACE_A,
+                "1",
+                context_id="ctx-1",
+                events=[
+                    _debug_event("supervisor", "2026-01-01T10:00:01", {"outcome": "REPLAN"}),
+                    _debug_event("tool_call", "2026-01-01T10:00:02", {"tool": "search"}),
+                    {"name": "exception", "timestamp": "2026-01-01T10:00:03", "attributes": {}},
+                ],
+            ),
+            _span(
+                TRACE_B,
+                "2",
+                context_id="ctx-2",
+                events=[_debug_event("supervisor", "2026-01-01T10:00:04", {"outcome": "ABORT"})],
+            ),
+        ]
+    )
+
+    all_events = store.debug_events()
+    assert [e["attributes"]["debug.event_type"] for e in all_events] == [
+        "supervisor",
+        "tool_call",
+        "supervisor",
+    ]
+    assert all_events[0]["trace_id"] == TRACE_B
+
+    ctx_events = store.debug_events(context_id="ctx-1", event_type="supervisor")
+    assert len(ctx_events) == 1 and ctx_events[0]["trace_id"] == TRACE_A
+    recent = store.debug_events(event_type="supervisor", since="2026-01-01T10:00:03")
+    assert [e["timestamp"] for e in recent] == ["2026-01-01T10:00:04"]
+    assert len(store.debug_events(trace_id=TRACE_A, limit=1)) == 1
+    store.close()
+
+
+def test_retention_deletes_oldest_spans(tmp_path: Path) -> None:
+    store = SpanStore(tmp_path / "spans.db", max_size_mb=1)
+    store.max_bytes = 5000
+    for i in range(40):
+        store.add([{**_span(TRACE_A, f"{i:016x}"), "payload": "x" * 500}])
+
+    remaining = store.spans_for_trace(TRACE_A)
+    assert 0 < len(remaining) < 10
+    assert remaining[-1]["context"]["span_id"] == f"{39:016x}"
+    store.close()
+
+    reopened = SpanStore(tmp_path / "spans.db", max_size_mb=1)
+    assert reopened.count() == len(remaining)
+    reopened.close()
+
+
+def test_get_span_store_imports_existing_span_log(tmp_path: Path) -> None:
+    log_path = tmp_path / "spans.jsonl"
+    assert get_span_store(log_path) is None
+
+    Path(f"{log_path}.1").write_text(json.dumps(_span(TRACE_A, "1")) + "\n")
+    log_path.write_text(json.dumps(_span(TRACE_A, "2")) + "\nnot json\n")
+
+    store = get_span_store(log_path)
+    assert store is not None
+    assert store.path == tmp_path / "spans.db"
+    assert [s["context"]["span_id"] for s in store.recent_spans(10)] == ["1", "2"]
+    assert get_span_store(log_path) is store
+
+
+def test_exporter_writes_to_store_without_jsonl_mirror(tmp_path: Path) -> None:
+    log_path = tmp_path / "spans.jsonl"
+    store = get_span_store(log_path, create=True)
+    assert store is not None
+
+    exporter = _FileSpanExporter(str(log_path), store=store, mirror_jsonl=False)
+    exporter._write_batch_sync([_span(TRACE_A, "1")])
+
+    assert not log_path.exists()
+    assert store.count() == 1
+
+
+def _skill_span(span_id: str, timestamp: str, outcome: str) -> dict[str, Any]:
+    return _span(
+        TRACE_A,
+        span_id,
+        start=timestamp,
+        context_id="ctx-1",
+        events=[
+            _debug_event("skill_step", timestamp, {"skill_name": "research", "outcome": outcome}),
+            _debug_event(
+                "supervisor",
+                timestamp,
+                {"outcome": outcome, "reason": "empty result", "skill_name": "research"},
+            ),
+        ],
+    )
+
+
+def test_skill_aggregates_are_maintained_on_insert(tmp_path: Path) -> None:
+    store = SpanStore(tmp_path / "spans.db")
+    store.add(
+        [
+            _skill_span("1", "2026-01-01T09:10:00", "SUCCESS"),
+            _skill_span("2", "2026-01-01T10:10:00", "REPLAN"),
+            _skill_span("3", "2026-01-01T10:20:00", "ABORT"),
+        ]
+    )
+
+    counts = store.skill_outcome_counts("ctx-1", "2026-01-01T10:15:00")
+    assert counts == {"research": {"total": 2, "SUCCESS": 0, "REPLAN": 1, "ABORT": 1, "RETRY": 0}}
+    decisions = store.supervisor_decisions("ctx-1", "2026-01-01T10:15:00")
+    assert [d["outcome"] for d in decisions] == ["ABORT"]
+    assert decisions[0]["reason"] == "empty result" and decisions[0]["trace_id"] == TRACE_A
+    assert store.skill_outcome_counts("ctx-2", "2026-01-01T00:00:00") == {}
+    store.close()
+
+
+def test_skill_aggregates_outlive_span_retention(tmp_path: Path) -> None:
+    store = SpanStore(tmp_path / "spans.db")
+    store.max_bytes = 3000
+    for i in range(20):
+        store.add([{**_skill_span(f"{i:016x}", "2026-01-01T10:00:00", "REPLAN"), "pad": "x" * 500}])
+
+    assert store.count() < 20
+    assert store.skill_outcome_counts("ctx-1", "2026-01-01T00:00:00")["research"]["total"] == 20
+    assert len(store.supervisor_decisions("ctx-1", "2026-01-01T00:00:00")) == 20
+    store.close()
+
+
+def test_skill_aggregates_drop_entries_past_retention(tmp_path: Path) -> None:
+    store = SpanStore(tmp_path / "spans.db")
+    store.add([_skill_span("1", "2026-01-01T10:00:00", "REPLAN")])
+    store.add([_skill_span("2", "2026-06-01T10:00:00", "ABORT")])
+
+    counts = store.skill_outcome_counts("ctx-1", "2025-01-01T00:00:00")
+    assert counts["research"]["total"] == 1 and counts["research"]["ABORT"] == 1
+    assert len(store.supervisor_decisions("ctx-1", "2025-01-01T00:00:00")) == 1
+    store.close()
+
+
+def test_skill_aggregates_are_backfilled_for_existing_stores(tmp_path: Path) -> None:
+    store = SpanStore(tmp_path / "spans.db")
+    store.add([_skill_span("1", "2026-01-01T10:00:00", "REPLAN")])
+    store._conn.execute("DROP TABLE skill_outcomes")
+    store._conn.execute("DROP TABLE supervisor_decisions")
+    store._conn.commit()
+    store.close()
+
+    reopened = SpanStore(tmp_path / "spans.db")
+    assert reopened.skill_outcome_counts("ctx-1", "2026-01-01T00:00:00")["research"]["REPLAN"] == 1
+    assert len(reopened.supervisor_decisions("ctx-1", "2026-01-01T00:00:00")) == 1
+    reopened.close()
+
+
+class _FakeSpan:
+    def __init__(self, span_id: int) -> None:
+        self.name = "request"
+        self.start_time = 1_767_261_600_000_000_000
+        self.end_time = self.start_time + 2_000_000
+        self.attributes = {"status": "OK"}
+        self._span_id = span_id
+
+    def get_span_context(self) -> Any:
+        return type("Ctx", (), {"trace_id": 0xA, "span_id": self._span_id})()
+
+
+def test_exporter_flushes_queued_spans_from_writer_thread(tmp_path: Path) -> None:
+    log_path = tmp_path / "spans.jsonl"
+    store = SpanStore(tmp_path / "spans.db")
+    exporter = _FileSpanExporter(str(log_path), store=store, flush_spans=4, flush_interval=0.05)
+
+    exporter.export([_FakeSpan(i) for i in range(1, 4)])
+    assert exporter.force_flush(timeout_millis=5000)
+    exporter.export([_FakeSpan(i) for i in range(4, 6)])
+    exporter.shutdown()
+
+    assert store.count() == 5
+    lines = log_path.read_bytes().splitlines()
+    assert [json.loads(line)["context"]["span_id"] for line in lines] == [
+        f"{i:016x}" for i in range(1, 6)
+    ]
+    assert exporter.dropped_spans == 0
+    store.close()
+
+
+def test_exporter_drops_oldest_spans_when_queue_is_full(tmp_path: Path) -> None:
+    exporter = _FileSpanExporter(str(tmp_path / "spans.jsonl"), max_queue_size=3)
+    exporter._writer = threading.Thread()  # Stalled writer: nothing drains the queue
+
+    exporter.export([_FakeSpan(i) for i in range(1, 6)])
+
+    assert exporter.dropped_spans == 2
+    assert [span._span_id for span in exporter._queue] == [3, 4, 5]
@@ -7,8 +7,6 @@ restricted environments without installing optional dependencies.
 
 from __future__ import annotations
 
-import asyncio
-import json
 import logging
 import os
 import threading
@@ -19,7 +17,13 @@ from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from types import TracebackType
-from typing import Any
+from typing import Any, BinaryIO
+
+import orjson
+
+from core.observability.metrics import record_span_export
+from core.observability.span_store import DEFAULT_MAX_SIZE_MB as DEFAULT_SPAN_STORE_MAX_SIZE_MB
+from core.observability.span_store import SpanStore, get_span_store
 
 try:  # pragma: no cover - exercised implicitly during imports
     from openinference.instrumentation.litellm import (
@@ -66,6 +70,9 @@ except ImportError:  # pragma: no cover - fallback branch for offline CI
 
 logger = logging.getLogger(__name__)
 
+# Spans buffered for the span exporter's writer thread before the oldest are dropped
+DEFAULT_SPAN_QUEUE_SIZE = 20_000
+
 
 class _NoOpSpanContext:
     """Minimal span context used when OpenTelemetry is absent."""
@@ -210,183 +217,292 @@ class _SanitizingSpanProcessor(SpanProcessor):
         return True
 
 
-class _FileSpanExporter(SpanExporter):
-    """JSONL file exporter for spans with async write batching and rotation.
+def _attributes_dict(attributes: Any) -> dict[str, Any]:
+    """Copy span or event attributes into a plain dict.
 
-    Uses asyncio.to_thread() to offload file I/O when an event loop is available.
-    Falls back to synchronous writes when called outside an async context.
+    OTel hands out read-only mappings whose ``copy()`` returns a dict directly,
+    which is several times faster than ``dict(mapping)``.
+    """
+    if not attributes:
+        return {}
+    copied = attributes.copy() if hasattr(attributes, "copy") else attributes
+    return copied if isinstance(copied, dict) else dict(copied)
 
-    Rotation: When the file exceeds max_size_mb, rotates to .1, .2, etc.
+
+def _ns_to_iso(timestamp_ns: int | None) -> str | None:
+    return datetime.utcfromtimestamp(timestamp_ns / 1e9).isoformat() if timestamp_ns else None
+
+
+class _FileSpanExporter(SpanExporter):
+    """Buffered exporter writing spans to the span store and an optional JSONL mirror.
+
+    ``export`` runs on the BatchSpanProcessor thread and only appends the
+    finished spans to a bounded ring buffer. When the buffer is full the
+    oldest spans are dropped and counted (``dropped_spans`` and the
+    ``agent.tracing.spans`` metric), so a stalled disk cannot grow memory
+    without bound.
+
+    A writer thread flushes the buffer once it holds ``flush_spans`` spans or
+    ``flush_interval`` seconds after the first pending span. It converts each
+    span to a record encoded once with orjson, writes the batch to ``store``
+    in one transaction and, unless ``mirror_jsonl`` is False, appends it to
+    the JSONL file at ``path`` with a single write of newline-framed records.
+
+    Rotation: When the file exceeds max_size_mb, it is closed, rotated to
+    .1, .2, etc. and reopened. Only one thread writes at a time (the writer
+    thread, or the caller while it is not running), so rotation needs no lock.
     """
 
-    def __init__(self, path: str, max_size_mb: int = 10, max_files: int = 3) -> None:
+    def __init__(
+        self,
+        path: str,
+        max_size_mb: int = 10,
+        max_files: int = 3,
+        *,
+        store: SpanStore | None = None,
+        mirror_jsonl: bool = True,
+        max_queue_size: int = DEFAULT_SPAN_QUEUE_SIZE,
+        flush_spans: int = 512,
+        flush_interval: float = 1.0,
+    ) -> None:
         self._path = Path(path)
         self._path.parent.mkdir(parents=True, exist_ok=True)
-        self._queue: deque[dict[str, Any]] = deque()
-        self._write_task: asyncio.Task[None] | None = None
         self._max_size_bytes = max_size_mb * 1024 * 1024
         self._max_files = max_files
-        self._rotation_lock = threading.Lock()
+        self._store = store
+        self._mirror_jsonl = mirror_jsonl
+        self._max_queue_size = max_queue_size
+        self._flush_spans = flush_spans
+        self._flush_interval = flush_interval
+        self._queue: deque[Any] = deque()
+        self._cond = threading.Condition()
+        self._writer: threading.Thread | None = None
+        self._flush_requested = False
+        self._writing = False
+        self._closing = False
+        self._fp: BinaryIO | None = None
+        self._size = 0
+        self.dropped_spans = 0
+
+    @staticmethod
+    def _span_record(span: Any) -> dict[str, Any]:
+        """Convert a finished span to its stored record."""
+        ctx = span.get_span_context()
+        parent = getattr(span, "parent", None)
+        attributes = _attributes_dict(getattr(span, "attributes", None))
+
+        # reliable timestamp conversion (ns to ISO or ms)
+        start_ns = getattr(span, "start_time", 0) or 0
+        end_ns = getattr(span, "end_time", 0) or 0
+        duration_ms = (end_ns - start_ns) / 1e6 if end_ns and start_ns else 0.0
+
+        # Status extraction
+        status_name = "UNSET"
+        status_obj = getattr(span, "status", None)
+
+        # OTLP/Real Span
+        if status_obj and hasattr(status_obj, "status_code"):
+            status_name = getattr(status_obj.status_code, "name", "UNSET")
+        # NoOp Span (Attributes)
+        elif span:
+            status_name = str(attributes.get("status", "UNSET"))
+
+        # Extract span events (debug events, exceptions, etc.)
+        events_list = [
+            {
+                "name": getattr(evt, "name", ""),
+                "timestamp": _ns_to_iso(getattr(evt, "timestamp", None)),
+                "attributes": _attributes_dict(getattr(evt, "attributes", None)),
+            }
+            for evt in getattr(span, "events", None) or ()
+        ]
+
+        return {
+            "name": getattr(span, "name", "unknown"),
+            "context": {
+                "trace_id": format(getattr(ctx, "trace_id", 0), "032x"),
+                "span_id": format(getattr(ctx, "span_id", 0), "016x"),
+                "parent_id": (format(getattr(parent, "span_id", 0), "016x") if parent else None),
+            },
+            "kind": getattr(getattr(span, "kind", None), "name", "INTERNAL"),
+            "attributes": attributes,
+            "start_time": _ns_to_iso(start_ns),
+            "end_time": _ns_to_iso(end_ns),
+            "duration_ms": duration_ms,
+            "status": status_name,
+            "events": events_list,
+        }
 
     def export(self, spans: Sequence[Any]) -> Any:
-        """Export spans to file. Batches writes when async context is available."""
-        records = []
-        for span in spans:
-            ctx = span.get_span_context()
-            parent = getattr(span, "parent", None)
-
-            # reliable timestamp conversion (ns to ISO or ms)
-            start_ns = getattr(span, "start_time", 0) or 0
-            end_ns = getattr(span, "end_time", 0) or 0
-
-            duration_ms = (end_ns - start_ns) / 1e6 if end_ns and start_ns else 0.0
-            start_iso = datetime.utcfromtimestamp(start_ns / 1e9).isoformat() if start_ns else None
-
-            # Status extraction
-            status_name = "UNSET"
-            status_obj = getattr(span, "status", None)
-
-            # OTLP/Real Span
-            if status_obj and hasattr(status_obj, "status_code"):
-                status_code = status_obj.status_code
-                status_name = getattr(status_code, "name", "UNSET")
-            # NoOp Span (Attributes)
-            elif span and hasattr(span, "attributes"):
-                status_name = str(span.attributes.get("status", "UNSET"))
-
-            # Extract span events (debug events, exceptions, etc.)
-            raw_events = getattr(span, "events", None) or ()
-            events_list: list[dict[str, Any]] = []
-            for evt in raw_events:
-                evt_attrs = dict(getattr(evt, "attributes", {}) or {})
-                evt_ts = getattr(evt, "timestamp", None)
-                evt_iso = datetime.utcfromtimestamp(evt_ts / 1e9).isoformat() if evt_ts else None
-                events_list.append(
-                    {
-                        "name": getattr(evt, "name", ""),
-                        "timestamp": evt_iso,
-                        "attributes": evt_attrs,
-                    }
+        """Queue spans for the writer thread, dropping the oldest if the buffer is full."""
+        dropped = 0
+        with self._cond:
+            was_empty = not self._queue
+            self._queue.extend(spans)
+            overflow = len(self._queue) - self._max_queue_size
+            if overflow > 0:
+                for _ in range(overflow):
+                    self._queue.popleft()
+                self.dropped_spans += overflow
+                dropped = overflow
+            # Wake the writer to start the flush timer or to flush a full batch
+            if was_empty or len(self._queue) >= self._flush_spans:
+                self._cond.notify_all()
+            if self._writer is None and not self._closing:
+                self._writer = threading.Thread(
+                    target=self._run_writer, name="span-exporter", daemon=True
                 )
-
-            record = {
-                "name": getattr(span, "name", "unknown"),
-                "context": {
-                    "trace_id": format(getattr(ctx, "trace_id", 0), "032x"),
-                    "span_id": format(getattr(ctx, "span_id", 0), "016x"),
-                    "parent_id": (
-                        format(getattr(parent, "span_id", 0), "016x") if parent else None
-                    ),
-                },
-                "kind": getattr(getattr(span, "kind", None), "name", "INTERNAL"),
-                "attributes": dict(getattr(span, "attributes", {}) or {}),
-                "start_time": start_iso,
-                "end_time": (
-                    datetime.utcfromtimestamp(end_ns / 1e9).isoformat() if end_ns else None
-                ),
-                "duration_ms": duration_ms,
-                "status": status_name,
-                "events": events_list,
-            }
-            records.append(record)
-
-        # Queue records and ensure writer is running
-        self._queue.extend(records)
-        self._ensure_writer_running()
+                self._writer.start()
+        if dropped:
+            record_span_export(0, dropped)
 
         if _OTEL_AVAILABLE:
             return _otel_trace.Status(_otel_trace.StatusCode.OK)
         return None
 
-    def _ensure_writer_running(self) -> None:
-        """Start background writer if event loop is available, otherwise write sync."""
-        try:
-            loop = asyncio.get_running_loop()
-            if self._write_task is None or self._write_task.done():
-                self._write_task = loop.create_task(self._background_writer())
-        except RuntimeError:
-            # No event loop - fall back to synchronous write
-            self._write_sync()
-
-    async def _background_writer(self) -> None:
-        """Background task that batches and writes records asynchronously."""
-        while self._queue:
-            batch: list[dict[str, Any]] = []
-            # Collect up to 100 records for batching
-            while self._queue and len(batch) < 100:
-                batch.append(self._queue.popleft())
-
-            if batch:
-                # Offload file I/O to thread pool
-                await asyncio.to_thread(self._write_batch_sync, batch)
-
-            # Small delay to allow more records to accumulate
-            await asyncio.sleep(0.05)
+    def _flush_due(self) -> bool:
+        return self._closing or self._flush_requested or len(self._queue) >= self._flush_spans
+
+    def _run_writer(self) -> None:
+        """Writer thread: flush on size or time thresholds until shutdown."""
+        while True:
+            with self._cond:
+                while not self._queue and not self._closing:
+                    self._cond.wait()
+                self._cond.wait_for(self._flush_due, timeout=self._flush_interval)
+                batch = list(self._queue)
+                self._queue.clear()
+                self._flush_requested = False
+                self._writing = True
+                closing = self._closing
+            try:
+                if batch:
+                    self._write_spans(batch)
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+            if closing:
+                return
 
     def _rotate_if_needed(self) -> None:
         """Rotate log file if it exceeds size threshold.
 
-        Thread-safe rotation using file locking. Rotates spans.jsonl to spans.jsonl.1,
-        spans.jsonl.1 to spans.jsonl.2, etc. Deletes oldest file if max_files exceeded.
+        Closes the open file, rotates spans.jsonl to spans.jsonl.1, spans.jsonl.1
+        to spans.jsonl.2, etc. and deletes the oldest file if max_files is exceeded.
+        The next write reopens spans.jsonl.
         """
-        with self._rotation_lock:
-            # Check if rotation needed
-            if not self._path.exists():
+        try:
+            if self._fp is not None:
+                file_size = self._size
+            elif self._path.exists():
+                file_size = self._path.stat().st_size
+            else:
+                return
+            if file_size < self._max_size_bytes:
                 return
 
+            self._close_file()
+
+            # Rotate existing files: .2 -> .3, .1 -> .2, etc.
+            for i in range(self._max_files - 1, 0, -1):
+                old_file = Path(f"{self._path}.{i}")
+                new_file = Path(f"{self._path}.{i + 1}")
+
+                if old_file.exists():
+                    if i + 1 > self._max_files:
+                        # Delete oldest file
+                        old_file.unlink()
+                        logger.info(f"Deleted oldest span log: {old_file}")
+                    else:
+                        # Rename to next number
+                        old_file.rename(new_file)
+
+            # Rotate current file to .1
+            rotated_path = Path(f"{self._path}.1")
+            self._path.rename(rotated_path)
+            logger.info(
+                f"Rotated span log: {self._path} -> {rotated_path} "
+                f"(size: {file_size / 1024 / 1024:.2f} MB)"
+            )
+
+        except Exception as e:
+            logger.warning(f"Failed to rotate span log {self._path}: {e}")
+
+    def _close_file(self) -> None:
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def _write_encoded(self, batch: list[tuple[dict[str, Any], bytes]]) -> None:
+        """Write a batch of (record, orjson bytes) pairs to the store and the mirror."""
+        if self._store is not None:
             try:
-                file_size = self._path.stat().st_size
-                if file_size < self._max_size_bytes:
-                    return
-
-                # Rotate existing files: .2 -> .3, .1 -> .2, etc.
-                for i in range(self._max_files - 1, 0, -1):
-                    old_file = Path(f"{self._path}.{i}")
-                    new_file = Path(f"{self._path}.{i + 1}")
-
-                    if old_file.exists():
-                        if i + 1 > self._max_files:
-                            # Delete oldest file
-                            old_file.unlink()
-                            logger.info(f"Deleted oldest span log: {old_file}")
-                        else:
-                            # Rename to next number
-                            old_file.rename(new_file)
-
-                # Rotate current file to .1
-                rotated_path = Path(f"{self._path}.1")
-                self._path.rename(rotated_path)
-                logger.info(
-                    f"Rotated span log: {self._path} -> {rotated_path} "
-                    f"(size: {file_size / 1024 / 1024:.2f} MB)"
-                )
+                self._store.add([record for record, _ in batch], [blob for _, blob in batch])
+            except Exception as e:
+                logger.warning(f"Failed to store span batch in {self._store.path}: {e}")
+        if self._mirror_jsonl:
+            try:
+                # Check if rotation needed before writing
+                self._rotate_if_needed()
+                if self._fp is None:
+                    self._fp = self._path.open("ab")
+                    self._size = self._fp.tell()
+                data = b"\n".join(blob for _, blob in batch) + b"\n"
+                self._fp.write(data)
+                self._fp.flush()
+                self._size += len(data)
+            except Exception as e:
+                logger.warning(f"Failed to write span batch to {self._path}: {e}")
+        record_span_export(len(batch))
 
+    def _write_spans(self, spans: list[Any]) -> None:
+        """Convert and write a batch of finished spans."""
+        batch = []
+        for span in spans:
+            try:
+                record = self._span_record(span)
+                batch.append((record, orjson.dumps(record, default=str)))
             except Exception as e:
-                logger.warning(f"Failed to rotate span log {self._path}: {e}")
+                logger.warning(f"Failed to serialize span {getattr(span, 'name', '?')}: {e}")
+        self._write_encoded(batch)
 
     def _write_batch_sync(self, records: list[dict[str, Any]]) -> None:
         """Synchronous write of a batch of records."""
-        try:
-            # Check if rotation needed before writing
-            self._rotate_if_needed()
-
-            with self._path.open("a", encoding="utf-8") as fp:
-                for record in records:
-                    fp.write(json.dumps(record) + "\n")
-        except Exception as e:
-            logger.warning(f"Failed to write span batch to {self._path}: {e}")
+        self._write_encoded([(record, orjson.dumps(record, default=str)) for record in records])
 
-    def _write_sync(self) -> None:
-        """Fallback synchronous write when no event loop is available."""
-        records = list(self._queue)
-        self._queue.clear()
-        if records:
-            self._write_batch_sync(records)
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Flush queued spans; return False if the writer did not finish in time."""
+        with self._cond:
+            if self._writer is not None and self._writer.is_alive():
+                self._flush_requested = True
+                self._cond.notify_all()
+                return self._cond.wait_for(
+                    lambda: not self._queue and not self._writing, timeout=timeout_millis / 1000
+                )
+            batch = list(self._queue)
+            self._queue.clear()
+        if batch:
+            self._write_spans(batch)
+        return True
 
     def shutdown(self) -> None:
-        """Flush any remaining queued records on shutdown."""
-        if self._queue:
-            self._write_sync()
+        """Flush any remaining queued records and stop the writer thread."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+            writer = self._writer
+        if writer is not None:
+            writer.join(timeout=5.0)
+            if writer.is_alive():
+                logger.warning("Span writer did not stop within 5s; pending spans are lost")
+                return
+        with self._cond:
+            batch = list(self._queue)
+            self._queue.clear()
+        if batch:
+            self._write_spans(batch)
+        self._close_file()
 
 
 def configure_tracing(
@@ -395,14 +511,20 @@ def configure_tracing(
     span_log_path: str | None = None,
     span_log_max_size_mb: int = 10,
     span_log_max_files: int = 3,
+    span_log_mirror: bool = True,
+    span_store_max_size_mb: int = DEFAULT_SPAN_STORE_MAX_SIZE_MB,
 ) -> None:
     """Initialise the tracer provider with OTLP, console, and file exporters if available.
 
     Args:
         service_name: Name of the service for tracing
-        span_log_path: Optional path to write spans (JSONL format)
+        span_log_path: Optional span log path; spans are stored in an indexed
+            SQLite store next to it (``spans.jsonl`` -> ``spans.db``)
         span_log_max_size_mb: Maximum size of span log before rotation (default: 10MB)
         span_log_max_files: Maximum number of rotated files to keep (default: 3)
+        span_log_mirror: Also append spans to the JSONL span log (default: True)
+        span_store_max_size_mb: Size limit of the span store before the oldest
+            spans are deleted (default: 100MB)
     """
     if not _OTEL_AVAILABLE:
         logger.info("OpenTelemetry not available; using no-op tracer")
@@ -418,13 +540,16 @@ def configure_tracing(
         console_processor: SpanProcessor = SimpleSpanProcessor(ConsoleSpanExporter())
         provider.add_span_processor(_SanitizingSpanProcessor(console_processor))
 
-    # 2. File Exporter (Batch) with rotation
+    # 2. Span store exporter (Batch), optionally mirrored to a rotated JSONL file
     span_log_file = span_log_path or os.getenv("SPAN_LOG_PATH")
     if span_log_file:
+        store = get_span_store(Path(span_log_file), create=True, max_size_mb=span_store_max_size_mb)
         exporter = _FileSpanExporter(
             span_log_file,
             max_size_mb=span_log_max_size_mb,
             max_files=span_log_max_files,
+            store=store,
+            mirror_jsonl=span_log_mirror,
         )
         file_processor: SpanProcessor = BatchSpanProcessor(exporter)
         provider.add_span_processor(_SanitizingSpanProcessor(file_processor))
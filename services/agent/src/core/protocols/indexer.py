@@ -41,6 +41,8 @@ class ICodeIndexer(Protocol):
         """Scan the root path and index all relevant files.
 
         Respects .gitignore patterns and skips hidden directories.
+        Files are indexed concurrently; unchanged files are skipped via a
+        local manifest and chunks of deleted files are purged.
         """
         ...
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any, Protocol, runtime_checkable
 
 
@@ -41,7 +42,7 @@ class IRAGManager(Protocol):
 
     async def ingest_document(
         self,
-        content: str,
+        content: str | Iterable[str],
         metadata: dict[str, Any],
         chunker: Any | None = None,
         document_type: str = "prose",
@@ -52,7 +53,7 @@ class IRAGManager(Protocol):
         splitting. Content-type routing via document_type parameter.
 
         Args:
-            content: Document text content.
+            content: Document text content, or an iterable of text pieces to stream.
             metadata: Metadata to attach to all chunks.
             chunker: Optional SemanticChunker instance (uses instance default if not provided).
             document_type: Type of document ('markdown' or 'prose') for content-type routing.
@@ -0,0 +1,294 @@
+"""Semantic cache of UnifiedOrchestrator routing decisions.
+
+Repeated intents ("turn off the kitchen lights", daily scheduled prompts)
+usually produce the same single-skill plan. The cache embeds the normalized
+prompt and stores that plan's template in a dedicated Qdrant collection,
+scoped per context. A later prompt within the similarity threshold reuses
+the template with its own text as the goal and skips the planner LLM call.
+
+Entries are tagged with a fingerprint of the skill index the planner saw,
+so adding, removing or editing a skill invalidates every cached decision;
+older entries are filtered out at lookup and pruned in the background.
+In shadow mode lookups run and are compared with the planner's decision
+(``record_routing_cache``), but the planner's decision is always used.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from uuid import UUID, uuid4
+
+from qdrant_client.models import (
+    FieldCondition,
+    Filter,
+    FilterSelector,
+    MatchValue,
+    PayloadSchemaType,
+    PointStruct,
+    Range,
+)
+from shared.models import Plan, PlanStep
+
+from core.providers import get_embedder
+from core.utils.vector_storage import (
+    VectorStorageProfile,
+    create_collection,
+    fit_vector,
+    lookup_schema,
+)
+
+if TYPE_CHECKING:
+    from qdrant_client import AsyncQdrantClient
+
+    from core.runtime.config import Settings
+
+LOGGER = logging.getLogger(__name__)
+
+# Prompts shorter than this are usually follow-ups ("yes, do it") whose
+# meaning depends on the conversation, so they are never cached
+_MIN_PROMPT_WORDS = 3
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Lowercase, collapse whitespace and drop trailing punctuation."""
+    return _WHITESPACE.sub(" ", prompt).strip().lower().rstrip("?!. ")
+
+
+def cacheable_prompt(prompt: str) -> bool:
+    """True if ``prompt`` is long enough to be looked up or stored."""
+    return len(normalize_prompt(prompt).split()) >= _MIN_PROMPT_WORDS
+
+
+def skills_fingerprint(available_skills_text: str) -> str:
+    """Identify the skill index a routing decision was made against."""
+    return hashlib.sha256(available_skills_text.encode()).hexdigest()[:16]
+
+
+@dataclass(frozen=True, slots=True)
+class RoutingLookup:
+    """Result of a cache lookup; carries the embedding for a later ``store``."""
+
+    context_id: UUID
+    fingerprint: str
+    vector: list[float]
+    plan: Plan | None = None  # Cached plan rebuilt for the current prompt
+    score: float = 0.0
+
+    @property
+    def skill(self) -> str | None:
+        return self.plan.steps[0].tool if self.plan else None
+
+
+def single_skill(plan: Plan) -> PlanStep | None:
+    """Return the plan's only step if it deterministically routes to one skill.
+
+    Only plans whose single step is a skill call driven by a ``goal`` argument
+    are cacheable; anything with extra arguments depends on the prompt details.
+    """
+    if len(plan.steps) != 1:
+        return None
+    step = plan.steps[0]
+    if step.action != "skill" or not step.tool or set(step.args) - {"goal"}:
+        return None
+    return step
+
+
+class RoutingCache:
+    """Qdrant-backed cache of single-skill routing decisions."""
+
+    def __init__(
+        self,
+        client: AsyncQdrantClient,
+        *,
+        collection: str,
+        threshold: float,
+        ttl_seconds: float,
+        shadow: bool = True,
+        profile: VectorStorageProfile | None = None,
+    ) -> None:
+        self._client = client
+        self._collection = collection
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.shadow = shadow
+        self._profile = profile or VectorStorageProfile()
+        self._ready = False
+        self._ready_lock = asyncio.Lock()
+        self._fingerprint: str | None = None
+        self._prune_task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings, client: AsyncQdrantClient) -> RoutingCache:
+        return cls(
+            client,
+            collection=settings.routing_cache_collection,
+            threshold=settings.routing_cache_similarity_threshold,
+            ttl_seconds=settings.routing_cache_ttl_seconds,
+            shadow=settings.routing_cache_shadow,
+            profile=VectorStorageProfile.from_settings(settings),
+        )
+
+    async def lookup(
+        self, prompt: str, *, context_id: UUID, available_skills_text: str
+    ) -> RoutingLookup | None:
+        """Find a cached decision for ``prompt``.
+
+        Returns None when the prompt is not cacheable or the cache is
+        unavailable; otherwise a ``RoutingLookup`` whose ``plan`` is set on
+        a hit.
+        """
+        if not cacheable_prompt(prompt):
+            return None
+        normalized = normalize_prompt(prompt)
+        fingerprint = skills_fingerprint(available_skills_text)
+        try:
+            await self._ensure_collection()
+            self._note_fingerprint(fingerprint)
+            vectors = await get_embedder().embed([normalized])
+            if not vectors:
+                return None
+            schema = await lookup_schema(
+                self._client, self._collection, hybrid=False, profile=self._profile
+            )
+            vector = fit_vector(vectors[0], schema.vector_size if schema else None)
+            response = await self._client.query_points(
+                collection_name=self._collection,
+                query=vector,
+                limit=1,
+                score_threshold=self.threshold,
+                query_filter=Filter(
+                    must=[
+                        FieldCondition(key="context_id", match=MatchValue(value=str(context_id))),
+                        FieldCondition(key="skills", match=MatchValue(value=fingerprint)),
+                        FieldCondition(
+                            key="created_at", range=Range(gte=time.time() - self.ttl_seconds)
+                        ),
+                    ]
+                ),
+                search_params=self._profile.search_params(),
+            )
+        except Exception as exc:
+            LOGGER.warning("Routing cache lookup failed: %s", exc)
+            return None
+
+        lookup = RoutingLookup(context_id=context_id, fingerprint=fingerprint, vector=vector)
+        if not response.points:
+            return lookup
+        match = response.points[0]
+        payload = match.payload or {}
+        plan = Plan(
+            description=str(payload.get("description") or "Cached plan"),
+            steps=[
+                PlanStep(
+                    id="1",
+                    label=str(payload.get("label") or "Skill"),
+                    executor="skill",
+                    action="skill",
+                    tool=str(payload["skill"]),
+                    args={"goal": prompt},
+                )
+            ],
+        )
+        return RoutingLookup(
+            context_id=context_id,
+            fingerprint=fingerprint,
+            vector=vector,
+            plan=plan,
+            score=match.score,
+        )
+
+    async def store(self, lookup: RoutingLookup, plan: Plan) -> None:
+        """Cache ``plan`` under the lookup's embedding if it is a single-skill plan."""
+        step = single_skill(plan)
+        if step is None:
+            return
+        point = PointStruct(
+            id=uuid4().hex,
+            vector=lookup.vector,
+            payload={
+                "context_id": str(lookup.context_id),
+                "skills": lookup.fingerprint,
+                "created_at": time.time(),
+                "skill": step.tool,
+                "label": step.label,
+                "description": plan.description,
+            },
+        )
+        try:
+            await self._client.upsert(collection_name=self._collection, points=[point])
+        except Exception as exc:
+            LOGGER.warning("Routing cache store failed: %s", exc)
+
+    async def _ensure_collection(self) -> None:
+        if self._ready:
+            return
+        async with self._ready_lock:
+            if self._ready:
+                return
+            if not await self._client.collection_exists(self._collection):
+                await create_collection(
+                    self._client,
+                    self._collection,
+                    dimension=get_embedder().dimension,
+                    profile=self._profile,
+                )
+                for field, schema in (
+                    ("context_id", PayloadSchemaType.KEYWORD),
+                    ("skills", PayloadSchemaType.KEYWORD),
+                    ("created_at", PayloadSchemaType.FLOAT),
+                ):
+                    await self._client.create_payload_index(
+                        self._collection, field_name=field, field_schema=schema
+                    )
+            self._ready = True
+
+    def _note_fingerprint(self, fingerprint: str) -> None:
+        """Prune entries for other skill indexes and expired ones when the index changes."""
+        if fingerprint == self._fingerprint:
+            return
+        self._fingerprint = fingerprint
+        if self._prune_task is None or self._prune_task.done():
+            self._prune_task = asyncio.create_task(self._prune(fingerprint))
+
+    async def _prune(self, fingerprint: str) -> None:
+        try:
+            await self._client.delete(
+                collection_name=self._collection,
+                points_selector=FilterSelector(
+                    filter=Filter(
+                        should=[
+                            Filter(
+                                must_not=[
+                                    FieldCondition(
+                                        key="skills", match=MatchValue(value=fingerprint)
+                                    )
+                                ]
+                            ),
+                            FieldCondition(
+                                key="created_at",
+                                range=Range(lt=time.time() - self.ttl_seconds),
+                            ),
+                        ]
+                    )
+                ),
+            )
+        except Exception as exc:
+            LOGGER.warning("Routing cache prune failed: %s", exc)
+
+
+__all__ = [
+    "RoutingCache",
+    "RoutingLookup",
+    "cacheable_prompt",
+    "normalize_prompt",
+    "single_skill",
+    "skills_fingerprint",
+]
@@ -8,19 +8,66 @@ model call that either:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass
-from datetime import datetime
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
 from shared.models import AgentMessage, Plan, PlanStep
 
+from core.observability.metrics import record_routing_cache
+from core.routing.routing_cache import (
+    RoutingCache,
+    RoutingLookup,
+    cacheable_prompt,
+    single_skill,
+)
+from core.runtime.model_registry import ModelCapabilityRegistry
+from core.runtime.prompt_layout import current_time_message
+
 if TYPE_CHECKING:
     from core.runtime.litellm_client import LiteLLMClient
 
 LOGGER = logging.getLogger(__name__)
 
+# A plan response opens with a JSON object or a code fence (see the system prompt)
+_PLAN_PREFIXES = ("{", "`")
+
+
+def _segment_end(text: str) -> int | None:
+    """End of the JSON object or code span that opens ``text`` (None while incomplete)."""
+    if text.startswith("`"):
+        ticks = len(text) - len(text.lstrip("`"))
+        if ticks == len(text):
+            return None  # May still grow into a fence
+        if ticks < 3:
+            return ticks  # Inline code never holds a plan
+        close = text.find("```", ticks)
+        return None if close == -1 else close + 3
+    depth = 0
+    in_string = escaped = False
+    for i, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return None
+
 
 @dataclass
 class OrchestrationResult:
@@ -36,12 +83,14 @@ class OrchestrationResult:
         return self.direct_answer is not None
 
 
+@lru_cache(maxsize=32)
 def _build_system_prompt(available_skills_text: str) -> str:
-    """Build the system prompt for the unified orchestrator."""
-    now = datetime.now().strftime("%Y-%m-%d %H:%M")
-    year = datetime.now().year
+    """Build the system prompt for the unified orchestrator.
 
-    return f"""You are a smart orchestrator. Current time: {now}.
+    The prompt is static for a given skill index so it forms a cacheable
+    prefix; the current time is sent in a separate message after history.
+    """
+    return f"""You are a smart orchestrator.
 
 Based on the user's request, do ONE of:
 
@@ -51,7 +100,7 @@ respond with plain text.
 
 ## OPTION 2: PLAN (JSON)
 If the request needs external tools/skills (web search, smart home, Azure DevOps,
-CURRENT data from {year}), return a JSON plan:
+CURRENT data), return a JSON plan:
 
 ```json
 {{"description": "Brief summary", "steps": [{{"id": "1", "label": "Step label",
@@ -109,9 +158,15 @@ User: "Turn off the kitchen lights"
 class UnifiedOrchestrator:
     """Single LLM call that either answers directly or returns a plan."""
 
-    def __init__(self, litellm: LiteLLMClient, model_name: str | None = None) -> None:
+    def __init__(
+        self,
+        litellm: LiteLLMClient,
+        model_name: str | None = None,
+        routing_cache: RoutingCache | None = None,
+    ) -> None:
         self._litellm = litellm
         self._model_name = model_name
+        self._routing_cache = routing_cache
 
     async def process(
         self,
@@ -119,6 +174,7 @@ class UnifiedOrchestrator:
         *,
         history: list[AgentMessage] | None = None,
         available_skills_text: str = "",
+        context_id: UUID | None = None,
     ) -> OrchestrationResult:
         """Process a user prompt and return either a direct answer or a plan.
 
@@ -126,13 +182,221 @@ class UnifiedOrchestrator:
             prompt: The user's input
             history: Optional conversation history
             available_skills_text: Formatted list of available skills
+            context_id: Context scoping the routing cache (None skips the cache)
 
         Returns:
             OrchestrationResult with either direct_answer or plan set
         """
+        lookup_task = self._start_lookup(prompt, context_id, available_skills_text)
+        if lookup_task is not None and not self._shadow:
+            lookup = await lookup_task
+            if lookup is not None and lookup.plan is not None:
+                return OrchestrationResult(plan=lookup.plan)
+
+        messages = self._build_messages(prompt, history, available_skills_text)
+        LOGGER.info("UnifiedOrchestrator processing: %s...", prompt[:50])
+
+        try:
+            response = await self._litellm.generate(messages, model=self._resolve_model())
+            result = self._parse_response(response)
+        except Exception as e:
+            LOGGER.error("UnifiedOrchestrator failed: %s", e)
+            if lookup_task is not None:
+                lookup_task.cancel()
+            return self._fallback_result(prompt)
+        if lookup_task is not None:
+            await self._record_decision(await lookup_task, result)
+        return result
+
+    async def process_stream(
+        self,
+        prompt: str,
+        *,
+        history: list[AgentMessage] | None = None,
+        available_skills_text: str = "",
+        context_id: UUID | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Stream the orchestrator call, forwarding direct answers as they arrive.
+
+        The first non-whitespace character decides the mode: a plan always
+        starts with ``{`` or a code fence, so anything else is a direct answer
+        and is yielded as ``{"type": "token", "content": ...}`` events
+        immediately. Plans are buffered. Within a direct answer, text from a
+        ``{`` or backtick is held back until the object or code span it opens
+        is complete and known not to be a plan, so a plan that follows a
+        preamble is never shown as content. The stream always ends with one
+        ``{"type": "result", "result": OrchestrationResult}`` event.
+
+        With a routing cache and ``context_id``, a cached single-skill plan
+        is returned without calling the model. In shadow mode the lookup runs
+        alongside the model call and is only scored once the plan is known.
+        """
+        lookup_task = self._start_lookup(prompt, context_id, available_skills_text)
+        if lookup_task is not None and not self._shadow:
+            lookup = await lookup_task
+            if lookup is not None and lookup.plan is not None:
+                yield {"type": "result", "result": OrchestrationResult(plan=lookup.plan)}
+                return
+
+        messages = self._build_messages(prompt, history, available_skills_text)
+        model_name = self._resolve_model()
+        LOGGER.info("UnifiedOrchestrator streaming: %s...", prompt[:50])
+
+        content_parts: list[str] = []
+        thinking_parts: list[str] = []
+        direct: bool | None = None  # Undecided until the first non-whitespace text
+        held = ""  # Direct-mode text not yet known to be free of a plan
+        plan_follows = False
+
+        from core.runtime.litellm_client import LiteLLMError
+
+        try:
+            async for chunk in self._litellm.stream_chat(messages, model=model_name):
+                if chunk["type"] == "error":
+                    raise LiteLLMError(chunk["content"] or "LiteLLM stream error")
+                if chunk["type"] == "thinking" and chunk["content"]:
+                    thinking_parts.append(chunk["content"])
+                    continue
+                if chunk["type"] != "content" or not chunk["content"]:
+                    continue
+
+                content_parts.append(chunk["content"])
+                if direct is None:
+                    head = "".join(content_parts).lstrip()
+                    if not head:
+                        continue
+                    direct = not head.startswith(_PLAN_PREFIXES)
+                    if not direct:
+                        continue
+                    held = head
+                elif direct and not plan_follows:
+                    held += chunk["content"]
+                else:
+                    continue
+                released, held, plan_follows = self._release_held(held)
+                if released:
+                    yield {"type": "token", "content": released}
+        except Exception as e:
+            LOGGER.error("UnifiedOrchestrator failed: %s", e)
+            if lookup_task is not None:
+                lookup_task.cancel()
+            if direct and not plan_follows:
+                if held:
+                    yield {"type": "token", "content": held}
+                # Part of the answer is already on screen; keep it rather than re-plan
+                partial = "".join(content_parts).strip()
+                yield {"type": "result", "result": OrchestrationResult(direct_answer=partial)}
+            else:
+                yield {"type": "result", "result": self._fallback_result(prompt)}
+            return
+
+        response = "".join(content_parts)
+        if not response and thinking_parts and model_name:
+            # Mirrors LiteLLMClient.generate for reasoning models that only emit thinking
+            if ModelCapabilityRegistry.get_instance().should_fallback_to_reasoning(model_name):
+                response = "".join(thinking_parts)
+
+        result = self._parse_response(response)
+        if direct and result.plan is not None:
+            # The preamble is already on screen; the plan JSON itself was held back
+            LOGGER.info("UnifiedOrchestrator: plan followed streamed preamble")
+        elif held:
+            yield {"type": "token", "content": held}
+        if lookup_task is not None:
+            await self._record_decision(await lookup_task, result)
+        yield {"type": "result", "result": result}
+
+    def _release_held(self, held: str) -> tuple[str, str, bool]:
+        """Split held-back direct-mode text into a streamable part and the rest.
+
+        Returns ``(released, held, plan_follows)``; ``plan_follows`` is set once
+        a complete JSON object or code fence in ``held`` parses as a plan.
+        """
+        released: list[str] = []
+        while held:
+            starts = [i for i in (held.find("{"), held.find("`")) if i != -1]
+            if not starts:
+                released.append(held)
+                return "".join(released), "", False
+            released.append(held[: min(starts)])
+            held = held[min(starts) :]
+            end = _segment_end(held)
+            if end is None:
+                break
+            if self._try_parse_plan(held[:end]) is not None:
+                return "".join(released), held, True
+            released.append(held[:end])
+            held = held[end:]
+        return "".join(released), held, False
+
+    @property
+    def _shadow(self) -> bool:
+        return self._routing_cache is None or self._routing_cache.shadow
+
+    def _start_lookup(
+        self, prompt: str, context_id: UUID | None, available_skills_text: str
+    ) -> asyncio.Task[RoutingLookup | None] | None:
+        """Start a routing cache lookup, or return None when the prompt can't be cached."""
+        if self._routing_cache is None or context_id is None or not cacheable_prompt(prompt):
+            return None
+        return asyncio.create_task(
+            self._lookup_cache(self._routing_cache, prompt, context_id, available_skills_text)
+        )
+
+    async def _lookup_cache(
+        self,
+        routing_cache: RoutingCache,
+        prompt: str,
+        context_id: UUID,
+        available_skills_text: str,
+    ) -> RoutingLookup | None:
+        lookup = await routing_cache.lookup(
+            prompt, context_id=context_id, available_skills_text=available_skills_text
+        )
+        if lookup is None:
+            return None
+        if lookup.plan is None:
+            record_routing_cache("miss")
+        elif not self._shadow:
+            LOGGER.info(
+                "UnifiedOrchestrator: routing cache hit -> %s (score %.3f)",
+                lookup.skill,
+                lookup.score,
+            )
+            record_routing_cache("hit")
+        return lookup
+
+    async def _record_decision(
+        self, lookup: RoutingLookup | None, result: OrchestrationResult
+    ) -> None:
+        """Score a shadow lookup against the planner and cache new single-skill plans."""
+        if self._routing_cache is None or lookup is None:
+            return
+        step = single_skill(result.plan) if result.plan else None
+        planned_skill = step.tool if step else None
+        if lookup.plan is not None:
+            agree = planned_skill == lookup.skill
+            record_routing_cache("shadow_agree" if agree else "shadow_disagree")
+            if agree:
+                return
+            LOGGER.info(
+                "Routing cache shadow mismatch: cached %s, planner %s",
+                lookup.skill,
+                planned_skill or "direct/multi-step",
+            )
+        if result.plan is not None and step is not None:
+            await self._routing_cache.store(lookup, result.plan)
+
+    def _build_messages(
+        self,
+        prompt: str,
+        history: list[AgentMessage] | None,
+        available_skills_text: str,
+    ) -> list[AgentMessage]:
         system_prompt = _build_system_prompt(available_skills_text)
 
-        # Build messages
+        # Build messages static-first: the system prompt is a stable cacheable
+        # prefix, volatile content (history, time, request) follows it
         messages = [AgentMessage(role="system", content=system_prompt)]
 
         # Add history if provided (last few messages for context)
@@ -140,38 +404,35 @@ class UnifiedOrchestrator:
             for msg in history[-6:]:  # Last 6 messages for context
                 messages.append(msg)
 
-        # Add current user message
+        # Add current time and user message
+        messages.append(current_time_message())
         messages.append(AgentMessage(role="user", content=prompt))
-
-        # Get model name
-        model_name = self._model_name
-        if model_name is None:
-            settings = getattr(self._litellm, "_settings", None)
-            model_name = getattr(settings, "model_planner", None)
-
-        LOGGER.info("UnifiedOrchestrator processing: %s...", prompt[:50])
-
-        try:
-            response = await self._litellm.generate(messages, model=model_name)
-            return self._parse_response(response)
-        except Exception as e:
-            LOGGER.error("UnifiedOrchestrator failed: %s", e)
-            # Fallback: treat as needing agentic handling
-            return OrchestrationResult(
-                plan=Plan(
-                    description="Fallback plan due to orchestrator error",
-                    steps=[
-                        PlanStep(
-                            id="1",
-                            label="Research",
-                            executor="skill",
-                            action="skill",
-                            tool="researcher",
-                            args={"goal": prompt},
-                        )
-                    ],
-                )
+        return messages
+
+    def _resolve_model(self) -> str | None:
+        if self._model_name is not None:
+            return self._model_name
+        settings = getattr(self._litellm, "_settings", None)
+        return getattr(settings, "model_planner", None)
+
+    @staticmethod
+    def _fallback_result(prompt: str) -> OrchestrationResult:
+        """Treat the request as needing agentic handling when the call fails."""
+        return OrchestrationResult(
+            plan=Plan(
+                description="Fallback plan due to orchestrator error",
+                steps=[
+                    PlanStep(
+                        id="1",
+                        label="Research",
+                        executor="skill",
+                        action="skill",
+                        tool="researcher",
+                        args={"goal": prompt},
+                    )
+                ],
             )
+        )
 
     def _parse_response(self, response: str) -> OrchestrationResult:
         """Parse the LLM response into an OrchestrationResult."""
@@ -73,6 +73,82 @@ class Settings(BaseModel):
         default="agent-memories",
         description="Vector collection used to persist semantic memories.",
     )
+    qdrant_quantization: Literal["none", "int8", "binary"] = Field(
+        default="none",
+        description="Dense vector quantization for new collections (rescored at query time).",
+    )
+    qdrant_vector_dimensions: int | None = Field(
+        default=None,
+        gt=0,
+        description="Matryoshka truncation of stored embeddings (e.g. 1024 or 512); None = full.",
+    )
+    qdrant_vectors_on_disk: bool = Field(
+        default=False,
+        description="Keep original float32 vectors on disk; quantized copies stay in RAM.",
+    )
+    qdrant_quantization_oversampling: float = Field(
+        default=2.0,
+        ge=1.0,
+        description="Quantized candidates fetched per result before rescoring.",
+    )
+    rag_hybrid_search: bool = Field(
+        default=False,
+        description=(
+            "Store local BM25 sparse vectors next to dense embeddings and fuse both "
+            "at retrieval time (collections must be created with sparse vector support)."
+        ),
+    )
+    embedding_cache_max_entries: int = Field(
+        default=10000,
+        description="Capacity of the in-process embedding LRU cache (0 disables it).",
+    )
+    embedding_cache_path: Path | None = Field(
+        default=None,
+        description="Optional SQLite file for the persistent embedding cache tier.",
+    )
+    embedding_batch_size: int = Field(
+        default=64,
+        description="Maximum texts per upstream embedding request (shrinks on 413/timeouts).",
+    )
+    embedding_batch_wait_ms: float = Field(
+        default=10.0,
+        description="How long a partial embedding batch waits for more texts before sending.",
+    )
+    embedding_max_in_flight: int = Field(
+        default=4,
+        description=(
+            "Maximum concurrent upstream embedding batches; single-text queries get as "
+            "many slots of their own."
+        ),
+    )
+    routing_cache_enabled: bool = Field(
+        default=False,
+        description=(
+            "Consult the semantic routing cache before the orchestrator LLM call "
+            "(single-skill plans only)."
+        ),
+    )
+    routing_cache_shadow: bool = Field(
+        default=True,
+        description=(
+            "Shadow mode: look up and record cache agreement with the planner, "
+            "but always use the planner's decision."
+        ),
+    )
+    routing_cache_collection: str = Field(
+        default="agent-routing-cache",
+        description="Qdrant collection holding cached routing decisions.",
+    )
+    routing_cache_similarity_threshold: float = Field(
+        default=0.93,
+        ge=0.0,
+        le=1.0,
+        description="Minimum cosine similarity for reusing a cached routing decision.",
+    )
+    routing_cache_ttl_seconds: int = Field(
+        default=7 * 86400,
+        description="Maximum age of a cached routing decision.",
+    )
     searxng_url: HttpUrl = Field(
         default=cast(HttpUrl, "http://searxng:8080"),
         description="Base URL for the SearXNG search engine.",
@@ -178,6 +254,20 @@ class Settings(BaseModel):
         default=None,
         description="API Key for Context7 service (required for @upstash/context7-mcp).",
     )
+    mcp_schema_cache_path: Path | None = Field(
+        default=Path("data/mcp_schema_cache.sqlite"),
+        description=(
+            "SQLite file caching MCP tool/resource/prompt listings across reconnects "
+            "and restarts (None disables the persistent tier)."
+        ),
+    )
+    mcp_schema_cache_ttl_seconds: int = Field(
+        default=86400,
+        description=(
+            "Maximum age of cached MCP listings; servers that send list_changed "
+            "notifications are refreshed sooner."
+        ),
+    )
 
     tools_config_path: Path = Field(
         default=Path("config/tools.yaml"),
@@ -190,7 +280,10 @@ class Settings(BaseModel):
 
     trace_span_log_path: Path | None = Field(
         default=None,
-        description="Optional file path for writing span telemetry (JSONL).",
+        description=(
+            "Optional span log path (JSONL). Spans are stored in an indexed SQLite store "
+            "next to it (spans.jsonl -> spans.db)."
+        ),
     )
     trace_span_log_max_size_mb: int = Field(
         default=10,
@@ -200,6 +293,26 @@ class Settings(BaseModel):
         default=3,
         description="Maximum number of rotated span log files to keep.",
     )
+    trace_span_log_mirror: bool = Field(
+        default=False,
+        description="Also append spans to the JSONL span log (for external log shippers).",
+    )
+    trace_span_store_max_size_mb: int = Field(
+        default=100,
+        description="Maximum size of stored spans in MB before the oldest are deleted.",
+    )
+    latency_stall_monitor_enabled: bool = Field(
+        default=False,
+        description=(
+            "Sample event-loop stalls over latency_stall_threshold_ms and record the "
+            "blocking stack (shown under Diagnostics > Latency)."
+        ),
+    )
+    latency_stall_threshold_ms: int = Field(
+        default=250,
+        ge=20,
+        description="Event-loop stall duration in ms that the stall monitor reports.",
+    )
 
     log_level: str = Field(default="INFO", description="Python logging level for the service.")
 
@@ -17,6 +17,13 @@ from core.observability.tracing import add_span_event, set_span_attributes
 from core.runtime.config import Settings
 from core.runtime.model_registry import ModelCapabilityRegistry, ReasoningMode
 from core.runtime.models import AgentMessage
+from core.runtime.prompt_layout import apply_cache_breakpoint
+from core.runtime.stream_decoder import (
+    DeltaBatcher,
+    InlineReasoningSplitter,
+    SSEDecoder,
+    TextKind,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +31,10 @@ LOGGER = logging.getLogger(__name__)
 class LiteLLMError(RuntimeError):
     """Raised when the LiteLLM gateway returns an unexpected error."""
 
+    def __init__(self, message: str, *, status_code: int | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
 
 class LiteLLMClient:
     """Wrapper around the LiteLLM HTTP API."""
@@ -51,6 +62,15 @@ class LiteLLMClient:
             headers["Authorization"] = f"Bearer {self._settings.litellm_api_key}"
         return headers
 
+    def _serialize_messages(
+        self, messages: Iterable[AgentMessage], model: str
+    ) -> list[dict[str, Any]]:
+        """Dump messages for the request body, adding cache hints where supported."""
+        payload = [message.model_dump(exclude_none=True) for message in messages]
+        if self._registry.supports_cache_control(model):
+            apply_cache_breakpoint(payload)
+        return payload
+
     async def stream_chat(
         self,
         messages: Iterable[AgentMessage],
@@ -58,10 +78,15 @@ class LiteLLMClient:
         model: str | None = None,
         tools: list[dict[str, Any]] | None = None,
     ) -> AsyncGenerator[AgentChunk, None]:
-        """Stream chat completions from LiteLLM."""
+        """Stream chat completions from LiteLLM.
+
+        Response bytes go through ``SSEDecoder`` in one pass; text deltas that
+        arrive in the same network read are coalesced by ``DeltaBatcher``.
+        """
+        current_model = model or self._settings.model_agentchat
         payload: dict[str, Any] = {
-            "model": model or self._settings.model_agentchat,
-            "messages": [message.model_dump(exclude_none=True) for message in messages],
+            "model": current_model,
+            "messages": self._serialize_messages(messages, current_model),
             "stream": True,
         }
 
@@ -71,6 +96,148 @@ class LiteLLMClient:
         start_time = time.perf_counter()
         first_token_received = False
 
+        # Reasoning handling depends only on the requested model, so resolve it once
+        cap = self._registry.get_capability(current_model)
+        reasoning_field: str | None = None
+        splitter: InlineReasoningSplitter | None = None
+        if cap.reasoning_mode == ReasoningMode.SEPARATE_FIELD and cap.reasoning_field:
+            reasoning_field = cap.reasoning_field
+        elif (
+            cap.reasoning_mode == ReasoningMode.INLINE_TAGS
+            and cap.reasoning_tags
+            and len(cap.reasoning_tags) >= 2
+        ):
+            splitter = InlineReasoningSplitter(cap.reasoning_tags[0], cap.reasoning_tags[1])
+
+        decoder = SSEDecoder()
+        batcher = DeltaBatcher()
+        seen_model = seen_provider = seen_fingerprint = False
+
+        def add_content(text: str) -> None:
+            nonlocal first_token_received
+            if contains_raw_model_tokens(text):
+                text = strip_raw_tokens(text)
+            if not text:
+                return
+            if not first_token_received:
+                ttft_ms = (time.perf_counter() - start_time) * 1000
+                set_span_attributes({"gen_ai.performance.ttft_ms": ttft_ms})
+                add_span_event("gen_ai.first_token", {"ttft_ms": ttft_ms})
+                first_token_received = True
+            batcher.add_text("content", text)
+
+        def add_segments(segments: list[tuple[TextKind, str]]) -> None:
+            for kind, text in segments:
+                if kind == "content":
+                    add_content(text)
+                else:
+                    batcher.add_text("thinking", strip_raw_tokens(text))
+
+        def handle(data: dict[str, Any]) -> None:
+            nonlocal seen_model, seen_provider, seen_fingerprint
+            if not seen_model and data.get("model"):
+                set_span_attributes({"gen_ai.response.model": data["model"]})
+                seen_model = True
+
+            # Capture OpenRouter provider (e.g., "Groq", "DeepInfra")
+            if not seen_provider and data.get("provider"):
+                provider = data["provider"]
+                set_span_attributes({"gen_ai.provider": provider})
+                LOGGER.info("LLM provider: %s (model: %s)", provider, data.get("model"))
+                seen_provider = True
+
+            # Capture system fingerprint (model version/deployment)
+            if not seen_fingerprint and data.get("system_fingerprint"):
+                set_span_attributes({"gen_ai.system_fingerprint": data["system_fingerprint"]})
+                seen_fingerprint = True
+
+            if "usage" in data and data["usage"]:
+                usage = data["usage"]
+                attrs: dict[str, Any] = {}
+                if "prompt_tokens" in usage:
+                    attrs["gen_ai.usage.prompt_tokens"] = usage["prompt_tokens"]
+                if "completion_tokens" in usage:
+                    attrs["gen_ai.usage.completion_tokens"] = usage["completion_tokens"]
+                if "total_tokens" in usage:
+                    attrs["gen_ai.usage.total_tokens"] = usage["total_tokens"]
+                if "cost" in usage:
+                    attrs["gen_ai.usage.cost"] = usage["cost"]
+
+                # Capture reasoning vs output tokens (important for reasoning models)
+                completion_details = usage.get("completion_tokens_details", {})
+                if completion_details.get("reasoning_tokens"):
+                    attrs["gen_ai.usage.reasoning_tokens"] = completion_details["reasoning_tokens"]
+
+                # Capture cache hits (cost optimization metric)
+                prompt_details = usage.get("prompt_tokens_details", {})
+                if prompt_details.get("cached_tokens"):
+                    attrs["gen_ai.usage.cached_tokens"] = prompt_details["cached_tokens"]
+
+                if attrs:
+                    set_span_attributes(attrs)
+
+                # Record OTel metrics
+                from core.observability.metrics import record_llm_call
+
+                duration_ms = (time.perf_counter() - start_time) * 1000
+                record_llm_call(
+                    model=data.get("model", payload.get("model", "unknown")),
+                    duration_ms=duration_ms,
+                    prompt_tokens=usage.get("prompt_tokens", 0),
+                    completion_tokens=usage.get("completion_tokens", 0),
+                    cached_tokens=prompt_details.get("cached_tokens") or 0,
+                )
+
+            # Handle content
+            if not data.get("choices"):
+                return
+            choice = data["choices"][0]
+            delta = choice.get("delta", {})
+
+            # Capture finish reason (stop, length, tool_calls, etc.)
+            if choice.get("finish_reason"):
+                set_span_attributes({"gen_ai.finish_reason": choice["finish_reason"]})
+
+            if reasoning_field:
+                reasoning = delta.get(reasoning_field)
+                # Fallback to common field names if configured field not found
+                if reasoning is None:
+                    reasoning = delta.get("reasoning_content") or delta.get("reasoning")
+                if reasoning:
+                    batcher.add_text("thinking", strip_raw_tokens(reasoning))
+
+            content_val = delta.get("content")
+            if content_val:
+                if splitter is not None:
+                    add_segments(splitter.feed(content_val))
+                else:
+                    add_content(content_val)
+
+            # Handle tool calls (if supported by LiteLLM/Model)
+            # Basic support for OpenAI format tool calls
+            for tool_call in delta.get("tool_calls") or ():
+                batcher.add_event(
+                    {
+                        "type": "tool_start",
+                        "content": None,
+                        "tool_call": tool_call,
+                        "metadata": None,
+                    }
+                )
+
+        def finish() -> None:
+            for data_bytes in decoder.flush():
+                if data_bytes != b"[DONE]":
+                    decode(data_bytes)
+            if splitter is not None:
+                add_segments(splitter.flush())
+
+        def decode(data_bytes: bytes) -> None:
+            try:
+                handle(orjson.loads(data_bytes))
+            except orjson.JSONDecodeError:
+                LOGGER.warning("Failed to decode JSON chunk: %s", data_bytes[:200])
+
         try:
             async with self._client.stream(
                 "POST",
@@ -90,15 +257,19 @@ class LiteLLMClient:
                     }
                     return
 
-                async for line in response.aiter_lines():
-                    if not line.startswith("data: "):
-                        continue
-
-                    # Force yield to allow event loop to process other tasks (e.g. flushing)
-                    await asyncio.sleep(0)
-
-                    data_str = line[6:].strip()
-                    if data_str == "[DONE]":
+                done = False
+                async for raw in response.aiter_bytes():
+                    for data_bytes in decoder.feed(raw):
+                        if data_bytes == b"[DONE]":
+                            done = True
+                            break
+                        decode(data_bytes)
+                    if done:
+                        finish()
+                    chunks = batcher.drain()
+                    for chunk in chunks:
+                        yield chunk
+                    if done:
                         total_latency_ms = (time.perf_counter() - start_time) * 1000
                         set_span_attributes({"gen_ai.performance.latency_ms": total_latency_ms})
                         yield {
@@ -109,177 +280,14 @@ class LiteLLMClient:
                         }
                         break
 
-                    try:
-                        data = orjson.loads(data_str)
-                        if "model" in data and data["model"]:
-                            set_span_attributes({"gen_ai.response.model": data["model"]})
-
-                        # Capture OpenRouter provider (e.g., "Groq", "DeepInfra")
-                        if "provider" in data and data["provider"]:
-                            provider = data["provider"]
-                            set_span_attributes({"gen_ai.provider": provider})
-                            LOGGER.info("LLM provider: %s (model: %s)", provider, data.get("model"))
-
-                        # Capture system fingerprint (model version/deployment)
-                        if "system_fingerprint" in data and data["system_fingerprint"]:
-                            set_span_attributes(
-                                {"gen_ai.system_fingerprint": data["system_fingerprint"]}
-                            )
-
-                        if "usage" in data and data["usage"]:
-                            usage = data["usage"]
-                            attrs: dict[str, Any] = {}
-                            if "prompt_tokens" in usage:
-                                attrs["gen_ai.usage.prompt_tokens"] = usage["prompt_tokens"]
-                            if "completion_tokens" in usage:
-                                attrs["gen_ai.usage.completion_tokens"] = usage["completion_tokens"]
-                            if "total_tokens" in usage:
-                                attrs["gen_ai.usage.total_tokens"] = usage["total_tokens"]
-                            if "cost" in usage:
-                                attrs["gen_ai.usage.cost"] = usage["cost"]
-
-                            # Capture reasoning vs output tokens (important for reasoning models)
-                            completion_details = usage.get("completion_tokens_details", {})
-                            if completion_details.get("reasoning_tokens"):
-                                attrs["gen_ai.usage.reasoning_tokens"] = completion_details[
-                                    "reasoning_tokens"
-                                ]
-
-                            # Capture cache hits (cost optimization metric)
-                            prompt_details = usage.get("prompt_tokens_details", {})
-                            if prompt_details.get("cached_tokens"):
-                                attrs["gen_ai.usage.cached_tokens"] = prompt_details[
-                                    "cached_tokens"
-                                ]
-
-                            if attrs:
-                                set_span_attributes(attrs)
-
-                            # Record OTel metrics
-                            from core.observability.metrics import record_llm_call
-
-                            duration_ms = (time.perf_counter() - start_time) * 1000
-                            record_llm_call(
-                                model=data.get("model", payload.get("model", "unknown")),
-                                duration_ms=duration_ms,
-                                prompt_tokens=usage.get("prompt_tokens", 0),
-                                completion_tokens=usage.get("completion_tokens", 0),
-                            )
-
-                        # Handle content
-                        if "choices" in data and len(data["choices"]) > 0:
-                            choice = data["choices"][0]
-                            delta = choice.get("delta", {})
-
-                            # Capture finish reason (stop, length, tool_calls, etc.)
-                            if choice.get("finish_reason"):
-                                set_span_attributes(
-                                    {"gen_ai.finish_reason": choice["finish_reason"]}
-                                )
-
-                            # Get model from payload
-                            current_model = payload.get("model", "")
-
-                            # Get model capability
-                            cap = self._registry.get_capability(current_model)
-
-                            # Extract reasoning based on model capability
-                            reasoning = None
-                            if (
-                                cap.reasoning_mode == ReasoningMode.SEPARATE_FIELD
-                                and cap.reasoning_field
-                            ):
-                                reasoning = delta.get(cap.reasoning_field)
-                                # Fallback to common field names if configured field not found
-                                if reasoning is None:
-                                    reasoning = delta.get("reasoning_content") or delta.get(
-                                        "reasoning"
-                                    )
-                            elif cap.reasoning_mode == ReasoningMode.INLINE_TAGS:
-                                content_text = delta.get("content", "")
-                                if content_text:
-                                    (
-                                        reasoning_part,
-                                        clean_content,
-                                    ) = self._registry.extract_inline_reasoning(
-                                        content_text, current_model
-                                    )
-                                    if reasoning_part:
-                                        reasoning_part = strip_raw_tokens(reasoning_part)
-                                    if reasoning_part:
-                                        yield {
-                                            "type": "thinking",
-                                            "content": reasoning_part,
-                                            "tool_call": None,
-                                            "metadata": {"source": "reasoning_model"},
-                                        }
-                                    if clean_content:
-                                        clean_content = strip_raw_tokens(clean_content)
-                                    if clean_content:
-                                        if not first_token_received:
-                                            ttft_ms = (time.perf_counter() - start_time) * 1000
-                                            set_span_attributes(
-                                                {"gen_ai.performance.ttft_ms": ttft_ms}
-                                            )
-                                            add_span_event(
-                                                "gen_ai.first_token", {"ttft_ms": ttft_ms}
-                                            )
-                                            first_token_received = True
-
-                                        yield {
-                                            "type": "content",
-                                            "content": clean_content,
-                                            "tool_call": None,
-                                            "metadata": None,
-                                        }
-                                    continue
-
-                            # Emit reasoning as thinking if found
-                            if reasoning:
-                                reasoning = strip_raw_tokens(reasoning)
-                            if reasoning:
-                                yield {
-                                    "type": "thinking",
-                                    "content": reasoning,
-                                    "tool_call": None,
-                                    "metadata": {"source": "reasoning_model"},
-                                }
-
-                            if "content" in delta and delta["content"] is not None:
-                                content_val = delta["content"]
-                                if contains_raw_model_tokens(content_val):
-                                    content_val = strip_raw_tokens(content_val)
-                                if not content_val:
-                                    continue
-
-                                if not first_token_received:
-                                    ttft_ms = (time.perf_counter() - start_time) * 1000
-                                    set_span_attributes({"gen_ai.performance.ttft_ms": ttft_ms})
-                                    add_span_event("gen_ai.first_token", {"ttft_ms": ttft_ms})
-                                    first_token_received = True
-
-                                yield {
-                                    "type": "content",
-                                    "content": content_val,
-                                    "tool_call": None,
-                                    "metadata": None,
-                                }
-
-                            # Handle tool calls (if supported by LiteLLM/Model)
-                            # Basic support for OpenAI format tool calls
-                            if "tool_calls" in delta and delta["tool_calls"]:
-                                for tool_call in delta["tool_calls"]:
-                                    yield {
-                                        # or tool_output if it's chunked, simplified for now
-                                        "type": "tool_start",
-                                        "content": None,
-                                        "tool_call": tool_call,
-                                        "metadata": None,
-                                    }
-
-                    except orjson.JSONDecodeError:
-                        LOGGER.warning("Failed to decode JSON chunk: %s", data_str)
-                        continue
+                    # Force yield to allow event loop to process other tasks (e.g. flushing)
+                    if chunks:
+                        await asyncio.sleep(0)
+                else:
+                    # Stream ended without [DONE]; release anything still buffered
+                    finish()
+                    for chunk in batcher.drain():
+                        yield chunk
 
         except httpx.HTTPError as exc:
             yield {
@@ -305,7 +313,7 @@ class LiteLLMClient:
             elif chunk["type"] == "thinking" and chunk["content"]:
                 full_thinking.append(chunk["content"])
             elif chunk["type"] == "error":
-                raise LiteLLMError(chunk["content"])
+                raise LiteLLMError(chunk["content"] or "LiteLLM stream error")
 
         # If no content but we have thinking, use thinking as content (for reasoning models)
         if not full_content and full_thinking:
@@ -333,7 +341,7 @@ class LiteLLMClient:
         current_model = model or self._settings.model_agentchat
         payload: dict[str, Any] = {
             "model": current_model,
-            "messages": [message.model_dump(exclude_none=True) for message in messages],
+            "messages": self._serialize_messages(messages, current_model),
             "tools": tools,
             "tool_choice": "auto",
         }
@@ -397,6 +405,7 @@ class LiteLLMClient:
                 duration_ms=duration_ms,
                 prompt_tokens=usage.get("prompt_tokens", 0),
                 completion_tokens=usage.get("completion_tokens", 0),
+                cached_tokens=prompt_details.get("cached_tokens") or 0,
             )
 
             message = data["choices"][0]["message"]
@@ -439,7 +448,10 @@ class LiteLLMClient:
         if response.status_code >= 400:
             error_text = response.text
             LOGGER.error("LiteLLM embedding error %s: %s", response.status_code, error_text)
-            raise LiteLLMError(f"Embedding failed: {response.status_code} - {error_text[:200]}")
+            raise LiteLLMError(
+                f"Embedding failed: {response.status_code} - {error_text[:200]}",
+                status_code=response.status_code,
+            )
         data = response.json()
         return [item["embedding"] for item in data["data"]]
 
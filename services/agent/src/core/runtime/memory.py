@@ -10,7 +10,6 @@ from uuid import UUID, uuid4
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.http.exceptions import UnexpectedResponse
 from qdrant_client.models import (
-    Distance,
     FieldCondition,
     Filter,
     HasIdCondition,
@@ -20,11 +19,17 @@ from qdrant_client.models import (
     MatchValue,
     NestedCondition,
     PointStruct,
-    VectorParams,
 )
 
 from core.providers import get_embedder
 from core.runtime.config import Settings
+from core.utils.vector_storage import (
+    VectorStorageProfile,
+    build_point_vectors,
+    create_collection,
+    fit_vector,
+    lookup_schema,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -70,6 +75,7 @@ class MemoryStore:
         self._context_id = context_id
         self._client: AsyncQdrantClient | None = client
         self._owns_client = client is None  # Track if we created the client
+        self._profile = VectorStorageProfile.from_settings(settings)
 
         # SECURITY: Warn if context_id is None - this disables tenant isolation
         if context_id is None:
@@ -98,11 +104,11 @@ class MemoryStore:
                 await self._client.get_collection(self._settings.qdrant_collection)
                 _verified_collections.add(self._settings.qdrant_collection)
             except UnexpectedResponse:
-                await self._client.create_collection(
-                    collection_name=self._settings.qdrant_collection,
-                    vectors_config=VectorParams(
-                        size=get_embedder().dimension, distance=Distance.COSINE
-                    ),
+                await create_collection(
+                    self._client,
+                    self._settings.qdrant_collection,
+                    dimension=get_embedder().dimension,
+                    profile=self._profile,
                 )
                 _verified_collections.add(self._settings.qdrant_collection)
             return
@@ -121,11 +127,11 @@ class MemoryStore:
                     await self._client.get_collection(self._settings.qdrant_collection)
                     _verified_collections.add(self._settings.qdrant_collection)
                 except UnexpectedResponse:
-                    await self._client.create_collection(
-                        collection_name=self._settings.qdrant_collection,
-                        vectors_config=VectorParams(
-                            size=get_embedder().dimension, distance=Distance.COSINE
-                        ),
+                    await create_collection(
+                        self._client,
+                        self._settings.qdrant_collection,
+                        dimension=get_embedder().dimension,
+                        profile=self._profile,
                     )
                     _verified_collections.add(self._settings.qdrant_collection)
         except Exception as exc:  # pragma: no cover - depends on infra
@@ -153,8 +159,16 @@ class MemoryStore:
             )
             return
 
+        point_vectors = await build_point_vectors(
+            self._client,
+            self._settings.qdrant_collection,
+            [record.text for record in record_list],
+            vectors,
+            hybrid=self._settings.rag_hybrid_search,
+            profile=self._profile,
+        )
         points = []
-        for record, vector in zip(record_list, vectors, strict=False):
+        for record, vector in zip(record_list, point_vectors, strict=False):
             payload = {
                 "conversation_id": record.conversation_id,
                 "text": record.text,
@@ -191,7 +205,10 @@ class MemoryStore:
         vectors = await self._async_embed_texts([query])
         if not vectors:
             return []
-        vector = vectors[0]
+        schema = await lookup_schema(
+            client, self._settings.qdrant_collection, hybrid=False, profile=self._profile
+        )
+        vector = fit_vector(vectors[0], schema.vector_size if schema else None)
 
         # Build filter conditions for context and conversation isolation
         filter_conditions: list[
@@ -239,6 +256,7 @@ class MemoryStore:
                 query=vector,
                 limit=limit,
                 query_filter=query_filter,
+                search_params=self._profile.search_params(),
             )
             results = response.points
         except UnexpectedResponse as exc:  # pragma: no cover - defensive
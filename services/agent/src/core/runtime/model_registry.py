@@ -39,6 +39,10 @@ class ModelCapability(BaseModel):
         default=False, description="Use reasoning as content if content empty"
     )
     strip_inline_tags: bool = Field(default=True, description="Remove inline tags from content")
+    cache_control: bool = Field(
+        default=False,
+        description="Accepts explicit cache_control breakpoints for prompt caching",
+    )
 
 
 class ModelCapabilityRegistry:
@@ -116,6 +120,10 @@ class ModelCapabilityRegistry:
         cap = self.get_capability(model)
         return cap.fallback_to_reasoning
 
+    def supports_cache_control(self, model: str) -> bool:
+        """Check if model accepts explicit prompt-cache breakpoints."""
+        return self.get_capability(model).cache_control
+
     def has_reasoning(self, model: str) -> bool:
         """Check if model has reasoning capability."""
         cap = self.get_capability(model)
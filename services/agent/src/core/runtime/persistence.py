@@ -5,7 +5,6 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections.abc import AsyncGenerator
-from datetime import datetime
 from typing import Any
 
 from shared.models import AgentMessage
@@ -16,8 +15,10 @@ from core.context_manager import ContextManager
 from core.db import Context, Conversation, Message, Session
 from core.models.pydantic_schemas import SupervisorDecision, TraceContext
 from core.observability.logging import log_event
+from core.observability.profiler import phase
 from core.observability.tracing import current_trace_ids
 from core.runtime.memory import MemoryRecord, MemoryStore
+from core.runtime.prompt_layout import current_date_message
 
 LOGGER = logging.getLogger(__name__)
 
@@ -178,12 +179,9 @@ class ConversationPersistence:
 
         history = [AgentMessage(role=msg.role, content=msg.content) for msg in db_messages]
 
-        # Inject current date as system context
-        current_date_str = datetime.now().strftime("%Y-%m-%d")
-        history.insert(
-            0,
-            AgentMessage(role="system", content=f"Current Date: {current_date_str}"),
-        )
+        # Inject current date after the messages: volatile content goes last so
+        # it never invalidates the provider's cached prompt prefix
+        history.append(current_date_message())
 
         return history
 
@@ -207,25 +205,28 @@ class ConversationPersistence:
         Yields:
             Final events including history snapshot
         """
-        # Record assistant message
-        if completion_text:
-            session.add(
-                Message(
-                    session_id=db_session.id,
-                    role="assistant",
-                    content=completion_text,
-                    trace_id=current_trace_ids().get("trace_id"),
+        with phase("persistence"):
+            # Record assistant message
+            if completion_text:
+                session.add(
+                    Message(
+                        session_id=db_session.id,
+                        role="assistant",
+                        content=completion_text,
+                        trace_id=current_trace_ids().get("trace_id"),
+                    )
                 )
-            )
 
-        # Background memory persistence (fire-and-forget)
-        if self._memory and completion_text:
-            asyncio.create_task(
-                _persist_memory_background(self._memory, conversation_id, completion_text, LOGGER)
-            )
+            # Background memory persistence (fire-and-forget)
+            if self._memory and completion_text:
+                asyncio.create_task(
+                    _persist_memory_background(
+                        self._memory, conversation_id, completion_text, LOGGER
+                    )
+                )
 
-        # Commit transaction
-        await session.commit()
+            # Commit transaction
+            await session.commit()
 
         # Log event
         LOGGER.info("Completed conversation %s", conversation_id)
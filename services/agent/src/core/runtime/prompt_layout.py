@@ -0,0 +1,70 @@
+"""Prompt layout helpers that keep provider-side prefix caches warm.
+
+Providers cache the longest previously seen prompt prefix, so every prompt we
+assemble is ordered static-first: system instructions, the skill index and
+tool schemas come first and stay byte-identical between calls, while volatile
+data (current time, pinned files, history, the user request) comes last.
+
+The first message of a prompt is the static block. For models that accept
+explicit cache hints, ``apply_cache_breakpoint`` marks its end with an
+Anthropic-style ``cache_control`` content block; other providers cache the
+prefix automatically.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from shared.models import AgentMessage
+
+CACHE_CONTROL_EPHEMERAL: dict[str, str] = {"type": "ephemeral"}
+
+
+def current_time_context(now: datetime | None = None) -> str:
+    """Return the volatile date/time block that belongs after all static content."""
+    now = now or datetime.now()
+    return (
+        "SYSTEM CONTEXT:\n"
+        f"- Current Date & Time: {now.strftime('%Y-%m-%d %H:%M')}\n"
+        f"- Your knowledge cutoff is static, but YOU ARE LIVE in {now.year}.\n"
+        f"- Treat all retrieved documents dated up to {now.strftime('%Y-%m-%d')} "
+        "as HISTORICAL FACTS, not predictions.\n"
+    )
+
+
+def current_time_message(now: datetime | None = None) -> AgentMessage:
+    """Wrap ``current_time_context`` in a system message for the end of a prompt."""
+    return AgentMessage(role="system", content=current_time_context(now))
+
+
+def current_date_message(now: datetime | None = None) -> AgentMessage:
+    """Day-granular date message appended after conversation history."""
+    now = now or datetime.now()
+    return AgentMessage(role="system", content=f"Current Date: {now.strftime('%Y-%m-%d')}")
+
+
+def apply_cache_breakpoint(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Mark the static leading system message as a prompt-cache breakpoint.
+
+    Converts its string content into a single text block carrying
+    ``cache_control``. Messages are modified in place and returned.
+    """
+    if not messages:
+        return messages
+    first = messages[0]
+    content = first.get("content")
+    if first.get("role") == "system" and isinstance(content, str) and content:
+        first["content"] = [
+            {"type": "text", "text": content, "cache_control": CACHE_CONTROL_EPHEMERAL}
+        ]
+    return messages
+
+
+__all__ = [
+    "CACHE_CONTROL_EPHEMERAL",
+    "apply_cache_breakpoint",
+    "current_date_message",
+    "current_time_context",
+    "current_time_message",
+]
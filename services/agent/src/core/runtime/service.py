@@ -32,6 +32,7 @@ from core.db import Context, Conversation, Message, Session
 from core.models.pydantic_schemas import SupervisorDecision, TraceContext
 from core.observability.debug_logger import DebugLogger
 from core.observability.logging import log_event
+from core.observability.profiler import phase
 from core.observability.tracing import (
     current_trace_ids,
     set_span_attributes,
@@ -219,14 +220,21 @@ class AgentService:
 
         # Cap history to prevent unbounded context growth
         if len(history) > MAX_PROMPT_HISTORY_MESSAGES:
-            # Preserve system messages at the start, trim older user/assistant messages
-            system_msgs = [m for m in history if m.role == "system"]
-            non_system = [m for m in history if m.role != "system"]
-            keep_count = MAX_PROMPT_HISTORY_MESSAGES - len(system_msgs)
-            history = system_msgs + non_system[-keep_count:]
+            # Preserve system messages in place (static ones lead, volatile ones such
+            # as the date and pinned files trail), trim older user/assistant messages
+            original_count = len(history)
+            system_count = sum(1 for m in history if m.role == "system")
+            drop = original_count - max(MAX_PROMPT_HISTORY_MESSAGES, system_count)
+            capped: list[AgentMessage] = []
+            for message in history:
+                if drop > 0 and message.role != "system":
+                    drop -= 1
+                    continue
+                capped.append(message)
+            history = capped
             LOGGER.info(
                 "Capped prompt history from %d to %d messages",
-                len(system_msgs) + len(non_system),
+                original_count,
                 len(history),
             )
 
@@ -298,7 +306,8 @@ class AgentService:
             Event dictionaries for the chat response
         """
         # Direct LLM completion
-        completion_text = await self._litellm.generate(history)
+        with phase("completion"):
+            completion_text = await self._litellm.generate(history)
 
         # Record and persist
         session.add(
@@ -883,17 +892,18 @@ class AgentService:
             }
 
         plan: Plan | None = None
-        async for event in planner.generate_stream(
-            request,
-            history=history,
-            tool_descriptions=tool_descriptions,
-            available_skills_text=available_skills_text,
-        ):
-            if event["type"] == "token":
-                # Do not show raw JSON plan to user
-                pass
-            elif event["type"] == "plan":
-                plan = event["plan"]
+        with phase("planner"):
+            async for event in planner.generate_stream(
+                request,
+                history=history,
+                tool_descriptions=tool_descriptions,
+                available_skills_text=available_skills_text,
+            ):
+                if event["type"] == "token":
+                    # Do not show raw JSON plan to user
+                    pass
+                elif event["type"] == "plan":
+                    plan = event["plan"]
 
         if plan is None:
             raise ValueError("Planner returned no plan")
@@ -1046,9 +1056,10 @@ class AgentService:
         )
 
         # Use composer model for generating final answers
-        completion_text = await self._litellm.generate(
-            prompt_history, model=self._settings.model_composer
-        )
+        with phase("completion"):
+            completion_text = await self._litellm.generate(
+                prompt_history, model=self._settings.model_composer
+            )
 
         # Debug: Log the completion response
         await debug_logger.log_completion_response(
@@ -1258,44 +1269,68 @@ class AgentService:
             needs_replan = False
             abort_execution = False
 
-            for step_index, plan_step in enumerate(plan.steps):
-                # Skip completion step if skill is awaiting user input
-                if plan_step.action == "completion" and awaiting_input_request:
-                    LOGGER.info("Skipping completion step - skill awaiting user input")
-                    execution_complete = True
-                    break
-
-                # Execute step with retry logic
-                step_outcome = None
-                step_result = None
-                replan_reason: str | None = None
-                replan_suggested_fix: str | None = None
-                async for event in self._execute_step_with_retry(
-                    plan_step,
+            # Plans that declare depends_on run ready steps concurrently;
+            # otherwise steps run strictly in order.
+            if self._plan_declares_dependencies(plan.steps):
+                step_stream = self._iter_steps_concurrently(
+                    plan.steps,
+                    skill_executor,
+                    step_supervisor,
+                    request,
+                    prompt_history,
+                    db_session,
+                )
+            else:
+                step_stream = self._iter_steps_sequentially(
+                    plan.steps,
                     skill_executor,
                     step_supervisor,
                     request,
                     prompt_history,
-                    step_index,
                     session,
                     db_session,
-                ):
+                )
+
+            step_states: dict[int, dict[str, Any]] = {}
+            async with contextlib.aclosing(step_stream) as steps:
+                async for step_index, plan_step, event in steps:
+                    if event["type"] == "step_begin":
+                        # Skip completion step if skill is awaiting user input
+                        if plan_step.action == "completion" and awaiting_input_request:
+                            LOGGER.info("Skipping completion step - skill awaiting user input")
+                            execution_complete = True
+                            break
+                        step_states[step_index] = {
+                            "outcome": None,
+                            "result": None,
+                            "reason": None,
+                            "suggested_fix": None,
+                        }
+                        continue
+
+                    state = step_states[step_index]
                     if event["type"] == "step_outcome":
-                        step_outcome = event["outcome"]
-                        step_result = event.get("result")
-                        awaiting_input_request = event.get("awaiting_input")
-                        replan_reason = event.get("reason")
-                        replan_suggested_fix = event.get("suggested_fix")
+                        state["outcome"] = event["outcome"]
+                        state["result"] = event.get("result")
+                        awaiting_input_request = (
+                            event.get("awaiting_input") or awaiting_input_request
+                        )
+                        state["reason"] = event.get("reason")
+                        state["suggested_fix"] = event.get("suggested_fix")
 
                         # Handle completion steps
-                        if plan_step.action == "completion" and step_outcome == "success":
-                            if step_result:
-                                completion_text = step_result.result.get("completion", "")
+                        if plan_step.action == "completion" and state["outcome"] == "success":
+                            if state["result"]:
+                                completion_text = state["result"].result.get("completion", "")
                                 completion_provider = plan_step.provider or completion_provider
-                                completion_model = step_result.result.get("model", completion_model)
+                                completion_model = state["result"].result.get(
+                                    "model", completion_model
+                                )
                             execution_complete = True
+                        continue
                     elif event["type"] == "skill_content_yielded":
                         skill_content_yielded = event["value"]
+                        continue
                     elif event["type"] == "awaiting_input":
                         # HITL: Store state for resume and mark execution complete
                         meta = event.get("metadata") or {}
@@ -1308,113 +1343,121 @@ class AgentService:
                         )
                         execution_complete = True
                         yield event
-                    else:
+                        continue
+                    elif event["type"] != "step_end":
                         yield event
+                        continue
 
-                if not step_outcome:
-                    LOGGER.error("Step execution ended without outcome")
-                    yield {"type": "error", "content": "Step execution ended without outcome."}
-                    return
+                    # Step finished: emit its result, update history, apply supervisor outcome
+                    step_outcome = state["outcome"]
+                    step_result = state["result"]
+                    replan_reason = state["reason"]
+                    replan_suggested_fix = state["suggested_fix"]
 
-                # Emit step result for compatibility
-                if plan_step.action in ("tool", "skill") and step_result:
-                    chunk_type = "tool_output"
-                    tool_call = {"name": plan_step.tool}
-                    content_str = str(step_result.result.get("output") or step_result.status)
-
-                    # Check for trivial status content
-                    is_trivial = content_str.lower() in ("ok", "completed step")
-
-                    if not is_trivial:
-                        meta = {
-                            "status": step_result.status,
-                            "decision": "ok" if step_outcome == "success" else "adjust",
-                            "outcome": step_outcome,
-                            "id": plan_step.id,
-                            "action": plan_step.action,
-                            "tool": plan_step.tool,
-                            "name": plan_step.tool,
-                            "executor": plan_step.executor,
-                            "output": str(step_result.result.get("output") or ""),
-                            "source_count": step_result.result.get("source_count", 0),
-                        }
-                        if plan_step.executor == "skill" or plan_step.action == "skill":
-                            meta["skill"] = plan_step.tool
+                    if not step_outcome:
+                        LOGGER.error("Step execution ended without outcome")
+                        yield {"type": "error", "content": "Step execution ended without outcome."}
+                        return
 
-                        yield {
-                            "type": chunk_type,
-                            "content": content_str,
-                            "tool_call": tool_call,
-                            "metadata": meta,
-                        }
+                    # Emit step result for compatibility
+                    if plan_step.action in ("tool", "skill") and step_result:
+                        chunk_type = "tool_output"
+                        tool_call = {"name": plan_step.tool}
+                        content_str = str(step_result.result.get("output") or step_result.status)
+
+                        # Check for trivial status content
+                        is_trivial = content_str.lower() in ("ok", "completed step")
+
+                        if not is_trivial:
+                            meta = {
+                                "status": step_result.status,
+                                "decision": "ok" if step_outcome == "success" else "adjust",
+                                "outcome": step_outcome,
+                                "id": plan_step.id,
+                                "action": plan_step.action,
+                                "tool": plan_step.tool,
+                                "name": plan_step.tool,
+                                "executor": plan_step.executor,
+                                "output": str(step_result.result.get("output") or ""),
+                                "source_count": step_result.result.get("source_count", 0),
+                            }
+                            if plan_step.executor == "skill" or plan_step.action == "skill":
+                                meta["skill"] = plan_step.tool
+
+                            yield {
+                                "type": chunk_type,
+                                "content": content_str,
+                                "tool_call": tool_call,
+                                "metadata": meta,
+                            }
 
-                # Update prompt history
-                if step_result:
-                    prompt_history.extend(step_result.messages)
-                    if plan_step.action in ("tool", "skill"):
-                        session.add(
-                            Message(
-                                session_id=db_session.id,
-                                role="tool",
-                                content=str(step_result.result.get("output", "")),
-                                trace_id=current_trace_ids().get("trace_id"),
+                    # Update prompt history
+                    if step_result:
+                        prompt_history.extend(step_result.messages)
+                        if plan_step.action in ("tool", "skill"):
+                            session.add(
+                                Message(
+                                    session_id=db_session.id,
+                                    role="tool",
+                                    content=str(step_result.result.get("output", "")),
+                                    trace_id=current_trace_ids().get("trace_id"),
+                                )
                             )
-                        )
 
-                # Handle replan outcome
-                if step_outcome == "replan":
-                    reason = replan_reason or "Step failed"
-                    suggested_fix = replan_suggested_fix
+                    # Handle replan outcome
+                    if step_outcome == "replan":
+                        reason = replan_reason or "Step failed"
+                        suggested_fix = replan_suggested_fix
 
-                    LOGGER.warning(
-                        "Supervisor requested replan for step '%s': %s",
-                        plan_step.label,
-                        reason,
-                    )
-
-                    if replans_remaining > 0:
-                        # Inject feedback for re-planning
-                        feedback_msg = (
-                            f"Step '{plan_step.label}' failed validation. "
-                            f"Supervisor feedback: {reason}."
+                        LOGGER.warning(
+                            "Supervisor requested replan for step '%s': %s",
+                            plan_step.label,
+                            reason,
                         )
-                        if suggested_fix:
-                            feedback_msg += f"\n\nSuggested approach: {suggested_fix}"
-                        feedback_msg += "\n\nPlease generate a new plan to address this issue."
-                        prompt_history.append(AgentMessage(role="system", content=feedback_msg))
 
-                        yield {
-                            "type": "thinking",
-                            "content": f"Step needs replan: {reason}",
-                            "metadata": {
-                                "role": "Supervisor",
-                                "outcome": "replan",
-                                "reason": reason,
-                                "suggested_fix": suggested_fix,
-                                "replans_remaining": replans_remaining - 1,
-                            },
-                        }
+                        if replans_remaining > 0:
+                            # Inject feedback for re-planning
+                            feedback_msg = (
+                                f"Step '{plan_step.label}' failed validation. "
+                                f"Supervisor feedback: {reason}."
+                            )
+                            if suggested_fix:
+                                feedback_msg += f"\n\nSuggested approach: {suggested_fix}"
+                            feedback_msg += "\n\nPlease generate a new plan to address this issue."
+                            prompt_history.append(AgentMessage(role="system", content=feedback_msg))
+
+                            yield {
+                                "type": "thinking",
+                                "content": f"Step needs replan: {reason}",
+                                "metadata": {
+                                    "role": "Supervisor",
+                                    "outcome": "replan",
+                                    "reason": reason,
+                                    "suggested_fix": suggested_fix,
+                                    "replans_remaining": replans_remaining - 1,
+                                },
+                            }
 
-                        needs_replan = True
-                        replans_remaining -= 1
-                        break  # Exit step loop to trigger re-plan
-                    else:
-                        # Max replans reached
-                        LOGGER.error(
-                            "Max replans (%d) reached. Continuing despite failure.", max_replans
-                        )
-                        yield {
-                            "type": "thinking",
-                            "content": (
-                                f"Step issue: {reason}. "
-                                f"Max re-plans ({max_replans}) reached. Continuing..."
-                            ),
-                            "metadata": {"role": "Supervisor", "max_replans_reached": True},
-                        }
+                            needs_replan = True
+                            replans_remaining -= 1
+                            break  # Exit step loop to trigger re-plan
+                        else:
+                            # Max replans reached
+                            LOGGER.error(
+                                "Max replans (%d) reached. Continuing despite failure.", max_replans
+                            )
+                            yield {
+                                "type": "thinking",
+                                "content": (
+                                    f"Step issue: {reason}. "
+                                    f"Max re-plans ({max_replans}) reached. Continuing..."
+                                ),
+                                "metadata": {"role": "Supervisor", "max_replans_reached": True},
+                            }
 
-                elif step_outcome == "abort":
-                    abort_execution = True
-                    break  # Exit step loop
+                    elif step_outcome == "abort":
+                        abort_execution = True
+                        break  # Exit step loop
 
             # If no replan needed and loop completed normally
             if not needs_replan and not abort_execution:
@@ -1571,9 +1614,10 @@ class AgentService:
                         return
 
                     # Phase 2: Load and prepare history
-                    history, history_source = await self._load_and_prepare_history(
-                        session, db_session, db_context, db_conversation, request
-                    )
+                    with phase("history.load"):
+                        history, history_source = await self._load_and_prepare_history(
+                            session, db_session, db_context, db_conversation, request
+                        )
 
                     # Debug logging
                     debug_logger = DebugLogger(session)
@@ -1859,55 +1903,166 @@ class AgentService:
             if key not in {"tool_args", "allowed_tools"}
         }
 
-    def _group_steps_for_parallel_execution(
-        self,
-        steps: list[PlanStep],
-    ) -> list[list[PlanStep]]:
-        """Group plan steps into batches for parallel execution.
+    @staticmethod
+    def _plan_declares_dependencies(steps: list[PlanStep]) -> bool:
+        """Return True if any step explicitly declares ``depends_on``.
+
+        Plans without any declaration keep strict sequential execution.
+        """
+        return any(step.depends_on is not None for step in steps)
 
-        Steps with no dependencies or satisfied dependencies are grouped together.
-        Each batch can be executed in parallel, batches are executed sequentially.
+    @staticmethod
+    def _resolve_step_dependencies(steps: list[PlanStep]) -> list[set[int]]:
+        """Map each step to the indexes of the steps it waits for.
+
+        Steps that declare ``depends_on`` wait for the listed step IDs (unknown
+        IDs are ignored). Steps without a declaration wait for every earlier
+        step, which keeps their sequential position.
 
         Args:
-            steps: List of plan steps with optional depends_on fields.
+            steps: Plan steps in planner order.
 
         Returns:
-            List of step batches. Each batch contains steps that can run in parallel.
+            One set of prerequisite step indexes per step.
         """
-        if not steps:
-            return []
-
-        batches: list[list[PlanStep]] = []
-        completed_ids: set[str] = set()
-        remaining = list(steps)
-
-        while remaining:
-            # Find all steps whose dependencies are satisfied
-            ready: list[PlanStep] = []
-            still_pending: list[PlanStep] = []
-
-            for step in remaining:
-                deps = step.depends_on or []
-                if all(dep in completed_ids for dep in deps):
-                    ready.append(step)
-                else:
-                    still_pending.append(step)
-
-            if not ready:
-                # No steps ready but we have remaining steps - this means
-                # circular dependency or missing step IDs. Fall back to sequential.
-                LOGGER.warning(
-                    "Dependency cycle detected or missing step IDs. "
-                    "Falling back to sequential execution for remaining %d steps.",
-                    len(still_pending),
-                )
-                # Add all remaining as individual batches
-                for step in still_pending:
-                    batches.append([step])
-                break
+        index_by_id: dict[str, int] = {}
+        for index, step in enumerate(steps):
+            index_by_id.setdefault(step.id, index)
+
+        dependencies: list[set[int]] = []
+        for index, step in enumerate(steps):
+            if step.depends_on is None:
+                dependencies.append(set(range(index)))
+                continue
+            deps: set[int] = set()
+            for dep_id in step.depends_on:
+                dep_index = index_by_id.get(dep_id)
+                if dep_index is None or dep_index == index:
+                    LOGGER.warning("Step '%s' has unknown dependency '%s'", step.id, dep_id)
+                    continue
+                deps.add(dep_index)
+            dependencies.append(deps)
+        return dependencies
+
+    async def _iter_steps_sequentially(
+        self,
+        steps: list[PlanStep],
+        skill_executor: SkillExecutor | None,
+        step_supervisor: StepSupervisorAgent,
+        request: AgentRequest,
+        prompt_history: list[AgentMessage],
+        session: AsyncSession,
+        db_session: Session,
+    ) -> AsyncGenerator[tuple[int, PlanStep, dict[str, Any]], None]:
+        """Run plan steps one after another, framing each with step_begin/step_end.
+
+        The consumer may stop at ``step_begin`` to skip the step entirely.
+        """
+        for step_index, plan_step in enumerate(steps):
+            yield step_index, plan_step, {"type": "step_begin"}
+            async for event in self._execute_step_with_retry(
+                plan_step,
+                skill_executor,
+                step_supervisor,
+                request,
+                prompt_history,
+                step_index,
+                session,
+                db_session,
+            ):
+                yield step_index, plan_step, event
+            yield step_index, plan_step, {"type": "step_end"}
+
+    async def _iter_steps_concurrently(
+        self,
+        steps: list[PlanStep],
+        skill_executor: SkillExecutor | None,
+        step_supervisor: StepSupervisorAgent,
+        request: AgentRequest,
+        prompt_history: list[AgentMessage],
+        db_session: Session,
+    ) -> AsyncGenerator[tuple[int, PlanStep, dict[str, Any]], None]:
+        """Run plan steps as a dependency graph, merging their event streams.
+
+        Every step whose prerequisites have ended is started immediately. Each
+        running step gets its own database session and a snapshot of the prompt
+        history taken at start, so it sees the output of the steps it depends
+        on. Client-facing events are tagged with ``metadata.step_id``.
 
-            batches.append(ready)
-            completed_ids.update(s.id for s in ready)
-            remaining = still_pending
+        Closing the generator (replan, abort, skipped completion) cancels any
+        steps still running.
+        """
+        dependencies = self._resolve_step_dependencies(steps)
+        pending = list(range(len(steps)))
+        ended: set[int] = set()
+        running: dict[int, asyncio.Task[None]] = {}
+        queue: asyncio.Queue[tuple[int, dict[str, Any]]] = asyncio.Queue()
+
+        async def pump(step_index: int, history: list[AgentMessage]) -> None:
+            plan_step = steps[step_index]
+            try:
+                async with self._open_step_session() as step_session:
+                    step_request = request.model_copy(
+                        update={
+                            "metadata": {
+                                **(request.metadata or {}),
+                                "_db_session": step_session,
+                            }
+                        }
+                    )
+                    async for event in self._execute_step_with_retry(
+                        plan_step,
+                        skill_executor,
+                        step_supervisor,
+                        step_request,
+                        history,
+                        step_index,
+                        step_session,
+                        db_session,
+                    ):
+                        if event["type"] not in ("step_outcome", "skill_content_yielded"):
+                            tagged_meta = {**(event.get("metadata") or {}), "step_id": plan_step.id}
+                            event = {**event, "metadata": tagged_meta}
+                        await queue.put((step_index, event))
+            except Exception as exc:
+                await queue.put((step_index, {"type": "step_exception", "error": exc}))
+                return
+            await queue.put((step_index, {"type": "step_end"}))
+
+        try:
+            while pending or running:
+                ready = [i for i in pending if dependencies[i] <= ended]
+                if not ready and not running:
+                    # Dependency cycle: fall back to plan order for the rest
+                    LOGGER.warning(
+                        "Dependency cycle in plan; running %d remaining steps in order",
+                        len(pending),
+                    )
+                    ready = [pending[0]]
+                for step_index in ready:
+                    yield step_index, steps[step_index], {"type": "step_begin"}
+                    pending.remove(step_index)
+                    running[step_index] = asyncio.create_task(
+                        pump(step_index, list(prompt_history))
+                    )
+                    if len(running) > 1:
+                        set_span_attributes({"plan.concurrent_steps": len(running)})
+
+                step_index, event = await queue.get()
+                if event["type"] == "step_exception":
+                    raise event["error"]
+                if event["type"] == "step_end":
+                    running.pop(step_index, None)
+                    ended.add(step_index)
+                yield step_index, steps[step_index], event
+        finally:
+            for task in running.values():
+                task.cancel()
+            await asyncio.gather(*running.values(), return_exceptions=True)
+
+    @staticmethod
+    def _open_step_session() -> contextlib.AbstractAsyncContextManager[AsyncSession]:
+        """Open a dedicated database session for a concurrently running step."""
+        from core.db.engine import AsyncSessionLocal
 
-        return batches
+        return AsyncSessionLocal()
@@ -13,6 +13,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.db.models import ToolPermission
+from core.observability.metrics import record_service_assembly
+from core.observability.profiler import phase
 from core.runtime.config import Settings
 from core.runtime.litellm_client import LiteLLMClient
 from core.runtime.memory import MemoryStore
@@ -24,6 +26,30 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger(__name__)
 
+# Assembly versions. Bumped whenever a context's tool permissions, skill files or
+# MCP clients change; the global version covers changes affecting every context.
+_global_version = 0
+_context_versions: dict[UUID, int] = {}
+
+
+def invalidate_context_services(context_id: UUID | None = None) -> None:
+    """Invalidate cached AgentService assemblies.
+
+    The next request for an invalidated context re-assembles its service.
+
+    Args:
+        context_id: Context whose service is stale, or None for every context.
+    """
+    global _global_version
+    if context_id is None:
+        _global_version += 1
+    else:
+        _context_versions[context_id] = _context_versions.get(context_id, 0) + 1
+
+
+def _assembly_version(context_id: UUID) -> tuple[int, int]:
+    return _global_version, _context_versions.get(context_id, 0)
+
 
 class ServiceFactory:
     """Factory for creating context-scoped AgentService instances.
@@ -35,7 +61,8 @@ class ServiceFactory:
     - Properly scoped dependencies
 
     The factory caches the base tool registry to avoid repeatedly parsing
-    the tools configuration file.
+    the tools configuration file, and caches each context's assembled service
+    until ``invalidate_context_services`` bumps its version.
     """
 
     def __init__(
@@ -70,12 +97,50 @@ class ServiceFactory:
         )
         LOGGER.info("Created shared AsyncQdrantClient for service factory")
 
+        # Assembled services per context, tagged with the version they were built at
+        self._services: dict[UUID, tuple[tuple[int, int], AgentService]] = {}
+
     async def create_service(
         self,
         context_id: UUID,
         session: AsyncSession,
     ) -> AgentService:
-        """Create an AgentService instance for a specific context.
+        """Return the AgentService for a specific context.
+
+        Services are cached per context; a request for an unchanged context costs
+        a single lookup. On a miss (or after invalidation) the service is assembled
+        from scratch.
+
+        Args:
+            context_id: Context UUID for isolation
+            session: Database session for loading context-specific config
+
+        Returns:
+            AgentService instance scoped to the context
+        """
+        with phase("service.create") as span:
+            version = _assembly_version(context_id)
+            cached = self._services.get(context_id)
+            if cached is not None and cached[0] == version:
+                record_service_assembly(hit=True)
+                span.set_attribute("cache_hit", True)
+                return cached[1]
+
+            start = time.perf_counter()
+            service = await self._assemble_service(context_id, session)
+            # Skip caching if the context was invalidated while assembling
+            if _assembly_version(context_id) == version:
+                self._services[context_id] = (version, service)
+            record_service_assembly(hit=False, duration_ms=(time.perf_counter() - start) * 1000)
+            span.set_attribute("cache_hit", False)
+            return service
+
+    async def _assemble_service(
+        self,
+        context_id: UUID,
+        session: AsyncSession,
+    ) -> AgentService:
+        """Assemble a new AgentService instance for a specific context.
 
         This method:
         1. Clones the base tool registry to avoid mutation
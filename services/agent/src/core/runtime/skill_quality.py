@@ -574,12 +574,15 @@ class SkillQualityAnalyser:
         """
         import asyncio
 
+        from core.runtime.service_factory import invalidate_context_services
+
         context_dir = ensure_context_directories(context_id)
         skills_dir = context_dir / "skills"
         skills_dir.mkdir(parents=True, exist_ok=True)
         target = skills_dir / file_name
 
         await asyncio.to_thread(target.write_text, content, "utf-8")
+        invalidate_context_services(context_id)
 
         LOGGER.info(
             "Wrote improved skill overlay '%s' for context %s",
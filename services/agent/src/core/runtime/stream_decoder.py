@@ -0,0 +1,175 @@
+"""Incremental decoding helpers for streamed chat completions.
+
+``LiteLLMClient.stream_chat`` feeds raw response bytes through three small
+state machines:
+
+- ``SSEDecoder`` splits bytes into ``data:`` payloads without decoding lines
+  to text first, keeping partial lines across network reads.
+- ``InlineReasoningSplitter`` separates ``<think>``-style reasoning from
+  content for models that inline it, including tags split across deltas.
+- ``DeltaBatcher`` merges consecutive text deltas of the same kind that
+  arrived in one network read into a single chunk, bounded by size. Nothing
+  is held back past the read that delivered it, so batching adds no latency.
+"""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from shared.streaming import AgentChunk
+
+TextKind = Literal["content", "thinking"]
+
+_REASONING_METADATA = {"source": "reasoning_model"}
+
+
+class SSEDecoder:
+    """Split a Server-Sent Events byte stream into ``data:`` payloads.
+
+    Each ``data:`` line is returned as one payload (the OpenAI-style streams
+    LiteLLM produces put one JSON object per line). Comments, other fields
+    and blank lines are skipped.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Consume a network read and return the complete payloads it finished."""
+        self._buffer.extend(chunk)
+        end = self._buffer.rfind(b"\n")
+        if end == -1:
+            return []
+        complete = bytes(self._buffer[:end])
+        del self._buffer[: end + 1]
+        return self._payloads(complete.split(b"\n"))
+
+    def flush(self) -> list[bytes]:
+        """Return the payload of a trailing line that had no newline."""
+        if not self._buffer:
+            return []
+        rest = bytes(self._buffer)
+        self._buffer.clear()
+        return self._payloads([rest])
+
+    @staticmethod
+    def _payloads(lines: list[bytes]) -> list[bytes]:
+        payloads: list[bytes] = []
+        for line in lines:
+            if not line.startswith(b"data:"):
+                continue
+            payload = line[5:].strip()
+            if payload:
+                payloads.append(payload)
+        return payloads
+
+
+class InlineReasoningSplitter:
+    """Incrementally split text into reasoning and content at inline tags.
+
+    A tag prefix at the end of a delta (``"<thi"``) is held back until the
+    next delta shows whether it completes the tag. Whitespace directly after
+    a closing tag is dropped, as models put a blank line between the two.
+    """
+
+    def __init__(self, open_tag: str, close_tag: str) -> None:
+        self._open = open_tag
+        self._close = close_tag
+        self._in_reasoning = False
+        self._pending = ""
+        self._strip_next = False
+
+    def feed(self, text: str) -> list[tuple[TextKind, str]]:
+        """Return ``(kind, text)`` segments that are certain after this delta."""
+        text = self._pending + text
+        self._pending = ""
+        segments: list[tuple[TextKind, str]] = []
+        while text:
+            if self._strip_next:
+                text = text.lstrip()
+                if not text:
+                    break
+                self._strip_next = False
+            tag = self._close if self._in_reasoning else self._open
+            index = text.find(tag)
+            if index >= 0:
+                if index:
+                    segments.append((self._kind, text[:index]))
+                self._strip_next = self._in_reasoning
+                self._in_reasoning = not self._in_reasoning
+                text = text[index + len(tag) :]
+                continue
+            keep = _partial_tag_suffix(text, tag)
+            if keep:
+                self._pending = text[-keep:]
+                text = text[:-keep]
+            if text:
+                segments.append((self._kind, text))
+            break
+        return segments
+
+    def flush(self) -> list[tuple[TextKind, str]]:
+        """Release a held-back partial tag at the end of the stream."""
+        pending, self._pending = self._pending, ""
+        return [(self._kind, pending)] if pending else []
+
+    @property
+    def _kind(self) -> TextKind:
+        return "thinking" if self._in_reasoning else "content"
+
+
+def _partial_tag_suffix(text: str, tag: str) -> int:
+    """Length of the longest suffix of ``text`` that is a proper prefix of ``tag``."""
+    for size in range(min(len(text), len(tag) - 1), 0, -1):
+        if text.endswith(tag[:size]):
+            return size
+    return 0
+
+
+class DeltaBatcher:
+    """Coalesce consecutive same-kind text deltas into size-bounded chunks."""
+
+    def __init__(self, max_chars: int = 512) -> None:
+        self._max_chars = max_chars
+        self._ready: list[AgentChunk] = []
+        self._kind: TextKind | None = None
+        self._parts: list[str] = []
+        self._size = 0
+
+    def add_text(self, kind: TextKind, text: str) -> None:
+        """Append a text delta, starting a new chunk on kind change or size limit."""
+        if not text:
+            return
+        if kind != self._kind or self._size + len(text) > self._max_chars:
+            self._close_run()
+            self._kind = kind
+        self._parts.append(text)
+        self._size += len(text)
+
+    def add_event(self, event: AgentChunk) -> None:
+        """Append a non-text event, preserving its order relative to text."""
+        self._close_run()
+        self._ready.append(event)
+
+    def drain(self) -> list[AgentChunk]:
+        """Return everything collected since the last drain."""
+        self._close_run()
+        ready, self._ready = self._ready, []
+        return ready
+
+    def _close_run(self) -> None:
+        if self._kind is not None and self._parts:
+            self._ready.append(
+                {
+                    "type": self._kind,
+                    "content": "".join(self._parts),
+                    "tool_call": None,
+                    "metadata": dict(_REASONING_METADATA) if self._kind == "thinking" else None,
+                }
+            )
+        self._kind = None
+        self._parts = []
+        self._size = 0
+
+
+__all__ = ["DeltaBatcher", "InlineReasoningSplitter", "SSEDecoder"]
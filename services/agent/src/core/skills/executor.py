@@ -13,7 +13,6 @@ import logging
 import re
 import time
 from collections.abc import AsyncGenerator
-from datetime import datetime
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
@@ -25,11 +24,13 @@ from shared.models import (
     StepResult,
 )
 
+from core.observability.profiler import phase
 from core.observability.tracing import (
     set_span_attributes,
     set_span_status,
     start_span,
 )
+from core.runtime.prompt_layout import current_time_message
 from core.tools.activity_hints import build_activity_message
 
 if TYPE_CHECKING:
@@ -242,18 +243,11 @@ class SkillExecutor:
             # Fallback to step description
             goal = step.description or step.label
 
-        # Build system context
-        now = datetime.now().strftime("%Y-%m-%d %H:%M")
-        today = datetime.now().strftime("%Y-%m-%d")
-        year = datetime.now().year
+        # Build the execution protocol (static per skill, part of the cacheable
+        # prefix; the current time is sent in its own message after it)
         max_turns = skill.max_turns
 
         system_context = (
-            "SYSTEM CONTEXT:\n"
-            f"- Current Date & Time: {now}\n"
-            f"- Your knowledge cutoff is static, but YOU ARE LIVE in {year}.\n"
-            f"- Treat all retrieved documents dated up to {today} as HISTORICAL FACTS.\n"
-            "\n"
             "## EXECUTION PROTOCOL\n"
             "RULE 1 - PROGRESSIVE RESEARCH: You may call tools multiple times.\n"
             "RULE 2 - AVOID EXACT DUPLICATES: Don't repeat identical tool calls.\n"
@@ -289,6 +283,7 @@ class SkillExecutor:
                     role="system",
                     content=f"{system_context}\n{skill_prompt}",
                 ),
+                current_time_message(),
                 AgentMessage(role="user", content=goal),
             ]
 
@@ -335,7 +330,12 @@ class SkillExecutor:
                 }
                 return
 
-        with start_span(f"skill.execution.{skill_name}", attributes={"goal": goal[:200]}):
+        with phase(
+            "skill.execution",
+            skill=skill_name,
+            span_name=f"skill.execution.{skill_name}",
+            attributes={"goal": goal[:200]},
+        ):
             yield {
                 "type": "thinking",
                 "content": f"Goal: {goal[:80]}...",
@@ -347,7 +347,7 @@ class SkillExecutor:
                 LOGGER.debug("%s Turn %d", logger_prefix, turn + 1)
                 blocked_this_turn = False
 
-                with start_span(f"skill.turn.{turn + 1}"):
+                with phase("skill.turn", skill=skill_name, span_name=f"skill.turn.{turn + 1}"):
                     set_span_attributes({"skill.turn": turn + 1, "skill.name": skill_name})
 
                     # Stream LLM response
@@ -539,6 +539,14 @@ class SkillExecutor:
                         source_count,
                     )
 
+                    # Classify every call in the model's order before running anything.
+                    # Dedup and rate-limit bookkeeping happens only here, sequentially,
+                    # so concurrently dispatched calls cannot race on it.
+                    call_meta: list[tuple[str, str]] = []  # (call_id, fname) per call
+                    outputs: list[str] = []
+                    runnable: list[tuple[int, str, Tool, dict[str, Any]]] = []
+                    hitl_call: tuple[str, dict[str, Any]] | None = None
+
                     for tc in tool_calls:
                         func = tc.get("function", {})
                         fname = func.get("name", "")
@@ -590,38 +598,9 @@ class SkillExecutor:
                             blocked_this_turn = True
 
                         elif fname == "request_user_input":
-                            # HITL: User input requested via structured tool call
-                            LOGGER.info("%s HITL: User input requested", logger_prefix)
-
-                            # Map category string to enum for validation
-                            category_str = fargs.get("category", "clarification")
-                            try:
-                                category = AwaitingInputCategory(category_str)
-                            except ValueError:
-                                LOGGER.warning(
-                                    "%s Invalid HITL category '%s', using CLARIFICATION",
-                                    logger_prefix,
-                                    category_str,
-                                )
-                                category = AwaitingInputCategory.CLARIFICATION
-
-                            # Yield awaiting_input event with skill state for resume
-                            yield {
-                                "type": "awaiting_input",
-                                "content": fargs.get("prompt", ""),
-                                "tool_call": None,
-                                "metadata": {
-                                    "category": category.value,
-                                    "prompt": fargs.get("prompt", ""),
-                                    "options": fargs.get("options"),
-                                    "skill_name": skill_name,
-                                    "skill_messages": [m.model_dump() for m in messages],
-                                    "step": step.model_dump(),
-                                    "tool_call_id": call_id,
-                                },
-                            }
-                            # Stop execution - service.py will store state and resume later
-                            return
+                            # HITL: handled after earlier calls in this turn have run
+                            hitl_call = (call_id, fargs)
+                            break
 
                         elif fname not in tool_lookup:
                             # Tool not in scoped set - SECURITY: reject
@@ -633,7 +612,7 @@ class SkillExecutor:
                             output_str = f"ERROR: Tool '{fname}' is not available to this skill."
 
                         else:
-                            # Execute tool (tool_obj is guaranteed to exist here)
+                            # Schedule tool (tool_obj is guaranteed to exist here)
                             assert tool_obj is not None
                             seen_calls.add(call_key)
                             tool_call_counts[fname] = current_count + 1
@@ -653,7 +632,6 @@ class SkillExecutor:
                                     "fetch_url": fargs.get("url"),
                                 },
                             }
-                            await asyncio.sleep(0)
 
                             # Inject context into tool args
                             tool_args = fargs.copy()
@@ -662,33 +640,39 @@ class SkillExecutor:
                             if context_id and session and fname in ("azure_devops",):
                                 tool_args["session"] = session
 
-                            try:
-                                with start_span(f"skill.tool.{fname}"):
-                                    tool_start = time.perf_counter()
-                                    output_str = str(await tool_obj.run(**tool_args))
-                                    tool_duration_ms = (time.perf_counter() - tool_start) * 1000
-                                    set_span_attributes(
-                                        {
-                                            "tool.output_preview": output_str[:500],
-                                            "tool.status": "success",
-                                            "tool.duration_ms": round(tool_duration_ms, 1),
-                                        }
-                                    )
-                            except Exception as e:
-                                from core.observability.error_codes import classify_exception
-
-                                output_str = f"Error: {e}"
-                                LOGGER.error(
-                                    "%s Tool %s failed: %s",
-                                    logger_prefix,
+                            runnable.append((len(outputs), fname, tool_obj, tool_args))
+
+                        call_meta.append((call_id, fname))
+                        outputs.append(output_str)
+
+                    # Run scheduled calls concurrently (bounded per skill); turn latency
+                    # becomes the slowest call instead of the sum of all calls.
+                    if runnable:
+                        await asyncio.sleep(0)
+                        limiter = asyncio.Semaphore(max(1, skill.max_parallel_tools))
+                        # A shared AsyncSession must never be used by two calls at once
+                        session_lock = asyncio.Lock()
+                        results = await asyncio.gather(
+                            *(
+                                self._run_tool(
+                                    tool_obj,
                                     fname,
-                                    e,
+                                    tool_args,
+                                    limiter=limiter,
+                                    session_lock=session_lock,
+                                    timeout=self._resolve_tool_timeout(
+                                        tool_obj, skill.tool_timeout
+                                    ),
+                                    logger_prefix=logger_prefix,
                                 )
-                                error_code = classify_exception(e)
-                                set_span_status("ERROR", str(e))
-                                set_span_attributes({"error_code": error_code.value})
+                                for _, fname, tool_obj, tool_args in runnable
+                            )
+                        )
+                        for (position, *_), result in zip(runnable, results, strict=True):
+                            outputs[position] = result
 
-                        # Add tool result to messages
+                    # Add tool results to messages in the original call order
+                    for (call_id, fname), output_str in zip(call_meta, outputs, strict=True):
                         messages.append(
                             AgentMessage(
                                 role="tool",
@@ -698,6 +682,41 @@ class SkillExecutor:
                             )
                         )
 
+                    if hitl_call is not None:
+                        # HITL: User input requested via structured tool call
+                        LOGGER.info("%s HITL: User input requested", logger_prefix)
+                        call_id, fargs = hitl_call
+
+                        # Map category string to enum for validation
+                        category_str = fargs.get("category", "clarification")
+                        try:
+                            category = AwaitingInputCategory(category_str)
+                        except ValueError:
+                            LOGGER.warning(
+                                "%s Invalid HITL category '%s', using CLARIFICATION",
+                                logger_prefix,
+                                category_str,
+                            )
+                            category = AwaitingInputCategory.CLARIFICATION
+
+                        # Yield awaiting_input event with skill state for resume
+                        yield {
+                            "type": "awaiting_input",
+                            "content": fargs.get("prompt", ""),
+                            "tool_call": None,
+                            "metadata": {
+                                "category": category.value,
+                                "prompt": fargs.get("prompt", ""),
+                                "options": fargs.get("options"),
+                                "skill_name": skill_name,
+                                "skill_messages": [m.model_dump() for m in messages],
+                                "step": step.model_dump(),
+                                "tool_call_id": call_id,
+                            },
+                        }
+                        # Stop execution - service.py will store state and resume later
+                        return
+
                     if blocked_this_turn:
                         LOGGER.info("%s Blocked calls, terminating", logger_prefix)
                         break
@@ -751,6 +770,64 @@ class SkillExecutor:
                 ),
             }
 
+    @staticmethod
+    def _resolve_tool_timeout(tool_obj: Tool, skill_timeout: float | None) -> float | None:
+        """Return the tool's own run_timeout, falling back to the skill default."""
+        tool_timeout = getattr(tool_obj, "run_timeout", None)
+        if isinstance(tool_timeout, int | float):
+            return float(tool_timeout)
+        return skill_timeout
+
+    async def _run_tool(
+        self,
+        tool_obj: Tool,
+        fname: str,
+        tool_args: dict[str, Any],
+        *,
+        limiter: asyncio.Semaphore,
+        session_lock: asyncio.Lock,
+        timeout: float | None,
+        logger_prefix: str,
+    ) -> str:
+        """Run one scoped tool call and return its output (or error) as a string."""
+        async with limiter:
+            try:
+                with start_span(f"skill.tool.{fname}"):
+                    tool_start = time.perf_counter()
+                    if "session" in tool_args:
+                        async with session_lock:
+                            raw = await asyncio.wait_for(tool_obj.run(**tool_args), timeout)
+                    else:
+                        raw = await asyncio.wait_for(tool_obj.run(**tool_args), timeout)
+                    output_str = str(raw)
+                    tool_duration_ms = (time.perf_counter() - tool_start) * 1000
+                    set_span_attributes(
+                        {
+                            "tool.output_preview": output_str[:500],
+                            "tool.status": "success",
+                            "tool.duration_ms": round(tool_duration_ms, 1),
+                        }
+                    )
+                    return output_str
+            except Exception as e:
+                from core.observability.error_codes import classify_exception
+
+                if isinstance(e, TimeoutError) and timeout is not None:
+                    LOGGER.error("%s Tool %s timed out after %.0fs", logger_prefix, fname, timeout)
+                    set_span_status("ERROR", "timeout")
+                    return f"Error: Tool '{fname}' timed out after {timeout:.0f} seconds."
+
+                LOGGER.error(
+                    "%s Tool %s failed: %s",
+                    logger_prefix,
+                    fname,
+                    e,
+                )
+                error_code = classify_exception(e)
+                set_span_status("ERROR", str(e))
+                set_span_attributes({"error_code": error_code.value})
+                return f"Error: {e}"
+
     def _merge_tool_calls(
         self,
         buffer: dict[int, Any],
@@ -69,6 +69,8 @@ def parse_skill_content(path: Path, content: str, skills_dir: Path) -> Skill | N
         tools=metadata.get("tools", []),
         model=metadata.get("model", "agentchat"),
         max_turns=metadata.get("max_turns", 10),
+        max_parallel_tools=metadata.get("max_parallel_tools", 4),
+        tool_timeout=metadata.get("tool_timeout"),
         variables=metadata.get("variables", []),
         raw_content=content,
         body_template=body_template,
@@ -85,6 +87,8 @@ class Skill:
     tools: list[str] = field(default_factory=list)
     model: str = "agentchat"
     max_turns: int = 10
+    max_parallel_tools: int = 4
+    tool_timeout: float | None = None
     variables: list[str] = field(default_factory=list)
     raw_content: str = ""
     body_template: str = ""
@@ -135,6 +135,7 @@ async def build_service(tmp_path: Path) -> AgentService:
     settings = Settings(
         environment="test",
         internal_api_key=None,
+        trace_span_log_path=tmp_path / "spans.jsonl",
     )
     memory = cast(MemoryStore, DummyMemory())
     await memory.ainit()
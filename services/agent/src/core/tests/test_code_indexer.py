@@ -7,8 +7,9 @@ from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from qdrant_client.http import models
 
-from modules.indexer.ingestion import CodeIndexer
+from modules.indexer.ingestion import MANIFEST_DIR, CodeIndexer
 
 
 class MockEmbedder:
@@ -31,9 +32,15 @@ def mock_embedder() -> MockEmbedder:
 
 
 @pytest.fixture
-def code_indexer(tmp_path: Path, mock_embedder: MockEmbedder) -> CodeIndexer:
+def code_indexer(
+    tmp_path: Path, tmp_path_factory: pytest.TempPathFactory, mock_embedder: MockEmbedder
+) -> CodeIndexer:
     """Create a CodeIndexer with mock dependencies."""
-    return CodeIndexer(root_path=tmp_path, embedder=mock_embedder)
+    return CodeIndexer(
+        root_path=tmp_path,
+        embedder=mock_embedder,
+        manifest_path=tmp_path_factory.mktemp("manifest") / "index.json",
+    )
 
 
 class TestCodeIndexerInitialization:
@@ -49,6 +56,23 @@ class TestCodeIndexerInitialization:
         assert indexer.client is not None
         assert indexer.splitter is not None
 
+    def test_default_manifest_lives_outside_indexed_tree(
+        self, tmp_path: Path, mock_embedder: MockEmbedder
+    ) -> None:
+        """Test that the default manifest is keyed by root path and collection."""
+        first = CodeIndexer(root_path=tmp_path / "a", embedder=mock_embedder)
+        other_root = CodeIndexer(root_path=tmp_path / "b", embedder=mock_embedder)
+        other_collection = CodeIndexer(
+            root_path=tmp_path / "a", embedder=mock_embedder, collection_name="other"
+        )
+
+        assert first.manifest_path.parent == MANIFEST_DIR
+        assert not first.manifest_path.is_relative_to(tmp_path)
+        assert (
+            len({first.manifest_path, other_root.manifest_path, other_collection.manifest_path})
+            == 3
+        )
+
     def test_configuration_from_constructor(
         self, tmp_path: Path, mock_embedder: MockEmbedder
     ) -> None:
@@ -401,6 +425,143 @@ class TestCodeIndexerScanAndIndex:
             assert any("included.py" in str(f) for f in indexed_files)
 
 
+class TestCodeIndexerManifest:
+    """Test manifest-driven incremental indexing."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_skip_network(
+        self, code_indexer: CodeIndexer, tmp_path: Path
+    ) -> None:
+        """Test that a second run skips unchanged files without touching Qdrant."""
+        (tmp_path / "a.py").write_text("def a():\n    pass\n", encoding="utf-8")
+        (tmp_path / "b.md").write_text("# Title\n", encoding="utf-8")
+
+        mock_scroll = AsyncMock(return_value=([], None))
+        mock_delete = AsyncMock()
+        mock_upsert = AsyncMock()
+        mock_count = AsyncMock(return_value=models.CountResult(count=2))
+        with (
+            patch.object(code_indexer.client, "scroll", new=mock_scroll),
+            patch.object(code_indexer.client, "delete", new=mock_delete),
+            patch.object(code_indexer.client, "upsert", new=mock_upsert),
+            patch.object(code_indexer.client, "count", new=mock_count),
+        ):
+            await code_indexer.scan_and_index()
+            assert mock_upsert.call_count == 2
+            assert code_indexer.manifest_path.exists()
+
+            mock_scroll.reset_mock()
+            mock_delete.reset_mock()
+            mock_upsert.reset_mock()
+
+            # Fresh indexer reads the persisted manifest
+            second = CodeIndexer(
+                root_path=tmp_path,
+                embedder=code_indexer.embedder,
+                manifest_path=code_indexer.manifest_path,
+            )
+            second.client = code_indexer.client
+            await second.scan_and_index()
+
+            mock_scroll.assert_not_called()
+            mock_delete.assert_not_called()
+            mock_upsert.assert_not_called()
+            assert second.last_run_stats is not None
+            assert second.last_run_stats.files_scanned == 2
+            assert second.last_run_stats.chunks_indexed == 0
+
+    @pytest.mark.asyncio
+    async def test_changed_file_reindexed_without_scroll(
+        self, code_indexer: CodeIndexer, tmp_path: Path
+    ) -> None:
+        """Test that a manifest hash mismatch re-indexes without a Qdrant lookup."""
+        test_file = tmp_path / "a.py"
+        test_file.write_text("x = 1\n", encoding="utf-8")
+
+        mock_scroll = AsyncMock(return_value=([], None))
+        mock_delete = AsyncMock()
+        mock_upsert = AsyncMock()
+        mock_count = AsyncMock(return_value=models.CountResult(count=2))
+        with (
+            patch.object(code_indexer.client, "scroll", new=mock_scroll),
+            patch.object(code_indexer.client, "delete", new=mock_delete),
+            patch.object(code_indexer.client, "upsert", new=mock_upsert),
+            patch.object(code_indexer.client, "count", new=mock_count),
+        ):
+            await code_indexer.scan_and_index()
+            mock_scroll.reset_mock()
+            mock_upsert.reset_mock()
+
+            test_file.write_text("x = 2\ny = 3\n", encoding="utf-8")
+            await code_indexer.scan_and_index()
+
+            mock_scroll.assert_not_called()
+            mock_upsert.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_deleted_files_purged_in_one_call(
+        self, code_indexer: CodeIndexer, tmp_path: Path
+    ) -> None:
+        """Test that chunks of deleted files are removed with a single filter delete."""
+        for name in ("a.py", "b.py", "c.py"):
+            (tmp_path / name).write_text(f"# {name}\n", encoding="utf-8")
+
+        mock_delete = AsyncMock()
+        with (
+            patch.object(code_indexer.client, "scroll", new=AsyncMock(return_value=([], None))),
+            patch.object(code_indexer.client, "delete", new=mock_delete),
+            patch.object(code_indexer.client, "upsert", new=AsyncMock()),
+            patch.object(
+                code_indexer.client,
+                "count",
+                new=AsyncMock(return_value=models.CountResult(count=3)),
+            ),
+        ):
+            await code_indexer.scan_and_index()
+            mock_delete.reset_mock()
+
+            (tmp_path / "a.py").unlink()
+            (tmp_path / "b.py").unlink()
+            await code_indexer.scan_and_index()
+
+            mock_delete.assert_called_once()
+            condition = mock_delete.call_args[1]["points_selector"].filter.must[0]
+            assert sorted(condition.match.any) == sorted(
+                [str(tmp_path / "a.py"), str(tmp_path / "b.py")]
+            )
+            assert code_indexer.last_run_stats is not None
+            assert code_indexer.last_run_stats.files_deleted == 2
+
+    @pytest.mark.asyncio
+    async def test_manifest_discarded_when_collection_emptied(
+        self, code_indexer: CodeIndexer, tmp_path: Path
+    ) -> None:
+        """Test that files are re-indexed after the collection was dropped."""
+        (tmp_path / "a.py").write_text("x = 1\n", encoding="utf-8")
+
+        mock_upsert = AsyncMock()
+        mock_count = AsyncMock(return_value=models.CountResult(count=1))
+        with (
+            patch.object(code_indexer.client, "scroll", new=AsyncMock(return_value=([], None))),
+            patch.object(code_indexer.client, "delete", new=AsyncMock()),
+            patch.object(code_indexer.client, "upsert", new=mock_upsert),
+            patch.object(code_indexer.client, "count", new=mock_count),
+        ):
+            await code_indexer.scan_and_index()
+            mock_upsert.reset_mock()
+
+            mock_count.return_value = models.CountResult(count=0)
+            second = CodeIndexer(
+                root_path=tmp_path,
+                embedder=code_indexer.embedder,
+                manifest_path=code_indexer.manifest_path,
+            )
+            second.client = code_indexer.client
+            await second.scan_and_index()
+
+            mock_upsert.assert_called_once()
+
+
 class TestCodeIndexerClose:
     """Test cleanup functionality."""
 
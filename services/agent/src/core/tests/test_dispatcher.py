@@ -17,6 +17,17 @@ from core.skills.registry import Skill, SkillRegistry
 from orchestrator.dispatcher import Dispatcher
 
 
+def _orchestrated(result: OrchestrationResult, *tokens: str) -> MagicMock:
+    """Mock ``UnifiedOrchestrator.process_stream`` emitting tokens, then the result."""
+
+    async def stream(*args, **kwargs):  # type: ignore[no-untyped-def]
+        for token in tokens:
+            yield {"type": "token", "content": token}
+        yield {"type": "result", "result": result}
+
+    return MagicMock(side_effect=stream)
+
+
 @pytest.fixture
 def mock_litellm() -> MagicMock:
     """Create a mock LiteLLM client."""
@@ -266,10 +277,8 @@ class TestSlashCommandRouting:
 
         with patch.object(
             dispatcher._unified_orchestrator,
-            "process",
-            new=AsyncMock(
-                return_value=OrchestrationResult(direct_answer="I don't recognize that command.")
-            ),
+            "process_stream",
+            new=_orchestrated(OrchestrationResult(direct_answer="I don't recognize that command.")),
         ):
             chunks = []
             async for chunk in dispatcher.stream_message(
@@ -412,8 +421,8 @@ class TestUnifiedOrchestration:
         """Test that direct answers are streamed correctly."""
         with patch.object(
             dispatcher._unified_orchestrator,
-            "process",
-            new=AsyncMock(return_value=OrchestrationResult(direct_answer="The answer is 42.")),
+            "process_stream",
+            new=_orchestrated(OrchestrationResult(direct_answer="The answer is 42.")),
         ):
             chunks = []
             async for chunk in dispatcher.stream_message(
@@ -440,6 +449,36 @@ class TestUnifiedOrchestration:
                 for chunk in chunks
             )
 
+    @pytest.mark.asyncio
+    async def test_streamed_direct_answer_is_not_repeated(
+        self,
+        dispatcher: Dispatcher,
+        mock_db_session: AsyncMock,
+        mock_agent_service: MagicMock,
+    ) -> None:
+        """Tokens forwarded while generating are the whole answer; nothing is re-sent."""
+        with patch.object(
+            dispatcher._unified_orchestrator,
+            "process_stream",
+            new=_orchestrated(OrchestrationResult(direct_answer="Bonjour !"), "Bon", "jour !"),
+        ):
+            chunks = [
+                chunk
+                async for chunk in dispatcher.stream_message(
+                    session_id="test-session",
+                    message="Hello in French?",
+                    platform="web",
+                    db_session=mock_db_session,
+                    agent_service=mock_agent_service,
+                )
+            ]
+
+        assert [(c["type"], c["content"]) for c in chunks] == [
+            ("thinking", "Direct answer (no tools needed)"),
+            ("content", "Bon"),
+            ("content", "jour !"),
+        ]
+
     @pytest.mark.asyncio
     async def test_direct_answer_persists_to_db(
         self, dispatcher: Dispatcher, mock_db_session: AsyncMock, mock_agent_service: MagicMock
@@ -456,8 +495,8 @@ class TestUnifiedOrchestration:
 
         with patch.object(
             dispatcher._unified_orchestrator,
-            "process",
-            new=AsyncMock(return_value=OrchestrationResult(direct_answer="Test answer")),
+            "process_stream",
+            new=_orchestrated(OrchestrationResult(direct_answer="Test answer")),
         ):
             chunks = []
             async for chunk in dispatcher.stream_message(
@@ -483,8 +522,8 @@ class TestUnifiedOrchestration:
 
         with patch.object(
             dispatcher._unified_orchestrator,
-            "process",
-            new=AsyncMock(return_value=OrchestrationResult(direct_answer="Test answer")),
+            "process_stream",
+            new=_orchestrated(OrchestrationResult(direct_answer="Test answer")),
         ):
             chunks = []
             async for chunk in dispatcher.stream_message(
@@ -523,8 +562,8 @@ class TestUnifiedOrchestration:
 
         with patch.object(
             dispatcher._unified_orchestrator,
-            "process",
-            new=AsyncMock(return_value=OrchestrationResult(plan=test_plan)),
+            "process_stream",
+            new=_orchestrated(OrchestrationResult(plan=test_plan)),
         ):
             chunks = []
             async for chunk in dispatcher.stream_message(
@@ -544,6 +583,46 @@ class TestUnifiedOrchestration:
             # Should yield agent execution chunks
             assert any(chunk["type"] == "content" for chunk in chunks)
 
+    @pytest.mark.asyncio
+    async def test_plan_after_streamed_preamble_is_not_shown(
+        self,
+        dispatcher: Dispatcher,
+        mock_litellm: MagicMock,
+        mock_db_session: AsyncMock,
+        mock_agent_service: MagicMock,
+    ) -> None:
+        """A plan following a preamble runs without its JSON reaching the user."""
+        plan_json = (
+            '{"description": "Weather", "steps": [{"id": "1", "label": "Search", '
+            '"executor": "skill", "action": "skill", "tool": "researcher", '
+            '"args": {"goal": "Weather in Oslo"}}]}'
+        )
+
+        async def stream_chat(*args, **kwargs):  # type: ignore[no-untyped-def]
+            for text in ("Let me check", " that.\n", "```json\n", plan_json, "\n```"):
+                yield {"type": "content", "content": text, "tool_call": None, "metadata": None}
+
+        mock_litellm.stream_chat = MagicMock(side_effect=stream_chat)
+
+        chunks = [
+            chunk
+            async for chunk in dispatcher.stream_message(
+                session_id="test-session",
+                message="What's the weather in Oslo?",
+                platform="web",
+                db_session=mock_db_session,
+                agent_service=mock_agent_service,
+            )
+        ]
+
+        content = "".join(c["content"] or "" for c in chunks if c["type"] == "content")
+        assert content.startswith("Let me check that.")
+        assert "steps" not in content and "```" not in content
+        assert any(
+            c["type"] == "thinking" and c["content"] and "Plan:" in c["content"] for c in chunks
+        )
+        assert "Test response" in content
+
     @pytest.mark.asyncio
     async def test_history_passed_to_orchestrator(
         self, dispatcher: Dispatcher, mock_db_session: AsyncMock, mock_agent_service: MagicMock
@@ -556,8 +635,8 @@ class TestUnifiedOrchestration:
 
         with patch.object(
             dispatcher._unified_orchestrator,
-            "process",
-            new=AsyncMock(return_value=OrchestrationResult(direct_answer="Response")),
+            "process_stream",
+            new=_orchestrated(OrchestrationResult(direct_answer="Response")),
         ) as mock_process:
             chunks = []
             async for chunk in dispatcher.stream_message(
@@ -585,8 +664,8 @@ class TestUnifiedOrchestration:
 
         with patch.object(
             dispatcher._unified_orchestrator,
-            "process",
-            new=AsyncMock(return_value=OrchestrationResult(direct_answer="Response")),
+            "process_stream",
+            new=_orchestrated(OrchestrationResult(direct_answer="Response")),
         ):
             chunks = []
             async for chunk in dispatcher.stream_message(
@@ -651,7 +730,8 @@ class TestAgentExecution:
         """Test that different chunk types are normalized correctly."""
 
         async def mock_execute_stream(  # type: ignore[no-untyped-def]
-            *args, **kwargs  # noqa: ANN002, ANN003
+            *args,
+            **kwargs,  # noqa: ANN002, ANN003
         ):
             yield {"type": "plan", "description": "Test plan"}
             yield {"type": "step_start", "content": "Starting step"}
@@ -697,7 +777,8 @@ class TestAgentExecution:
         """Test that agent execution errors are caught and yielded."""
 
         async def mock_execute_stream(  # type: ignore[no-untyped-def]
-            *args, **kwargs  # noqa: ANN002, ANN003
+            *args,
+            **kwargs,  # noqa: ANN002, ANN003
         ):
             yield {"type": "content", "content": "Start"}
             raise RuntimeError("Agent execution failed")
@@ -811,8 +892,8 @@ class TestMetadataHandling:
 
         with patch.object(
             dispatcher._unified_orchestrator,
-            "process",
-            new=AsyncMock(return_value=OrchestrationResult(plan=test_plan)),
+            "process_stream",
+            new=_orchestrated(OrchestrationResult(plan=test_plan)),
         ):
             chunks = []
             async for chunk in dispatcher.stream_message(
@@ -846,10 +927,8 @@ class TestEdgeCases:
         """Test handling of empty message."""
         with patch.object(
             dispatcher._unified_orchestrator,
-            "process",
-            new=AsyncMock(
-                return_value=OrchestrationResult(direct_answer="Please provide a message.")
-            ),
+            "process_stream",
+            new=_orchestrated(OrchestrationResult(direct_answer="Please provide a message.")),
         ):
             chunks = []
             async for chunk in dispatcher.stream_message(
@@ -874,10 +953,8 @@ class TestEdgeCases:
         """Test handling of whitespace-only message."""
         with patch.object(
             dispatcher._unified_orchestrator,
-            "process",
-            new=AsyncMock(
-                return_value=OrchestrationResult(direct_answer="Please provide a message.")
-            ),
+            "process_stream",
+            new=_orchestrated(OrchestrationResult(direct_answer="Please provide a message.")),
         ):
             chunks = []
             async for chunk in dispatcher.stream_message(
@@ -902,8 +979,8 @@ class TestEdgeCases:
         """Test handling of bare slash without command."""
         with patch.object(
             dispatcher._unified_orchestrator,
-            "process",
-            new=AsyncMock(return_value=OrchestrationResult(direct_answer="Invalid command.")),
+            "process_stream",
+            new=_orchestrated(OrchestrationResult(direct_answer="Invalid command.")),
         ):
             chunks = []
             async for chunk in dispatcher.stream_message(
@@ -925,8 +1002,8 @@ class TestEdgeCases:
         """Test that invalid UUID conversation_id doesn't crash persistence."""
         with patch.object(
             dispatcher._unified_orchestrator,
-            "process",
-            new=AsyncMock(return_value=OrchestrationResult(direct_answer="Test answer")),
+            "process_stream",
+            new=_orchestrated(OrchestrationResult(direct_answer="Test answer")),
         ):
             chunks = []
             async for chunk in dispatcher.stream_message(
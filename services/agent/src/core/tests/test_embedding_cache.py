@@ -0,0 +1,112 @@
+"""Unit tests for the content-addressed embedding cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from core.observability.metrics import _metric_snapshot
+from modules.embedder.cache import CachedEmbedder, EmbeddingDiskCache, embedding_cache_key
+
+
+class CountingEmbedder:
+    """Deterministic embedder that records every upstream batch."""
+
+    def __init__(self, dim: int = 8) -> None:
+        self._dim = dim
+        self.calls: list[list[str]] = []
+
+    @property
+    def dimension(self) -> int:
+        return self._dim
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(t)) + i / 10 for i in range(self._dim)] for t in texts]
+
+
+@pytest.mark.asyncio
+async def test_repeated_texts_hit_memory_tier() -> None:
+    inner = CountingEmbedder()
+    cache = CachedEmbedder(inner, model="embedder")
+
+    first = await cache.embed(["alpha", "beta"])
+    second = await cache.embed(["beta", "alpha"])
+
+    assert inner.calls == [["alpha", "beta"]]
+    assert second == [first[1], first[0]]
+
+
+@pytest.mark.asyncio
+async def test_batch_fetches_only_misses_once() -> None:
+    inner = CountingEmbedder()
+    cache = CachedEmbedder(inner, model="embedder")
+    await cache.embed(["alpha"])
+
+    result = await cache.embed(["alpha", "gamma", "gamma", "delta"])
+
+    assert inner.calls[-1] == ["gamma", "delta"]
+    assert len(result) == 4
+    assert result[1] == result[2]
+
+
+@pytest.mark.asyncio
+async def test_model_namespaces_keys() -> None:
+    assert embedding_cache_key("a", "text") != embedding_cache_key("b", "text")
+
+    inner = CountingEmbedder()
+    await CachedEmbedder(inner, model="a").embed(["text"])
+    await CachedEmbedder(inner, model="b").embed(["text"])
+
+    assert len(inner.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_oldest_entry() -> None:
+    inner = CountingEmbedder()
+    cache = CachedEmbedder(inner, model="embedder", max_entries=2)
+
+    await cache.embed(["a", "b"])
+    await cache.embed(["a"])  # refresh "a"
+    await cache.embed(["c"])  # evicts "b"
+    await cache.embed(["a", "b"])
+
+    assert len(cache) == 2
+    assert inner.calls[-1] == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_new_instance(tmp_path: Path) -> None:
+    db_path = tmp_path / "embeddings.sqlite"
+    inner = CountingEmbedder(dim=4096)
+
+    writer = CachedEmbedder(inner, model="embedder", disk_cache=EmbeddingDiskCache(db_path))
+    original = await writer.embed(["persisted"])
+    writer.close()
+
+    disk = EmbeddingDiskCache(db_path)
+    reader = CachedEmbedder(inner, model="embedder", disk_cache=disk)
+    restored = await reader.embed(["persisted"])
+
+    assert len(inner.calls) == 1
+    assert disk.count() == 1
+    # float16 packing keeps values within half-precision tolerance
+    np.testing.assert_allclose(restored[0], original[0], rtol=1e-3)
+    disk.close()
+
+
+@pytest.mark.asyncio
+async def test_records_hit_and_miss_metrics() -> None:
+    _metric_snapshot.clear()
+    cache = CachedEmbedder(CountingEmbedder(dim=4), model="embedder")
+
+    await cache.embed(["x", "y"])
+    await cache.embed(["x"])
+
+    assert _metric_snapshot["embeddings.cache.misses"] == 2.0
+    assert _metric_snapshot["embeddings.cache.hits"] == 1.0
+    assert _metric_snapshot["embeddings.cache.bytes_served"] == 16.0
+    assert _metric_snapshot["embeddings.cache.bytes_fetched"] == 32.0
+    assert _metric_snapshot["embeddings.upstream.calls"] == 1.0
@@ -0,0 +1,128 @@
+"""Unit tests for the batching embedding scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from core.observability.metrics import _metric_snapshot
+from core.runtime.litellm_client import LiteLLMError
+from modules.embedder.scheduler import EmbeddingScheduler
+
+
+class RecordingEmbedder:
+    """Deterministic embedder that records batches and can inject failures."""
+
+    def __init__(self, failures: list[BaseException] | None = None, max_size: int = 0) -> None:
+        self.calls: list[list[str]] = []
+        self._failures = list(failures or [])
+        self._max_size = max_size
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    @property
+    def dimension(self) -> int:
+        return 2
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self._max_size and len(texts) > self._max_size:
+                raise LiteLLMError("Embedding failed: 413", status_code=413)
+            if self._failures:
+                raise self._failures.pop(0)
+            return [[float(len(t)), 1.0] for t in texts]
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_are_coalesced() -> None:
+    inner = RecordingEmbedder()
+    scheduler = EmbeddingScheduler(inner, model="embedder", max_batch_size=16, max_wait_ms=20)
+
+    results = await asyncio.gather(scheduler.embed(["a", "bb"]), scheduler.embed(["ccc", "dddd"]))
+
+    assert inner.calls == [["a", "bb", "ccc", "dddd"]]
+    assert results == [[[1.0, 1.0], [2.0, 1.0]], [[3.0, 1.0], [4.0, 1.0]]]
+
+
+@pytest.mark.asyncio
+async def test_query_does_not_wait_behind_ingestion_batches() -> None:
+    gate = asyncio.Event()
+
+    class SlowBulkEmbedder(RecordingEmbedder):
+        async def embed(self, texts: list[str]) -> list[list[float]]:
+            if len(texts) > 1:
+                await gate.wait()
+            return await super().embed(texts)
+
+    inner = SlowBulkEmbedder()
+    scheduler = EmbeddingScheduler(inner, model="embedder", max_batch_size=4, max_in_flight=1)
+    ingestion = asyncio.create_task(scheduler.embed([f"t{i}" for i in range(8)]))
+    await asyncio.sleep(0.05)  # first batch in flight, second queued
+
+    assert await asyncio.wait_for(scheduler.embed(["query"]), timeout=1) == [[5.0, 1.0]]
+    assert inner.calls == [["query"]]
+
+    gate.set()
+    assert len(await ingestion) == 8
+
+
+@pytest.mark.asyncio
+async def test_large_request_runs_batches_in_flight() -> None:
+    inner = RecordingEmbedder()
+    scheduler = EmbeddingScheduler(inner, model="embedder", max_batch_size=4, max_in_flight=3)
+
+    texts = [f"t{i}" for i in range(12)]
+    result = await scheduler.embed(texts)
+
+    assert len(inner.calls) == 3
+    assert all(len(call) == 4 for call in inner.calls)
+    assert inner.peak_in_flight == 3
+    assert len(result) == 12
+
+
+@pytest.mark.asyncio
+async def test_oversized_batch_is_split_and_shrinks() -> None:
+    inner = RecordingEmbedder(max_size=3)
+    scheduler = EmbeddingScheduler(inner, model="embedder", max_batch_size=8)
+
+    result = await scheduler.embed([f"t{i}" for i in range(8)])
+
+    assert len(result) == 8
+    assert scheduler.batch_size <= 3
+    assert sum(len(call) for call in inner.calls if len(call) <= 3) == 8
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried() -> None:
+    before = _metric_snapshot.get("embeddings.batches.retry", 0.0)
+    inner = RecordingEmbedder(
+        failures=[httpx.RemoteProtocolError("disconnect"), LiteLLMError("busy", status_code=503)]
+    )
+    scheduler = EmbeddingScheduler(inner, model="embedder", backoff_base=0.001)
+
+    result = await scheduler.embed(["alpha"])
+
+    assert result == [[5.0, 1.0]]
+    assert len(inner.calls) == 3
+    assert _metric_snapshot["embeddings.batches.retry"] - before == 2
+
+
+@pytest.mark.asyncio
+async def test_permanent_error_propagates_to_all_callers() -> None:
+    inner = RecordingEmbedder(failures=[LiteLLMError("bad request", status_code=400)])
+    scheduler = EmbeddingScheduler(inner, model="embedder", max_wait_ms=20)
+
+    results = await asyncio.gather(
+        scheduler.embed(["a", "b"]), scheduler.embed(["c", "d"]), return_exceptions=True
+    )
+
+    assert len(inner.calls) == 1
+    assert all(isinstance(r, LiteLLMError) for r in results)
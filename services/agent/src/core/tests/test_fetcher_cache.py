@@ -0,0 +1,176 @@
+"""Tests for WebFetcher downloads, request coalescing and its two-tier page cache."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from modules.fetcher import WebFetcher
+from modules.fetcher.cache import PageDiskCache, PageEntry
+from modules.fetcher.extract import ExtractionPool
+
+PAGE = "<html><body><p>Cached page about cache coalescing.</p></body></html>"
+
+
+@pytest.fixture
+def fetcher(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> WebFetcher:
+    monkeypatch.setenv("CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr("modules.fetcher.extract._pool", ExtractionPool(max_workers=0))
+    fetcher = WebFetcher()
+    fetcher._validate_url = AsyncMock(return_value=("93.184.216.34",))  # type: ignore[method-assign]
+    return fetcher
+
+
+def _serve(fetcher: WebFetcher, handler: httpx.MockTransport) -> None:
+    fetcher.http_client = httpx.AsyncClient(transport=handler)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fetches_share_one_request(fetcher: WebFetcher) -> None:
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, text=PAGE)
+
+    _serve(fetcher, httpx.MockTransport(handler))
+    results = await asyncio.gather(*(fetcher.fetch("https://example.com/a") for _ in range(5)))
+    again = await fetcher.fetch("https://example.com/a")
+    await fetcher.close()
+
+    assert len(requests) == 1
+    assert all(r["ok"] and r == results[0] for r in results)
+    assert again["text"] == results[0]["text"]
+    assert fetcher._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_stale_page_is_revalidated_with_conditional_request(
+    fetcher: WebFetcher,
+) -> None:
+    seen: list[dict[str, str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(dict(request.headers))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, text=PAGE, headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024"}
+        )
+
+    _serve(fetcher, httpx.MockTransport(handler))
+    first = await fetcher.fetch("https://example.com/a")
+
+    fetcher.cache_ttl = 0
+    second = await fetcher.fetch("https://example.com/a")
+    await fetcher.close()
+
+    assert len(seen) == 2
+    assert "if-none-match" not in seen[0]
+    assert seen[1]["if-none-match"] == '"v1"'
+    assert seen[1]["if-modified-since"] == "Mon, 01 Jan 2024"
+    assert second["text"] == first["text"]
+
+
+@pytest.mark.asyncio
+async def test_large_body_is_capped_and_only_text_is_cached(fetcher: WebFetcher) -> None:
+    reads = 0
+
+    async def body() -> AsyncIterator[bytes]:
+        nonlocal reads
+        yield PAGE.encode()
+        for _ in range(100):
+            reads += 1
+            yield b"<p>" + b"x" * 1024 + b"</p>"
+
+    _serve(
+        fetcher,
+        httpx.MockTransport(
+            lambda request: httpx.Response(
+                200, headers={"Content-Type": "text/html; charset=utf-8"}, content=body()
+            )
+        ),
+    )
+    fetcher.max_bytes = 4096
+    result = await fetcher.fetch("https://example.com/big")
+    cached = await fetcher._cache_get("https://example.com/big")
+    await fetcher.close()
+
+    assert result["ok"] and result["body_truncated"] is True
+    assert reads < 10
+    assert "html_truncated" in result
+    assert cached is not None and "html_truncated" not in cached
+    assert cached["text"] == result["text"]
+
+
+@pytest.mark.asyncio
+async def test_non_text_content_is_rejected(fetcher: WebFetcher) -> None:
+    _serve(
+        fetcher,
+        httpx.MockTransport(
+            lambda request: httpx.Response(
+                200, headers={"Content-Type": "application/pdf"}, content=b"%PDF-1.7"
+            )
+        ),
+    )
+    result = await fetcher.fetch("https://example.com/doc.pdf")
+    await fetcher.close()
+
+    assert result["ok"] is False
+    assert "Unsupported content type: application/pdf" in result["error"]
+    assert await fetcher._cache_lookup("https://example.com/doc.pdf") is None
+
+
+@pytest.mark.asyncio
+async def test_extraction_pool_runs_in_worker_process() -> None:
+    pool = ExtractionPool(max_workers=1)
+    try:
+        text = await pool.extract(PAGE.encode(), "utf-8", max_chars=10)
+    finally:
+        pool.shutdown()
+
+    assert text == "Cached pag\n...\n"
+
+
+@pytest.mark.asyncio
+async def test_pages_survive_restart_through_disk_tier(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("CACHE_DIR", str(tmp_path))
+    first = WebFetcher()
+    await first._cache_set(
+        "https://example.com/a",
+        PageEntry(data={"url": "https://example.com/a", "ok": True}, fetched_at=time.time()),
+    )
+    await first.close()
+
+    second = WebFetcher()
+    cached = await second._cache_get("https://example.com/a")
+    await second.close()
+
+    assert cached == {"url": "https://example.com/a", "ok": True}
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = PageDiskCache(tmp_path / "pages.sqlite3", max_entries=2)
+    for key in ("a", "b"):
+        cache.put(key, PageEntry(data={"url": key}, fetched_at=time.time()))
+        time.sleep(0.001)
+    assert cache.get("a") is not None  # "b" becomes the least recently used
+    cache.put("c", PageEntry(data={"url": "c"}, fetched_at=time.time()))
+
+    assert cache.count() == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    cache.close()
+
+    reopened = PageDiskCache(tmp_path / "pages.sqlite3", max_entries=2)
+    assert reopened.count() == 2
+    reopened.close()
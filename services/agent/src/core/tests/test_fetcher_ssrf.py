@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import ipaddress
 import socket
-from unittest.mock import MagicMock, patch
+from collections.abc import Iterable
+from unittest.mock import patch
+from urllib.parse import urlparse
 
+import httpcore
+import httpx
 import pytest
 
 from modules.fetcher import WebFetcher
+from modules.fetcher.resolver import PinnedNetworkBackend, PinnedTransport
+
+# Responses handed to a patched ``send`` need a request for raise_for_status()
+_REQUEST = httpx.Request("GET", "https://example.com")
 
 
 @pytest.fixture
@@ -91,6 +100,7 @@ class TestWebFetcherSSRFProtection:
         ]
 
         for ip, _network_desc in private_ips:
+            web_fetcher._resolver.clear()  # Same hostname, new DNS answer
             with patch("socket.getaddrinfo") as mock_getaddrinfo:
                 mock_getaddrinfo.return_value = [
                     (socket.AF_INET, socket.SOCK_STREAM, 0, "", (ip, 80))
@@ -111,6 +121,7 @@ class TestWebFetcherSSRFProtection:
         ]
 
         for ip in private_ipv6:
+            web_fetcher._resolver.clear()  # Same hostname, new DNS answer
             with patch("socket.getaddrinfo") as mock_getaddrinfo:
                 mock_getaddrinfo.return_value = [
                     (socket.AF_INET6, socket.SOCK_STREAM, 0, "", (ip, 80, 0, 0))
@@ -140,6 +151,7 @@ class TestWebFetcherSSRFProtection:
         ]
 
         for ip in public_ips:
+            web_fetcher._resolver.clear()  # Same hostname, new DNS answer
             with patch("socket.getaddrinfo") as mock_getaddrinfo:
                 if ":" in ip:
                     # IPv6
@@ -169,11 +181,9 @@ class TestWebFetcherSSRFProtection:
     async def test_fetch_validates_redirect_targets(self, web_fetcher: WebFetcher) -> None:
         """Test that redirect targets are validated for SSRF."""
         # Mock HTTP client to return a redirect to private IP
-        mock_response = MagicMock()
-        mock_response.status_code = 302
-        mock_response.headers = {"Location": "http://192.168.1.1/admin"}
+        mock_response = httpx.Response(302, headers={"Location": "http://192.168.1.1/admin"})
 
-        with patch.object(web_fetcher.http_client, "get", return_value=mock_response):
+        with patch.object(web_fetcher.http_client, "send", return_value=mock_response):
             # Mock DNS resolution for initial URL (public IP)
             with patch("socket.getaddrinfo") as mock_getaddrinfo:
                 mock_getaddrinfo.side_effect = [
@@ -191,11 +201,11 @@ class TestWebFetcherSSRFProtection:
     async def test_fetch_handles_relative_redirects(self, web_fetcher: WebFetcher) -> None:
         """Test that relative redirects are converted to absolute URLs."""
         mock_responses = [
-            MagicMock(status_code=302, headers={"Location": "/redirect-path"}),
-            MagicMock(status_code=200, text="<html>Success</html>"),
+            httpx.Response(302, headers={"Location": "/redirect-path"}),
+            httpx.Response(200, html="<html>Success</html>", request=_REQUEST),
         ]
 
-        with patch.object(web_fetcher.http_client, "get", side_effect=mock_responses) as mock_get:
+        with patch.object(web_fetcher.http_client, "send", side_effect=mock_responses) as mock_get:
             # Mock DNS resolution (public IP)
             with patch("socket.getaddrinfo") as mock_getaddrinfo:
                 mock_getaddrinfo.return_value = [
@@ -207,20 +217,18 @@ class TestWebFetcherSSRFProtection:
                     with patch.object(web_fetcher, "_cache_set", return_value=None):
                         await web_fetcher.fetch("https://example.com")
 
-                        # Verify second call used absolute URL
+                        # Verify second call used the absolute URL
                         assert mock_get.call_count == 2
-                        second_call_url = mock_get.call_args_list[1][0][0]
-                        assert second_call_url == "https://example.com/redirect-path"
+                        second_request = mock_get.call_args_list[1][0][0]
+                        assert second_request.url == "https://example.com/redirect-path"
 
     @pytest.mark.asyncio
     async def test_fetch_enforces_max_redirects(self, web_fetcher: WebFetcher) -> None:
         """Test that excessive redirects are blocked."""
         # Create a redirect loop response
-        mock_response = MagicMock()
-        mock_response.status_code = 302
-        mock_response.headers = {"Location": "https://example.com/redirect"}
+        mock_response = httpx.Response(302, headers={"Location": "https://example.com/redirect"})
 
-        with patch.object(web_fetcher.http_client, "get", return_value=mock_response):
+        with patch.object(web_fetcher.http_client, "send", return_value=mock_response):
             with patch("socket.getaddrinfo") as mock_getaddrinfo:
                 mock_getaddrinfo.return_value = [
                     (socket.AF_INET, socket.SOCK_STREAM, 0, "", ("8.8.8.8", 443))
@@ -280,11 +288,11 @@ class TestWebFetcherIntegration:
         fetcher = WebFetcher()
 
         # Mock HTTP response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = "<html><body>Test content</body></html>"
+        mock_response = httpx.Response(
+            200, html="<html><body>Test content</body></html>", request=_REQUEST
+        )
 
-        with patch.object(fetcher.http_client, "get", return_value=mock_response):
+        with patch.object(fetcher.http_client, "send", return_value=mock_response):
             # Mock DNS resolution (public IP)
             with patch("socket.getaddrinfo") as mock_getaddrinfo:
                 mock_getaddrinfo.return_value = [
@@ -299,3 +307,139 @@ class TestWebFetcherIntegration:
                         assert result.get("ok") is True
                         assert result.get("url") == "https://example.com"
                         assert "text" in result
+
+
+class TestWebFetcherDnsCache:
+    """Test cached resolution used by SSRF validation."""
+
+    @pytest.mark.asyncio
+    async def test_resolutions_are_cached_and_coalesced(self, web_fetcher: WebFetcher) -> None:
+        """Concurrent and repeated validations of one hostname resolve it once."""
+        with patch("socket.getaddrinfo") as mock_getaddrinfo:
+            mock_getaddrinfo.return_value = [
+                (socket.AF_INET, socket.SOCK_STREAM, 0, "", ("8.8.8.8", 443))
+            ]
+
+            results = await asyncio.gather(
+                *(web_fetcher._validate_url(f"https://example.com/{i}") for i in range(5))
+            )
+            await web_fetcher._validate_url("https://EXAMPLE.com/again")
+
+        assert results == [("8.8.8.8",)] * 5
+        assert mock_getaddrinfo.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_resolutions_are_cached(self, web_fetcher: WebFetcher) -> None:
+        """A failed lookup is not retried within the negative TTL."""
+        with patch("socket.getaddrinfo") as mock_getaddrinfo:
+            mock_getaddrinfo.side_effect = socket.gaierror("Name resolution failed")
+
+            for _ in range(2):
+                with pytest.raises(ValueError, match="DNS resolution failed"):
+                    await web_fetcher._validate_url("http://nonexistent.invalid")
+
+        assert mock_getaddrinfo.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_ipv4_mapped_ipv6_addresses_are_blocked(self, web_fetcher: WebFetcher) -> None:
+        """Private IPv4 addresses cannot be smuggled in as IPv4-mapped IPv6."""
+        with patch("socket.getaddrinfo") as mock_getaddrinfo:
+            mock_getaddrinfo.return_value = [
+                (socket.AF_INET6, socket.SOCK_STREAM, 0, "", ("::ffff:127.0.0.1", 80, 0, 0))
+            ]
+
+            with pytest.raises(ValueError, match="Blocked private IP"):
+                await web_fetcher._validate_url("http://example.com")
+
+    @pytest.mark.asyncio
+    async def test_fetch_connects_only_to_validated_addresses(
+        self, web_fetcher: WebFetcher
+    ) -> None:
+        """Sockets go to the validated IPs in order, never to a fresh DNS answer."""
+        backend = _RecordingBackend()
+        web_fetcher.http_client = httpx.AsyncClient(
+            transport=PinnedTransport(web_fetcher._validate_host, backend=backend)
+        )
+
+        with patch("socket.getaddrinfo") as mock_getaddrinfo:
+            # A rebinding resolver would answer with a private IP the second time
+            mock_getaddrinfo.side_effect = [
+                [
+                    (socket.AF_INET6, socket.SOCK_STREAM, 0, "", ("2001:db8::1", 443, 0, 0)),
+                    (socket.AF_INET, socket.SOCK_STREAM, 0, "", ("93.184.216.34", 443)),
+                ],
+                [(socket.AF_INET, socket.SOCK_STREAM, 0, "", ("127.0.0.1", 443))],
+            ]
+            with patch.object(web_fetcher, "_cache_get", return_value=None):
+                result = await web_fetcher.fetch("https://example.com:8443/page")
+
+        assert result["ok"] is False
+        assert backend.attempts == [("2001:db8::1", 8443), ("93.184.216.34", 8443)]
+
+
+class _RecordingBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that records connection attempts and refuses them."""
+
+    def __init__(self, reachable: str | None = None) -> None:
+        self.attempts: list[tuple[str, int]] = []
+        self._reachable = reachable
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        self.attempts.append((host, port))
+        if host != self._reachable:
+            raise httpcore.ConnectError(f"{host} unreachable")
+        return httpcore.AsyncMockStream([b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok"] * 2)
+
+
+class TestPinnedNetworkBackend:
+    """Test connection pinning to validated addresses."""
+
+    @pytest.mark.asyncio
+    async def test_falls_back_through_validated_addresses(self) -> None:
+        """An unreachable first address (e.g. AAAA without IPv6) falls back to the next."""
+        inner = _RecordingBackend(reachable="93.184.216.34")
+
+        async def resolve(host: str) -> tuple[str, ...]:
+            assert host == "example.com"
+            return ("2001:db8::1", "93.184.216.34")
+
+        stream = await PinnedNetworkBackend(resolve, inner).connect_tcp("example.com", 443)
+
+        assert isinstance(stream, httpcore.AsyncMockStream)
+        assert inner.attempts == [("2001:db8::1", 443), ("93.184.216.34", 443)]
+
+    @pytest.mark.asyncio
+    async def test_blocked_host_is_a_connect_error(self) -> None:
+        """Validation failures surface as connection errors, before any socket is opened."""
+        inner = _RecordingBackend()
+
+        async def resolve(host: str) -> tuple[str, ...]:
+            raise ValueError(f"Blocked private IP: 127.0.0.1 (from {host})")
+
+        with pytest.raises(httpcore.ConnectError, match="Blocked private IP"):
+            await PinnedNetworkBackend(resolve, inner).connect_tcp("example.com", 443)
+        assert inner.attempts == []
+
+    @pytest.mark.asyncio
+    async def test_connections_are_pooled_per_hostname(self) -> None:
+        """Hosts sharing an IP get their own connections, so SNI is never mixed up."""
+        inner = _RecordingBackend(reachable="93.184.216.34")
+
+        async def resolve(host: str) -> tuple[str, ...]:
+            return ("93.184.216.34",)
+
+        async with httpx.AsyncClient(transport=PinnedTransport(resolve, backend=inner)) as client:
+            for url in ("https://a.example/", "https://a.example/again", "https://b.example/"):
+                response = await client.get(url)
+                assert response.text == "ok"
+                assert response.request.url.host == urlparse(url).hostname
+
+        # a.example reuses its kept-alive connection; b.example opens its own
+        assert inner.attempts == [("93.184.216.34", 443)] * 2
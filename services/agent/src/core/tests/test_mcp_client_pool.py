@@ -0,0 +1,107 @@
+"""Tests for McpClientPool background health supervision."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from core.mcp.client_pool import McpClientPool
+
+
+class FakeClient:
+    """Minimal stand-in for McpClient with controllable health."""
+
+    def __init__(self, name: str, *, connected: bool = True, idle_s: float = 0.0) -> None:
+        self.name = name
+        self.is_connected = connected
+        self.last_seen: float | None = time.monotonic() - idle_s
+        self.reconnect_count = 0
+        self.state = MagicMock()
+        self.tools: list[object] = []
+        self.resources: list[object] = []
+        self.prompts: list[object] = []
+        self.ping_result = True
+        self.reconnect_error: Exception | None = None
+        self.pings = 0
+        self.reconnects = 0
+
+    def is_cache_stale(self) -> bool:
+        return False
+
+    async def ping(self) -> bool:
+        self.pings += 1
+        if not self.ping_result:
+            self.is_connected = False
+        return self.ping_result
+
+    async def reconnect(self) -> None:
+        self.reconnects += 1
+        if self.reconnect_error is not None:
+            raise self.reconnect_error
+        self.is_connected = True
+        self.reconnect_count += 1
+
+    async def disconnect(self) -> None:
+        self.is_connected = False
+
+
+def _pool(*clients: FakeClient) -> tuple[McpClientPool, object]:
+    pool = McpClientPool(MagicMock())
+    context_id = uuid4()
+    pool._pools[context_id] = list(clients)  # type: ignore[arg-type]
+    pool._healthy[context_id] = [c for c in clients if c.is_connected]  # type: ignore[misc]
+    return pool, context_id
+
+
+@pytest.mark.asyncio
+async def test_get_clients_reads_health_table_without_pinging() -> None:
+    up, down = FakeClient("up"), FakeClient("down", connected=False)
+    pool, context_id = _pool(up, down)
+
+    clients = await pool.get_clients(context_id, MagicMock())  # type: ignore[arg-type]
+
+    assert clients == [up]
+    assert up.pings == 0
+
+
+@pytest.mark.asyncio
+async def test_supervisor_pings_only_idle_clients() -> None:
+    busy, idle = FakeClient("busy"), FakeClient("idle", idle_s=600)
+    pool, _ = _pool(busy, idle)
+
+    await pool._supervise()
+
+    assert busy.pings == 0
+    assert idle.pings == 1
+
+
+@pytest.mark.asyncio
+async def test_supervisor_reconnects_failed_client_and_updates_table() -> None:
+    client = FakeClient("flaky", idle_s=600)
+    client.ping_result = False
+    pool, context_id = _pool(client)
+
+    await pool._supervise()
+
+    assert client.reconnects == 1
+    assert pool._healthy[context_id] == [client]  # type: ignore[index]
+    assert pool.get_health_status()[str(context_id)]["clients"][0]["reconnect_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_reconnect_backs_off() -> None:
+    client = FakeClient("dead", connected=False)
+    client.reconnect_error = ConnectionError("refused")
+    pool, context_id = _pool(client)
+
+    await pool._supervise()
+    await pool._supervise()
+
+    assert client.reconnects == 1  # Second pass is still inside the backoff window
+    assert pool._healthy[context_id] == []  # type: ignore[index]
+    status = pool.get_health_status()[str(context_id)]["clients"][0]
+    assert status["consecutive_failures"] == 1
+    assert status["next_reconnect_in_seconds"] > 0
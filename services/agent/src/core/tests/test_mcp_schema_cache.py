@@ -0,0 +1,115 @@
+"""Tests for the persistent MCP schema cache and list_changed-driven refresh."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from mcp import types as mcp_types
+
+from core.mcp.client import McpClient
+from core.mcp.schema_cache import McpSchemaCache, server_fingerprint
+from core.models.mcp import McpPrompt, McpTool
+
+
+def _listing(*names: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        tools=[
+            mcp_types.Tool(name=n, description=f"{n} tool", inputSchema={"type": "object"})
+            for n in names
+        ]
+    )
+
+
+def _session(*names: str) -> MagicMock:
+    session = MagicMock()
+    session.list_tools = AsyncMock(return_value=_listing(*names))
+    session.list_resources = AsyncMock(return_value=SimpleNamespace(resources=[]))
+    session.list_prompts = AsyncMock(return_value=SimpleNamespace(prompts=[]))
+    return session
+
+
+def _client(cache: McpSchemaCache, **kwargs: object) -> McpClient:
+    client = McpClient(url="http://mcp.test/mcp", name="test", schema_cache=cache, **kwargs)  # type: ignore[arg-type]
+    client._server_fingerprint = "fp-1"
+    return client
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> McpSchemaCache:
+    return McpSchemaCache(tmp_path / "schemas.sqlite", ttl_seconds=60)
+
+
+def test_round_trip_and_ttl(cache: McpSchemaCache) -> None:
+    key = McpSchemaCache.make_key("http://mcp.test", "fp", None)
+    tool = McpTool(name="search", input_schema={"type": "object"}, outputSchema={"type": "string"})
+    cache.put(key, "http://mcp.test", [tool], [], [McpPrompt(name="summarize")])
+
+    entry = cache.get(key)
+
+    assert entry is not None
+    assert entry.tools == [tool]
+    assert entry.prompts[0].name == "summarize"
+
+    cache.ttl_seconds = 0
+    time.sleep(0.01)
+    assert cache.get(key) is None
+
+
+def test_fingerprint_tracks_server_version() -> None:
+    def init(version: str) -> mcp_types.InitializeResult:
+        return mcp_types.InitializeResult(
+            protocolVersion="2025-06-18",
+            capabilities=mcp_types.ServerCapabilities(),
+            serverInfo=mcp_types.Implementation(name="srv", version=version),
+        )
+
+    assert server_fingerprint(init("1.0")) == server_fingerprint(init("1.0"))
+    assert server_fingerprint(init("1.0")) != server_fingerprint(init("1.1"))
+
+
+def test_key_is_scoped_per_context() -> None:
+    a = McpSchemaCache.make_key("http://mcp.test", "fp", uuid4())
+    b = McpSchemaCache.make_key("http://mcp.test", "fp", uuid4())
+    assert a != b
+
+
+@pytest.mark.asyncio
+async def test_warm_connect_skips_list_calls(cache: McpSchemaCache) -> None:
+    cold = _client(cache)
+    cold._mcp_session = _session("search", "fetch")
+    await cold._load_schemas()
+
+    warm = _client(cache)
+    warm._mcp_session = session = _session()
+    await warm._load_schemas()
+
+    assert [t.name for t in warm.tools] == ["search", "fetch"]
+    session.list_tools.assert_not_called()
+    assert not warm.is_cache_stale()
+
+
+@pytest.mark.asyncio
+async def test_list_changed_notification_refreshes_and_persists(cache: McpSchemaCache) -> None:
+    changed = MagicMock()
+    client = _client(cache, on_schemas_changed=changed)
+    client._mcp_session = _session("search")
+    await client._load_schemas()
+
+    client._mcp_session = _session("search", "create_issue")
+    notification = mcp_types.ServerNotification(
+        mcp_types.ToolListChangedNotification(method="notifications/tools/list_changed")
+    )
+    await client._handle_message(notification)
+    assert client._refresh_task is not None
+    await asyncio.wait_for(client._refresh_task, timeout=1)
+
+    assert [t.name for t in client.tools] == ["search", "create_issue"]
+    changed.assert_called_once()
+    entry = cache.get(McpSchemaCache.make_key("http://mcp.test/mcp", "fp-1", None))
+    assert entry is not None and len(entry.tools) == 2
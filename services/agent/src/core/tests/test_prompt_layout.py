@@ -0,0 +1,85 @@
+"""Tests for prompt-cache-friendly prompt layout."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from shared.models import AgentMessage
+
+from core.observability.metrics import _metric_snapshot, record_llm_call
+from core.runtime.litellm_client import LiteLLMClient
+from core.runtime.model_registry import ModelCapability, ModelCapabilityRegistry
+from core.runtime.prompt_layout import (
+    CACHE_CONTROL_EPHEMERAL,
+    apply_cache_breakpoint,
+    current_time_context,
+)
+
+
+def _client(*, cache_control: bool) -> LiteLLMClient:
+    client = LiteLLMClient.__new__(LiteLLMClient)
+    registry = ModelCapabilityRegistry()
+    registry._defaults = ModelCapability(cache_control=cache_control)
+    client._registry = registry
+    return client
+
+
+def test_time_context_is_minute_granular() -> None:
+    text = current_time_context(datetime(2026, 3, 4, 5, 6, 7))
+
+    assert "2026-03-04 05:06" in text
+    assert "LIVE in 2026" in text
+
+
+def test_breakpoint_marks_leading_system_message_only() -> None:
+    messages = [
+        {"role": "system", "content": "static instructions"},
+        {"role": "system", "content": "Current Date: 2026-01-01"},
+        {"role": "user", "content": "hi"},
+    ]
+
+    apply_cache_breakpoint(messages)
+
+    assert messages[0]["content"] == [
+        {"type": "text", "text": "static instructions", "cache_control": CACHE_CONTROL_EPHEMERAL}
+    ]
+    assert messages[1]["content"] == "Current Date: 2026-01-01"
+
+
+def test_breakpoint_skips_non_system_first_message() -> None:
+    messages = [{"role": "user", "content": "hi"}]
+
+    assert apply_cache_breakpoint(messages) == [{"role": "user", "content": "hi"}]
+
+
+def test_serialize_adds_cache_hints_only_when_supported() -> None:
+    messages = [
+        AgentMessage(role="system", content="static"),
+        AgentMessage(role="user", content="hi"),
+    ]
+
+    plain = _client(cache_control=False)._serialize_messages(messages, "some/model")
+    hinted = _client(cache_control=True)._serialize_messages(messages, "some/model")
+
+    assert plain[0]["content"] == "static"
+    assert hinted[0]["content"][0]["cache_control"] == CACHE_CONTROL_EPHEMERAL
+    assert hinted[1] == {"role": "user", "content": "hi"}
+
+
+def test_cached_tokens_tracked_in_snapshot() -> None:
+    _metric_snapshot.clear()
+
+    record_llm_call(
+        model="m", duration_ms=1.0, prompt_tokens=1000, completion_tokens=10, cached_tokens=800
+    )
+
+    assert _metric_snapshot["llm.tokens.prompt"] == 1000.0
+    assert _metric_snapshot["llm.tokens.cached"] == 800.0
+
+
+def test_registry_reads_cache_control_flag() -> None:
+    registry = ModelCapabilityRegistry()
+    registry._models["anthropic/x"] = ModelCapability(cache_control=True)
+
+    assert registry.supports_cache_control("openrouter/anthropic/x")
+    assert not registry.supports_cache_control("other/y")
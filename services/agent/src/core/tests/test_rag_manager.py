@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import numpy as np
 import pytest
 
+from core.utils.sparse import SPARSE_VECTOR_NAME, encode_document, encode_query, tokenize
+from core.utils.vector_storage import invalidate_collection_schema
 from modules.rag import RAGManager
 
 
@@ -138,6 +141,32 @@ class TestRAGManagerMMR:
         # Second doc should be the diverse one (index 2), not similar one (index 1)
         assert 2 in result
 
+    def test_mmr_matches_pairwise_reference(self, rag_manager: RAGManager) -> None:
+        """Matrix-based MMR selects the same indices as the pairwise formulation."""
+        rng = np.random.default_rng(7)
+        query_vec = rng.standard_normal(64).astype(np.float32)
+        doc_vecs = [rng.standard_normal(64).astype(np.float32) for _ in range(30)]
+        lam = 0.7
+
+        sims = [rag_manager._cosine(query_vec, v) for v in doc_vecs]
+        expected = [int(np.argmax(sims))]
+        while len(expected) < 8:
+            scores = {
+                i: (1.0 - lam) * sims[i]
+                + lam * (1.0 - max(rag_manager._cosine(doc_vecs[i], doc_vecs[j]) for j in expected))
+                for i in range(len(doc_vecs))
+                if i not in expected
+            }
+            expected.append(max(scores, key=lambda i: scores[i]))
+
+        assert rag_manager._mmr(query_vec, doc_vecs, k=8, lam=lam) == expected
+
+    def test_mmr_ties_resolve_to_lowest_index(self, rag_manager: RAGManager) -> None:
+        """Identical candidates are selected in index order."""
+        query_vec = np.array([1.0, 0.0, 0.0])
+        doc_vecs = [np.array([0.0, 1.0, 0.0])] * 3
+        assert rag_manager._mmr(query_vec, doc_vecs, k=3, lam=0.5) == [0, 1, 2]
+
 
 class TestRAGManagerRetrieve:
     """Test RAG retrieval functionality."""
@@ -228,6 +257,91 @@ class TestRAGManagerRetrieve:
         assert call_args[1]["collection_name"] == "custom-collection"
 
 
+class TestRAGManagerHybrid:
+    """Test hybrid (dense + sparse) retrieval and ingestion."""
+
+    @staticmethod
+    def _client(sparse: bool) -> AsyncMock:
+        invalidate_collection_schema("documents_v2")
+        client = AsyncMock()
+        info = MagicMock()
+        info.config.params.sparse_vectors = {SPARSE_VECTOR_NAME: MagicMock()} if sparse else None
+        client.get_collection = AsyncMock(return_value=info)
+        client.query_points = AsyncMock(return_value=MagicMock(points=[]))
+        return client
+
+    def test_tokenize_splits_identifiers(self) -> None:
+        """Identifiers are kept whole and split into parts; IDs survive."""
+        tokens = tokenize("getUserById in snake_case_name, see AB#12345")
+        assert {"getuserbyid", "get", "user", "by", "id"} <= set(tokens)
+        assert {"snake_case_name", "snake", "case", "name"} <= set(tokens)
+        assert "12345" in tokens
+
+    def test_encode_is_deterministic(self) -> None:
+        """Sparse encoding is stable across calls (no salted hashing)."""
+        doc = encode_document("retry the retry loop")
+        assert doc == encode_document("retry the retry loop")
+        query = encode_query("retry loop")
+        assert query is not None and set(query.indices) <= set(doc.indices)
+        assert encode_query("!!") is None
+
+    @pytest.mark.asyncio
+    async def test_hybrid_query_fuses_dense_and_sparse(self, mock_embedder: MockEmbedder) -> None:
+        """Hybrid mode issues one fused prefetch query."""
+        manager = RAGManager(embedder=mock_embedder, hybrid=True)
+        manager._client = self._client(sparse=True)
+
+        await manager.retrieve("CodeIndexer.scan_and_index", filters={"source": "codebase"})
+
+        kwargs = manager._client.query_points.call_args[1]
+        fused = kwargs["prefetch"]
+        assert fused.query.fusion.value == "rrf"
+        assert [p.using for p in fused.prefetch] == [None, SPARSE_VECTOR_NAME]
+        assert all(p.filter is not None for p in fused.prefetch)
+        assert kwargs["query"] == pytest.approx([0.1, 0.2, 0.3])
+
+    @pytest.mark.asyncio
+    async def test_hybrid_falls_back_without_sparse_vector(
+        self, mock_embedder: MockEmbedder
+    ) -> None:
+        """Collections created without the sparse vector use dense-only search."""
+        manager = RAGManager(embedder=mock_embedder, hybrid=True)
+        manager._client = self._client(sparse=False)
+
+        await manager.retrieve("query")
+
+        assert manager._client.query_points.call_args[1]["prefetch"] is None
+
+    @pytest.mark.asyncio
+    async def test_vectors_only_fetched_for_mmr(self, mock_embedder: MockEmbedder) -> None:
+        """Without MMR, points are requested without vectors and kept in score order."""
+        manager = RAGManager(embedder=mock_embedder, mmr_lambda=0.0)
+        points = [
+            MagicMock(payload={"uri": f"doc{i}", "text": "t"}, vector=None, score=1 - i / 10)
+            for i in range(4)
+        ]
+        client = AsyncMock()
+        client.query_points = AsyncMock(return_value=MagicMock(points=points))
+        manager._client = client
+
+        result = await manager.retrieve("query", top_k=2)
+
+        assert client.query_points.call_args[1]["with_vectors"] is False
+        assert [d["uri"] for d in result] == ["doc0", "doc1"]
+
+    @pytest.mark.asyncio
+    async def test_hybrid_ingest_writes_named_vectors(self, mock_embedder: MockEmbedder) -> None:
+        """Ingested points carry both the dense and the sparse vector."""
+        manager = RAGManager(embedder=mock_embedder, hybrid=True)
+        manager._client = self._client(sparse=True)
+
+        await manager.ingest_document("Fix PBI 4711 in the parser", metadata={"uri": "a.md"})
+
+        point = manager._client.upsert.call_args[1]["points"][0]
+        assert point.vector[""] == [0.1, 0.2, 0.3]
+        assert point.vector[SPARSE_VECTOR_NAME] == encode_document("Fix PBI 4711 in the parser")
+
+
 class TestRAGManagerIngestDocument:
     """Test document ingestion functionality."""
 
@@ -309,6 +423,39 @@ class TestRAGManagerIngestDocument:
         result = await rag_manager.ingest_document("content", metadata={})
         assert result == 0  # Should return 0 on error
 
+    @pytest.mark.asyncio
+    async def test_ingest_streams_bounded_batches(self, mock_embedder: MockEmbedder) -> None:
+        """Chunks are upserted batch by batch while chunking is still running."""
+        manager = RAGManager(embedder=mock_embedder, ingest_batch_size=2, max_pending_batches=1)
+        produced: list[int] = []
+        produced_at_upsert: list[int] = []
+
+        def iter_chunks(content: str, document_type: str = "prose") -> Any:
+            for i in range(20):
+                produced.append(i)
+                yield {"text": f"chunk {i}", "metadata": {}}
+
+        async def upsert(collection_name: str, points: list[Any]) -> None:
+            produced_at_upsert.append(len(produced))
+
+        manager.chunker = MagicMock()
+        manager.chunker.iter_chunks = iter_chunks
+        manager._client = AsyncMock()
+        manager._client.upsert = AsyncMock(side_effect=upsert)
+
+        result = await manager.ingest_document("large document", metadata={"uri": "big.md"})
+
+        assert result == 20
+        assert manager._client.upsert.await_count == 10
+        # Backpressure: the first batch landed before chunking finished
+        assert produced_at_upsert[0] < 20
+        indexes = [
+            p.payload["chunk_index"]
+            for call in manager._client.upsert.call_args_list
+            for p in call.kwargs["points"]
+        ]
+        assert indexes == list(range(20))
+
 
 class TestRAGManagerClose:
     """Test cleanup functionality."""
@@ -1,5 +1,6 @@
 """Unit tests for readiness probe endpoint."""
 
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -12,12 +13,13 @@ from interfaces.http.app import create_app
 
 
 @pytest.fixture
-def mock_settings() -> Settings:
+def mock_settings(tmp_path: Path) -> Settings:
     """Create test settings."""
     return Settings(
         environment="test",
         litellm_api_base="http://localhost:4000",
         qdrant_url="http://localhost:6333",
+        trace_span_log_path=tmp_path / "spans.jsonl",
     )
 
 
@@ -0,0 +1,225 @@
+"""Tests for the semantic routing cache and its use by UnifiedOrchestrator."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections.abc import AsyncGenerator, Iterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from qdrant_client import AsyncQdrantClient
+from shared.models import Plan, PlanStep
+
+import core.providers as providers
+from core.routing.routing_cache import (
+    RoutingCache,
+    RoutingLookup,
+    cacheable_prompt,
+    normalize_prompt,
+    single_skill,
+)
+from core.routing.unified_orchestrator import UnifiedOrchestrator
+
+SKILLS = "• [general/homey]: Smart home\n• [researcher]: Web research"
+
+
+class _BagOfWordsEmbedder:
+    """Deterministic embedder: prompts with the same words get the same vector."""
+
+    dimension = 64
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        vectors = []
+        for text in texts:
+            vector = [0.0] * self.dimension
+            for word in text.split():
+                vector[int(hashlib.sha256(word.encode()).hexdigest(), 16) % self.dimension] += 1.0
+            vectors.append(vector)
+        return vectors
+
+
+@pytest.fixture(autouse=True)
+def embedder() -> Iterator[None]:
+    previous = providers._embedder
+    providers.set_embedder(_BagOfWordsEmbedder())
+    yield
+    providers._embedder = previous
+
+
+@pytest_asyncio.fixture
+async def cache() -> AsyncGenerator[RoutingCache, None]:
+    client = AsyncQdrantClient(location=":memory:")
+    yield RoutingCache(client, collection="routing", threshold=0.95, ttl_seconds=3600, shadow=False)
+    await client.close()
+
+
+def _plan(tool: str = "general/homey", **args: Any) -> Plan:
+    return Plan(
+        description="Smart home control",
+        steps=[
+            PlanStep(
+                id="1",
+                label="Lights",
+                executor="skill",
+                action="skill",
+                tool=tool,
+                args=args or {"goal": "Turn off the kitchen lights"},
+            )
+        ],
+    )
+
+
+async def _remember(cache: RoutingCache, prompt: str, context_id: UUID, plan: Plan) -> None:
+    lookup = await cache.lookup(prompt, context_id=context_id, available_skills_text=SKILLS)
+    assert lookup is not None and lookup.plan is None
+    await cache.store(lookup, plan)
+
+
+def test_normalize_and_cacheable_plans() -> None:
+    assert normalize_prompt("  Turn OFF\tthe lights?! ") == "turn off the lights"
+    assert cacheable_prompt("Turn off the lights") and not cacheable_prompt("yes please!")
+    assert single_skill(_plan()) is not None
+    assert single_skill(_plan(goal="x", room="kitchen")) is None
+    assert single_skill(Plan(description="two", steps=_plan().steps * 2)) is None
+
+
+@pytest.mark.asyncio
+async def test_hit_is_scoped_to_context_and_rebuilt_for_prompt(cache: RoutingCache) -> None:
+    context_id = uuid4()
+    await _remember(cache, "Turn off the kitchen lights", context_id, _plan())
+
+    hit = await cache.lookup(
+        "turn off the kitchen lights!", context_id=context_id, available_skills_text=SKILLS
+    )
+    other = await cache.lookup(
+        "turn off the kitchen lights", context_id=uuid4(), available_skills_text=SKILLS
+    )
+
+    assert hit is not None and hit.plan is not None
+    assert hit.skill == "general/homey"
+    assert hit.plan.steps[0].args == {"goal": "turn off the kitchen lights!"}
+    assert other is not None and other.plan is None
+
+
+@pytest.mark.asyncio
+async def test_skill_index_change_and_ttl_invalidate(cache: RoutingCache) -> None:
+    context_id = uuid4()
+    await _remember(cache, "Turn off the kitchen lights", context_id, _plan())
+
+    changed = await cache.lookup(
+        "Turn off the kitchen lights",
+        context_id=context_id,
+        available_skills_text=SKILLS + "\n• [new]: New skill",
+    )
+    assert changed is not None and changed.plan is None
+
+    cache.ttl_seconds = 0
+    expired = await cache.lookup(
+        "Turn off the kitchen lights", context_id=context_id, available_skills_text=SKILLS
+    )
+    assert expired is not None and expired.plan is None
+
+
+@pytest.mark.asyncio
+async def test_short_prompts_are_not_cached(cache: RoutingCache) -> None:
+    assert (
+        await cache.lookup("yes please", context_id=uuid4(), available_skills_text=SKILLS) is None
+    )
+
+
+def _orchestrator(cache: RoutingCache, response: str) -> tuple[UnifiedOrchestrator, MagicMock]:
+    litellm = MagicMock()
+    litellm._settings = MagicMock()
+    litellm._settings.model_planner = "test-planner-model"
+    litellm.generate = AsyncMock(return_value=response)
+    return UnifiedOrchestrator(litellm, routing_cache=cache), litellm
+
+
+_HOMEY_PLAN = (
+    '{"description": "Smart home control", "steps": [{"id": "1", "label": "Lights", '
+    '"executor": "skill", "action": "skill", "tool": "general/homey", '
+    '"args": {"goal": "Turn off the kitchen lights"}}]}'
+)
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_skips_llm_on_hit(cache: RoutingCache) -> None:
+    context_id = uuid4()
+    orchestrator, litellm = _orchestrator(cache, _HOMEY_PLAN)
+
+    first = await orchestrator.process(
+        "Turn off the kitchen lights", available_skills_text=SKILLS, context_id=context_id
+    )
+    second = await orchestrator.process(
+        "turn off the kitchen lights", available_skills_text=SKILLS, context_id=context_id
+    )
+
+    assert first.plan is not None and second.plan is not None
+    assert second.plan.steps[0].tool == "general/homey"
+    assert litellm.generate.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_shadow_mode_always_calls_planner(
+    cache: RoutingCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    outcomes: list[str] = []
+    monkeypatch.setattr("core.routing.unified_orchestrator.record_routing_cache", outcomes.append)
+    cache.shadow = True
+    context_id = uuid4()
+    orchestrator, litellm = _orchestrator(cache, _HOMEY_PLAN)
+
+    for _ in range(2):
+        await orchestrator.process(
+            "Turn off the kitchen lights", available_skills_text=SKILLS, context_id=context_id
+        )
+
+    assert litellm.generate.await_count == 2
+    assert outcomes == ["miss", "shadow_agree"]
+
+
+@pytest.mark.asyncio
+async def test_shadow_lookup_runs_alongside_planner_stream(
+    cache: RoutingCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache.shadow = True
+    planner_started = asyncio.Event()
+    real_lookup = cache.lookup
+
+    async def lookup(prompt: str, **kwargs: Any) -> RoutingLookup | None:
+        await planner_started.wait()  # Deadlocks if the lookup gates the planner
+        return await real_lookup(prompt, **kwargs)
+
+    async def stream_chat(*args: Any, **kwargs: Any) -> AsyncGenerator[dict[str, Any], None]:
+        planner_started.set()
+        yield {"type": "content", "content": _HOMEY_PLAN, "tool_call": None, "metadata": None}
+
+    monkeypatch.setattr(cache, "lookup", lookup)
+    orchestrator, litellm = _orchestrator(cache, _HOMEY_PLAN)
+    litellm.stream_chat = MagicMock(side_effect=stream_chat)
+
+    async def collect() -> list[dict[str, Any]]:
+        stream = orchestrator.process_stream("Turn off the kitchen lights", context_id=uuid4())
+        return [event async for event in stream]
+
+    events = await asyncio.wait_for(collect(), timeout=5)
+
+    assert events[-1]["result"].plan.steps[0].tool == "general/homey"
+
+
+@pytest.mark.asyncio
+async def test_short_prompts_skip_the_cache(
+    cache: RoutingCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    lookup = AsyncMock()
+    monkeypatch.setattr(cache, "lookup", lookup)
+    orchestrator, _ = _orchestrator(cache, "Sure.")
+
+    result = await orchestrator.process("yes please", context_id=uuid4())
+
+    assert result.direct_answer == "Sure."
+    lookup.assert_not_called()
@@ -453,3 +453,101 @@ async def test_should_auto_replan_rag_search_insufficient_retrieval(tmp_path: Pa
     should_replan, reason = service._should_auto_replan(step_result, plan_step)
     assert should_replan is False
     assert reason == ""
+
+
+def test_plan_step_dependencies_resolution() -> None:
+    """Undeclared depends_on keeps order; declared lists define the graph."""
+    from shared.models import PlanStep
+
+    def step(step_id: str, **extra: Any) -> PlanStep:
+        return PlanStep(id=step_id, label=step_id, executor="skill", action="skill", **extra)
+
+    sequential = [step("1"), step("2")]
+    assert not AgentService._plan_declares_dependencies(sequential)
+
+    graph = [
+        step("a", depends_on=[]),
+        step("b", depends_on=[]),
+        step("c", depends_on=["a", "b", "missing"]),
+        step("d"),
+    ]
+    assert AgentService._plan_declares_dependencies(graph)
+    assert AgentService._resolve_step_dependencies(graph) == [set(), set(), {0, 1}, {0, 1, 2}]
+
+
+def test_plan_dependencies_survive_metadata_round_trip() -> None:
+    """Plans rebuilt from dispatcher metadata keep their execution mode."""
+    from shared.models import Plan, PlanStep
+
+    sequential = Plan(
+        steps=[
+            PlanStep(id="1", label="Research", executor="skill", action="skill"),
+            PlanStep(id="2", label="Write", executor="skill", action="skill"),
+        ]
+    )
+    rebuilt = Plan(**sequential.model_dump())
+
+    assert not AgentService._plan_declares_dependencies(rebuilt.steps)
+    assert AgentService._resolve_step_dependencies(rebuilt.steps) == [set(), {0}]
+
+    graph = Plan(
+        steps=[
+            PlanStep(id="a", label="A", executor="skill", action="skill", depends_on=[]),
+            PlanStep(id="b", label="B", executor="skill", action="skill", depends_on=[]),
+        ]
+    )
+    rebuilt = Plan(**graph.model_dump())
+
+    assert AgentService._plan_declares_dependencies(rebuilt.steps)
+    assert AgentService._resolve_step_dependencies(rebuilt.steps) == [set(), set()]
+
+
+@pytest.mark.asyncio
+async def test_independent_steps_run_concurrently(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Ready steps overlap, dependents wait, and events carry their step id."""
+    import asyncio
+    from contextlib import asynccontextmanager
+
+    from shared.models import PlanStep, StepResult
+
+    service = AgentService(
+        settings=Settings(),
+        litellm=cast(LiteLLMClient, MockLiteLLMClient()),
+        memory=cast(MemoryStore, DummyMemory()),
+    )
+    timeline: list[str] = []
+
+    async def fake_step(plan_step: PlanStep, *args: Any) -> AsyncGenerator[dict[str, Any], None]:
+        timeline.append(f"start:{plan_step.id}")
+        await asyncio.sleep(0.02)
+        yield {"type": "content", "content": plan_step.id, "metadata": {}}
+        timeline.append(f"end:{plan_step.id}")
+        result = StepResult(step=plan_step, status="ok", result={"output": plan_step.id})
+        yield {"type": "step_outcome", "outcome": "success", "result": result}
+
+    @asynccontextmanager
+    async def fake_session() -> AsyncGenerator[AsyncMock, None]:
+        yield AsyncMock()
+
+    monkeypatch.setattr(service, "_execute_step_with_retry", fake_step)
+    monkeypatch.setattr(service, "_open_step_session", fake_session)
+
+    steps = [
+        PlanStep(id="a", label="A", executor="skill", action="skill", depends_on=[]),
+        PlanStep(id="b", label="B", executor="skill", action="skill", depends_on=[]),
+        PlanStep(id="c", label="C", executor="skill", action="skill", depends_on=["a", "b"]),
+    ]
+    events = [
+        event
+        async for _, _, event in service._iter_steps_concurrently(
+            steps, None, MagicMock(), AgentRequest(prompt="q"), [], MagicMock()
+        )
+    ]
+
+    assert timeline[:2] == ["start:a", "start:b"]
+    assert timeline.index("start:c") > max(timeline.index("end:a"), timeline.index("end:b"))
+    content = [e for e in events if e["type"] == "content"]
+    assert {e["metadata"]["step_id"] for e in content} == {"a", "b", "c"}
+    assert sum(1 for e in events if e["type"] == "step_end") == 3
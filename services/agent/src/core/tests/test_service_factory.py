@@ -0,0 +1,88 @@
+"""Tests for the per-context AgentService assembly cache in ServiceFactory."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from core.observability.metrics import get_metric_snapshot
+from core.runtime.config import Settings
+from core.runtime.service_factory import ServiceFactory, invalidate_context_services
+
+
+@pytest.fixture
+def factory() -> ServiceFactory:
+    """Create a ServiceFactory whose assembly step returns fresh sentinels."""
+    settings = Settings(
+        environment="development",
+        qdrant_url="http://qdrant:6333",
+        tools_config_path=Path("config/tools.yaml"),
+    )
+    with (
+        patch("core.runtime.service_factory.AsyncQdrantClient"),
+        patch("core.runtime.service_factory.load_tool_registry"),
+    ):
+        factory = ServiceFactory(settings=settings, litellm_client=MagicMock())
+
+    async def assemble(context_id: Any, session: Any) -> MagicMock:
+        return MagicMock(name=f"service-{context_id}")
+
+    factory._assemble_service = MagicMock(side_effect=assemble)  # type: ignore[method-assign]
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_cached_service_reused_until_invalidated(factory: ServiceFactory) -> None:
+    context_id = uuid4()
+    before = get_metric_snapshot()
+
+    first = await factory.create_service(context_id, MagicMock())
+    second = await factory.create_service(context_id, MagicMock())
+    invalidate_context_services(context_id)
+    third = await factory.create_service(context_id, MagicMock())
+
+    assert first is second
+    assert third is not first
+    assert factory._assemble_service.call_count == 2  # type: ignore[attr-defined]
+    after = get_metric_snapshot()
+    assert after["services.assembly.hits"] - before.get("services.assembly.hits", 0) == 1
+    assert after["services.assembly.misses"] - before.get("services.assembly.misses", 0) == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidation_is_per_context(factory: ServiceFactory) -> None:
+    ctx_a, ctx_b = uuid4(), uuid4()
+    service_a = await factory.create_service(ctx_a, MagicMock())
+    service_b = await factory.create_service(ctx_b, MagicMock())
+
+    invalidate_context_services(ctx_a)
+
+    assert await factory.create_service(ctx_a, MagicMock()) is not service_a
+    assert await factory.create_service(ctx_b, MagicMock()) is service_b
+
+    invalidate_context_services()
+
+    assert await factory.create_service(ctx_b, MagicMock()) is not service_b
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_assembly_is_not_cached(factory: ServiceFactory) -> None:
+    context_id = uuid4()
+
+    async def assemble_then_invalidate(ctx: Any, session: Any) -> MagicMock:
+        await asyncio.sleep(0)
+        invalidate_context_services(ctx)
+        return MagicMock()
+
+    factory._assemble_service = MagicMock(  # type: ignore[method-assign]
+        side_effect=assemble_then_invalidate
+    )
+    first = await factory.create_service(context_id, MagicMock())
+
+    assert context_id not in factory._services
+    assert await factory.create_service(context_id, MagicMock()) is not first
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import tempfile
 from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -52,7 +53,6 @@ def mock_tool_registry() -> MagicMock:
 def mock_litellm() -> MagicMock:
     """Create a mock LiteLLM client."""
     from collections.abc import AsyncGenerator
-    from typing import Any
 
     litellm = MagicMock()
 
@@ -211,6 +211,139 @@ class TestSkillExecutor:
         assert result_events[0]["result"].status == "ok"
 
 
+class TestConcurrentToolDispatch:
+    """Tests for concurrent execution of tool calls within one turn."""
+
+    @staticmethod
+    def _litellm_with_tool_calls(calls: list[tuple[str, str]]) -> tuple[MagicMock, list[Any]]:
+        """LLM that requests the given (call_id, query) calls, then answers."""
+        import json
+        from collections.abc import AsyncGenerator
+
+        litellm = MagicMock()
+        seen_messages: list[Any] = []
+
+        async def mock_stream(
+            messages: list[Any], *args: Any, **kwargs: Any
+        ) -> AsyncGenerator[dict[str, Any], None]:
+            if not seen_messages:
+                seen_messages.append(True)
+                for idx, (call_id, query) in enumerate(calls):
+                    yield {
+                        "type": "tool_start",
+                        "tool_call": {
+                            "index": idx,
+                            "id": call_id,
+                            "type": "function",
+                            "function": {
+                                "name": "web_search",
+                                "arguments": json.dumps({"query": query}),
+                            },
+                        },
+                    }
+                return
+            seen_messages.extend(messages)
+            yield {"type": "content", "content": "Done."}
+
+        litellm.stream_chat = mock_stream
+        return litellm, seen_messages
+
+    @pytest.mark.asyncio
+    async def test_calls_run_concurrently_and_keep_order(
+        self,
+        skill_registry: SkillRegistry,
+        mock_tool_registry: MagicMock,
+    ) -> None:
+        """Slow calls overlap, and results are appended in call order."""
+        import asyncio
+
+        active = 0
+        peak = 0
+
+        async def slow_search(query: str) -> str:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            # Earlier calls finish last, so completion order differs from call order
+            await asyncio.sleep({"a": 0.05, "b": 0.03, "c": 0.01}[query])
+            active -= 1
+            return f"result {query}"
+
+        mock_tool_registry.get.return_value.run = AsyncMock(side_effect=slow_search)
+        litellm, seen = self._litellm_with_tool_calls([("1", "a"), ("2", "b"), ("3", "c")])
+        executor = SkillExecutor(
+            skill_registry=skill_registry,
+            tool_registry=mock_tool_registry,
+            litellm=litellm,
+        )
+        step = PlanStep(
+            id="1", label="Research", executor="skill", action="skill", tool="test_skill"
+        )
+
+        events = [e async for e in executor.execute_stream(step, AgentRequest(prompt="q"))]
+
+        assert peak == 3
+        tool_msgs = [m for m in seen[1:] if m.role == "tool"]
+        assert [m.tool_call_id for m in tool_msgs] == ["1", "2", "3"]
+        assert [m.content for m in tool_msgs] == ["result a", "result b", "result c"]
+        assert events[-1]["result"].status == "ok"
+
+    @pytest.mark.asyncio
+    async def test_duplicate_in_same_turn_is_blocked(
+        self,
+        skill_registry: SkillRegistry,
+        mock_tool_registry: MagicMock,
+    ) -> None:
+        """Identical calls in one turn run once; the repeat is blocked."""
+        run = AsyncMock(return_value="result")
+        mock_tool_registry.get.return_value.run = run
+        litellm, _ = self._litellm_with_tool_calls([("1", "same"), ("2", "same")])
+        executor = SkillExecutor(
+            skill_registry=skill_registry,
+            tool_registry=mock_tool_registry,
+            litellm=litellm,
+        )
+        step = PlanStep(
+            id="1", label="Research", executor="skill", action="skill", tool="test_skill"
+        )
+
+        events = [e async for e in executor.execute_stream(step, AgentRequest(prompt="q"))]
+
+        assert run.await_count == 1
+        assert any(e.get("content") == "Skipping duplicate web_search" for e in events)
+
+    @pytest.mark.asyncio
+    async def test_tool_timeout_reports_error(
+        self,
+        skill_registry: SkillRegistry,
+        mock_tool_registry: MagicMock,
+    ) -> None:
+        """A call exceeding run_timeout yields an error result instead of hanging."""
+        import asyncio
+
+        async def hang(query: str) -> str:
+            await asyncio.sleep(10)
+            return "late"
+
+        tool = mock_tool_registry.get.return_value
+        tool.run = AsyncMock(side_effect=hang)
+        tool.run_timeout = 0.01
+        litellm, seen = self._litellm_with_tool_calls([("1", "slow")])
+        executor = SkillExecutor(
+            skill_registry=skill_registry,
+            tool_registry=mock_tool_registry,
+            litellm=litellm,
+        )
+        step = PlanStep(
+            id="1", label="Research", executor="skill", action="skill", tool="test_skill"
+        )
+
+        [e async for e in executor.execute_stream(step, AgentRequest(prompt="q"))]
+
+        tool_msgs = [m for m in seen[1:] if m.role == "tool"]
+        assert "timed out" in tool_msgs[0].content
+
+
 class TestActivityMessage:
     """Tests for activity message building."""
 
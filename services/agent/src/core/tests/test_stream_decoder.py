@@ -0,0 +1,134 @@
+"""Tests for incremental SSE decoding, inline reasoning splitting and delta batching."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+import orjson
+import pytest
+
+from core.runtime.config import Settings
+from core.runtime.litellm_client import LiteLLMClient
+from core.runtime.model_registry import ModelCapability, ModelCapabilityRegistry, ReasoningMode
+from core.runtime.models import AgentMessage
+from core.runtime.stream_decoder import DeltaBatcher, InlineReasoningSplitter, SSEDecoder
+
+
+def test_sse_decoder_keeps_partial_lines_across_reads() -> None:
+    decoder = SSEDecoder()
+
+    assert decoder.feed(b'data: {"a"') == []
+    assert decoder.feed(b": 1}\n\n: keep-alive\nevent: x\ndata: [DO") == [b'{"a": 1}']
+    assert decoder.feed(b"NE]\n") == [b"[DONE]"]
+    assert decoder.feed(b"data: tail") == []
+    assert decoder.flush() == [b"tail"]
+
+
+def test_splitter_handles_tags_split_across_deltas() -> None:
+    splitter = InlineReasoningSplitter("<think>", "</think>")
+    segments: list[tuple[str, str]] = []
+    for delta in ["<th", "ink>plan", " it</thi", "nk>\n\n", "Answer <b>", "ok"]:
+        segments.extend(splitter.feed(delta))
+    segments.extend(splitter.flush())
+
+    thinking = "".join(text for kind, text in segments if kind == "thinking")
+    content = "".join(text for kind, text in segments if kind == "content")
+    assert thinking == "plan it"
+    assert content == "Answer <b>ok"
+
+
+def test_splitter_releases_unfinished_tag_prefix_on_flush() -> None:
+    splitter = InlineReasoningSplitter("<think>", "</think>")
+
+    assert splitter.feed("a <thi") == [("content", "a ")]
+    assert splitter.flush() == [("content", "<thi")]
+
+
+def test_batcher_merges_same_kind_and_keeps_event_order() -> None:
+    batcher = DeltaBatcher(max_chars=8)
+    batcher.add_text("thinking", "ab")
+    batcher.add_text("thinking", "cd")
+    batcher.add_text("content", "hello")
+    batcher.add_text("content", " world")
+    batcher.add_event({"type": "tool_start", "content": None, "tool_call": {}, "metadata": None})
+    batcher.add_text("content", "!")
+
+    chunks = batcher.drain()
+
+    assert [(c["type"], c["content"]) for c in chunks] == [
+        ("thinking", "abcd"),
+        ("content", "hello"),
+        ("content", " world"),
+        ("tool_start", None),
+        ("content", "!"),
+    ]
+    assert chunks[0]["metadata"] == {"source": "reasoning_model"}
+    assert batcher.drain() == []
+
+
+def _sse(*deltas: dict[str, Any]) -> list[bytes]:
+    lines = [
+        b"data: " + orjson.dumps({"model": "test/inline", "choices": [{"delta": d}]}) + b"\n\n"
+        for d in deltas
+    ]
+    return [*lines, b"data: [DONE]\n\n"]
+
+
+def _client(reads: list[bytes]) -> LiteLLMClient:
+    async def body() -> AsyncIterator[bytes]:
+        for read in reads:
+            yield read
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body())
+
+    client = LiteLLMClient(Settings(environment="test"))
+    client._client = httpx.AsyncClient(
+        base_url="http://litellm.test", transport=httpx.MockTransport(handler)
+    )
+    registry = ModelCapabilityRegistry()
+    registry._models["test/inline"] = ModelCapability(
+        reasoning_mode=ReasoningMode.INLINE_TAGS, reasoning_tags=["<think>", "</think>"]
+    )
+    client._registry = registry
+    return client
+
+
+@pytest.mark.asyncio
+async def test_stream_chat_splits_inline_reasoning_across_reads() -> None:
+    reads = _sse({"content": "<thi"}, {"content": "nk>check"}, {"content": "</think>Hi"})
+    # Split one SSE line across two network reads
+    reads = [reads[0][:10], reads[0][10:], *reads[1:]]
+    client = _client(reads)
+
+    chunks = [
+        c
+        async for c in client.stream_chat(
+            [AgentMessage(role="user", content="hello")], model="test/inline"
+        )
+    ]
+    await client.aclose()
+
+    assert [(c["type"], c["content"]) for c in chunks] == [
+        ("thinking", "check"),
+        ("content", "Hi"),
+        ("done", None),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_chat_coalesces_deltas_from_one_read() -> None:
+    reads = _sse(*({"content": word} for word in ["a", "b", "c"]))
+    client = _client([b"".join(reads[:-1]), reads[-1]])
+
+    chunks = [
+        c
+        async for c in client.stream_chat(
+            [AgentMessage(role="user", content="hello")], model="test/inline"
+        )
+    ]
+    await client.aclose()
+
+    assert [(c["type"], c["content"]) for c in chunks] == [("content", "abc"), ("done", None)]
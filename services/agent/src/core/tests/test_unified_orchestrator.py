@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncGenerator
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -491,8 +493,8 @@ class TestHistoryContext:
         call_args = mock_litellm.generate.call_args
         messages = call_args[0][0]
 
-        # Should have: system + 3 history + current user message
-        assert len(messages) >= 4
+        # Should have: system + 3 history + time context + current user message
+        assert len(messages) >= 5
 
         # Check history messages are included
         user_messages = [m for m in messages if m.role == "user"]
@@ -518,9 +520,9 @@ class TestHistoryContext:
         call_args = mock_litellm.generate.call_args
         messages = call_args[0][0]
 
-        # Should have: system + last 6 history + current user
-        # = 1 system + 6 history + 1 current = 8 total
-        assert len(messages) == 8
+        # Should have: system + last 6 history + time context + current user
+        # = 1 system + 6 history + 1 time + 1 current = 9 total
+        assert len(messages) == 9
 
         # Verify the last 6 history messages are included (not the first ones)
         history_messages = messages[1:7]  # Skip system, get next 6
@@ -539,7 +541,7 @@ class TestHistoryContext:
         # Should have system + current user message only
         call_args = mock_litellm.generate.call_args
         messages = call_args[0][0]
-        assert len(messages) == 2  # system + user
+        assert len(messages) == 3  # system + time context + user
 
 
 class TestModelSelection:
@@ -594,6 +596,22 @@ class TestAvailableSkillsText:
         assert "researcher: Web research" in system_message.content
         assert "homey: Smart home control" in system_message.content
 
+    @pytest.mark.asyncio
+    async def test_system_prompt_is_static_prefix(self, mock_litellm: MagicMock) -> None:
+        """The system prompt carries no time so it stays byte-identical across calls."""
+        mock_litellm.generate.return_value = "Answer"
+
+        orchestrator = UnifiedOrchestrator(mock_litellm)
+        await orchestrator.process("First", available_skills_text="- researcher")
+        first = mock_litellm.generate.call_args[0][0]
+        await orchestrator.process("Second", available_skills_text="- researcher")
+        second = mock_litellm.generate.call_args[0][0]
+
+        assert first[0].content == second[0].content
+        assert "Current Date & Time" not in (first[0].content or "")
+        assert first[-2].role == "system"
+        assert "Current Date & Time" in (first[-2].content or "")
+
 
 class TestPlanParsingRobustness:
     """Tests for plan parsing error handling and edge cases."""
@@ -806,3 +824,127 @@ class TestEdgeCases:
         assert result.plan.description is not None
         assert "norsk" in result.plan.description
         assert result.plan.steps[0].args["goal"] == "Finn informasjon på norsk"
+
+
+def _stream(*chunks: dict[str, Any]) -> MagicMock:
+    async def stream_chat(*args: Any, **kwargs: Any) -> AsyncGenerator[dict[str, Any], None]:
+        for chunk in chunks:
+            yield chunk
+
+    return MagicMock(side_effect=stream_chat)
+
+
+def _content(text: str) -> dict[str, Any]:
+    return {"type": "content", "content": text, "tool_call": None, "metadata": None}
+
+
+async def _collect(orchestrator: UnifiedOrchestrator, prompt: str) -> list[dict[str, Any]]:
+    return [event async for event in orchestrator.process_stream(prompt)]
+
+
+class TestProcessStream:
+    """Tests for the speculative streaming path."""
+
+    @pytest.mark.asyncio
+    async def test_direct_answer_tokens_forwarded_immediately(
+        self, mock_litellm: MagicMock
+    ) -> None:
+        mock_litellm.stream_chat = _stream(_content("\n"), _content("Bon"), _content("jour"))
+
+        events = await _collect(UnifiedOrchestrator(mock_litellm), "Hello in French?")
+
+        assert events[:-1] == [
+            {"type": "token", "content": "Bon"},
+            {"type": "token", "content": "jour"},
+        ]
+        assert events[-1]["result"].direct_answer == "Bonjour"
+
+    @pytest.mark.asyncio
+    async def test_plan_is_buffered(self, mock_litellm: MagicMock) -> None:
+        plan = (
+            '{"description": "Lights", "steps": [{"id": "1", "label": "Lights", '
+            '"executor": "skill", "action": "skill", "tool": "general/homey", '
+            '"args": {"goal": "Turn off"}}]}'
+        )
+        mock_litellm.stream_chat = _stream(
+            _content("```"), _content("json\n"), _content(plan), _content("\n```")
+        )
+
+        events = await _collect(UnifiedOrchestrator(mock_litellm), "Turn off the lights")
+
+        assert [e["type"] for e in events] == ["result"]
+        result = events[0]["result"]
+        assert result.plan is not None
+        assert result.plan.steps[0].tool == "general/homey"
+
+    @pytest.mark.asyncio
+    async def test_plan_after_preamble_is_held_back(self, mock_litellm: MagicMock) -> None:
+        plan = (
+            '{"description": "Lights", "steps": [{"id": "1", "label": "Lights", '
+            '"executor": "skill", "action": "skill", "tool": "general/homey", '
+            '"args": {"goal": "Turn off"}}]}'
+        )
+        mock_litellm.stream_chat = _stream(
+            _content("Let me check that.\n"),
+            _content("``"),
+            _content("`json\n" + plan),
+            _content("\n```"),
+        )
+
+        events = await _collect(UnifiedOrchestrator(mock_litellm), "Turn off the lights")
+
+        assert events[:-1] == [{"type": "token", "content": "Let me check that.\n"}]
+        assert events[-1]["result"].plan.steps[0].tool == "general/homey"
+
+    @pytest.mark.asyncio
+    async def test_braces_and_code_in_direct_answer_are_released(
+        self, mock_litellm: MagicMock
+    ) -> None:
+        mock_litellm.stream_chat = _stream(
+            _content('Use `ls` or {"a": '),
+            _content("1} then"),
+            _content(" ```py\nx = {}\n```"),
+            _content(" done"),
+        )
+
+        events = await _collect(UnifiedOrchestrator(mock_litellm), "How?")
+
+        tokens = [e["content"] for e in events if e["type"] == "token"]
+        assert tokens == ["Use `ls` or ", '{"a": 1} then', " ```py\nx = {}\n```", " done"]
+        assert "".join(tokens) == events[-1]["result"].direct_answer
+
+    @pytest.mark.asyncio
+    async def test_unclosed_brace_is_flushed_at_end(self, mock_litellm: MagicMock) -> None:
+        mock_litellm.stream_chat = _stream(_content("Sets look like {1, 2"))
+
+        events = await _collect(UnifiedOrchestrator(mock_litellm), "Sets?")
+
+        assert [e["content"] for e in events if e["type"] == "token"] == [
+            "Sets look like ",
+            "{1, 2",
+        ]
+        assert events[-1]["result"].direct_answer == "Sets look like {1, 2"
+
+    @pytest.mark.asyncio
+    async def test_error_before_output_returns_fallback_plan(self, mock_litellm: MagicMock) -> None:
+        mock_litellm.stream_chat = _stream(
+            {"type": "error", "content": "LiteLLM 503", "tool_call": None, "metadata": None}
+        )
+
+        events = await _collect(UnifiedOrchestrator(mock_litellm), "Anything")
+
+        assert len(events) == 1
+        assert events[0]["result"].plan.steps[0].tool == "researcher"
+
+    @pytest.mark.asyncio
+    async def test_error_after_streamed_tokens_keeps_partial_answer(
+        self, mock_litellm: MagicMock
+    ) -> None:
+        mock_litellm.stream_chat = _stream(
+            _content("Partial"),
+            {"type": "error", "content": "Network error", "tool_call": None, "metadata": None},
+        )
+
+        events = await _collect(UnifiedOrchestrator(mock_litellm), "Anything")
+
+        assert events[-1]["result"].direct_answer == "Partial"
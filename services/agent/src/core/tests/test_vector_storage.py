@@ -0,0 +1,92 @@
+"""Unit tests for vector storage profiles and collection schema helpers."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from qdrant_client.http import models
+
+from core.utils.sparse import SPARSE_VECTOR_NAME
+from core.utils.vector_storage import (
+    VectorStorageProfile,
+    build_point_vectors,
+    fit_vector,
+    invalidate_collection_schema,
+)
+
+
+def _client(size: int, sparse: bool) -> AsyncMock:
+    invalidate_collection_schema("test-vectors")
+    info = MagicMock()
+    info.config.params.vectors = models.VectorParams(size=size, distance=models.Distance.COSINE)
+    info.config.params.sparse_vectors = {SPARSE_VECTOR_NAME: MagicMock()} if sparse else None
+    client = AsyncMock()
+    client.get_collection = AsyncMock(return_value=info)
+    return client
+
+
+class TestVectorStorageProfile:
+    def test_default_profile_is_full_precision(self) -> None:
+        profile = VectorStorageProfile()
+        assert profile.vectors_config(4096).size == 4096
+        assert profile.quantization_config() is None
+        assert profile.search_params() is None
+        assert profile.ram_bytes_per_vector(4096) == 4096 * 4
+
+    def test_int8_on_disk_profile(self) -> None:
+        profile = VectorStorageProfile(quantization="int8", dimensions=1024, on_disk=True)
+        config = profile.collection_config(4096)
+        assert config["vectors_config"].size == 1024
+        assert config["vectors_config"].on_disk is True
+        assert isinstance(config["quantization_config"], models.ScalarQuantization)
+        params = profile.search_params()
+        assert params is not None and params.quantization is not None
+        assert params.quantization.rescore is True
+        # int8 copy in RAM, originals on disk: 16x less than float32 at full size
+        assert profile.ram_bytes_per_vector(4096) == 1024
+
+    def test_binary_rest_schema(self) -> None:
+        schema = VectorStorageProfile(quantization="binary").collection_schema(4096)
+        assert schema["vectors"] == {"size": 4096, "distance": "Cosine"}
+        assert schema["quantization_config"] == {"binary": {"always_ram": True}}
+        assert schema["sparse_vectors"] == {SPARSE_VECTOR_NAME: {"modifier": "idf"}}
+
+    def test_rejects_unknown_quantization(self) -> None:
+        with pytest.raises(ValueError):
+            VectorStorageProfile(quantization="pq")  # type: ignore[arg-type]
+
+
+def test_fit_vector_truncates_prefix() -> None:
+    assert fit_vector([1.0, 2.0, 3.0], 2) == [1.0, 2.0]
+    assert fit_vector([1.0, 2.0], 4) == [1.0, 2.0]
+    assert fit_vector([1.0, 2.0], None) == [1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_build_point_vectors_skips_lookup_by_default() -> None:
+    client = _client(size=2, sparse=True)
+    vectors = await build_point_vectors(client, "test-vectors", ["a"], [[1.0, 2.0, 3.0]])
+    assert vectors == [[1.0, 2.0, 3.0]]
+    client.get_collection.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_build_point_vectors_fits_collection_size() -> None:
+    client = _client(size=2, sparse=False)
+    profile = VectorStorageProfile(dimensions=2)
+    vectors = await build_point_vectors(
+        client, "test-vectors", ["a", "b"], [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], profile=profile
+    )
+    assert vectors == [[1.0, 2.0], [4.0, 5.0]]
+
+
+@pytest.mark.asyncio
+async def test_build_point_vectors_adds_sparse_in_hybrid_mode() -> None:
+    client = _client(size=3, sparse=True)
+    vectors = await build_point_vectors(
+        client, "test-vectors", ["getUserById"], [[1.0, 2.0, 3.0]], hybrid=True
+    )
+    assert isinstance(vectors[0], dict)
+    assert vectors[0][""] == [1.0, 2.0, 3.0]
+    assert vectors[0][SPARSE_VECTOR_NAME].indices
@@ -47,6 +47,8 @@ class Tool(ABC):
         requires_confirmation: If True, tool execution pauses for user approval.
         mcp_annotations: MCP protocol hints (readOnlyHint, destructiveHint).
         activity_hint: UI display patterns for tool arguments.
+        run_timeout: Wall-clock limit in seconds applied by the skill executor
+            (None defers to the skill's ``tool_timeout``).
     """
 
     name: str
@@ -62,6 +64,9 @@ class Tool(ABC):
     # Special placeholder {domain} extracts netloc from URL values
     activity_hint: dict[str, str] | None = None
 
+    # Optional per-tool execution timeout enforced by SkillExecutor
+    run_timeout: float | None = None
+
     @abstractmethod
     async def run(self, *args: Any, **kwargs: Any) -> Any:
         """Execute the tool and return results.
@@ -266,6 +266,7 @@ def get_mcp_stats() -> dict[str, Any]:
             "total_clients": 0,
             "connected_clients": 0,
             "disconnected_clients": 0,
+            "total_reconnects": 0,
         }
 
     return _client_pool.get_stats()
@@ -28,6 +28,7 @@ class WebFetchTool(Tool):
         "required": ["url"],
     }
     activity_hint = {"url": "Fetching: {domain}"}  # {domain} extracts netloc from URL
+    run_timeout = 60.0
 
     def __init__(
         self,
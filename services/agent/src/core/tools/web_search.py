@@ -27,6 +27,7 @@ class WebSearchTool(Tool):
         "required": ["query"],
     }
     activity_hint = {"query": 'Searching: "{query}"'}
+    run_timeout = 30.0
 
     def __init__(
         self,
@@ -0,0 +1,89 @@
+"""Local lexical sparse vectors for hybrid (dense + BM25) retrieval.
+
+Texts are tokenised into lower-cased words, with code identifiers additionally
+split on snake_case and camelCase boundaries, and each token is hashed into
+Qdrant's u32 sparse index space. Document weights use the BM25 term-frequency
+saturation; the IDF half of BM25 is applied server-side by Qdrant through the
+``Modifier.IDF`` sparse vector setting, so no corpus statistics are kept here.
+
+Everything is computed in-process: ingestion does not need an extra network
+hop to produce sparse vectors.
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from collections import Counter
+
+from qdrant_client.http import models
+
+# Name of the sparse vector next to the unnamed (default) dense vector
+SPARSE_VECTOR_NAME = "lexical"
+DENSE_VECTOR_NAME = ""
+
+# BM25 parameters. _AVG_DOC_TOKENS approximates the token count of a typical chunk.
+_K1 = 1.2
+_B = 0.75
+_AVG_DOC_TOKENS = 256.0
+
+_WORD_RE = re.compile(r"[A-Za-z0-9_]+")
+_CAMEL_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lexical tokens, keeping whole identifiers and their parts.
+
+    ``getUserById`` yields ``getuserbyid``, ``get``, ``user``, ``by``, ``id``;
+    ``AB#12345`` yields ``ab`` and ``12345`` so work item IDs match exactly.
+    """
+    tokens: list[str] = []
+    for word in _WORD_RE.findall(text):
+        lowered = word.lower()
+        if len(lowered) > 1 or lowered.isdigit():
+            tokens.append(lowered)
+        parts = [p for piece in word.split("_") for p in _CAMEL_RE.findall(piece)]
+        if len(parts) > 1:
+            tokens.extend(p.lower() for p in parts if len(p) > 1 or p.isdigit())
+    return tokens
+
+
+def _token_index(token: str) -> int:
+    return zlib.crc32(token.encode("utf-8"))
+
+
+def _to_sparse(weights: dict[int, float]) -> models.SparseVector:
+    indices = sorted(weights)
+    return models.SparseVector(indices=indices, values=[weights[i] for i in indices])
+
+
+def encode_document(text: str) -> models.SparseVector:
+    """Encode a document chunk with BM25 term-frequency weights."""
+    counts = Counter(_token_index(t) for t in tokenize(text))
+    length_norm = 1.0 - _B + _B * (sum(counts.values()) / _AVG_DOC_TOKENS)
+    return _to_sparse(
+        {idx: tf * (_K1 + 1.0) / (tf + _K1 * length_norm) for idx, tf in counts.items()}
+    )
+
+
+def encode_query(text: str) -> models.SparseVector | None:
+    """Encode a query as a binary bag of tokens, or None if it has no tokens."""
+    indices = {_token_index(t) for t in tokenize(text)}
+    if not indices:
+        return None
+    return _to_sparse(dict.fromkeys(indices, 1.0))
+
+
+def sparse_vectors_config() -> dict[str, models.SparseVectorParams]:
+    """Sparse vector schema to pass to ``create_collection``."""
+    return {SPARSE_VECTOR_NAME: models.SparseVectorParams(modifier=models.Modifier.IDF)}
+
+
+__all__ = [
+    "DENSE_VECTOR_NAME",
+    "SPARSE_VECTOR_NAME",
+    "encode_document",
+    "encode_query",
+    "sparse_vectors_config",
+    "tokenize",
+]
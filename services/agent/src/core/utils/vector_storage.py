@@ -0,0 +1,270 @@
+"""Vector storage profiles and collection schema helpers for Qdrant.
+
+A ``VectorStorageProfile`` describes how dense embeddings are stored:
+optional scalar (int8) or binary quantization with full-precision rescoring,
+original vectors kept on disk instead of RAM, and optional Matryoshka-style
+truncation of the 4096-dim qwen3 embeddings to a prefix (e.g. 1024 or 512).
+The same profile drives collection creation (``create_collection``), the
+``stack qdrant`` commands, and query-time search parameters.
+
+When a profile truncates, writers and readers fit vectors to the dense size
+each collection was actually created with (``fit_vector``), so a collection
+migrated to a smaller profile keeps working while others still hold
+full-size vectors. Collections without the lexical sparse vector stay
+dense-only until ``stack qdrant migrate-profile`` re-creates them.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.http import models
+
+from core.utils.sparse import (
+    DENSE_VECTOR_NAME,
+    SPARSE_VECTOR_NAME,
+    encode_document,
+    sparse_vectors_config,
+)
+
+if TYPE_CHECKING:
+    from core.runtime.config import Settings
+
+LOGGER = logging.getLogger(__name__)
+
+QuantizationMode = Literal["none", "int8", "binary"]
+
+
+@dataclass(frozen=True, slots=True)
+class VectorStorageProfile:
+    """How dense vectors are stored and searched in a collection.
+
+    Args:
+        quantization: ``"none"``, ``"int8"`` (scalar, ~4x smaller) or
+            ``"binary"`` (1 bit per dimension, ~32x smaller).
+        dimensions: Matryoshka truncation target; ``None`` keeps full vectors.
+        on_disk: Keep original float32 vectors on disk (memory-mapped).
+        oversampling: Candidates fetched from the quantized index per result
+            before rescoring with the original vectors.
+        rescore: Rescore quantized candidates with the original vectors.
+    """
+
+    quantization: QuantizationMode = "none"
+    dimensions: int | None = None
+    on_disk: bool = False
+    oversampling: float = 2.0
+    rescore: bool = True
+
+    def __post_init__(self) -> None:
+        if self.quantization not in ("none", "int8", "binary"):
+            raise ValueError(f"Unknown quantization mode: {self.quantization}")
+        if self.dimensions is not None and self.dimensions < 1:
+            raise ValueError("dimensions must be positive")
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> VectorStorageProfile:
+        return cls(
+            quantization=settings.qdrant_quantization,
+            dimensions=settings.qdrant_vector_dimensions,
+            on_disk=settings.qdrant_vectors_on_disk,
+            oversampling=settings.qdrant_quantization_oversampling,
+        )
+
+    def vector_size(self, full_size: int) -> int:
+        """Stored dense size for embeddings of ``full_size`` dimensions."""
+        if self.dimensions is None:
+            return full_size
+        return min(self.dimensions, full_size)
+
+    def vectors_config(self, full_size: int) -> models.VectorParams:
+        return models.VectorParams(
+            size=self.vector_size(full_size),
+            distance=models.Distance.COSINE,
+            on_disk=self.on_disk or None,
+        )
+
+    def quantization_config(self) -> models.QuantizationConfig | None:
+        # Quantized vectors always stay in RAM; they are what makes search fast
+        # when the originals live on disk.
+        if self.quantization == "int8":
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8, quantile=0.99, always_ram=True
+                )
+            )
+        if self.quantization == "binary":
+            return models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(always_ram=True)
+            )
+        return None
+
+    def search_params(self) -> models.SearchParams | None:
+        """Query-time parameters matching this profile (None when unquantized)."""
+        if self.quantization == "none":
+            return None
+        return models.SearchParams(
+            quantization=models.QuantizationSearchParams(
+                rescore=self.rescore, oversampling=self.oversampling
+            )
+        )
+
+    def ram_bytes_per_vector(self, full_size: int) -> float:
+        """Approximate resident bytes per dense vector (originals + quantized copy)."""
+        size = self.vector_size(full_size)
+        originals = 0.0 if self.on_disk else size * 4.0
+        quantized = {"none": 0.0, "int8": float(size), "binary": size / 8}[self.quantization]
+        return originals + quantized
+
+    def collection_config(self, full_size: int) -> dict[str, Any]:
+        """Keyword arguments for ``create_collection`` on either Qdrant client."""
+        return {
+            "vectors_config": self.vectors_config(full_size),
+            "sparse_vectors_config": sparse_vectors_config(),
+            "quantization_config": self.quantization_config(),
+        }
+
+    def collection_schema(self, full_size: int) -> dict[str, Any]:
+        """REST body for ``PUT /collections/{name}`` (used by the ``stack`` CLI)."""
+        schema: dict[str, Any] = {
+            "vectors": self.vectors_config(full_size).model_dump(mode="json", exclude_none=True),
+            "sparse_vectors": {
+                name: params.model_dump(mode="json", exclude_none=True)
+                for name, params in sparse_vectors_config().items()
+            },
+        }
+        quantization = self.quantization_config()
+        if quantization is not None:
+            schema["quantization_config"] = quantization.model_dump(mode="json", exclude_none=True)
+        return schema
+
+
+@dataclass(frozen=True, slots=True)
+class CollectionSchema:
+    """The parts of a collection's configuration that writers and readers depend on."""
+
+    vector_size: int | None
+    has_sparse: bool
+
+
+# collection name -> schema, filled on first use
+_schemas: dict[str, CollectionSchema] = {}
+
+
+def dense_vector_size(vectors: Any) -> int | None:
+    """Size of the unnamed dense vector in a collection's ``params.vectors``."""
+    if isinstance(vectors, models.VectorParams):
+        return vectors.size
+    if isinstance(vectors, dict):
+        params = vectors.get(DENSE_VECTOR_NAME)
+        if isinstance(params, models.VectorParams):
+            return params.size
+    return None
+
+
+async def get_collection_schema(
+    client: AsyncQdrantClient, collection_name: str
+) -> CollectionSchema | None:
+    """Return the cached dense size and sparse support of a collection."""
+    cached = _schemas.get(collection_name)
+    if cached is not None:
+        return cached
+    try:
+        info = await client.get_collection(collection_name)
+    except Exception as exc:
+        LOGGER.warning("Could not inspect collection %s: %s", collection_name, exc)
+        return None
+    params = info.config.params
+    schema = CollectionSchema(
+        vector_size=dense_vector_size(params.vectors),
+        has_sparse=SPARSE_VECTOR_NAME in (params.sparse_vectors or {}),
+    )
+    _schemas[collection_name] = schema
+    return schema
+
+
+def invalidate_collection_schema(collection_name: str) -> None:
+    """Forget the cached schema of a collection (after re-creating it)."""
+    _schemas.pop(collection_name, None)
+
+
+def fit_vector(vector: list[float], size: int | None) -> list[float]:
+    """Truncate a Matryoshka embedding to the collection's dense size."""
+    if size is None or len(vector) <= size:
+        return vector
+    return vector[:size]
+
+
+async def build_point_vectors(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    texts: list[str],
+    vectors: list[list[float]],
+    *,
+    hybrid: bool = False,
+    profile: VectorStorageProfile | None = None,
+) -> list[list[float] | dict[str, Any]]:
+    """Fit dense vectors to the collection and attach sparse vectors when enabled.
+
+    The collection is only inspected when hybrid mode or truncation is
+    configured; otherwise the vectors are returned unchanged. Returns one
+    ``PointStruct.vector`` value per text.
+    """
+    schema = await lookup_schema(client, collection_name, hybrid=hybrid, profile=profile)
+    if schema is None:
+        return list(vectors)
+    if not (hybrid and schema.has_sparse):
+        return [fit_vector(v, schema.vector_size) for v in vectors]
+    return [
+        {
+            DENSE_VECTOR_NAME: fit_vector(v, schema.vector_size),
+            SPARSE_VECTOR_NAME: encode_document(text),
+        }
+        for text, v in zip(texts, vectors, strict=True)
+    ]
+
+
+async def lookup_schema(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    *,
+    hybrid: bool,
+    profile: VectorStorageProfile | None,
+) -> CollectionSchema | None:
+    """Return the collection schema only if hybrid mode or truncation needs it."""
+    if not hybrid and (profile is None or profile.dimensions is None):
+        return None
+    return await get_collection_schema(client, collection_name)
+
+
+async def create_collection(
+    client: AsyncQdrantClient,
+    collection_name: str,
+    *,
+    dimension: int,
+    profile: VectorStorageProfile,
+    hnsw_config: models.HnswConfigDiff | None = None,
+) -> None:
+    """Create a collection with the dense, sparse and quantization layout of ``profile``."""
+    await client.create_collection(
+        collection_name=collection_name,
+        hnsw_config=hnsw_config,
+        **profile.collection_config(dimension),
+    )
+    invalidate_collection_schema(collection_name)
+
+
+__all__ = [
+    "CollectionSchema",
+    "QuantizationMode",
+    "VectorStorageProfile",
+    "build_point_vectors",
+    "create_collection",
+    "dense_vector_size",
+    "fit_vector",
+    "get_collection_schema",
+    "invalidate_collection_schema",
+    "lookup_schema",
+]
@@ -21,6 +21,11 @@ from core.auth.credential_service import CredentialService
 from core.db.models import WikiImport
 from core.providers import get_rag_manager
 from core.runtime.config import get_settings
+from core.utils.vector_storage import (
+    VectorStorageProfile,
+    build_point_vectors,
+    create_collection,
+)
 
 LOGGER = logging.getLogger(__name__)
 
@@ -30,9 +35,7 @@ GIT_CLONE_TIMEOUT = 300.0  # 5 minutes for clone
 ADO_REQUEST_TIMEOUT = 30.0
 CHUNK_SIZE = 2000
 CHUNK_OVERLAP = 300
-EMBED_BATCH_SIZE = 32  # chunks per embedding API call (safe with 2GB LiteLLM limit)
-UPSERT_BATCH_SIZE = 500  # points per Qdrant upsert
-EMBED_MAX_RETRIES = 3  # retries on transient embedding errors
+UPSERT_BATCH_SIZE = 500  # chunks embedded and upserted per window
 
 
 class WikiImportError(Exception):
@@ -262,6 +265,9 @@ async def full_import(
                 "RAG manager does not expose embedder/client. Cannot ingest wiki pages."
             )
 
+        settings = get_settings()
+        profile = VectorStorageProfile.from_settings(settings)
+
         if force:
             LOGGER.info("Force mode: recreating collection %s", COLLECTION_NAME)
             from qdrant_client.http import models as qm
@@ -274,9 +280,11 @@ async def full_import(
                     await qdrant_client.delete_collection(COLLECTION_NAME)
             except Exception as e:
                 LOGGER.warning("Could not delete collection: %s", e)
-            await qdrant_client.create_collection(
-                collection_name=COLLECTION_NAME,
-                vectors_config=qm.VectorParams(size=4096, distance=qm.Distance.COSINE),
+            await create_collection(
+                qdrant_client,
+                COLLECTION_NAME,
+                dimension=4096,
+                profile=profile,
                 hnsw_config=qm.HnswConfigDiff(m=32, ef_construct=256),
             )
 
@@ -308,42 +316,31 @@ async def full_import(
                 chunk_index += 1
 
         LOGGER.info(
-            "Wiki: collected %d chunks from %d pages, embedding in batches of %d",
+            "Wiki: collected %d chunks from %d pages, embedding in windows of %d",
             len(all_chunks),
             len(pages),
-            EMBED_BATCH_SIZE,
+            UPSERT_BATCH_SIZE,
         )
 
-        # Embed chunks in batches and upsert incrementally (avoid OOM from unbounded accumulation)
+        # Embed and upsert window by window (avoid OOM from unbounded accumulation).
+        # The shared embedding scheduler splits each window into micro-batches,
+        # runs them concurrently and handles retries and oversize rejections.
         total_chunks = 0
-        for batch_start in range(0, len(all_chunks), EMBED_BATCH_SIZE):
-            batch = all_chunks[batch_start : batch_start + EMBED_BATCH_SIZE]
-            texts = [t for t, _ in batch]
-            # Retry on transient errors (server disconnect, timeout)
-            embeddings: list[list[float]] = []
-            for attempt in range(EMBED_MAX_RETRIES):
-                try:
-                    embeddings = await rag.embedder.embed(texts)
-                    break
-                except Exception as embed_err:
-                    if attempt < EMBED_MAX_RETRIES - 1:
-                        wait = 2.0**attempt
-                        LOGGER.warning(
-                            "Embed batch %d/%d failed (attempt %d/%d), retrying in %.0fs: %s",
-                            batch_start // EMBED_BATCH_SIZE + 1,
-                            -(-len(all_chunks) // EMBED_BATCH_SIZE),
-                            attempt + 1,
-                            EMBED_MAX_RETRIES,
-                            wait,
-                            embed_err,
-                        )
-                        await asyncio.sleep(wait)
-                    else:
-                        raise
+        for batch_start in range(0, len(all_chunks), UPSERT_BATCH_SIZE):
+            batch = all_chunks[batch_start : batch_start + UPSERT_BATCH_SIZE]
+            embeddings = await rag.embedder.embed([t for t, _ in batch])
+            point_vectors = await build_point_vectors(
+                rag.client,
+                COLLECTION_NAME,
+                [t for t, _ in batch],
+                embeddings,
+                hybrid=settings.rag_hybrid_search,
+                profile=profile,
+            )
 
             # Build points for this batch only
             batch_points: list[PointStruct] = []
-            for (chunk_text, meta), vector in zip(batch, embeddings, strict=False):
+            for (chunk_text, meta), vector in zip(batch, point_vectors, strict=False):
                 payload: dict[str, str | int] = dict(meta)
                 payload["text"] = chunk_text
                 batch_points.append(
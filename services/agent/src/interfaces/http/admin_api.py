@@ -8,6 +8,7 @@ Authentication: X-API-Key header OR Entra ID admin session.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import secrets
 from datetime import UTC, datetime, timedelta
@@ -300,7 +301,7 @@ async def get_system_status(
     # Get diagnostics summary
     summary = await diagnostics.get_diagnostics_summary()
 
-    # Get recent debug log errors from JSONL
+    # Get recent debug log errors from the span store
     from core.observability.debug_logger import read_debug_logs
 
     recent_errors: list[dict[str, Any]] = []
@@ -541,7 +542,7 @@ async def get_debug_stats(
     hours: int = Query(24, le=168, description="Hours of data to analyze"),
     auth: AdminUser | APIKeyUser = Depends(get_api_key_auth),
 ) -> DebugLogStats:
-    """Get aggregated debug log statistics from JSONL file.
+    """Get aggregated debug log statistics from the span store.
 
     Provides counts by event type, hourly distribution, and recent errors.
     """
@@ -626,6 +627,18 @@ async def get_otel_metrics_api(
     - error_rate_pct: Error rate as percentage
     - avg_request_duration_ms: Average request latency
     - avg_llm_duration_ms: Average LLM call latency
+    - embedding_cache_hit_rate_pct: Share of embedded texts served from cache
+    - avg_embedding_batch_size: Mean texts per successful upstream embedding batch
+    - embedding_texts_per_s: Texts embedded per second of upstream batch time
+    - service_cache_hit_rate_pct: Share of requests reusing a cached AgentService
+    - avg_service_assembly_ms: Mean time to assemble an AgentService on a miss
+    - mcp_schema_cache_hit_rate_pct: Share of MCP connects that skipped the list calls
+    - prompt_cache_hit_rate_pct: Share of LLM prompt tokens served from provider prompt caches
+    - routing_cache_hit_rate_pct: Share of orchestrator calls answered by the routing cache
+    - routing_cache_shadow_accuracy_pct: Shadow-mode agreement between cache and planner
+    - fetcher_dns_cache_hit_rate_pct: Share of fetcher hostname lookups served from cache
+    - avg_fetcher_dns_resolve_ms: Mean DNS resolution time on a fetcher cache miss
+    - spans_dropped_pct: Share of spans dropped because the span exporter's queue was full
     """
     from core.observability.metrics import get_metric_snapshot
 
@@ -637,6 +650,27 @@ async def get_otel_metrics_api(
     duration_sum = snapshot.get("requests.duration_ms_sum", 0)
     llm_calls = snapshot.get("llm.calls.total", 0)
     llm_duration_sum = snapshot.get("llm.duration_ms_sum", 0)
+    embed_hits = snapshot.get("embeddings.cache.hits", 0)
+    embed_lookups = embed_hits + snapshot.get("embeddings.cache.misses", 0)
+    embed_batches = snapshot.get("embeddings.batches.ok", 0)
+    embed_texts = snapshot.get("embeddings.batches.texts", 0)
+    embed_batch_ms = snapshot.get("embeddings.batches.duration_ms_sum", 0)
+    assembly_hits = snapshot.get("services.assembly.hits", 0)
+    assembly_misses = snapshot.get("services.assembly.misses", 0)
+    assembly_ms = snapshot.get("services.assembly.duration_ms_sum", 0)
+    schema_hits = snapshot.get("mcp.schema_cache.hits", 0)
+    schema_misses = snapshot.get("mcp.schema_cache.misses", 0)
+    prompt_tokens = snapshot.get("llm.tokens.prompt", 0)
+    cached_tokens = snapshot.get("llm.tokens.cached", 0)
+    routing_hits = snapshot.get("routing_cache.hit", 0)
+    routing_misses = snapshot.get("routing_cache.miss", 0)
+    shadow_agree = snapshot.get("routing_cache.shadow_agree", 0)
+    shadow_disagree = snapshot.get("routing_cache.shadow_disagree", 0)
+    dns_cached = snapshot.get("fetcher.dns.hit", 0) + snapshot.get("fetcher.dns.negative_hit", 0)
+    dns_resolutions = snapshot.get("fetcher.dns.resolutions", 0)
+    dns_ms = snapshot.get("fetcher.dns.duration_ms_sum", 0)
+    spans_exported = snapshot.get("tracing.spans.exported", 0)
+    spans_dropped = snapshot.get("tracing.spans.dropped", 0)
 
     return {
         "counters": snapshot,
@@ -650,6 +684,54 @@ async def get_otel_metrics_api(
             "total_tool_calls": int(snapshot.get("tools.calls.total", 0)),
             "total_tool_errors": int(snapshot.get("tools.errors", 0)),
             "active_requests": int(snapshot.get("requests.active", 0)),
+            "embedding_cache_hit_rate_pct": (
+                round(embed_hits / embed_lookups * 100, 2) if embed_lookups > 0 else 0.0
+            ),
+            "avg_embedding_batch_size": (
+                round(embed_texts / embed_batches, 1) if embed_batches > 0 else 0.0
+            ),
+            "embedding_texts_per_s": (
+                round(embed_texts / (embed_batch_ms / 1000), 1) if embed_batch_ms > 0 else 0.0
+            ),
+            "service_cache_hit_rate_pct": (
+                round(assembly_hits / (assembly_hits + assembly_misses) * 100, 2)
+                if assembly_hits + assembly_misses > 0
+                else 0.0
+            ),
+            "avg_service_assembly_ms": (
+                round(assembly_ms / assembly_misses, 1) if assembly_misses > 0 else 0.0
+            ),
+            "mcp_schema_cache_hit_rate_pct": (
+                round(schema_hits / (schema_hits + schema_misses) * 100, 2)
+                if schema_hits + schema_misses > 0
+                else 0.0
+            ),
+            "prompt_cache_hit_rate_pct": (
+                round(cached_tokens / prompt_tokens * 100, 2) if prompt_tokens > 0 else 0.0
+            ),
+            "routing_cache_hit_rate_pct": (
+                round(routing_hits / (routing_hits + routing_misses) * 100, 2)
+                if routing_hits + routing_misses > 0
+                else 0.0
+            ),
+            "routing_cache_shadow_accuracy_pct": (
+                round(shadow_agree / (shadow_agree + shadow_disagree) * 100, 2)
+                if shadow_agree + shadow_disagree > 0
+                else 0.0
+            ),
+            "fetcher_dns_cache_hit_rate_pct": (
+                round(dns_cached / (dns_cached + dns_resolutions) * 100, 2)
+                if dns_cached + dns_resolutions > 0
+                else 0.0
+            ),
+            "avg_fetcher_dns_resolve_ms": (
+                round(dns_ms / dns_resolutions, 1) if dns_resolutions > 0 else 0.0
+            ),
+            "spans_dropped_pct": (
+                round(spans_dropped / (spans_exported + spans_dropped) * 100, 2)
+                if spans_exported + spans_dropped > 0
+                else 0.0
+            ),
         },
     }
 
@@ -662,7 +744,7 @@ async def get_debug_logs_api(
     limit: int = Query(50, ge=1, le=500, description="Max entries to return"),
     auth: AdminUser | APIKeyUser = Depends(get_api_key_auth),
 ) -> list[dict[str, Any]]:
-    """Query debug log entries from JSONL file.
+    """Query debug log entries from the span store.
 
     Returns structured debug events with full event_data.
     Filter by trace_id to get all events for a specific request,
@@ -782,7 +864,7 @@ async def search_traces(
 ) -> list[TraceSearchResult]:
     """Search OpenTelemetry traces.
 
-    Reads from spans.jsonl file and filters based on criteria.
+    Reads from the span store and filters based on criteria.
     """
     settings = get_settings()
     diagnostics = DiagnosticsService(settings)
@@ -920,7 +1002,7 @@ async def get_tool_stats(
 
     cutoff = datetime.now(UTC) - timedelta(hours=hours)
 
-    # Get all tool_call events from JSONL
+    # Get all tool_call events from the span store
     logs = await read_debug_logs(event_type="tool_call", limit=10000)
 
     # Filter by time window
@@ -995,7 +1077,7 @@ async def get_skill_stats(
 
     cutoff = datetime.now(UTC) - timedelta(hours=hours)
 
-    # Get all skill_step events from JSONL
+    # Get all skill_step events from the span store
     logs = await read_debug_logs(event_type="skill_step", limit=10000)
 
     # Filter by time window
@@ -1081,69 +1163,21 @@ async def get_request_stats(
         hours: Number of hours to analyze (1-168).
 
     Note:
-        This reads from the spans.jsonl file. If the file doesn't exist
-        or is empty, returns empty stats.
+        This queries the span store by start time. If nothing has been traced
+        yet, returns empty stats.
     """
-    import json
-    from pathlib import Path
-
-    spans_file = Path("data/spans.jsonl")
-    if not spans_file.exists():
-        return {"period_hours": hours, "endpoints": {}, "total_requests": 0}
+    settings = get_settings()
+    diagnostics = DiagnosticsService(settings)
 
-    cutoff = datetime.now(UTC) - timedelta(hours=hours)
+    # Span start times are naive UTC ISO strings
+    cutoff = datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=hours)
     endpoint_stats: dict[str, dict[str, Any]] = {}
     endpoint_durations: dict[str, list[float]] = {}
 
     try:
-        for line in spans_file.read_text().splitlines():
-            if not line.strip():
-                continue
-
-            try:
-                span = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-            # Parse timestamp
-            start_time_str = span.get("start_time")
-            if not start_time_str:
-                continue
-
-            try:
-                start_time = datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
-                continue
-
-            # Filter by time range
-            if start_time < cutoff:
-                continue
-
-            attrs = span.get("attributes", {})
-            route = attrs.get("http.route") or attrs.get("http.target", "")
-            duration = span.get("duration_ms", 0)
-
-            if not route or not route.startswith("/"):
-                continue
-
-            # Initialize stats for this endpoint
-            if route not in endpoint_stats:
-                endpoint_stats[route] = {
-                    "count": 0,
-                    "avg_duration_ms": 0.0,
-                    "max_duration_ms": 0.0,
-                    "total_duration_ms": 0.0,
-                }
-                endpoint_durations[route] = []
-
-            stats = endpoint_stats[route]
-            stats["count"] += 1
-            stats["total_duration_ms"] += duration
-            stats["max_duration_ms"] = max(stats["max_duration_ms"], duration)
-            endpoint_durations[route].append(duration)
-
+        spans = await asyncio.to_thread(diagnostics.get_spans_since, cutoff)
     except Exception:
-        LOGGER.exception("Error reading spans file")
+        LOGGER.exception("Error reading span store")
         return {
             "period_hours": hours,
             "endpoints": {},
@@ -1151,6 +1185,30 @@ async def get_request_stats(
             "error": "Failed to read spans data",
         }
 
+    for span in spans:
+        attrs = span.get("attributes", {})
+        route = attrs.get("http.route") or attrs.get("http.target", "")
+        duration = span.get("duration_ms", 0)
+
+        if not route or not route.startswith("/"):
+            continue
+
+        # Initialize stats for this endpoint
+        if route not in endpoint_stats:
+            endpoint_stats[route] = {
+                "count": 0,
+                "avg_duration_ms": 0.0,
+                "max_duration_ms": 0.0,
+                "total_duration_ms": 0.0,
+            }
+            endpoint_durations[route] = []
+
+        stats = endpoint_stats[route]
+        stats["count"] += 1
+        stats["total_duration_ms"] += duration
+        stats["max_duration_ms"] = max(stats["max_duration_ms"], duration)
+        endpoint_durations[route].append(duration)
+
     # Calculate averages and percentiles
     for route, stats in endpoint_stats.items():
         if stats["count"] > 0:
@@ -1160,8 +1218,6 @@ async def get_request_stats(
         # Add percentiles
         durations = endpoint_durations.get(route, [])
         if durations:
-            settings = get_settings()
-            diagnostics = DiagnosticsService(settings)
             stats["latency_percentiles"] = diagnostics._calculate_percentiles(durations)
         else:
             stats["latency_percentiles"] = {"p50": 0.0, "p95": 0.0, "p99": 0.0}
@@ -30,6 +30,7 @@ from core.db.models import (
     Workspace,
 )
 from core.db.oauth_models import OAuthToken
+from core.runtime.service_factory import invalidate_context_services
 from interfaces.http.admin_auth import AdminUser, require_admin_or_redirect, verify_admin_user
 from interfaces.http.admin_shared import UTF8HTMLResponse, render_admin_page
 from interfaces.http.csrf import require_csrf
@@ -910,6 +911,7 @@ async def delete_context(
     # Delete context (cascade will delete related entities)
     await session.delete(ctx)
     await session.commit()
+    invalidate_context_services(context_id)
 
     LOGGER.info("Admin deleted context %s", sanitize_log(context_id))
 
@@ -1945,6 +1947,7 @@ async def fork_global_skill(
     target_file = skills_dir / skill.path.name
 
     target_file.write_text(skill.raw_content, encoding="utf-8")
+    invalidate_context_services(context_id)
 
     LOGGER.info(
         "Admin forked global skill '%s' to context %s as %s",
@@ -2103,6 +2106,7 @@ async def write_context_skill(
 
     # Write file
     file_path.write_text(request.content, encoding="utf-8")
+    invalidate_context_services(context_id)
 
     LOGGER.info(
         "Admin wrote skill %s for context %s (%d bytes)",
@@ -2168,6 +2172,7 @@ async def delete_context_skill(
 
     # Delete file
     file_path.unlink()
+    invalidate_context_services(context_id)
 
     LOGGER.info(
         "Admin deleted skill %s for context %s", sanitize_log(file_name), sanitize_log(context_id)
@@ -2346,6 +2351,7 @@ async def revert_skill_proposal(
     else:
         overlay_file.write_text(proposal.original_content, encoding="utf-8")
         LOGGER.info("Reverted '%s': restored previous overlay content", proposal.skill_name)
+    invalidate_context_services(context_id)
 
     # Update proposal status
     admin_email = getattr(request.state, "user_email", "admin")
@@ -2423,6 +2429,7 @@ async def promote_skill_to_global(
 
     # Write to global skill path
     global_skill.path.write_text(proposal.proposed_content, encoding="utf-8")
+    invalidate_context_services(context_id)
 
     # Update status
     admin_email = getattr(request.state, "user_email", "admin")
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -14,6 +15,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from core.db.engine import get_db
 from core.diagnostics.service import DiagnosticsService, TestResult, TraceGroup
 from core.observability.debug_logger import DebugLogger, read_debug_logs
+from core.observability.log_tail import literal_needle, tail_jsonl
+from core.observability.logging import APP_LOGS_PATH
+from core.observability.security_logger import SYSTEM_EVENTS_PATH
 from core.runtime.config import Settings, get_settings
 from interfaces.http.admin_auth import AdminUser, require_admin_or_redirect, verify_admin_user
 from interfaces.http.admin_shared import UTF8HTMLResponse, render_admin_page
@@ -21,6 +25,15 @@ from interfaces.http.csrf import require_csrf
 
 LOGGER = logging.getLogger(__name__)
 
+# Lines scanned per request for filtered log views; older entries are reached
+# by paging with next_before
+_MAX_SCAN_LINES = 100_000
+
+
+def _needles(*values: str | None) -> list[bytes]:
+    """Raw-line pre-filters for exact-match filter values (skips JSON decoding)."""
+    return [needle for value in values if value and (needle := literal_needle(value))]
+
 
 async def ensure_config_defaults(session: AsyncSession) -> None:
     """Ensure SystemConfig has default values for all required keys.
@@ -147,6 +160,27 @@ async def get_otel_metrics() -> dict[str, float]:
     return get_metric_snapshot()
 
 
+@router.get("/latency", dependencies=[Depends(verify_admin_user)])
+async def get_latency_profile(
+    window: int = Query(300, ge=60, le=3600, description="Sliding window in seconds"),
+) -> dict[str, Any]:
+    """Get per-phase latency percentiles of chat requests.
+
+    Args:
+        window: Sliding window in seconds (rounded up to 10 s slots)
+
+    Returns:
+        p50/p95/p99, mean and max per phase and per skill over the window,
+        plus event-loop stalls if the stall monitor is enabled
+
+    Security:
+        Requires admin role via Entra ID authentication.
+    """
+    from core.observability.profiler import latency_report
+
+    return latency_report(window)
+
+
 @router.post(
     "/run",
     response_model=list[TestResult],
@@ -304,6 +338,7 @@ async def get_system_events(
     limit: int = 500,
     event_type: str | None = None,
     severity: str | None = None,
+    before: int | None = None,
 ) -> dict[str, Any]:
     """Get system events that occurred outside of request context.
 
@@ -315,10 +350,12 @@ async def get_system_events(
         limit: Maximum number of events to return (default 500).
         event_type: Filter by event type (e.g., AUTH_FAILURE, RATE_LIMIT_EXCEEDED).
         severity: Filter by severity (INFO, WARNING, ERROR, CRITICAL).
+        before: Byte offset to continue from (``next_before`` of a previous page).
 
     Returns:
         - events: List of system events (newest first)
-        - total_count: Total events in file
+        - total_count: Number of events returned
+        - next_before: Offset for the next (older) page, or None at the start of the file
         - filters_applied: Applied filters
 
     Security:
@@ -327,52 +364,46 @@ async def get_system_events(
     Note: Most security events during normal requests are attached to traces
     and available via /platformadmin/diagnostics/traces endpoint.
     """
-    import json
-    from collections import deque
-
-    events_path = Path("data/system_events.jsonl")
+    events_path = SYSTEM_EVENTS_PATH
+    filters_applied = {"event_type": event_type, "severity": severity}
 
     if not events_path.exists():
         return {
             "events": [],
             "total_count": 0,
-            "filters_applied": {"event_type": event_type, "severity": severity},
+            "filters_applied": filters_applied,
             "message": "No system events file found",
         }
 
-    try:
-        # Read last N*2 lines to allow for filtering
-        with events_path.open("r", encoding="utf-8") as f:
-            lines = deque(f, maxlen=limit * 2)
-
-        events = []
-        for line in reversed(list(lines)):
-            if not line.strip():
-                continue
-            try:
-                event = json.loads(line)
-                # Apply filters
-                if event_type and event.get("event_type") != event_type:
-                    continue
-                if severity and event.get("severity") != severity.upper():
-                    continue
-                events.append(event)
-                if len(events) >= limit:
-                    break
-            except json.JSONDecodeError:
-                continue
+    severity_upper = severity.upper() if severity else None
+
+    def matches(event: dict[str, Any]) -> bool:
+        if event_type and event.get("event_type") != event_type:
+            return False
+        return not severity_upper or event.get("severity") == severity_upper
 
+    try:
+        page = await asyncio.to_thread(
+            tail_jsonl,
+            events_path,
+            limit,
+            match=matches,
+            contains=_needles(event_type, severity_upper),
+            before=before,
+            max_lines=_MAX_SCAN_LINES,
+        )
         return {
-            "events": events,
-            "total_count": len(events),
-            "filters_applied": {"event_type": event_type, "severity": severity},
+            "events": page.entries,
+            "total_count": len(page.entries),
+            "next_before": page.next_before,
+            "filters_applied": filters_applied,
         }
     except Exception as e:
         LOGGER.error(f"Failed to read system events: {e}")
         return {
             "events": [],
             "total_count": 0,
-            "filters_applied": {"event_type": event_type, "severity": severity},
+            "filters_applied": filters_applied,
             "error": "Failed to read system events",
         }
 
@@ -383,6 +414,7 @@ async def get_application_logs(
     level: str | None = None,
     logger_name: str | None = None,
     search: str | None = None,
+    before: int | None = None,
 ) -> dict[str, Any]:
     """Get application logs (warnings, errors, and critical messages).
 
@@ -394,10 +426,12 @@ async def get_application_logs(
         level: Filter by log level (WARNING, ERROR, CRITICAL).
         logger_name: Filter by logger name (e.g., "core.runtime.service").
         search: Search in log message text.
+        before: Byte offset to continue from (``next_before`` of a previous page).
 
     Returns:
         - logs: List of log entries (newest first)
         - total_count: Number of entries returned
+        - next_before: Offset for the next (older) page, or None at the start of the file
         - filters_applied: Applied filters
 
     Security:
@@ -405,54 +439,49 @@ async def get_application_logs(
 
     Note: Only WARNING level and above are written to file to reduce noise.
     """
-    import json
-    from collections import deque
-
-    logs_path = Path("data/app_logs.jsonl")
+    logs_path = APP_LOGS_PATH
+    filters_applied = {"level": level, "logger_name": logger_name, "search": search}
 
     if not logs_path.exists():
         return {
             "logs": [],
             "total_count": 0,
-            "filters_applied": {"level": level, "logger_name": logger_name, "search": search},
+            "filters_applied": filters_applied,
             "message": "No application logs file found",
         }
 
-    try:
-        # Read last N*2 lines to allow for filtering
-        with logs_path.open("r", encoding="utf-8") as f:
-            lines = deque(f, maxlen=limit * 2)
-
-        logs = []
-        for line in reversed(list(lines)):
-            if not line.strip():
-                continue
-            try:
-                log_entry = json.loads(line)
-                # Apply filters
-                if level and log_entry.get("level") != level.upper():
-                    continue
-                if logger_name and not log_entry.get("name", "").startswith(logger_name):
-                    continue
-                if search and search.lower() not in log_entry.get("message", "").lower():
-                    continue
-                logs.append(log_entry)
-                if len(logs) >= limit:
-                    break
-            except json.JSONDecodeError:
-                continue
+    level_upper = level.upper() if level else None
+    search_lower = search.lower() if search else None
 
+    def matches(log_entry: dict[str, Any]) -> bool:
+        if level_upper and log_entry.get("level") != level_upper:
+            return False
+        if logger_name and not log_entry.get("name", "").startswith(logger_name):
+            return False
+        return not search_lower or search_lower in log_entry.get("message", "").lower()
+
+    try:
+        page = await asyncio.to_thread(
+            tail_jsonl,
+            logs_path,
+            limit,
+            match=matches,
+            contains=_needles(level_upper, logger_name),
+            before=before,
+            max_lines=_MAX_SCAN_LINES,
+        )
         return {
-            "logs": logs,
-            "total_count": len(logs),
-            "filters_applied": {"level": level, "logger_name": logger_name, "search": search},
+            "logs": page.entries,
+            "total_count": len(page.entries),
+            "next_before": page.next_before,
+            "filters_applied": filters_applied,
         }
     except Exception as e:
         LOGGER.error(f"Failed to read application logs: {e}")
         return {
             "logs": [],
             "total_count": 0,
-            "filters_applied": {"level": level, "logger_name": logger_name, "search": search},
+            "filters_applied": filters_applied,
             "error": "Failed to read application logs",
         }
 
@@ -463,7 +492,7 @@ async def get_debug_logs(
     event_type: str | None = Query(None),
     limit: int = Query(100, le=500),
 ) -> list[dict[str, Any]]:
-    """Get debug log entries from JSONL file."""
+    """Get debug log entries from the span store."""
     return await read_debug_logs(
         trace_id=trace_id,
         event_type=event_type,
@@ -741,10 +741,10 @@ async def get_mcp_integrations(
 async def get_mcp_activity(
     session: AsyncSession = Depends(get_db),
 ) -> MCPActivityResponse:
-    """Get recent MCP connection events from debug logs (JSONL)."""
+    """Get recent MCP connection events from debug logs (span store)."""
     from core.observability.debug_logger import read_debug_logs
 
-    # Read MCP-related events from JSONL
+    # Read MCP-related events from the span store
     logs = await read_debug_logs(limit=200)
     mcp_logs = [log for log in logs if log.get("event_type") in ("mcp_connect", "mcp_error")][:50]
 
@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from core.db.engine import get_db
 from core.db.models import Context, ToolPermission, User, UserContext
 from core.runtime.config import Settings, get_settings
+from core.runtime.service_factory import invalidate_context_services
 from interfaces.http.admin_auth import AdminUser, verify_admin_user
 from interfaces.http.csrf import require_csrf
 
@@ -332,6 +333,7 @@ async def set_tool_permission(
             session.add(perm)
 
     await session.commit()
+    invalidate_context_services(context_id)
 
     action = "allowed" if request.allowed else "denied"
     LOGGER.info(
@@ -392,6 +394,7 @@ async def bulk_permission_action(
         del_stmt = delete(ToolPermission).where(ToolPermission.context_id == context_id)
         await session.execute(del_stmt)
         await session.commit()
+        invalidate_context_services(context_id)
 
         LOGGER.info(
             "Admin %s reset permissions for context %s (%s)",
@@ -425,6 +428,7 @@ async def bulk_permission_action(
         session.add(perm)
 
     await session.commit()
+    invalidate_context_services(context_id)
 
     action_desc = "allowed" if allowed else "denied"
     LOGGER.info(
@@ -115,6 +115,8 @@ def create_app(settings: Settings | None = None, service: AgentService | None =
         span_log_path=str(settings.trace_span_log_path or "data/spans.jsonl"),
         span_log_max_size_mb=settings.trace_span_log_max_size_mb,
         span_log_max_files=settings.trace_span_log_max_files,
+        span_log_mirror=settings.trace_span_log_mirror,
+        span_store_max_size_mb=settings.trace_span_store_max_size_mb,
     )
     configure_metrics(settings.app_name)
     setup_otel_log_bridge(settings.app_name)
@@ -158,12 +158,21 @@ def create_lifespan(settings: Settings, litellm_client: LiteLLMClient) -> Any:
 
         # Initialize MCP client pool for context-aware MCP connections
         from core.mcp.client_pool import McpClientPool
+        from core.mcp.schema_cache import McpSchemaCache
         from core.tools.mcp_loader import set_mcp_client_pool
 
-        mcp_pool = McpClientPool(settings)
+        mcp_schema_cache = (
+            McpSchemaCache(
+                settings.mcp_schema_cache_path,
+                ttl_seconds=settings.mcp_schema_cache_ttl_seconds,
+            )
+            if settings.mcp_schema_cache_path
+            else None
+        )
+        mcp_pool = McpClientPool(settings, schema_cache=mcp_schema_cache)
         set_mcp_client_pool(mcp_pool)
         mcp_pool.start_eviction()
-        LOGGER.info("MCP client pool initialized with background eviction")
+        LOGGER.info("MCP client pool initialized with background eviction and health supervision")
 
         # Initialize SkillRegistry for skills-native execution
         from core.skills import SkillRegistry
@@ -190,6 +199,20 @@ def create_lifespan(settings: Settings, litellm_client: LiteLLMClient) -> Any:
 
         LOGGER.info("ServiceFactory initialized with SkillRegistry")
 
+        # Semantic routing cache (opt-in; shadow mode only measures agreement)
+        app.state.routing_cache = None
+        if settings.routing_cache_enabled:
+            from core.routing.routing_cache import RoutingCache
+
+            app.state.routing_cache = RoutingCache.from_settings(
+                settings, service_factory._qdrant_client
+            )
+            LOGGER.info(
+                "Routing cache enabled (collection=%s, shadow=%s)",
+                settings.routing_cache_collection,
+                settings.routing_cache_shadow,
+            )
+
         # Warm-up LiteLLM connection in background
         async def warm_up_litellm() -> None:
             try:
@@ -221,6 +244,12 @@ def create_lifespan(settings: Settings, litellm_client: LiteLLMClient) -> Any:
         asyncio.create_task(retention_cleanup_loop())
         LOGGER.info("Retention cleanup scheduled (startup + daily)")
 
+        # Event-loop stall sampling (opt-in)
+        from core.observability.profiler import start_stall_monitor, stop_stall_monitor
+
+        if settings.latency_stall_monitor_enabled:
+            start_stall_monitor(settings.latency_stall_threshold_ms)
+
         # Email service + background schedulers (via orchestrator)
         email_service = create_email_service(settings)
         scheduler, homey_scheduler = await start_schedulers(email_service)
@@ -255,6 +284,10 @@ def create_lifespan(settings: Settings, litellm_client: LiteLLMClient) -> Any:
         yield  # Application runs here
 
         # --- SHUTDOWN ---
+        stop_stall_monitor()
+        from modules.fetcher.extract import get_extraction_pool
+
+        get_extraction_pool().shutdown()
         await job_scheduler.stop()
         await homey_scheduler.stop()
         await scheduler.stop()
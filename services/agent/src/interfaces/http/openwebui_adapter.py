@@ -174,7 +174,9 @@ def get_dispatcher(request: Request) -> Dispatcher:
         raise HTTPException(status_code=503, detail="Skill registry not initialized")
 
     # After None check, mypy knows skill_registry is SkillRegistry
-    return Dispatcher(skill_registry, litellm)
+    return Dispatcher(
+        skill_registry, litellm, routing_cache=getattr(request.app.state, "routing_cache", None)
+    )
 
 
 async def get_or_create_context_id(
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator, Iterator
 from datetime import UTC, datetime
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
@@ -16,13 +17,14 @@ from core.runtime.config import Settings
 
 
 @pytest.fixture(scope="session")
-def mock_settings() -> Settings:
+def mock_settings(tmp_path_factory: pytest.TempPathFactory) -> Settings:
     """Create test settings with diagnostic API key."""
     return Settings(
         environment="test",
         litellm_api_base="http://localhost:4000",
         qdrant_url="http://localhost:6333",
         diagnostic_api_key="test-diag-key-123",
+        trace_span_log_path=tmp_path_factory.mktemp("spans") / "spans.jsonl",
     )
 
 
@@ -406,6 +408,7 @@ class TestConversationMessagesEndpoint:
     def test_messages_accepts_pagination_params(
         self,
         test_client: TestClient,
+        tmp_path: Path,
     ) -> None:
         """Messages endpoint should accept limit and offset."""
         conversation_id = uuid4()
@@ -436,6 +439,7 @@ class TestConversationMessagesEndpoint:
                 litellm_api_base="http://localhost:4000",
                 qdrant_url="http://localhost:6333",
                 diagnostic_api_key="test-diag-key-123",
+                trace_span_log_path=tmp_path / "spans.jsonl",
             )
         )
         app.dependency_overrides[get_settings] = lambda: Settings(
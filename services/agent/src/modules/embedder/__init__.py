@@ -7,6 +7,8 @@ using qwen/qwen3-embedding-8b which produces 4096-dimensional vectors.
 import logging
 
 from core.runtime.litellm_client import LiteLLMClient
+from modules.embedder.cache import CachedEmbedder, EmbeddingDiskCache
+from modules.embedder.scheduler import EmbeddingScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -27,10 +29,15 @@ class LiteLLMEmbedder:
         """Embed texts via LiteLLM proxy."""
         return await self._client.embed(texts, model=self._model)
 
+    @property
+    def model(self) -> str:
+        """LiteLLM model alias used for embedding requests."""
+        return self._model
+
     @property
     def dimension(self) -> int:
         """Vector dimension size (4096 for qwen3-embedding-8b)."""
         return self._dimension
 
 
-__all__ = ["LiteLLMEmbedder"]
+__all__ = ["CachedEmbedder", "EmbeddingDiskCache", "EmbeddingScheduler", "LiteLLMEmbedder"]
@@ -0,0 +1,243 @@
+"""Content-addressed embedding cache.
+
+Wraps any ``IEmbedder`` with two cache tiers keyed by ``(model, sha256(text))``:
+
+- An in-process LRU holding float32 vectors (bounded by entry count).
+- An optional SQLite file holding float16-packed vectors, which survives
+  restarts and halves the on-disk footprint of 4096-dim embeddings.
+
+Only texts missing from both tiers are sent upstream, in a single batch,
+so wiki re-imports and repeated queries stop paying for identical embeddings.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from core.observability.metrics import record_embedding_cache
+from core.protocols import IEmbedder
+
+logger = logging.getLogger(__name__)
+
+# Bytes per float32 component, used to report how many vector bytes were served.
+_FLOAT32_BYTES = 4
+
+
+def embedding_cache_key(model: str, text: str) -> str:
+    """Return the content-addressed cache key for a text under a model."""
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"{model}:{digest}"
+
+
+class EmbeddingDiskCache:
+    """SQLite-backed embedding store with float16-packed vectors.
+
+    All methods are synchronous and thread-safe; ``CachedEmbedder`` calls them
+    via ``asyncio.to_thread`` so the event loop never blocks on disk I/O.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "  key TEXT PRIMARY KEY,"
+            "  dim INTEGER NOT NULL,"
+            "  vector BLOB NOT NULL,"
+            "  created_at REAL NOT NULL"
+            ")"
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: list[str]) -> dict[str, np.ndarray]:
+        """Return float32 vectors for the keys that are present."""
+        if not keys:
+            return {}
+        found: dict[str, np.ndarray] = {}
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                batch = keys[start : start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",  # noqa: S608
+                    batch,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float16).astype(np.float32)
+        return found
+
+    def put_many(self, items: dict[str, np.ndarray]) -> None:
+        """Store vectors, packing them as float16."""
+        if not items:
+            return
+        now = time.time()
+        rows = [
+            (key, int(vec.shape[0]), vec.astype(np.float16).tobytes(), now)
+            for key, vec in items.items()
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, dim, vector, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def count(self) -> int:
+        """Return the number of stored vectors."""
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        return int(row[0]) if row else 0
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class CachedEmbedder:
+    """Caching ``IEmbedder`` decorator in front of an upstream embedder.
+
+    Args:
+        inner: Upstream embedder (normally ``LiteLLMEmbedder``).
+        model: Model name used to namespace cache keys. Changing the embedding
+            model must change this value, otherwise stale vectors are served.
+        max_entries: Capacity of the in-process LRU tier (0 disables it).
+        disk_cache: Optional persistent tier.
+    """
+
+    def __init__(
+        self,
+        inner: IEmbedder,
+        *,
+        model: str,
+        max_entries: int = 10_000,
+        disk_cache: EmbeddingDiskCache | None = None,
+    ) -> None:
+        self._inner = inner
+        self._model = model
+        self._max_entries = max_entries
+        self._disk = disk_cache
+        self._lru: OrderedDict[str, np.ndarray] = OrderedDict()
+
+    @property
+    def dimension(self) -> int:
+        """Vector dimension of the wrapped embedder."""
+        return self._inner.dimension
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def _lru_get(self, key: str) -> np.ndarray | None:
+        vec = self._lru.get(key)
+        if vec is not None:
+            self._lru.move_to_end(key)
+        return vec
+
+    def _lru_put(self, key: str, vec: np.ndarray) -> None:
+        if self._max_entries <= 0:
+            return
+        self._lru[key] = vec
+        self._lru.move_to_end(key)
+        while len(self._lru) > self._max_entries:
+            self._lru.popitem(last=False)
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts, serving repeats from cache and batching the misses."""
+        if not texts:
+            return []
+
+        keys = [embedding_cache_key(self._model, text) for text in texts]
+        resolved: dict[str, np.ndarray] = {}
+
+        # Tier 1: in-process LRU
+        memory_hits = 0
+        for key in dict.fromkeys(keys):
+            vec = self._lru_get(key)
+            if vec is not None:
+                resolved[key] = vec
+                memory_hits += 1
+
+        # Tier 2: SQLite (best effort - a broken disk cache must not break embedding)
+        disk_hits = 0
+        pending = [key for key in dict.fromkeys(keys) if key not in resolved]
+        if pending and self._disk is not None:
+            try:
+                from_disk = await asyncio.to_thread(self._disk.get_many, pending)
+            except sqlite3.Error as exc:
+                logger.warning("Embedding disk cache read failed: %s", exc)
+                from_disk = {}
+            for key, vec in from_disk.items():
+                resolved[key] = vec
+                self._lru_put(key, vec)
+            disk_hits = len(from_disk)
+
+        # Upstream: one batch with each missing text exactly once
+        missing: dict[str, str] = {}
+        for key, text in zip(keys, texts, strict=True):
+            if key not in resolved and key not in missing:
+                missing[key] = text
+
+        upstream_ms: float | None = None
+        bytes_fetched = 0
+        if missing:
+            start = time.perf_counter()
+            vectors = await self._inner.embed(list(missing.values()))
+            upstream_ms = (time.perf_counter() - start) * 1000
+            if len(vectors) != len(missing):
+                raise ValueError(
+                    f"Embedder returned {len(vectors)} vectors for {len(missing)} texts"
+                )
+            fresh: dict[str, np.ndarray] = {}
+            for key, vector in zip(missing, vectors, strict=True):
+                vec = np.asarray(vector, dtype=np.float32)
+                fresh[key] = vec
+                resolved[key] = vec
+                self._lru_put(key, vec)
+                bytes_fetched += vec.shape[0] * _FLOAT32_BYTES
+            if self._disk is not None:
+                try:
+                    await asyncio.to_thread(self._disk.put_many, fresh)
+                except sqlite3.Error as exc:
+                    logger.warning("Embedding disk cache write failed: %s", exc)
+
+        bytes_served = sum(
+            resolved[key].shape[0] * _FLOAT32_BYTES for key in keys if key not in missing
+        )
+        record_embedding_cache(
+            model=self._model,
+            memory_hits=memory_hits,
+            disk_hits=disk_hits,
+            misses=len(missing),
+            bytes_served=bytes_served,
+            bytes_fetched=bytes_fetched,
+            upstream_duration_ms=upstream_ms,
+        )
+
+        return [resolved[key].tolist() for key in keys]
+
+    def clear(self) -> None:
+        """Drop the in-process tier (the disk tier is left untouched)."""
+        self._lru.clear()
+
+    def close(self) -> None:
+        """Release the disk tier, if any."""
+        if self._disk is not None:
+            self._disk.close()
+
+
+__all__ = ["CachedEmbedder", "EmbeddingDiskCache", "embedding_cache_key"]
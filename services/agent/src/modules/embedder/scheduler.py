@@ -0,0 +1,273 @@
+"""Shared embedding scheduler with micro-batching and adaptive batch sizing.
+
+Every ingestion path (RAG documents, code indexing, wiki import) funnels its
+embedding requests through one ``EmbeddingScheduler``. Texts from concurrent
+callers are coalesced into micro-batches bounded by size and by a short
+deadline, and up to ``max_in_flight`` batches are sent upstream at once.
+
+Batches that the gateway rejects as too large (413) or that time out are split
+in half and the working batch size shrinks; it grows back additively after a
+run of clean batches. Other transient errors (429, 5xx, dropped connections)
+are retried with exponential backoff.
+
+Single-text requests are interactive query embeds (RAG and memory search,
+routing cache lookups). They skip the batching queue and use their own
+in-flight slots, so they never wait behind ingestion batches.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+import httpx
+
+from core.observability.metrics import record_embedding_batch
+from core.protocols import IEmbedder
+from core.runtime.litellm_client import LiteLLMError
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses that mean "this request was too big or too slow" - split and shrink
+_OVERSIZE_STATUSES = frozenset({408, 413, 504})
+# HTTP statuses worth retrying unchanged after a backoff
+_TRANSIENT_STATUSES = frozenset({429, 500, 502, 503})
+# Consecutive successful batches before the working batch size grows again
+_GROW_AFTER_SUCCESSES = 4
+
+
+def _is_oversized(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.TimeoutException):
+        return True
+    return isinstance(exc, LiteLLMError) and exc.status_code in _OVERSIZE_STATUSES
+
+
+def _is_transient(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, LiteLLMError):
+        return exc.status_code in _TRANSIENT_STATUSES or exc.status_code in _OVERSIZE_STATUSES
+    return False
+
+
+@dataclass(slots=True)
+class _PendingText:
+    text: str
+    future: asyncio.Future[list[float]]
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class EmbeddingScheduler:
+    """Coalescing ``IEmbedder`` decorator in front of an upstream embedder.
+
+    Args:
+        inner: Upstream embedder (normally ``LiteLLMEmbedder``).
+        model: Model name used to label metrics.
+        max_batch_size: Upper bound on texts per upstream request.
+        min_batch_size: Batches are never shrunk below this size.
+        max_wait_ms: How long a partial batch waits for more texts.
+        max_in_flight: Number of upstream batch requests allowed concurrently.
+            Single-text queries get the same number of slots of their own.
+        max_retries: Retries per batch for transient errors.
+        backoff_base: First retry delay in seconds (doubled per attempt).
+    """
+
+    def __init__(
+        self,
+        inner: IEmbedder,
+        *,
+        model: str,
+        max_batch_size: int = 64,
+        min_batch_size: int = 1,
+        max_wait_ms: float = 10.0,
+        max_in_flight: int = 4,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+    ) -> None:
+        if min_batch_size < 1 or max_batch_size < min_batch_size:
+            raise ValueError("Require 1 <= min_batch_size <= max_batch_size")
+        self._inner = inner
+        self._model = model
+        self._max_batch_size = max_batch_size
+        self._min_batch_size = min_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._batch_size = max_batch_size
+        self._successes = 0
+        self._pending: deque[_PendingText] = deque()
+        self._wakeup = asyncio.Event()
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._query_slots = asyncio.Semaphore(max_in_flight)
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._batches: set[asyncio.Task[None]] = set()
+
+    @property
+    def dimension(self) -> int:
+        """Vector dimension of the wrapped embedder."""
+        return self._inner.dimension
+
+    @property
+    def batch_size(self) -> int:
+        """Current (adaptive) upper bound on texts per upstream request."""
+        return self._batch_size
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """Queue texts for batched embedding and wait for their vectors."""
+        if not texts:
+            return []
+        if len(texts) == 1:
+            async with self._query_slots:
+                return await self._embed_adaptive(texts)
+        loop = asyncio.get_running_loop()
+        items = [_PendingText(text, loop.create_future()) for text in texts]
+        self._pending.extend(items)
+        self._wakeup.set()
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        return list(await asyncio.gather(*(item.future for item in items)))
+
+    async def _dispatch(self) -> None:
+        """Drain the queue into batches until it is empty."""
+        while self._pending:
+            await self._slots.acquire()
+            try:
+                await self._wait_for_fill()
+                batch = [
+                    self._pending.popleft()
+                    for _ in range(min(self._batch_size, len(self._pending)))
+                ]
+            except BaseException:
+                self._slots.release()
+                raise
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batch_done)
+
+    def _batch_done(self, task: asyncio.Task[None]) -> None:
+        self._batches.discard(task)
+        self._slots.release()
+
+    async def _wait_for_fill(self) -> None:
+        """Wait until a full batch is queued or the oldest text hits its deadline."""
+        deadline = self._pending[0].enqueued_at + self._max_wait
+        while len(self._pending) < self._batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=remaining)
+            except TimeoutError:
+                return
+
+    async def _run_batch(self, batch: list[_PendingText]) -> None:
+        live = [item for item in batch if not item.future.done()]
+        if not live:
+            return
+        try:
+            vectors = await self._embed_adaptive([item.text for item in live])
+        except Exception as exc:
+            for item in live:
+                if not item.future.done():
+                    item.future.set_exception(exc)
+            return
+        for item, vector in zip(live, vectors, strict=True):
+            if not item.future.done():
+                item.future.set_result(vector)
+
+    async def _embed_adaptive(self, texts: list[str]) -> list[list[float]]:
+        """Embed one batch, splitting on oversize errors and retrying transient ones."""
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                vectors = await self._inner.embed(texts)
+            except Exception as exc:
+                duration_ms = (time.perf_counter() - start) * 1000
+                if _is_oversized(exc) and len(texts) > self._min_batch_size:
+                    self._shrink(len(texts))
+                    record_embedding_batch(
+                        model=self._model,
+                        size=len(texts),
+                        duration_ms=duration_ms,
+                        outcome="split",
+                    )
+                    logger.warning(
+                        "Embedding batch of %d rejected (%s), splitting; batch size now %d",
+                        len(texts),
+                        exc,
+                        self._batch_size,
+                    )
+                    mid = len(texts) // 2
+                    head = await self._embed_adaptive(texts[:mid])
+                    tail = await self._embed_adaptive(texts[mid:])
+                    return head + tail
+                if _is_transient(exc) and attempt < self._max_retries:
+                    wait = self._backoff_base * 2**attempt * (0.5 + random.random())  # noqa: S311
+                    attempt += 1
+                    record_embedding_batch(
+                        model=self._model,
+                        size=len(texts),
+                        duration_ms=duration_ms,
+                        outcome="retry",
+                    )
+                    logger.warning(
+                        "Embedding batch of %d failed (attempt %d/%d), retrying in %.1fs: %s",
+                        len(texts),
+                        attempt,
+                        self._max_retries,
+                        wait,
+                        exc,
+                    )
+                    await asyncio.sleep(wait)
+                    continue
+                record_embedding_batch(
+                    model=self._model,
+                    size=len(texts),
+                    duration_ms=duration_ms,
+                    outcome="error",
+                )
+                raise
+
+            if len(vectors) != len(texts):
+                raise ValueError(f"Embedder returned {len(vectors)} vectors for {len(texts)} texts")
+            record_embedding_batch(
+                model=self._model,
+                size=len(texts),
+                duration_ms=(time.perf_counter() - start) * 1000,
+                outcome="ok",
+            )
+            self._grow()
+            return vectors
+
+    def _shrink(self, failed_size: int) -> None:
+        self._successes = 0
+        self._batch_size = max(self._min_batch_size, min(self._batch_size, failed_size // 2))
+
+    def _grow(self) -> None:
+        if self._batch_size >= self._max_batch_size:
+            return
+        self._successes += 1
+        if self._successes >= _GROW_AFTER_SUCCESSES:
+            self._successes = 0
+            step = max(1, self._batch_size // 4)
+            self._batch_size = min(self._max_batch_size, self._batch_size + step)
+
+    async def aclose(self) -> None:
+        """Cancel the dispatcher and any batches still in flight."""
+        tasks = [t for t in (self._dispatcher, *self._batches) if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        while self._pending:
+            item = self._pending.popleft()
+            if not item.future.done():
+                item.future.cancel()
+
+
+__all__ = ["EmbeddingScheduler"]
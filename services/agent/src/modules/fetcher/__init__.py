@@ -1,37 +1,31 @@
 import asyncio
 import hashlib
 import ipaddress
-import json
 import logging
 import os
 import socket
+import sqlite3
 import time
-from collections import deque
-from html.parser import HTMLParser
+from collections import OrderedDict, deque
 from pathlib import Path
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
 import httpx
-import trafilatura
-from litellm import acompletion
 
 from core.protocols import IRAGManager
+from modules.fetcher.cache import PageDiskCache, PageEntry
+from modules.fetcher.extract import get_extraction_pool
+from modules.fetcher.resolver import AddressBlocklist, CachingResolver, PinnedTransport
 
 logger = logging.getLogger(__name__)
 
 
-class _PlainTextExtractor(HTMLParser):
-    def __init__(self) -> None:
-        super().__init__()
-        self._chunks: list[str] = []
-
-    def handle_data(self, data: str) -> None:
-        if data.strip():
-            self._chunks.append(data.strip())
-
-    def get_text(self) -> str:
-        return "\n".join(self._chunks)
+# Content types worth downloading and extracting; anything else is aborted
+# after the response headers
+_TEXT_CONTENT_TYPES = frozenset(
+    {"text/html", "application/xhtml+xml", "text/plain", "application/xml", "text/xml"}
+)
 
 
 class WebFetcher:
@@ -62,11 +56,14 @@ class WebFetcher:
         ipaddress.ip_network("fc00::/7"),
         ipaddress.ip_network("fe80::/10"),
     ]
+    _BLOCKLIST = AddressBlocklist(PRIVATE_RANGES)
 
     def __init__(self, rag_manager: IRAGManager | None = None) -> None:
         self.searxng_url = os.getenv("SEARXNG_URL", "http://searxng:8080")
         self.request_timeout = int(os.getenv("FETCHER_REQUEST_TIMEOUT", "15"))
         self.max_chars = int(os.getenv("FETCHER_MAX_CHARS", "12000"))
+        # Bodies beyond this are cut off mid-stream rather than read into memory
+        self.max_bytes = int(os.getenv("FETCHER_MAX_BYTES", str(2 * 1024 * 1024)))
         # Respect CACHE_DIR or default to user home cache.
         # Fallback to /app/.cache for legacy Docker.
         default_cache = Path(os.getenv("HOME", "/root")) / ".cache" / "agent-fetcher"
@@ -77,13 +74,30 @@ class WebFetcher:
         self.cache_ttl = int(os.getenv("CACHE_TTL", "86400"))
 
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Pages are served from an in-process LRU in front of the SQLite tier;
+        # stale entries are kept so they can be revalidated with ETag/Last-Modified
+        self._disk_cache = PageDiskCache(
+            self.cache_dir / "pages.sqlite3",
+            max_entries=int(os.getenv("FETCHER_CACHE_ENTRIES", "1000")),
+        )
+        self.memory_cache_entries = int(os.getenv("FETCHER_MEMORY_CACHE_ENTRIES", "128"))
+        self._memory_cache: OrderedDict[str, PageEntry] = OrderedDict()
+        self._resolver = CachingResolver(
+            ttl_seconds=float(os.getenv("FETCHER_DNS_TTL", "60")),
+            negative_ttl_seconds=float(os.getenv("FETCHER_DNS_NEGATIVE_TTL", "10")),
+        )
+        # One network fetch per URL at a time; concurrent callers share its result
+        self._inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+        # Page fetches only ever connect to addresses that passed SSRF validation
         self.http_client = httpx.AsyncClient(
             follow_redirects=False,  # Disable auto-redirect to validate each URL
-            limits=httpx.Limits(
-                max_connections=50,
-                max_keepalive_connections=20,
+            transport=PinnedTransport(
+                self._validate_host,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
             ),
         )
+        # SearXNG is an internal service, so searches bypass the SSRF guard
+        self.search_client = httpx.AsyncClient()
         self.rag_manager = rag_manager
 
         # Simple Rate Limiting
@@ -93,6 +107,8 @@ class WebFetcher:
 
     async def close(self) -> None:
         await self.http_client.aclose()
+        await self.search_client.aclose()
+        self._disk_cache.close()
         if self.rag_manager:
             await self.rag_manager.close()
 
@@ -111,61 +127,67 @@ class WebFetcher:
     def _cache_key(self, s: str) -> str:
         return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
-    async def _cache_get(self, url: str) -> dict[str, Any] | None:
-        p = self.cache_dir / self._cache_key(url)
-        if not p.exists():
+    def _memory_put(self, key: str, entry: PageEntry) -> None:
+        if self.memory_cache_entries <= 0:
+            return
+        self._memory_cache[key] = entry
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > self.memory_cache_entries:
+            self._memory_cache.popitem(last=False)
+
+    async def _cache_lookup(self, url: str) -> PageEntry | None:
+        """Return the cached entry for ``url`` from either tier, fresh or stale."""
+        key = self._cache_key(url)
+        entry = self._memory_cache.get(key)
+        if entry is not None:
+            self._memory_cache.move_to_end(key)
+            return entry
+        try:
+            entry = await asyncio.to_thread(self._disk_cache.get, key)
+        except sqlite3.Error as exc:
+            logger.warning("Fetcher disk cache read failed: %s", exc)
             return None
+        if entry is not None:
+            self._memory_put(key, entry)
+        return entry
 
-        # Check expiry
-        stat = await asyncio.to_thread(p.stat)
-        if (time.time() - stat.st_mtime) >= self.cache_ttl:
+    async def _cache_get(self, url: str) -> dict[str, Any] | None:
+        entry = await self._cache_lookup(url)
+        if entry is None or not entry.is_fresh(self.cache_ttl):
             return None
+        return entry.data
 
-        # Read cache file asynchronously
+    async def _cache_set(self, url: str, entry: PageEntry) -> None:
+        key = self._cache_key(url)
+        self._memory_put(key, entry)
         try:
-            text = await asyncio.to_thread(p.read_text, encoding="utf-8")
-            return json.loads(text)
-        except (OSError, json.JSONDecodeError):
-            logger.debug(
-                "Failed to read or parse cache file %s, treating as missing", p, exc_info=True
-            )
-            return None
-
-    async def _evict_old_cache_entries(self, max_entries: int = 1000) -> None:
-        """Evict oldest cache entries when limit exceeded."""
-        # Quick count check before expensive sort+stat
-        entry_count = sum(1 for _ in self.cache_dir.iterdir())
-        if entry_count < max_entries:
-            return
-
-        # Get all cache files sorted by modification time
-        entries = await asyncio.to_thread(
-            lambda: sorted(self.cache_dir.glob("*"), key=lambda p: p.stat().st_mtime)
-        )
-
-        # Delete oldest entries if we exceed the limit
-        while len(entries) >= max_entries:
-            oldest = entries.pop(0)
-            await asyncio.to_thread(oldest.unlink, missing_ok=True)
-
-    async def _cache_set(self, url: str, data: dict[str, Any]) -> None:
-        # Evict old entries before writing new one
-        await self._evict_old_cache_entries()
-
-        # Write cache file asynchronously
-        cache_path = self.cache_dir / self._cache_key(url)
-        content = json.dumps(data)
-        await asyncio.to_thread(cache_path.write_text, content, encoding="utf-8")
-
-    def _extract_text(self, html: str) -> str:
-        if trafilatura:
-            return trafilatura.extract(html, include_images=False, include_tables=False) or ""
-        # Fallback
-        parser = _PlainTextExtractor()
-        parser.feed(html)
-        return parser.get_text()
-
-    async def _validate_url(self, url: str) -> None:
+            await asyncio.to_thread(self._disk_cache.put, key, entry)
+        except sqlite3.Error as exc:
+            logger.warning("Fetcher disk cache write failed: %s", exc)
+
+    async def _cache_revalidated(self, url: str, entry: PageEntry) -> dict[str, Any]:
+        """Mark a stale entry fresh after the origin answered ``304 Not Modified``."""
+        key = self._cache_key(url)
+        fresh = entry.revalidated()
+        self._memory_put(key, fresh)
+        try:
+            await asyncio.to_thread(self._disk_cache.touch, key, fresh.fetched_at)
+        except sqlite3.Error as exc:
+            logger.warning("Fetcher disk cache write failed: %s", exc)
+        return fresh.data
+
+    async def _read_body(self, response: httpx.Response) -> tuple[bytes, bool]:
+        """Read at most ``max_bytes`` of a streamed body; return it and whether it was cut."""
+        chunks: list[bytes] = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self.max_bytes:
+                return b"".join(chunks)[: self.max_bytes], True
+        return b"".join(chunks), False
+
+    async def _validate_url(self, url: str) -> tuple[str, ...]:
         """Validate URL to prevent SSRF attacks.
 
         Blocks:
@@ -176,6 +198,9 @@ class WebFetcher:
         Args:
             url: The URL to validate
 
+        Returns:
+            The validated IP addresses the request may connect to
+
         Raises:
             ValueError: If the URL is blocked
         """
@@ -188,22 +213,26 @@ class WebFetcher:
         hostname = parsed.hostname
         if not hostname:
             raise ValueError("URL missing hostname")
+        return await self._validate_host(hostname)
 
+    async def _validate_host(self, hostname: str) -> tuple[str, ...]:
+        """Resolve ``hostname`` and return its addresses if none of them is internal.
+
+        Also called by ``PinnedTransport`` for every new connection, so sockets
+        are only opened to addresses checked here.
+        """
         # Block internal Docker service names
         if hostname.lower() in self.BLOCKED_HOSTNAMES:
             raise ValueError(f"Blocked internal hostname: {hostname}")
 
-        # Resolve hostname to IP addresses (blocking call, wrap in to_thread)
         try:
-            addr_info = await asyncio.to_thread(
-                socket.getaddrinfo, hostname, None, socket.AF_UNSPEC, socket.SOCK_STREAM
-            )
+            addresses = await self._resolver.resolve(hostname)
         except socket.gaierror as e:
             raise ValueError(f"DNS resolution failed for {hostname}: {e}") from e
 
         # Check all resolved IPs
-        for _family, _, _, _, sockaddr in addr_info:
-            ip_str = sockaddr[0]
+        validated: list[str] = []
+        for ip_str in addresses:
             try:
                 ip_addr = ipaddress.ip_address(ip_str)
             except ValueError:
@@ -212,10 +241,13 @@ class WebFetcher:
                 )
                 continue
 
-            # Check against private ranges
-            for network in self.PRIVATE_RANGES:
-                if ip_addr in network:
-                    raise ValueError(f"Blocked private IP: {ip_str} (from {hostname})")
+            if self._BLOCKLIST.match(ip_addr) is not None:
+                raise ValueError(f"Blocked private IP: {ip_str} (from {hostname})")
+            validated.append(ip_str)
+
+        if not validated:
+            raise ValueError(f"DNS resolution failed for {hostname}: no usable address")
+        return tuple(validated)
 
     async def fetch(self, url: str) -> dict[str, Any]:
         # Validate URL before checking cache to prevent cache poisoning
@@ -225,6 +257,22 @@ class WebFetcher:
         if cached:
             return cached
 
+        # Coalesce concurrent fetches of the same URL (parallel skills often
+        # research the same topic). The shared task is shielded so a cancelled
+        # caller does not cancel the fetch for everyone else.
+        key = self._cache_key(url)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_uncached(url))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_uncached(self, url: str) -> dict[str, Any]:
+        # A stale entry with validators turns the refetch into a conditional request
+        stale = await self._cache_lookup(url)
+        conditional = stale.conditional_headers() if stale else {}
+
         self._check_rate_limit()
         try:
             # Use realistic browser headers to avoid 403 blocks
@@ -254,14 +302,23 @@ class WebFetcher:
             redirect_count = 0
 
             while redirect_count < max_redirects:
-                r = await self.http_client.get(
-                    current_url,
-                    timeout=self.request_timeout,
-                    headers=headers,
+                # Each hop is validated up front; the transport re-checks on connect
+                await self._validate_url(current_url)
+                request_headers = dict(headers)
+                if stale and conditional and current_url == (stale.final_url or url):
+                    request_headers.update(conditional)
+                request = self.http_client.build_request(
+                    "GET", current_url, timeout=self.request_timeout, headers=request_headers
                 )
+                r = await self.http_client.send(request, stream=True)
+
+                if r.status_code == 304 and stale:
+                    await r.aclose()
+                    return await self._cache_revalidated(url, stale)
 
                 # Check for redirects (3xx status codes)
                 if 300 <= r.status_code < 400:
+                    await r.aclose()
                     redirect_url = r.headers.get("Location")
                     if not redirect_url:
                         break
@@ -270,33 +327,50 @@ class WebFetcher:
                     if not redirect_url.startswith(("http://", "https://")):
                         redirect_url = urljoin(current_url, redirect_url)
 
-                    # Validate redirect target to prevent SSRF via redirect
-                    await self._validate_url(redirect_url)
+                    # The redirect target is validated at the top of the loop
                     current_url = redirect_url
                     redirect_count += 1
                     continue
 
                 # Not a redirect, process the response
-                r.raise_for_status()
                 break
 
             if redirect_count >= max_redirects:
                 raise ValueError(f"Too many redirects (>{max_redirects})")
 
-            raw_html = r.text
-            text = await asyncio.to_thread(self._extract_text, raw_html)
-            text = text.strip()
-            if len(text) > self.max_chars:
-                text = text[: self.max_chars] + "\n...\n"
-
-            data = {
+            try:
+                r.raise_for_status()
+                content_type = r.headers.get("Content-Type", "").split(";")[0].strip().lower()
+                if content_type and content_type not in _TEXT_CONTENT_TYPES:
+                    raise ValueError(f"Unsupported content type: {content_type}")
+                body, truncated = await self._read_body(r)
+            finally:
+                await r.aclose()
+
+            text = await get_extraction_pool().extract(body, r.charset_encoding, self.max_chars)
+
+            # Only extracted text and metadata are cached; the raw HTML is
+            # returned for this response but not kept
+            data: dict[str, Any] = {
                 "url": url,
                 "ok": True,
                 "text": text,
-                "html_truncated": raw_html[:20000],
+                "final_url": current_url,
+                "content_type": content_type or None,
+                "body_truncated": truncated,
             }
-            await self._cache_set(url, data)
-            return data
+            await self._cache_set(
+                url,
+                PageEntry(
+                    data=data,
+                    fetched_at=time.time(),
+                    etag=r.headers.get("ETag"),
+                    last_modified=r.headers.get("Last-Modified"),
+                    final_url=current_url,
+                ),
+            )
+            html = body[:20000].decode(r.charset_encoding or "utf-8", errors="replace")
+            return {**data, "html_truncated": html}
         except Exception as e:
             logger.error(f"Fetch failed for {url}: {e}")
             # Don't cache failed responses - they should be retried
@@ -311,7 +385,7 @@ class WebFetcher:
             "safesearch": 1,
         }
         # Let exceptions propagate to the Tool for better visibility
-        r = await self.http_client.get(url, params=params, timeout=self.request_timeout)
+        r = await self.search_client.get(url, params=params, timeout=self.request_timeout)
         r.raise_for_status()
         data = r.json()
         results = []
@@ -379,6 +453,10 @@ class WebFetcher:
         Summarize the key points from the context in a bulleted list. Cite sources as [n].
         """
 
+        # Imported here so extraction worker processes, which import this
+        # package, do not load litellm
+        from litellm import acompletion
+
         try:
             response = await acompletion(
                 model=model,
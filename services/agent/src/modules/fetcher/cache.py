@@ -0,0 +1,166 @@
+"""Persistent page cache for ``WebFetcher``.
+
+Fetched pages are stored in one SQLite file keyed by ``sha256(url)``, together
+with the response's ``ETag``/``Last-Modified`` validators. Entries outlive the
+freshness TTL so a stale page can be revalidated with a conditional request
+instead of being downloaded again. Capacity is enforced per write by dropping
+the least recently used row through the ``accessed_at`` index, so the cost of
+eviction does not grow with the number of cached pages.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PageEntry:
+    """One cached fetch result plus what is needed to revalidate it."""
+
+    data: dict[str, Any]
+    fetched_at: float  # Unix time the page was last downloaded or revalidated
+    etag: str | None = None
+    last_modified: str | None = None
+    final_url: str | None = None  # URL the validators belong to (after redirects)
+
+    def is_fresh(self, ttl_seconds: float) -> bool:
+        return time.time() - self.fetched_at < ttl_seconds
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Return ``If-None-Match``/``If-Modified-Since`` headers for a refetch."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def revalidated(self) -> PageEntry:
+        """Return a copy marked fresh, for a ``304 Not Modified`` response."""
+        return replace(self, fetched_at=time.time())
+
+
+class PageDiskCache:
+    """SQLite-backed store of fetched pages, bounded by entry count.
+
+    All methods are synchronous and thread-safe; ``WebFetcher`` calls them via
+    ``asyncio.to_thread`` so the event loop never blocks on disk I/O.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 1000) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "  key TEXT PRIMARY KEY,"
+            "  payload TEXT NOT NULL,"
+            "  etag TEXT,"
+            "  last_modified TEXT,"
+            "  final_url TEXT,"
+            "  fetched_at REAL NOT NULL,"
+            "  accessed_at REAL NOT NULL"
+            ")"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed_at)")
+        self._conn.commit()
+        row = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()
+        self._count = int(row[0]) if row else 0
+
+    def get(self, key: str) -> PageEntry | None:
+        """Return the entry for ``key``, fresh or not, and mark it recently used."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, etag, last_modified, final_url, fetched_at "
+                "FROM pages WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE pages SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        payload, etag, last_modified, final_url, fetched_at = row
+        try:
+            data = json.loads(payload)
+        except json.JSONDecodeError:
+            logger.warning("Discarding unreadable fetcher cache entry %s", key)
+            self.delete(key)
+            return None
+        return PageEntry(
+            data=data,
+            fetched_at=fetched_at,
+            etag=etag,
+            last_modified=last_modified,
+            final_url=final_url,
+        )
+
+    def put(self, key: str, entry: PageEntry) -> None:
+        """Store ``entry``, evicting the least recently used page when full."""
+        payload = json.dumps(entry.data)
+        with self._lock:
+            exists = self._conn.execute("SELECT 1 FROM pages WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages "
+                "(key, payload, etag, last_modified, final_url, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    payload,
+                    entry.etag,
+                    entry.last_modified,
+                    entry.final_url,
+                    entry.fetched_at,
+                    time.time(),
+                ),
+            )
+            if exists is None:
+                self._count += 1
+            while self._count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM pages WHERE key = "
+                    "(SELECT key FROM pages ORDER BY accessed_at LIMIT 1)"
+                )
+                self._count -= 1
+            self._conn.commit()
+
+    def touch(self, key: str, fetched_at: float) -> None:
+        """Record a successful revalidation of ``key``."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE pages SET fetched_at = ?, accessed_at = ? WHERE key = ?",
+                (fetched_at, time.time(), key),
+            )
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        """Drop one entry."""
+        with self._lock:
+            deleted = self._conn.execute("DELETE FROM pages WHERE key = ?", (key,)).rowcount
+            self._count -= deleted
+            self._conn.commit()
+
+    def count(self) -> int:
+        """Return the number of stored pages."""
+        with self._lock:
+            return self._count
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["PageDiskCache", "PageEntry"]
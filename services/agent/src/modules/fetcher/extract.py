@@ -0,0 +1,104 @@
+"""Off-loop HTML text extraction for ``WebFetcher``.
+
+Decoding and ``trafilatura.extract`` are CPU-bound and hold the GIL for tens
+of milliseconds on large pages, so they run in a small dedicated process
+pool instead of the default thread pool shared with DB and DNS work. The
+worker receives the raw (capped) body and returns only the truncated text.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from html.parser import HTMLParser
+
+import trafilatura
+
+logger = logging.getLogger(__name__)
+
+
+class _PlainTextExtractor(HTMLParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[str] = []
+
+    def handle_data(self, data: str) -> None:
+        if data.strip():
+            self._chunks.append(data.strip())
+
+    def get_text(self) -> str:
+        return "\n".join(self._chunks)
+
+
+def extract_text(body: bytes, encoding: str | None, max_chars: int) -> str:
+    """Decode ``body`` and return its main text, truncated to ``max_chars``."""
+    html = body.decode(encoding or "utf-8", errors="replace")
+    if trafilatura:
+        text = trafilatura.extract(html, include_images=False, include_tables=False) or ""
+    else:
+        # Fallback
+        parser = _PlainTextExtractor()
+        parser.feed(html)
+        text = parser.get_text()
+    text = text.strip()
+    if len(text) > max_chars:
+        text = text[:max_chars] + "\n...\n"
+    return text
+
+
+class ExtractionPool:
+    """Bounded process pool for ``extract_text``, started on first use.
+
+    With ``max_workers=0`` extraction runs in a thread instead. A broken pool
+    (a worker was killed) is replaced on the next call and the current page
+    is extracted in a thread.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    async def extract(self, body: bytes, encoding: str | None, max_chars: int) -> str:
+        if self.max_workers <= 0:
+            return await asyncio.to_thread(extract_text, body, encoding, max_chars)
+        if self._executor is None:
+            # spawn: forking a process that runs the event loop, OTel exporters
+            # and SQLite connections is not safe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._executor, extract_text, body, encoding, max_chars
+            )
+        except BrokenProcessPool:
+            logger.warning("Extraction pool broke; restarting it on next use")
+            self.shutdown()
+            return await asyncio.to_thread(extract_text, body, encoding, max_chars)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Shared by every WebFetcher in the process so the worker count stays bounded
+_pool: ExtractionPool | None = None
+
+
+def get_extraction_pool() -> ExtractionPool:
+    """Get the process-wide extraction pool (``FETCHER_EXTRACT_WORKERS`` workers)."""
+    global _pool
+    if _pool is None:
+        default_workers = min(4, os.cpu_count() or 1)
+        _pool = ExtractionPool(int(os.getenv("FETCHER_EXTRACT_WORKERS", str(default_workers))))
+    return _pool
+
+
+__all__ = ["ExtractionPool", "extract_text", "get_extraction_pool"]
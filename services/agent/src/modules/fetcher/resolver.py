@@ -0,0 +1,215 @@
+"""Hostname resolution and address checks for ``WebFetcher``'s SSRF guard.
+
+``getaddrinfo`` does not report record TTLs, so successful lookups are cached
+for a fixed, short TTL and failures for a shorter one. Concurrent lookups of
+the same hostname share one resolver call. ``WebFetcher`` connects through
+``PinnedTransport``, which only ever opens sockets to addresses that passed the
+check, so a DNS answer that changes between the check and the request (DNS
+rebinding) cannot redirect it to an internal host. The URL keeps its hostname,
+so connection pooling, SNI and certificate checks stay per host.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import socket
+import time
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass
+
+import httpcore
+import httpx
+
+from core.observability.metrics import record_dns_lookup
+
+IPAddress = ipaddress.IPv4Address | ipaddress.IPv6Address
+IPNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+
+class AddressBlocklist:
+    """Precompiled membership test for a fixed set of IP networks.
+
+    Networks are grouped by IP version and prefix length, so a lookup is one
+    shift and one set probe per distinct prefix length instead of a scan over
+    every network.
+    """
+
+    def __init__(self, networks: Iterable[IPNetwork]) -> None:
+        self._prefixes: dict[int, dict[int, dict[int, IPNetwork]]] = {4: {}, 6: {}}
+        for network in networks:
+            by_prefix = self._prefixes[network.version].setdefault(network.prefixlen, {})
+            shift = network.max_prefixlen - network.prefixlen
+            by_prefix[int(network.network_address) >> shift] = network
+
+    def match(self, address: IPAddress) -> IPNetwork | None:
+        """Return the blocked network containing ``address``, if any."""
+        if isinstance(address, ipaddress.IPv6Address) and address.ipv4_mapped:
+            address = address.ipv4_mapped
+        value = int(address)
+        for prefixlen, networks in self._prefixes[address.version].items():
+            network = networks.get(value >> (address.max_prefixlen - prefixlen))
+            if network is not None:
+                return network
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class _Resolution:
+    expires_at: float  # time.monotonic() deadline
+    addresses: tuple[str, ...] = ()
+    error: str | None = None
+
+
+class CachingResolver:
+    """Async ``getaddrinfo`` with positive/negative caching and request coalescing."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 60.0,
+        negative_ttl_seconds: float = 10.0,
+        max_entries: int = 1024,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self._cache: dict[str, _Resolution] = {}
+        self._inflight: dict[str, asyncio.Task[tuple[str, ...]]] = {}
+
+    async def resolve(self, hostname: str) -> tuple[str, ...]:
+        """Return the addresses ``hostname`` resolves to.
+
+        Raises:
+            socket.gaierror: If resolution failed now or within the negative TTL.
+        """
+        key = hostname.lower()
+        cached = self._cache.get(key)
+        if cached is not None and cached.expires_at > time.monotonic():
+            if cached.error is not None:
+                record_dns_lookup("negative_hit")
+                raise socket.gaierror(cached.error)
+            record_dns_lookup("hit")
+            return cached.addresses
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._lookup(key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _lookup(self, hostname: str) -> tuple[str, ...]:
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            infos = await loop.getaddrinfo(
+                hostname, None, family=socket.AF_UNSPEC, type=socket.SOCK_STREAM
+            )
+        except socket.gaierror as exc:
+            record_dns_lookup("error", (time.perf_counter() - start) * 1000)
+            self._store(
+                hostname,
+                _Resolution(
+                    expires_at=time.monotonic() + self.negative_ttl_seconds, error=str(exc)
+                ),
+            )
+            raise
+        record_dns_lookup("miss", (time.perf_counter() - start) * 1000)
+        addresses = tuple(dict.fromkeys(str(info[4][0]) for info in infos))
+        self._store(
+            hostname,
+            _Resolution(expires_at=time.monotonic() + self.ttl_seconds, addresses=addresses),
+        )
+        return addresses
+
+    def _store(self, hostname: str, resolution: _Resolution) -> None:
+        self._cache.pop(hostname, None)
+        while self._cache and len(self._cache) >= self.max_entries:
+            # Dicts keep insertion order; drop the oldest resolution
+            del self._cache[next(iter(self._cache))]
+        self._cache[hostname] = resolution
+
+    def clear(self) -> None:
+        """Forget all cached resolutions."""
+        self._cache.clear()
+
+
+class PinnedNetworkBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that connects to validated addresses instead of resolving.
+
+    ``resolve`` maps a hostname to the addresses it may connect to (raising
+    ``ValueError`` if the host is blocked). They are tried in order, so a host
+    whose first record is unreachable, e.g. AAAA on an IPv4-only network,
+    falls back to the next one.
+    """
+
+    def __init__(
+        self,
+        resolve: Callable[[str], Awaitable[Sequence[str]]],
+        backend: httpcore.AsyncNetworkBackend | None = None,
+    ) -> None:
+        self._resolve = resolve
+        self._backend = backend or httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            addresses = await self._resolve(host)
+        except ValueError as exc:
+            raise httpcore.ConnectError(str(exc)) from exc
+        error: Exception = httpcore.ConnectError(f"No address to connect to for {host}")
+        for address in addresses:
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exc:
+                error = exc
+        raise error
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        raise httpcore.ConnectError("Unix sockets are not allowed for pinned connections")
+
+    async def sleep(self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+class PinnedTransport(httpx.AsyncHTTPTransport):
+    """``httpx`` transport whose connections go through ``PinnedNetworkBackend``."""
+
+    def __init__(
+        self,
+        resolve: Callable[[str], Awaitable[Sequence[str]]],
+        *,
+        limits: httpx.Limits | None = None,
+        backend: httpcore.AsyncNetworkBackend | None = None,
+    ) -> None:
+        limits = limits or httpx.Limits()
+        super().__init__(limits=limits)
+        # httpx does not expose the network backend, so the pool is rebuilt with it
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            network_backend=PinnedNetworkBackend(resolve, backend),
+        )
+
+
+__all__ = ["AddressBlocklist", "CachingResolver", "PinnedNetworkBackend", "PinnedTransport"]
@@ -1,4 +1,4 @@
 from .chunker import SemanticChunker
-from .ingestion import CodeIndexer
+from .ingestion import CodeIndexer, IndexRunStats
 
-__all__ = ["CodeIndexer", "SemanticChunker"]
+__all__ = ["CodeIndexer", "IndexRunStats", "SemanticChunker"]
@@ -3,6 +3,7 @@ Semantic chunking module using Chonkie library.
 Provides structure-aware chunking with content-type routing.
 """
 
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from chonkie import RecursiveChunker
@@ -18,16 +19,22 @@ class SemanticChunker:
 
     Note: Chonkie's chunker uses chunk_size in tokens (not characters) and does not support
     explicit chunk_overlap. Overlap can be simulated by merging chunks manually if needed.
+
+    Large documents can be streamed with ``iter_chunks``, which chunks one window of
+    ``window_chars`` characters at a time (cut at paragraph boundaries) so memory stays
+    bounded by the window rather than the document.
     """
 
-    def __init__(self, chunk_size: int = 1000) -> None:
+    def __init__(self, chunk_size: int = 1000, window_chars: int = 65536) -> None:
         """
         Initialize the SemanticChunker.
 
         Args:
             chunk_size: Maximum size of each chunk in tokens
+            window_chars: Characters chunked at a time by ``iter_chunks``
         """
         self.chunk_size = chunk_size
+        self.window_chars = window_chars
 
         # Initialize splitters for different content types
         # Markdown recipe handles headings and structure automatically
@@ -92,3 +99,69 @@ class SemanticChunker:
             List of chunks with metadata
         """
         return self.split_text(content, document_type, section_title)
+
+    def iter_chunks(
+        self,
+        source: str | Iterable[str],
+        document_type: str = "prose",
+        section_title: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Lazily split a document into chunks, one window at a time.
+
+        Documents that fit in a single window are chunked exactly like ``split_text``.
+        Longer documents are cut at the last paragraph break (or line break) before
+        ``window_chars``; their chunks carry a running ``chunk_index`` but no
+        ``total_chunks``, which is unknown until the stream ends.
+
+        Args:
+            source: The full text, or an iterable of text pieces (e.g. a file read in blocks)
+            document_type: Type of document ('markdown' or 'prose')
+            section_title: Optional section title to include in metadata
+
+        Yields:
+            Chunks with the same shape as ``split_text`` results
+        """
+        windows = self._windows(source)
+        window = next(windows, None)
+        streamed = False
+        index = 0
+        while window is not None:
+            following = next(windows, None)
+            streamed = streamed or following is not None
+            for chunk in self.split_text(window, document_type=document_type):
+                chunk_metadata = chunk.setdefault("metadata", {})
+                chunk_metadata["chunk_index"] = index
+                if streamed:
+                    chunk_metadata.pop("total_chunks", None)
+                if section_title:
+                    chunk_metadata["section_title"] = section_title
+                index += 1
+                yield chunk
+            window = following
+
+    def _windows(self, source: str | Iterable[str]) -> Iterator[str]:
+        """Regroup text pieces into windows of at most ``window_chars`` characters."""
+        if isinstance(source, str):
+            if len(source) <= self.window_chars:
+                yield source
+                return
+            source = [source]
+
+        buffer = ""
+        for piece in source:
+            buffer = buffer + piece if buffer else piece
+            start = 0
+            while len(buffer) - start > self.window_chars:
+                end = start + self.window_chars
+                cut = buffer.rfind("\n\n", start, end)
+                if cut <= start:
+                    cut = buffer.rfind("\n", start, end)
+                if cut <= start:
+                    cut = end
+                window, start = buffer[start:cut], cut
+                if window.strip():
+                    yield window
+            buffer = buffer[start:]
+        if buffer.strip():
+            yield buffer
@@ -1,6 +1,10 @@
+import asyncio
 import hashlib
+import json
 import logging
 import os
+import time
+from dataclasses import dataclass
 from pathlib import Path
 
 import pathspec
@@ -8,10 +12,33 @@ from qdrant_client import AsyncQdrantClient
 from qdrant_client.http import models
 
 from core.protocols import IEmbedder
+from core.utils.vector_storage import VectorStorageProfile, build_point_vectors
 from modules.indexer.code_splitter import CodeSplitter
 
 logger = logging.getLogger(__name__)
 
+MANIFEST_DIR = Path(os.getenv("CODE_INDEX_MANIFEST_DIR", "data/code_index"))
+INDEXED_SUFFIXES = (".py", ".md", ".txt", ".yml", ".yaml", ".json", ".toml")
+
+
+@dataclass
+class IndexRunStats:
+    """Throughput summary of one ``scan_and_index`` run."""
+
+    files_scanned: int = 0
+    files_failed: int = 0
+    files_deleted: int = 0
+    chunks_indexed: int = 0
+    duration_s: float = 0.0
+
+    @property
+    def files_per_sec(self) -> float:
+        return self.files_scanned / self.duration_s if self.duration_s > 0 else 0.0
+
+    @property
+    def chunks_per_sec(self) -> float:
+        return self.chunks_indexed / self.duration_s if self.duration_s > 0 else 0.0
+
 
 class CodeIndexer:
     def __init__(
@@ -21,12 +48,125 @@ class CodeIndexer:
         qdrant_url: str = "http://qdrant:6333",
         collection_name: str = "agent-memories",
         qdrant_api_key: str | None = None,
+        *,
+        concurrency: int = 8,
+        manifest_path: Path | None = None,
+        hybrid: bool = False,
+        storage_profile: VectorStorageProfile | None = None,
     ):
         self.root_path = root_path
         self.client = AsyncQdrantClient(url=qdrant_url, api_key=qdrant_api_key)
         self.collection_name = collection_name
         self.embedder = embedder
         self.splitter = CodeSplitter()
+        self.concurrency = max(1, concurrency)
+        # Also write lexical sparse vectors (exact identifier matches in hybrid retrieval)
+        self.hybrid = hybrid
+        # Matryoshka truncation must match the collection's storage profile
+        self.storage_profile = storage_profile
+        # Local manifest (path -> mtime, size, hash) lets unchanged files skip Qdrant entirely.
+        # It lives in the service data dir, never inside the indexed tree.
+        self.manifest_path = manifest_path or self.default_manifest_path(root_path, collection_name)
+        self._manifest: dict[str, dict[str, float | int | str]] | None = None
+        # Codebase point count the manifest was written against
+        self._manifest_points: int | None = None
+        self._manifest_dirty = False
+        self._chunks_indexed = 0
+        self.last_run_stats: IndexRunStats | None = None
+
+    @staticmethod
+    def default_manifest_path(root_path: Path, collection_name: str) -> Path:
+        """Manifest location for an indexed tree, keyed by root path and collection."""
+        key = f"{root_path.resolve()}\0{collection_name}"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        return MANIFEST_DIR / f"{collection_name}-{digest}.json"
+
+    def _load_manifest(self) -> dict[str, dict[str, float | int | str]]:
+        if self._manifest is not None:
+            return self._manifest
+        self._manifest = {}
+        if self.manifest_path.exists():
+            try:
+                with open(self.manifest_path, encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("collection") == self.collection_name:
+                    self._manifest = data.get("files", {})
+                    self._manifest_points = data.get("points")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable index manifest {self.manifest_path}: {e}")
+        return self._manifest
+
+    def save_manifest(self) -> None:
+        """Persist the manifest if it changed since it was loaded."""
+        if self._manifest is None or not self._manifest_dirty:
+            return
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "collection": self.collection_name,
+                    "root": str(self.root_path),
+                    "points": self._manifest_points,
+                    "files": self._manifest,
+                },
+                f,
+            )
+        os.replace(tmp_path, self.manifest_path)
+        self._manifest_dirty = False
+
+    def _record_manifest(self, file_path: Path, stat: os.stat_result, content_hash: str) -> None:
+        self._load_manifest()[str(file_path)] = {
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "hash": content_hash,
+        }
+        self._manifest_dirty = True
+
+    async def _count_codebase_points(self) -> int | None:
+        """Number of codebase chunks in the collection, or None if it cannot be read."""
+        try:
+            result = await self.client.count(
+                collection_name=self.collection_name,
+                count_filter=models.Filter(
+                    must=[
+                        models.FieldCondition(
+                            key="source", match=models.MatchValue(value="codebase")
+                        )
+                    ]
+                ),
+                exact=True,
+            )
+        except Exception as e:
+            logger.warning(f"Could not count points in {self.collection_name}: {e}")
+            return None
+        return result.count
+
+    async def _validate_manifest(self) -> None:
+        """Drop the manifest if the collection no longer holds what it describes.
+
+        A manifest hit skips Qdrant entirely, so after the collection is dropped,
+        recreated or partially wiped, every file would be skipped forever.
+        """
+        manifest = self._load_manifest()
+        if not manifest:
+            return
+        points = await self._count_codebase_points()
+        if points and points == self._manifest_points:
+            return
+        logger.info(
+            f"Discarding index manifest {self.manifest_path}: collection has "
+            f"{points} codebase points, manifest expects {self._manifest_points}"
+        )
+        manifest.clear()
+        self._manifest_points = None
+        self._manifest_dirty = True
+
+    @staticmethod
+    def _read_file(file_path: Path) -> tuple[os.stat_result, str]:
+        stat = file_path.stat()
+        with open(file_path, encoding="utf-8") as f:
+            return stat, f.read()
 
     def _get_gitignore_spec(self) -> pathspec.PathSpec | None:
         gitignore_path = self.root_path / ".gitignore"
@@ -91,10 +231,27 @@ class CodeIndexer:
         )
 
     async def index_file(self, file_path: Path) -> None:
+        manifest = self._load_manifest()
+        entry = manifest.get(str(file_path))
+
+        # Fast path: unchanged mtime and size means unchanged file, no I/O needed
+        if entry is not None:
+            cached_stat: os.stat_result | None
+            try:
+                cached_stat = file_path.stat()
+            except OSError:
+                cached_stat = None
+            if (
+                cached_stat is not None
+                and entry.get("mtime") == cached_stat.st_mtime
+                and entry.get("size") == cached_stat.st_size
+            ):
+                logger.debug(f"Skipping unchanged file (manifest): {file_path}")
+                return
+
         try:
-            # Read Content
-            with open(file_path, encoding="utf-8") as f:
-                content = f.read()
+            # Read Content (off the event loop so workers overlap on I/O)
+            stat, content = await asyncio.to_thread(self._read_file, file_path)
         except UnicodeDecodeError:
             logger.warning(f"Skipping binary or non-utf8 file: {file_path}")
             return
@@ -104,9 +261,15 @@ class CodeIndexer:
 
         content_hash = self._calculate_hash(content)
 
-        # Check if update needed
-        if not await self._file_needs_update(file_path, content_hash):
+        # Check if update needed. A manifest entry is authoritative; only files the
+        # manifest has never seen need the Qdrant round-trip.
+        if entry is not None:
+            needs_update = entry.get("hash") != content_hash
+        else:
+            needs_update = await self._file_needs_update(file_path, content_hash)
+        if not needs_update:
             logger.debug(f"Skipping unchanged file: {file_path}")
+            self._record_manifest(file_path, stat, content_hash)
             return
 
         logger.info(f"Indexing changed file: {file_path}")
@@ -117,6 +280,7 @@ class CodeIndexer:
         # Split
         chunks = self.splitter.split_file(file_path, content)
         if not chunks:
+            self._record_manifest(file_path, stat, content_hash)
             return
 
         # Embed
@@ -124,8 +288,16 @@ class CodeIndexer:
         vectors = await self.embedder.embed(texts)
 
         # Prepare Points
+        point_vectors = await build_point_vectors(
+            self.client,
+            self.collection_name,
+            texts,
+            vectors,
+            hybrid=self.hybrid,
+            profile=self.storage_profile,
+        )
         points = []
-        for i, (chunk, vector) in enumerate(zip(chunks, vectors, strict=True)):
+        for i, (chunk, vector) in enumerate(zip(chunks, point_vectors, strict=True)):
             # Add extra metadata
             payload = chunk
             payload["file_hash"] = content_hash
@@ -151,9 +323,81 @@ class CodeIndexer:
                 points=points,
             )
             logger.info(f"Indexed {len(points)} chunks for {file_path}")
+            self._chunks_indexed += len(points)
+
+        self._record_manifest(file_path, stat, content_hash)
+
+    async def _purge_deleted(self, seen: set[str]) -> int:
+        """Delete chunks of manifest files that no longer exist, in one filter delete."""
+        manifest = self._load_manifest()
+        deleted = [path for path in manifest if path not in seen]
+        if not deleted:
+            return 0
+        await self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=models.FilterSelector(
+                filter=models.Filter(
+                    must=[
+                        models.FieldCondition(
+                            key="filepath",
+                            match=models.MatchAny(any=deleted),
+                        )
+                    ]
+                )
+            ),
+        )
+        for path in deleted:
+            del manifest[path]
+        self._manifest_dirty = True
+        logger.info(f"Purged chunks for {len(deleted)} deleted files")
+        return len(deleted)
 
     async def scan_and_index(self) -> None:
+        start = time.perf_counter()
+        await self._validate_manifest()
+        chunks_before = self._chunks_indexed
+        stats = IndexRunStats()
+        files = self._collect_files()
+        stats.files_scanned = len(files)
+
+        # Bounded worker pool: read, hash, split, embed and upsert run concurrently,
+        # and concurrent embed calls are coalesced by the shared embedding scheduler.
+        queue: asyncio.Queue[Path] = asyncio.Queue()
+        for file_path in files:
+            queue.put_nowait(file_path)
+
+        async def worker() -> None:
+            while True:
+                try:
+                    file_path = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    await self.index_file(file_path)
+                except Exception as e:
+                    stats.files_failed += 1
+                    logger.error(f"Failed to index {file_path}: {e}")
+
+        await asyncio.gather(*(worker() for _ in range(min(self.concurrency, len(files) or 1))))
+
+        stats.files_deleted = await self._purge_deleted({str(f) for f in files})
+        if self._manifest_dirty:
+            self._manifest_points = await self._count_codebase_points()
+        await asyncio.to_thread(self.save_manifest)
+
+        stats.chunks_indexed = self._chunks_indexed - chunks_before
+        stats.duration_s = time.perf_counter() - start
+        self.last_run_stats = stats
+        logger.info(
+            f"Indexed {stats.files_scanned} files ({stats.chunks_indexed} chunks, "
+            f"{stats.files_failed} failed, {stats.files_deleted} deleted) in "
+            f"{stats.duration_s:.1f}s: {stats.files_per_sec:.1f} files/s, "
+            f"{stats.chunks_per_sec:.1f} chunks/s"
+        )
+
+    def _collect_files(self) -> list[Path]:
         spec = self._get_gitignore_spec()
+        collected: list[Path] = []
 
         # Always exclude .git, .venv, __pycache__
         # If no gitignore, we should ideally have some defaults
@@ -180,19 +424,13 @@ class CodeIndexer:
                 if spec and spec.match_file(rel_path):
                     continue
 
-                if file_path.suffix not in (
-                    ".py",
-                    ".md",
-                    ".txt",
-                    ".yml",
-                    ".yaml",
-                    ".json",
-                    ".toml",
-                ):
+                if file_path.suffix not in INDEXED_SUFFIXES:
                     # Limit to text files we care about for now
                     continue
 
-                await self.index_file(file_path)
+                collected.append(file_path)
+
+        return collected
 
     async def close(self) -> None:
         """Close the Qdrant client connection if initialized."""
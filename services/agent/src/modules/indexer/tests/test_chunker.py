@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -411,3 +412,57 @@ class TestChonkieIntegration:
             assert result[0]["text"].text == "chunk1"
             assert result[1]["text"].text == "chunk2"
             assert result[2]["text"].text == "chunk3"
+
+
+class TestStreamingChunks:
+    """Tests for window-at-a-time chunking of large documents."""
+
+    @patch("modules.indexer.chunker.RecursiveChunker")
+    def test_short_document_matches_split_text(self, mock_recursive_chunker: MagicMock) -> None:
+        """Test that a document within one window is chunked like split_text."""
+        mock_splitter = MagicMock()
+        mock_splitter.chunk.side_effect = lambda text: [text[:5], text[5:]]
+        mock_recursive_chunker.return_value = mock_splitter
+
+        chunker_obj = SemanticChunker(chunk_size=256, window_chars=100)
+
+        assert list(chunker_obj.iter_chunks("short text")) == chunker_obj.split_text("short text")
+
+    @patch("modules.indexer.chunker.RecursiveChunker")
+    def test_long_document_cut_at_paragraphs(self, mock_recursive_chunker: MagicMock) -> None:
+        """Test that long documents are chunked one paragraph-aligned window at a time."""
+        mock_splitter = MagicMock()
+        mock_splitter.chunk.side_effect = lambda text: [text]
+        mock_recursive_chunker.return_value = mock_splitter
+        text = "first paragraph\n\nsecond paragraph\n\nthird"
+
+        chunker_obj = SemanticChunker(chunk_size=256, window_chars=20)
+        result = list(chunker_obj.iter_chunks(text, section_title="Intro"))
+
+        assert "".join(chunk["text"] for chunk in result) == text
+        assert result[0]["text"] == "first paragraph"
+        assert all(len(chunk["text"]) <= 20 for chunk in result)
+        assert [chunk["metadata"]["chunk_index"] for chunk in result] == [0, 1, 2]
+        assert all("total_chunks" not in chunk["metadata"] for chunk in result)
+        assert all(chunk["metadata"]["section_title"] == "Intro" for chunk in result)
+
+    @patch("modules.indexer.chunker.RecursiveChunker")
+    def test_iterable_source_is_consumed_lazily(self, mock_recursive_chunker: MagicMock) -> None:
+        """Test that text pieces are pulled only as windows are needed."""
+        mock_splitter = MagicMock()
+        mock_splitter.chunk.side_effect = lambda text: [text]
+        mock_recursive_chunker.return_value = mock_splitter
+        pulled: list[int] = []
+
+        def pieces() -> Iterator[str]:
+            for i in range(100):
+                pulled.append(i)
+                yield f"line {i}\n"
+
+        chunker_obj = SemanticChunker(chunk_size=256, window_chars=32)
+        stream = chunker_obj.iter_chunks(pieces())
+        first = next(stream)
+
+        assert first["text"].startswith("line 0")
+        assert len(pulled) < 10
+        assert sum(1 for _ in stream) > 10
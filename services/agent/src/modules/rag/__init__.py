@@ -1,4 +1,8 @@
+import asyncio
 import logging
+import uuid
+from collections.abc import Iterable
+from itertools import islice
 from typing import Any
 
 import numpy as np
@@ -6,6 +10,14 @@ from qdrant_client import AsyncQdrantClient
 from qdrant_client.http import models
 
 from core.protocols import IEmbedder
+from core.utils.sparse import DENSE_VECTOR_NAME, SPARSE_VECTOR_NAME, encode_query
+from core.utils.vector_storage import (
+    VectorStorageProfile,
+    build_point_vectors,
+    fit_vector,
+    lookup_schema,
+)
+from modules.rag.mmr import mmr_select
 
 from ..indexer import SemanticChunker
 
@@ -13,7 +25,22 @@ logger = logging.getLogger(__name__)
 
 
 class RAGManager:
-    """RAG Manager with dependency injection for embedder."""
+    """RAG Manager with dependency injection for embedder.
+
+    With ``hybrid=True`` ingested chunks also carry a local BM25-style sparse
+    vector, and retrieval fuses dense and sparse candidates server-side
+    (Qdrant prefetch + RRF) before re-scoring them by dense similarity. This
+    catches exact matches on code identifiers and work item IDs that dense
+    search alone ranks poorly. Collections without the sparse vector fall
+    back to dense-only search.
+
+    ``storage_profile`` supplies the quantization search parameters; query
+    vectors are truncated to each collection's stored dense size.
+
+    Ingestion streams chunks through bounded chunk -> embed -> upsert stages of
+    ``ingest_batch_size`` chunks, with at most ``max_pending_batches`` waiting
+    between stages, so memory follows the batch size rather than the document.
+    """
 
     def __init__(
         self,
@@ -24,11 +51,19 @@ class RAGManager:
         mmr_lambda: float = 0.7,
         qdrant_api_key: str | None = None,
         chunker: SemanticChunker | None = None,
+        hybrid: bool = False,
+        storage_profile: VectorStorageProfile | None = None,
+        ingest_batch_size: int = 64,
+        max_pending_batches: int = 2,
     ) -> None:
         # Configuration
         self.qdrant_url = qdrant_url
         self.top_k = top_k
         self.mmr_lambda = mmr_lambda
+        self.hybrid = hybrid
+        self.storage_profile = storage_profile or VectorStorageProfile()
+        self.ingest_batch_size = ingest_batch_size
+        self.max_pending_batches = max_pending_batches
         self.collection_name = collection_name
         self._qdrant_api_key = qdrant_api_key
 
@@ -57,33 +92,7 @@ class RAGManager:
     def _mmr(
         self, query_vec: np.ndarray, doc_vecs: list[np.ndarray], k: int, lam: float
     ) -> list[int]:
-        if not doc_vecs:
-            return []
-        sims = [self._cosine(query_vec, v) for v in doc_vecs]
-        selected: list[int] = []
-        candidates = set(range(len(doc_vecs)))
-        while candidates and len(selected) < k:
-            if not selected:
-                i = int(np.argmax(sims))
-                selected.append(i)
-                candidates.remove(i)
-                continue
-
-            best_i = None
-            best_score = float("-inf")
-            for i in list(candidates):
-                redundancy = max(self._cosine(doc_vecs[i], doc_vecs[j]) for j in selected)
-                diversity = 1.0 - redundancy
-                score = (1.0 - lam) * sims[i] + lam * diversity
-                if score > best_score:
-                    best_score = score
-                    best_i = i
-
-            if best_i is None:
-                break
-            selected.append(best_i)
-            candidates.remove(best_i)
-        return selected
+        return mmr_select(query_vec, doc_vecs, k, lam)
 
     async def retrieve(
         self,
@@ -98,7 +107,12 @@ class RAGManager:
             vecs = await self.embedder.embed([query])
             if not vecs:
                 return []
-            qvec = np.array(vecs[0], dtype=np.float32)
+            schema = await lookup_schema(
+                self.client, target_collection, hybrid=self.hybrid, profile=self.storage_profile
+            )
+            qvec = np.array(
+                fit_vector(vecs[0], schema.vector_size if schema else None), dtype=np.float32
+            )
 
             query_filter = None
             if filters:
@@ -109,15 +123,48 @@ class RAGManager:
                     )
                 query_filter = models.Filter(must=conditions)
 
-            # Helper to search
+            # Over-fetch for dedup and MMR; vectors are only transferred when MMR
+            # will actually re-rank (they dominate the response size).
+            limit = max(k * 3, k)
+            use_mmr = self.mmr_lambda > 0 and k > 1
+            hybrid = self.hybrid and schema is not None and schema.has_sparse
+            sparse_query = encode_query(query) if hybrid else None
+            search_params = self.storage_profile.search_params()
+
+            prefetch: models.Prefetch | None = None
+            if sparse_query is not None:
+                # Fuse dense and lexical candidates (RRF), then score the fused
+                # pool by dense similarity so scores stay comparable to dense mode.
+                prefetch = models.Prefetch(
+                    prefetch=[
+                        models.Prefetch(
+                            query=qvec.tolist(),
+                            filter=query_filter,
+                            params=search_params,
+                            limit=limit,
+                        ),
+                        models.Prefetch(
+                            query=sparse_query,
+                            using=SPARSE_VECTOR_NAME,
+                            filter=query_filter,
+                            limit=limit,
+                        ),
+                    ],
+                    query=models.FusionQuery(fusion=models.Fusion.RRF),
+                    limit=limit,
+                )
+
             # 'search' is deprecated/removed in newer clients, use 'query_points'
             res = await self.client.query_points(
                 collection_name=target_collection,
+                prefetch=prefetch,
                 query=qvec.tolist(),
                 query_filter=query_filter,
-                limit=max(k * 3, k),
+                search_params=search_params,
+                limit=limit,
                 with_payload=True,
-                with_vectors=True,
+                # Only the dense vector feeds MMR; skip the sparse one in hybrid collections
+                with_vectors=([DENSE_VECTOR_NAME] if hybrid else True) if use_mmr else False,
             )
 
             docs: list[dict[str, Any]] = []
@@ -128,9 +175,12 @@ class RAGManager:
                 # Support 'url' (web), 'filepath' (code), and 'uri' (wiki/generic)
                 uri = payload.get("url") or payload.get("filepath") or payload.get("uri")
                 text = payload.get("text")
-                vec = p.vector
+                vec: Any = p.vector
+                if isinstance(vec, dict):
+                    # Collections with a sparse vector return named vectors
+                    vec = vec.get(DENSE_VECTOR_NAME)
 
-                if not uri or not text or vec is None:
+                if not uri or not text or (use_mmr and vec is None):
                     continue
 
                 # Reconstruct doc object
@@ -147,21 +197,26 @@ class RAGManager:
                 }
 
                 docs.append(doc_info)
-                dvecs.append(np.array(vec, dtype=np.float32))
+                if use_mmr:
+                    dvecs.append(np.array(vec, dtype=np.float32))
 
             if not docs:
                 return []
 
             # Dedup by URI (filepath or url)
             seen = set()
-            uniq_docs = []
-            uniq_vecs = []
-            for d, v in zip(docs, dvecs, strict=False):
+            uniq_idx = []
+            for i, d in enumerate(docs):
                 if d["uri"] in seen:
                     continue
                 seen.add(d["uri"])
-                uniq_docs.append(d)
-                uniq_vecs.append(v)
+                uniq_idx.append(i)
+            uniq_docs = [docs[i] for i in uniq_idx]
+
+            if not use_mmr:
+                # Points arrive ordered by score, which is what MMR with lam=0 returns
+                return uniq_docs[:k]
+            uniq_vecs = [dvecs[i] for i in uniq_idx]
 
             # MMR
             valid_k = min(k, len(uniq_docs))
@@ -174,7 +229,7 @@ class RAGManager:
 
     async def ingest_document(
         self,
-        content: str,
+        content: str | Iterable[str],
         metadata: dict[str, Any],
         chunker: SemanticChunker | None = None,
         document_type: str = "prose",
@@ -182,14 +237,18 @@ class RAGManager:
         """
         Ingest a document into Qdrant using semantic chunking.
 
+        Chunking runs lazily in a worker thread and feeds bounded embed and upsert
+        batches, so the first points land in Qdrant before chunking finishes and a
+        slow stage applies backpressure to the ones before it.
+
         Args:
-            content: The document content to ingest
+            content: The document content, or an iterable of text pieces for large documents
             metadata: Document metadata (uri, name, etc.)
             chunker: Optional SemanticChunker instance (defaults to self.chunker)
             document_type: Type of document ('markdown' or 'prose') for content-type routing
 
         Returns:
-            Number of chunks ingested
+            Number of chunks ingested (batches upserted before a failure still count)
         """
         if not content:
             return 0
@@ -197,63 +256,97 @@ class RAGManager:
         # Use provided chunker or instance default
         active_chunker = chunker or self.chunker
 
-        # Semantic chunking with metadata preservation
-        chunks_with_metadata = active_chunker.split_text(content, document_type=document_type)
-
-        if not chunks_with_metadata:
-            return 0
-
-        # Extract just the text chunks for embedding
-        chunk_texts = [c["text"] for c in chunks_with_metadata]
+        # Semantic chunking with metadata preservation, one window at a time
+        chunks = active_chunker.iter_chunks(content, document_type=document_type)
+        chunked: asyncio.Queue[list[dict[str, Any]] | None] = asyncio.Queue(
+            self.max_pending_batches
+        )
+        embedded: asyncio.Queue[list[models.PointStruct] | None] = asyncio.Queue(
+            self.max_pending_batches
+        )
+        ingested = 0
+
+        def next_batch() -> list[dict[str, Any]]:
+            return list(islice(chunks, self.ingest_batch_size))
+
+        async def chunk_stage() -> None:
+            while batch := await asyncio.to_thread(next_batch):
+                await chunked.put(batch)
+            await chunked.put(None)
+
+        async def embed_stage() -> None:
+            chunk_index = 0
+            while (batch := await chunked.get()) is not None:
+                points = await self._embed_batch(batch, metadata, chunk_index)
+                if not points:
+                    logger.warning("Embedder returned no embeddings")
+                    producer.cancel()
+                    break
+                chunk_index += len(batch)
+                await embedded.put(points)
+            await embedded.put(None)
+
+        async def upsert_stage() -> None:
+            nonlocal ingested
+            while (points := await embedded.get()) is not None:
+                await self.client.upsert(collection_name=self.collection_name, points=points)
+                ingested += len(points)
 
         try:
-            # Embed all chunks
-            embeddings = await self.embedder.embed(chunk_texts)
-            if not embeddings:
-                logger.warning("Embedder returned no embeddings")
-                return 0
-
-            points = []
-            import uuid
-
-            for i, (chunk_data, vector) in enumerate(
-                zip(chunks_with_metadata, embeddings, strict=False)
-            ):
-                point_id = str(uuid.uuid4())
-
-                # Build payload with chunk metadata preserved
-                payload = metadata.copy()
-                payload["text"] = chunk_data["text"]
-                payload["chunk_index"] = i
-
-                # Preserve semantic chunk metadata
-                chunk_metadata = chunk_data.get("metadata", {})
-                if "section_title" in chunk_metadata:
-                    payload["section_title"] = chunk_metadata["section_title"]
-                if "chunk_type" in chunk_metadata:
-                    payload["chunk_type"] = chunk_metadata["chunk_type"]
-                if "document_type" in chunk_metadata:
-                    payload["document_type"] = chunk_metadata["document_type"]
-
-                points.append(
-                    models.PointStruct(
-                        id=point_id,
-                        vector=vector,
-                        payload=payload,
-                    )
-                )
-
-            # Upsert to Qdrant
-            # Ensure Collection Exists (handled by caller or assumed known)
-
-            await self.client.upsert(collection_name=self.collection_name, points=points)
-
-            logger.info(f"Ingested {len(points)} chunks for doc {metadata.get('uri', 'unknown')}")
-            return len(points)
-
+            async with asyncio.TaskGroup() as tg:
+                producer = tg.create_task(chunk_stage())
+                tg.create_task(embed_stage())
+                tg.create_task(upsert_stage())
         except Exception:  # Intentional: catches embedder, chunker, and Qdrant errors
             logger.exception("Failed to ingest document")
-            return 0
+            return ingested
+
+        logger.info(f"Ingested {ingested} chunks for doc {metadata.get('uri', 'unknown')}")
+        return ingested
+
+    async def _embed_batch(
+        self, batch: list[dict[str, Any]], metadata: dict[str, Any], first_index: int
+    ) -> list[models.PointStruct]:
+        """Embed one batch of chunks and build its points."""
+        chunk_texts = [c["text"] for c in batch]
+        embeddings = await self.embedder.embed(chunk_texts)
+        if not embeddings:
+            return []
+
+        point_vectors = await build_point_vectors(
+            self.client,
+            self.collection_name,
+            chunk_texts,
+            embeddings,
+            hybrid=self.hybrid,
+            profile=self.storage_profile,
+        )
+        points = []
+        for i, (chunk_data, vector) in enumerate(
+            zip(batch, point_vectors, strict=False), start=first_index
+        ):
+            # Build payload with chunk metadata preserved
+            payload = metadata.copy()
+            payload["text"] = chunk_data["text"]
+            payload["chunk_index"] = i
+
+            # Preserve semantic chunk metadata
+            chunk_metadata = chunk_data.get("metadata", {})
+            if "section_title" in chunk_metadata:
+                payload["section_title"] = chunk_metadata["section_title"]
+            if "chunk_type" in chunk_metadata:
+                payload["chunk_type"] = chunk_metadata["chunk_type"]
+            if "document_type" in chunk_metadata:
+                payload["document_type"] = chunk_metadata["document_type"]
+
+            points.append(
+                models.PointStruct(
+                    id=str(uuid.uuid4()),
+                    vector=vector,
+                    payload=payload,
+                )
+            )
+        return points
 
     async def close(self) -> None:
         """Close the Qdrant client if it was initialized."""
@@ -0,0 +1,75 @@
+"""Matrix-based Maximal Marginal Relevance (MMR) selection.
+
+Candidates are normalised once and compared through a single
+candidate x candidate similarity matrix. Each selection step then updates a
+running max-redundancy vector instead of re-computing cosine similarity
+against every already-selected document, turning O(k*n^2) Python-level
+dot products into O(k) vectorised numpy operations.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+# Matches the epsilon used by RAGManager._cosine so scores (and ties) are unchanged.
+_EPS = 1e-9
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True) + _EPS
+    result: np.ndarray = matrix / norms
+    return result
+
+
+def mmr_select(
+    query_vec: np.ndarray,
+    doc_vecs: Sequence[np.ndarray] | np.ndarray,
+    k: int,
+    lam: float,
+) -> list[int]:
+    """Select up to ``k`` document indices by Maximal Marginal Relevance.
+
+    Args:
+        query_vec: Query embedding.
+        doc_vecs: Candidate embeddings (sequence of vectors or 2-D array).
+        k: Number of documents to select.
+        lam: Diversity weight. Score is ``(1 - lam) * relevance + lam * (1 - redundancy)``.
+
+    Returns:
+        Selected indices in selection order. Ties resolve to the lowest index.
+    """
+    n = len(doc_vecs)
+    if n == 0 or k <= 0:
+        return []
+
+    # float32 matches the precision RAGManager uses for query and point vectors
+    docs = np.asarray(doc_vecs, dtype=np.float32)
+    query = np.asarray(query_vec, dtype=np.float32)
+
+    unit_docs = _normalize_rows(docs)
+    unit_query = query / (np.linalg.norm(query) + _EPS)
+
+    relevance = (unit_docs @ unit_query).astype(np.float64)
+    similarity = (unit_docs @ unit_docs.T).astype(np.float64)
+
+    selected: list[int] = [int(np.argmax(relevance))]
+    available = np.ones(n, dtype=bool)
+    available[selected[0]] = False
+    max_redundancy = similarity[:, selected[0]].copy()
+
+    relevance_term = (1.0 - lam) * relevance
+    limit = min(k, n)
+    while len(selected) < limit:
+        scores = relevance_term + lam * (1.0 - max_redundancy)
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        available[best] = False
+        np.maximum(max_redundancy, similarity[:, best], out=max_redundancy)
+
+    return selected
+
+
+__all__ = ["mmr_select"]
@@ -14,8 +14,10 @@ from utils.template import substitute_variables
 from core.command_loader import get_registry_index
 from core.db.models import Context, Conversation, Message, Session
 from core.observability.debug_logger import DebugLogger
+from core.observability.profiler import profiled_iter
 from core.observability.tracing import current_trace_ids
-from core.routing.unified_orchestrator import UnifiedOrchestrator
+from core.routing.routing_cache import RoutingCache
+from core.routing.unified_orchestrator import OrchestrationResult, UnifiedOrchestrator
 from core.runtime.litellm_client import LiteLLMClient
 from core.runtime.routing import registry
 from core.runtime.service import AgentService
@@ -39,11 +41,27 @@ class DispatchResult:
     response: str | None = None  # The final agent response
 
 
+def _context_id(metadata: dict[str, Any] | None) -> uuid.UUID | None:
+    """Context of the request, as set by the adapter in the tool metadata."""
+    raw = (metadata or {}).get("context_id")
+    if not raw:
+        return None
+    try:
+        return uuid.UUID(str(raw))
+    except ValueError:
+        return None
+
+
 class Dispatcher:
-    def __init__(self, skill_registry: SkillRegistryProtocol, litellm: LiteLLMClient):
+    def __init__(
+        self,
+        skill_registry: SkillRegistryProtocol,
+        litellm: LiteLLMClient,
+        routing_cache: RoutingCache | None = None,
+    ):
         self._skill_registry = skill_registry
         self.litellm = litellm
-        self._unified_orchestrator = UnifiedOrchestrator(litellm)
+        self._unified_orchestrator = UnifiedOrchestrator(litellm, routing_cache=routing_cache)
 
     async def stream_message(
         self,
@@ -182,11 +200,39 @@ class Dispatcher:
 
         available_skills_text = get_registry_index()
 
-        result = await self._unified_orchestrator.process(
-            stripped_message,
-            history=chat_history,
-            available_skills_text=available_skills_text,
-        )
+        # Direct answers are forwarded token by token while the model generates;
+        # plans are buffered by the orchestrator and only arrive as the result
+        result: OrchestrationResult | None = None
+        answer_streamed = False
+        async for event in profiled_iter(
+            "orchestrator",
+            self._unified_orchestrator.process_stream(
+                stripped_message,
+                history=chat_history,
+                available_skills_text=available_skills_text,
+                context_id=_context_id(metadata),
+            ),
+        ):
+            if event["type"] == "token":
+                if not answer_streamed:
+                    answer_streamed = True
+                    yield {
+                        "type": "thinking",
+                        "content": "Direct answer (no tools needed)",
+                        "tool_call": None,
+                        "metadata": {"orchestration": "direct"},
+                    }
+                yield {
+                    "type": "content",
+                    "content": event["content"],
+                    "tool_call": None,
+                    "metadata": None,
+                }
+            elif event["type"] == "result":
+                result = event["result"]
+
+        if result is None:
+            result = OrchestrationResult(direct_answer="")
 
         if result.is_direct:
             # Direct answer - no plan needed
@@ -217,20 +263,21 @@ class Dispatcher:
                     conversation_id=conversation_id,
                 )
 
-            yield {
-                "type": "thinking",
-                "content": "Direct answer (no tools needed)",
-                "tool_call": None,
-                "metadata": {"orchestration": "direct"},
-            }
+            if not answer_streamed:
+                yield {
+                    "type": "thinking",
+                    "content": "Direct answer (no tools needed)",
+                    "tool_call": None,
+                    "metadata": {"orchestration": "direct"},
+                }
 
-            # Yield the direct answer as content
-            yield {
-                "type": "content",
-                "content": result.direct_answer,
-                "tool_call": None,
-                "metadata": None,
-            }
+                # Yield the direct answer as content
+                yield {
+                    "type": "content",
+                    "content": result.direct_answer,
+                    "tool_call": None,
+                    "metadata": None,
+                }
 
             # Persist to database
             if db_session:
@@ -398,7 +445,6 @@ class Dispatcher:
         try:
             # Stream events from AgentService
             async for chunk in agent_service.execute_stream(request, session=db_session):
-
                 # Normalize chunk to AgentChunk
                 # AgentService yields dicts that look like AgentChunks mostly
                 # We need to ensure types match what OpenWebUI adapter expects
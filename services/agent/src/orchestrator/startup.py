@@ -21,8 +21,14 @@ from core.providers import (
     set_rag_manager,
     set_token_manager,
 )
+from core.utils.vector_storage import VectorStorageProfile
 from modules.email.service import EmailConfig, ResendEmailService
-from modules.embedder import LiteLLMEmbedder
+from modules.embedder import (
+    CachedEmbedder,
+    EmbeddingDiskCache,
+    EmbeddingScheduler,
+    LiteLLMEmbedder,
+)
 from modules.fetcher import WebFetcher
 from modules.homey.scheduler import HomeyDeviceSyncScheduler
 from modules.indexer import CodeIndexer
@@ -46,8 +52,25 @@ async def register_providers(
 
     Returns the TokenManager instance (needed by app.py for OAuth routes).
     """
-    # 1. Embedder (LiteLLM proxy -> OpenRouter)
-    embedder = LiteLLMEmbedder(litellm_client)
+    # 1. Embedder (LiteLLM proxy -> OpenRouter), fronted by a content-addressed cache.
+    #    Cache misses from every ingestion path share one batching scheduler.
+    upstream_embedder = LiteLLMEmbedder(litellm_client)
+    scheduler = EmbeddingScheduler(
+        upstream_embedder,
+        model=upstream_embedder.model,
+        max_batch_size=settings.embedding_batch_size,
+        max_wait_ms=settings.embedding_batch_wait_ms,
+        max_in_flight=settings.embedding_max_in_flight,
+    )
+    disk_cache = (
+        EmbeddingDiskCache(settings.embedding_cache_path) if settings.embedding_cache_path else None
+    )
+    embedder = CachedEmbedder(
+        scheduler,
+        model=upstream_embedder.model,
+        max_entries=settings.embedding_cache_max_entries,
+        disk_cache=disk_cache,
+    )
     set_embedder(embedder)
 
     # 2. RAG manager with embedder and default SemanticChunker
@@ -56,6 +79,8 @@ async def register_providers(
         qdrant_url=str(settings.qdrant_url),
         collection_name=settings.qdrant_collection,
         qdrant_api_key=settings.qdrant_api_key,
+        hybrid=settings.rag_hybrid_search,
+        storage_profile=VectorStorageProfile.from_settings(settings),
     )
     set_rag_manager(rag_manager)
 
@@ -112,9 +112,13 @@ class PlanStep(BaseModel):
         default=None,
         description="Override provider identifier when the step reaches a remote LLM.",
     )
-    depends_on: list[str] = Field(
-        default_factory=list,
-        description="List of step IDs that must complete before this step can run.",
+    depends_on: list[str] | None = Field(
+        default=None,
+        description=(
+            "Step IDs that must complete before this step can run. When any step in a "
+            "plan declares it, ready steps run concurrently; steps that leave it unset "
+            "wait for every earlier step."
+        ),
     )
 
 
@@ -123,7 +127,9 @@ class Plan(BaseModel):
 
     steps: list[PlanStep] = Field(
         default_factory=list,
-        description="Ordered list of directives that the agent service consumes sequentially.",
+        description=(
+            "Ordered list of directives. Consumed sequentially unless steps declare depends_on."
+        ),
     )
     description: str | None = Field(
         default=None, description="Optional summary text produced by the planner."
@@ -4,10 +4,20 @@ from __future__ import annotations
 
 from datetime import datetime
 from pathlib import Path
+from typing import Any, cast
 
 import httpx
 import typer
+from qdrant_client import QdrantClient
+from qdrant_client.http import models as qm
 
+from core.utils.sparse import DENSE_VECTOR_NAME, SPARSE_VECTOR_NAME, encode_document
+from core.utils.vector_storage import (
+    QuantizationMode,
+    VectorStorageProfile,
+    dense_vector_size,
+    fit_vector,
+)
 from stack import compose, tooling
 
 app = typer.Typer(help="Qdrant schema, backup and restore helpers.")
@@ -17,6 +27,16 @@ def _repo_root() -> Path:
     return tooling.resolve_repo_root()
 
 
+def _profile(quantization: str, dimensions: int | None, on_disk: bool) -> VectorStorageProfile:
+    if quantization not in {"none", "int8", "binary"}:
+        raise typer.BadParameter("quantization must be none, int8 or binary")
+    return VectorStorageProfile(
+        quantization=cast(QuantizationMode, quantization),
+        dimensions=dimensions,
+        on_disk=on_disk,
+    )
+
+
 @app.command("ensure-schema")
 def ensure_schema(
     host: str = typer.Option("localhost", help="Qdrant host."),
@@ -27,6 +47,9 @@ def ensure_schema(
     recreate: bool = typer.Option(False, help="Drop the collection before ensuring schema."),
     hnsw_m: int = typer.Option(32, help="HNSW index M parameter (graph connectivity)."),
     hnsw_ef_construct: int = typer.Option(256, help="HNSW ef_construct (build quality)."),
+    quantization: str = typer.Option("none", help="Vector quantization (none, int8, binary)."),
+    dimensions: int | None = typer.Option(None, help="Matryoshka truncation (e.g. 1024, 512)."),
+    on_disk: bool = typer.Option(False, help="Keep original vectors on disk."),
 ) -> None:
     """Ensure the target Qdrant collection exists with the requested schema."""
 
@@ -48,16 +71,234 @@ def ensure_schema(
             exists = False
 
         if not exists:
-            payload = {
-                "vectors": {"size": size, "distance": distance_value},
-                "hnsw_config": {"m": hnsw_m, "ef_construct": hnsw_ef_construct},
-            }
+            profile = _profile(quantization, dimensions, on_disk)
+            payload = profile.collection_schema(size)
+            payload["vectors"]["distance"] = distance_value
+            payload["hnsw_config"] = {"m": hnsw_m, "ef_construct": hnsw_ef_construct}
             client.put(f"{base_url}/collections/{collection}", json=payload).raise_for_status()
         typer.echo(f"Collection '{collection}' is ensured at {host}:{port}.")
     finally:
         client.close()
 
 
+def _stored_profile(info: qm.CollectionInfo) -> VectorStorageProfile:
+    """The storage profile an existing collection was created with."""
+    vectors = info.config.params.vectors
+    if isinstance(vectors, dict):
+        vectors = vectors.get(DENSE_VECTOR_NAME)
+    quantization: QuantizationMode = "none"
+    if isinstance(info.config.quantization_config, qm.ScalarQuantization):
+        quantization = "int8"
+    elif isinstance(info.config.quantization_config, qm.BinaryQuantization):
+        quantization = "binary"
+    on_disk = isinstance(vectors, qm.VectorParams) and bool(vectors.on_disk)
+    return VectorStorageProfile(quantization=quantization, on_disk=on_disk)
+
+
+def _restore_payload_indexes(
+    client: QdrantClient, collection: str, payload_schema: dict[str, qm.PayloadIndexInfo]
+) -> None:
+    """Re-create the payload indexes filtered searches on the collection rely on."""
+    for field, index in payload_schema.items():
+        client.create_payload_index(
+            collection, field_name=field, field_schema=index.params or index.data_type, wait=True
+        )
+
+
+def _split_vector(vector: Any) -> tuple[list[float], Any]:
+    """Return the dense and (possibly missing) sparse vector of a scrolled point."""
+    if isinstance(vector, dict):
+        return list(vector[DENSE_VECTOR_NAME]), vector.get(SPARSE_VECTOR_NAME)
+    return list(vector), None
+
+
+def _copy_points(
+    client: QdrantClient, source: str, target: str, *, size: int, batch_size: int
+) -> int:
+    """Copy all points, truncating dense vectors and backfilling missing sparse vectors."""
+    copied = 0
+    offset: Any = None
+    while True:
+        records, offset = client.scroll(
+            source, limit=batch_size, offset=offset, with_payload=True, with_vectors=True
+        )
+        points = []
+        for record in records:
+            dense, sparse = _split_vector(record.vector)
+            if sparse is None:
+                sparse = encode_document(str((record.payload or {}).get("text", "")))
+            points.append(
+                qm.PointStruct(
+                    id=record.id,
+                    vector={DENSE_VECTOR_NAME: fit_vector(dense, size), SPARSE_VECTOR_NAME: sparse},
+                    payload=record.payload,
+                )
+            )
+        if points:
+            client.upsert(target, points=points, wait=True)
+            copied += len(points)
+        if offset is None:
+            return copied
+
+
+def recall_at_k(expected: list[Any], actual: list[Any], k: int) -> float:
+    """Fraction of the exact top-k neighbours that the candidate search also returned."""
+    truth = set(expected[:k])
+    if not truth:
+        return 1.0
+    return len(truth & set(actual[:k])) / len(truth)
+
+
+def _measure_recall(
+    client: QdrantClient,
+    source: str,
+    target: str,
+    profile: VectorStorageProfile,
+    *,
+    size: int,
+    samples: int,
+    k: int,
+) -> float:
+    """Mean recall@k of the migrated collection against exact search on the source.
+
+    Stored points are used as queries; each point's own id is excluded.
+    """
+    records, _ = client.scroll(source, limit=samples, with_payload=False, with_vectors=True)
+    scores = []
+    for record in records:
+        dense, _sparse = _split_vector(record.vector)
+        exact = client.query_points(
+            source, query=dense, limit=k + 1, search_params=qm.SearchParams(exact=True)
+        ).points
+        approx = client.query_points(
+            target,
+            query=fit_vector(dense, size),
+            limit=k + 1,
+            search_params=profile.search_params(),
+        ).points
+        scores.append(
+            recall_at_k(
+                [p.id for p in exact if p.id != record.id],
+                [p.id for p in approx if p.id != record.id],
+                k,
+            )
+        )
+    return sum(scores) / len(scores) if scores else 1.0
+
+
+def _hnsw_config(info: qm.CollectionInfo) -> qm.HnswConfigDiff:
+    return qm.HnswConfigDiff(
+        m=info.config.hnsw_config.m, ef_construct=info.config.hnsw_config.ef_construct
+    )
+
+
+def _cut_over(client: QdrantClient, collection: str, staging: str, *, batch_size: int) -> None:
+    """Re-create ``collection`` from the staging copy.
+
+    The staging collection already carries the new profile, the HNSW settings
+    and the payload indexes, so this step needs nothing from the original and
+    can be re-run after a partial failure.
+    """
+    info = client.get_collection(staging)
+    size = dense_vector_size(info.config.params.vectors)
+    if size is None:
+        raise typer.BadParameter(f"Collection '{staging}' has no unnamed dense vector")
+    if client.collection_exists(collection):
+        client.delete_collection(collection)
+    client.create_collection(
+        collection, hnsw_config=_hnsw_config(info), **_stored_profile(info).collection_config(size)
+    )
+    _restore_payload_indexes(client, collection, info.payload_schema)
+    _copy_points(client, staging, collection, size=size, batch_size=batch_size)
+
+
+@app.command("migrate-profile")
+def migrate_profile(
+    collection: str = typer.Argument(..., help="Collection to re-create."),
+    host: str = typer.Option("localhost", help="Qdrant host."),
+    port: int = typer.Option(6333, help="Qdrant HTTP port."),
+    api_key: str | None = typer.Option(None, envvar="QDRANT_API_KEY", help="Qdrant API key."),
+    quantization: str = typer.Option("int8", help="Vector quantization (none, int8, binary)."),
+    dimensions: int | None = typer.Option(None, help="Matryoshka truncation (e.g. 1024, 512)."),
+    on_disk: bool = typer.Option(True, help="Keep original vectors on disk."),
+    samples: int = typer.Option(50, help="Stored points used as recall queries."),
+    k: int = typer.Option(10, help="Neighbours compared per recall query."),
+    min_recall: float = typer.Option(0.95, help="Abort when recall@k drops below this."),
+    force: bool = typer.Option(False, help="Migrate even when recall is below --min-recall."),
+    batch_size: int = typer.Option(256, help="Points copied per request."),
+    resume: bool = typer.Option(
+        False, help="Finish an interrupted cut-over from the existing staging collection."
+    ),
+) -> None:
+    """Re-create a collection under a new vector storage profile.
+
+    Points are copied into a staging collection with the new profile (dense
+    vectors truncated, missing sparse vectors backfilled from the payload
+    text, payload indexes restored), recall@k is measured against exact search
+    on the original, and only then is the original dropped, re-created and
+    refilled from the staging copy. If the cut-over fails, the staging
+    collection is kept and ``--resume`` finishes the migration from it.
+    """
+
+    staging = f"{collection}__migrate"
+    client = QdrantClient(url=f"http://{host}:{port}", api_key=api_key, timeout=60)
+    try:
+        if resume:
+            if not client.collection_exists(staging):
+                raise typer.BadParameter(f"No staging collection '{staging}' to resume from")
+            summary = f"Collection '{collection}' restored from '{staging}'."
+        else:
+            profile = _profile(quantization, dimensions, on_disk)
+            if not client.collection_exists(collection):
+                raise typer.BadParameter(f"Collection '{collection}' does not exist")
+            info = client.get_collection(collection)
+            full_size = dense_vector_size(info.config.params.vectors)
+            if full_size is None:
+                raise typer.BadParameter(f"Collection '{collection}' has no unnamed dense vector")
+            size = profile.vector_size(full_size)
+
+            if client.collection_exists(staging):
+                client.delete_collection(staging)
+            client.create_collection(
+                staging, hnsw_config=_hnsw_config(info), **profile.collection_config(full_size)
+            )
+            _restore_payload_indexes(client, staging, info.payload_schema)
+            copied = _copy_points(client, collection, staging, size=size, batch_size=batch_size)
+            typer.echo(f"Copied {copied} points into '{staging}' ({full_size} -> {size} dims).")
+
+            recall = _measure_recall(
+                client, collection, staging, profile, size=size, samples=samples, k=k
+            )
+            typer.echo(f"recall@{k} vs exact search: {recall:.3f} (minimum {min_recall:.3f})")
+            if recall < min_recall and not force:
+                client.delete_collection(staging)
+                typer.echo("Recall below tolerance; original collection left unchanged.", err=True)
+                raise typer.Exit(code=1)
+
+            before = _stored_profile(info).ram_bytes_per_vector(full_size)
+            after = profile.ram_bytes_per_vector(full_size)
+            summary = (
+                f"Collection '{collection}' migrated: ~{before / 1024:.1f} KiB -> "
+                f"~{after / 1024:.2f} KiB resident per vector."
+            )
+
+        try:
+            _cut_over(client, collection, staging, batch_size=batch_size)
+        except Exception as exc:
+            typer.echo(f"Cut-over of '{collection}' failed: {exc}", err=True)
+            typer.echo(
+                f"All points are kept in '{staging}'. Finish the migration with:\n"
+                f"  stack qdrant migrate-profile {collection} --resume "
+                f"--host {host} --port {port}",
+                err=True,
+            )
+            raise typer.Exit(code=1) from exc
+        client.delete_collection(staging)
+        typer.echo(summary)
+    finally:
+        client.close()
+
+
 @app.command("backup")
 def backup(
     backup_dir: Path = typer.Option(Path("backups"), help="Destination directory for archives."),
@@ -0,0 +1,110 @@
+"""Tests for the stack qdrant module."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import MagicMock
+
+import pytest
+from qdrant_client.http import models as qm
+from typer.testing import CliRunner
+
+from core.utils.sparse import SPARSE_VECTOR_NAME
+from core.utils.vector_storage import VectorStorageProfile
+from stack import qdrant
+from stack.qdrant import _copy_points, _restore_payload_indexes, _stored_profile, recall_at_k
+
+
+def test_recall_at_k() -> None:
+    assert recall_at_k([1, 2, 3, 4], [1, 2, 9, 8], k=4) == 0.5
+    assert recall_at_k([1, 2, 3], [3, 2, 1, 9], k=3) == 1.0
+    assert recall_at_k([], [1], k=3) == 1.0
+
+
+def test_copy_points_truncates_and_backfills_sparse() -> None:
+    record = SimpleNamespace(id=7, vector=[1.0, 2.0, 3.0, 4.0], payload={"text": "AB#4711"})
+    client = MagicMock()
+    client.scroll.return_value = ([record], None)
+
+    copied = _copy_points(client, "old", "new", size=2, batch_size=10)
+
+    assert copied == 1
+    point: Any = client.upsert.call_args.kwargs["points"][0]
+    assert point.vector[""] == [1.0, 2.0]
+    assert point.vector[SPARSE_VECTOR_NAME].indices
+    assert point.payload == {"text": "AB#4711"}
+
+
+def test_stored_profile_reflects_existing_quantization() -> None:
+    config = SimpleNamespace(
+        params=SimpleNamespace(
+            vectors=qm.VectorParams(size=8, distance=qm.Distance.COSINE, on_disk=True)
+        ),
+        quantization_config=qm.ScalarQuantization(
+            scalar=qm.ScalarQuantizationConfig(type=qm.ScalarType.INT8)
+        ),
+    )
+
+    profile = _stored_profile(cast(qm.CollectionInfo, SimpleNamespace(config=config)))
+
+    assert profile == VectorStorageProfile(quantization="int8", on_disk=True)
+    assert profile.ram_bytes_per_vector(8) == 8.0
+
+
+def test_restore_payload_indexes_recreates_each_field() -> None:
+    client = MagicMock()
+    schema = {
+        "filepath": qm.PayloadIndexInfo(data_type=qm.PayloadSchemaType.KEYWORD, points=3),
+        "created_at": qm.PayloadIndexInfo(data_type=qm.PayloadSchemaType.FLOAT, points=3),
+    }
+
+    _restore_payload_indexes(client, "memory", schema)
+
+    created = {
+        call.kwargs["field_name"]: call.kwargs["field_schema"]
+        for call in client.create_payload_index.call_args_list
+    }
+    assert created == {
+        "filepath": qm.PayloadSchemaType.KEYWORD,
+        "created_at": qm.PayloadSchemaType.FLOAT,
+    }
+
+
+def _staged_client(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    client = MagicMock()
+    client.collection_exists.return_value = True
+    client.get_collection.return_value = SimpleNamespace(
+        config=SimpleNamespace(
+            params=SimpleNamespace(vectors=qm.VectorParams(size=4, distance=qm.Distance.COSINE)),
+            hnsw_config=SimpleNamespace(m=32, ef_construct=256),
+            quantization_config=None,
+        ),
+        payload_schema={},
+    )
+    client.scroll.return_value = ([], None)
+    monkeypatch.setattr(qdrant, "QdrantClient", lambda **_kwargs: client)
+    return client
+
+
+def test_failed_cut_over_keeps_staging_and_prints_resume(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _staged_client(monkeypatch)
+    client.scroll.side_effect = RuntimeError("connection reset")
+
+    result = CliRunner().invoke(qdrant.app, ["migrate-profile", "memory", "--resume"])
+
+    assert result.exit_code == 1
+    assert "stack qdrant migrate-profile memory --resume" in result.output
+    dropped = [call.args[0] for call in client.delete_collection.call_args_list]
+    assert dropped == ["memory"]
+
+
+def test_resume_refills_collection_from_staging(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _staged_client(monkeypatch)
+
+    result = CliRunner().invoke(qdrant.app, ["migrate-profile", "memory", "--resume"])
+
+    assert result.exit_code == 0, result.output
+    assert client.create_collection.call_args.args == ("memory",)
+    dropped = [call.args[0] for call in client.delete_collection.call_args_list]
+    assert dropped == ["memory", "memory__migrate"]